@@ -0,0 +1,103 @@
+"""
+API Gateway and Lambda function definitions of the stacks.
+
+Functions and the routes of the REST API are described once here, without
+importing CDK: the stacks build their functions and API methods from these
+definitions, and the local API emulator serves the same routes from the
+built functions (see tests.utils.local_api).
+"""
+
+from dataclasses import dataclass, field
+
+from stacks.table_definitions import TIMESTAMP_FORMAT
+
+# Constants
+HELLO_WORLD_FUNCTION = "hello_world"
+HELLO_WORLD_API_ID = "HelloWorldApi"
+DEFAULT_MEMORY_SIZE = 128
+# Matches DEFAULT_TIMEOUT_SECONDS of the Lambda factory
+DEFAULT_TIMEOUT_SECONDS = 30
+
+
+@dataclass(frozen=True)
+class FunctionDefinition:
+    """Lambda function built from ``dist/functions/<function_name>``."""
+
+    function_name: str
+    handler: str
+    memory_size: int = DEFAULT_MEMORY_SIZE
+    timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS
+    # Static settings; those naming other resources are added by the stack
+    environment: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class RouteDefinition:
+    """API method proxied to a Lambda function."""
+
+    method: str
+    # Resource path from the API root, e.g. "/hello"
+    path: str
+    function_name: str
+
+
+@dataclass(frozen=True)
+class ApiDefinition:
+    """REST API and the routes of its methods."""
+
+    construct_id: str
+    rest_api_name: str
+    description: str
+    routes: tuple[RouteDefinition, ...] = ()
+
+
+def hello_world_function(
+    timestamp_format: str = TIMESTAMP_FORMAT,
+) -> FunctionDefinition:
+    """
+    Get the definition of the Hello World function.
+
+    Args:
+        timestamp_format: Timestamp storage format of the greetings table
+
+    Returns:
+        The function definition, without the table name
+    """
+    return FunctionDefinition(
+        function_name=HELLO_WORLD_FUNCTION,
+        handler="handler.lambda_handler",
+        memory_size=256,
+        environment={
+            "HELLO_WORLD_TRACING": "xray",  # Subsegments for port and service calls
+            "HELLO_WORLD_TIMESTAMP_FORMAT": timestamp_format,
+        },
+    )
+
+
+def function_definitions() -> dict[str, FunctionDefinition]:
+    """
+    Get the definitions of every function of the stacks.
+
+    Returns:
+        Function definitions by function name, without the table names
+    """
+    return {HELLO_WORLD_FUNCTION: hello_world_function()}
+
+
+def hello_world_api() -> ApiDefinition:
+    """
+    Get the definition of the Hello World API.
+
+    Returns:
+        The API definition
+    """
+    return ApiDefinition(
+        construct_id=HELLO_WORLD_API_ID,
+        rest_api_name="Hello World API",
+        description="API for the Hello World Lambda function",
+        routes=(
+            RouteDefinition("GET", "/hello", HELLO_WORLD_FUNCTION),
+            # Most recent greetings, a page at a time
+            RouteDefinition("GET", "/greetings", HELLO_WORLD_FUNCTION),
+        ),
+    )
@@ -3,6 +3,8 @@ Hello World CDK stack that creates a Lambda function using the Lambda factory.
 """
 
 from aws_cdk import (
+    CfnOutput,
+    Duration,
     RemovalPolicy,
     Stack,
     Tags,
@@ -15,6 +17,20 @@ from aws_cdk import (
 )
 from constructs import Construct
 from lambda_factory import LambdaConfig, LambdaFactory
+from stacks import api_definitions, table_definitions
+from stacks.table_definitions import (
+    NUMBER,
+    TIMESTAMP_FORMAT,
+    KeyAttribute,
+    TableDefinition,
+)
+
+# Constants
+# Stack outputs, named <ResourceId>Name so tests resolve them without the
+# tagging API (see tests.utils.resource_discovery)
+TABLE_NAME_OUTPUT = "GreetingsTableName"
+FUNCTION_NAME_OUTPUT = "HelloWorldFunctionName"
+API_URL_OUTPUT = "HelloWorldApiUrl"
 
 
 class HelloWorldStack(Stack):
@@ -34,14 +50,8 @@ class HelloWorldStack(Stack):
         super().__init__(scope, construct_id, **kwargs)
 
         # Create DynamoDB table for greetings
-        greetings_table = dynamodb.Table(
-            self,
-            "GreetingsTable",
-            partition_key=dynamodb.Attribute(
-                name="name", type=dynamodb.AttributeType.STRING
-            ),
-            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
-            removal_policy=RemovalPolicy.DESTROY,  # For development only
+        greetings_table = self._create_table(
+            table_definitions.greetings_table(TIMESTAMP_FORMAT)
         )
 
         # Add ResourceId tag to DynamoDB table
@@ -51,13 +61,16 @@ class HelloWorldStack(Stack):
         lambda_factory = LambdaFactory(self)
 
         # Create Lambda function using the factory
+        function_definition = api_definitions.hello_world_function(TIMESTAMP_FORMAT)
         hello_function = lambda_factory.create_function(
             LambdaConfig(
-                function_name="hello_world",
-                handler="handler.lambda_handler",
-                memory_size=256,
+                function_name=function_definition.function_name,
+                handler=function_definition.handler,
+                memory_size=function_definition.memory_size,
+                timeout=Duration.seconds(function_definition.timeout_seconds),
                 environment={
-                    "HELLO_WORLD_TABLE_NAME": greetings_table.table_name  # Changed from GREETINGS_TABLE_NAME
+                    **function_definition.environment,
+                    "HELLO_WORLD_TABLE_NAME": greetings_table.table_name,  # Changed from GREETINGS_TABLE_NAME
                 },
             )
         )
@@ -65,19 +78,67 @@ class HelloWorldStack(Stack):
         # Grant DynamoDB permissions to Lambda function
         greetings_table.grant_read_write_data(hello_function)
 
-        # Create API Gateway
+        # Create API Gateway and its methods, all proxied to the function
+        api_definition = api_definitions.hello_world_api()
         api = apigateway.RestApi(
             self,
-            "HelloWorldApi",
-            rest_api_name="Hello World API",
-            description="API for the Hello World Lambda function",
+            api_definition.construct_id,
+            rest_api_name=api_definition.rest_api_name,
+            description=api_definition.description,
         )
-
-        # Create API Gateway resource and method
-        hello_resource = api.root.add_resource("hello")
         hello_integration = apigateway.LambdaIntegration(hello_function)
-        hello_resource.add_method("GET", hello_integration)
+        for route in api_definition.routes:
+            api.root.resource_for_path(route.path).add_method(
+                route.method, hello_integration
+            )
 
         # Output API Gateway URL and table name
         self.api_url = api.url
         self.table_name = greetings_table.table_name
+        CfnOutput(self, TABLE_NAME_OUTPUT, value=greetings_table.table_name)
+        CfnOutput(self, FUNCTION_NAME_OUTPUT, value=hello_function.function_name)
+        CfnOutput(self, API_URL_OUTPUT, value=api.url)
+
+    def _create_table(self, definition: TableDefinition) -> dynamodb.Table:
+        """
+        Create an on-demand table and its indexes from a table definition.
+
+        Args:
+            definition: Keys and indexes of the table
+
+        Returns:
+            The created table
+        """
+        table = dynamodb.Table(
+            self,
+            definition.construct_id,
+            partition_key=_attribute(definition.partition_key),
+            sort_key=_attribute(definition.sort_key),
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            removal_policy=RemovalPolicy.DESTROY,  # For development only
+        )
+        for index in definition.global_secondary_indexes:
+            table.add_global_secondary_index(
+                index_name=index.index_name,
+                partition_key=_attribute(index.partition_key),
+                sort_key=_attribute(index.sort_key),
+                projection_type=(
+                    dynamodb.ProjectionType.INCLUDE
+                    if index.non_key_attributes
+                    else dynamodb.ProjectionType.KEYS_ONLY
+                ),
+                non_key_attributes=list(index.non_key_attributes) or None,
+            )
+        return table
+
+
+def _attribute(key: KeyAttribute | None) -> dynamodb.Attribute | None:
+    """Convert a key attribute of a table definition to a CDK attribute."""
+    if key is None:
+        return None
+    attribute_type = (
+        dynamodb.AttributeType.NUMBER
+        if key.type == NUMBER
+        else dynamodb.AttributeType.STRING
+    )
+    return dynamodb.Attribute(name=key.name, type=attribute_type)
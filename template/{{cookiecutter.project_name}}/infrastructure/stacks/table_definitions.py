@@ -0,0 +1,136 @@
+"""
+DynamoDB table definitions of the stacks.
+
+Keys and indexes are described once here, without importing CDK: the
+stacks build their tables from these definitions, and the offline tests
+provision identical tables on the local DynamoDB stand-in from them
+(see tests.utils.local_dynamodb).
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+# Constants
+# Storage format of greeting timestamps; the recency index sort key follows it
+TIMESTAMP_FORMAT = "iso"
+# Must match adapters.greeting_listing in the shared Lambda code
+RECENCY_INDEX_NAME = "RecentGreetingsIndex"
+LISTING_ATTRIBUTE = "listing"
+GREETINGS_TABLE_ID = "GreetingsTable"
+STRING = "S"
+NUMBER = "N"
+
+
+@dataclass(frozen=True)
+class KeyAttribute:
+    """Key attribute of a table or index."""
+
+    name: str
+    type: str = STRING
+
+
+@dataclass(frozen=True)
+class IndexDefinition:
+    """Global secondary index projecting its keys and some attributes."""
+
+    index_name: str
+    partition_key: KeyAttribute
+    sort_key: KeyAttribute | None = None
+    # Attributes projected besides the keys (INCLUDE, or KEYS_ONLY if none)
+    non_key_attributes: tuple[str, ...] = ()
+
+    @property
+    def projection(self) -> dict[str, Any]:
+        """Get the Projection of the index in a CreateTable request."""
+        if not self.non_key_attributes:
+            return {"ProjectionType": "KEYS_ONLY"}
+        return {
+            "ProjectionType": "INCLUDE",
+            "NonKeyAttributes": list(self.non_key_attributes),
+        }
+
+
+@dataclass(frozen=True)
+class TableDefinition:
+    """On-demand table, with its keys and global secondary indexes."""
+
+    construct_id: str
+    partition_key: KeyAttribute
+    sort_key: KeyAttribute | None = None
+    global_secondary_indexes: tuple[IndexDefinition, ...] = ()
+
+    def create_table_request(self, table_name: str) -> dict[str, Any]:
+        """
+        Build the DynamoDB CreateTable request of the table.
+
+        Args:
+            table_name: Name of the table to create
+
+        Returns:
+            CreateTable parameters
+        """
+        attributes = {}
+        request: dict[str, Any] = {
+            "TableName": table_name,
+            "KeySchema": _key_schema(self.partition_key, self.sort_key, attributes),
+            "BillingMode": "PAY_PER_REQUEST",
+        }
+        if self.global_secondary_indexes:
+            request["GlobalSecondaryIndexes"] = [
+                {
+                    "IndexName": index.index_name,
+                    "KeySchema": _key_schema(
+                        index.partition_key, index.sort_key, attributes
+                    ),
+                    "Projection": index.projection,
+                }
+                for index in self.global_secondary_indexes
+            ]
+        request["AttributeDefinitions"] = [
+            {"AttributeName": name, "AttributeType": type_}
+            for name, type_ in attributes.items()
+        ]
+        return request
+
+
+def _key_schema(
+    partition_key: KeyAttribute,
+    sort_key: KeyAttribute | None,
+    attributes: dict[str, str],
+) -> list[dict[str, str]]:
+    """Build a key schema, collecting the types of its attributes."""
+    schema = [{"AttributeName": partition_key.name, "KeyType": "HASH"}]
+    attributes[partition_key.name] = partition_key.type
+    if sort_key is not None:
+        schema.append({"AttributeName": sort_key.name, "KeyType": "RANGE"})
+        attributes[sort_key.name] = sort_key.type
+    return schema
+
+
+def greetings_table(timestamp_format: str = TIMESTAMP_FORMAT) -> TableDefinition:
+    """
+    Get the definition of the greetings table.
+
+    Args:
+        timestamp_format: Timestamp storage format, which sets the type of
+            the recency index sort key
+
+    Returns:
+        The table definition
+    """
+    return TableDefinition(
+        construct_id=GREETINGS_TABLE_ID,
+        partition_key=KeyAttribute("name"),
+        global_secondary_indexes=(
+            # Index of every greeting, most recently updated first, holding
+            # what a listed greeting shows
+            IndexDefinition(
+                RECENCY_INDEX_NAME,
+                KeyAttribute(LISTING_ATTRIBUTE),
+                KeyAttribute(
+                    "updated_at", STRING if timestamp_format == "iso" else NUMBER
+                ),
+                non_key_attributes=("greeting", "created_at", "version"),
+            ),
+        ),
+    )
@@ -2,19 +2,101 @@
 Hello World Lambda function handler.
 """
 
+import functools
 import json
 from typing import Any
 
+from adapters.parameter_adapter_factory import create_parameter_adapter
+from adapters.saved_names_filter_adapter import (
+    SavedNamesFilterAdapter,
+    load_saved_names,
+    saved_names_from_stream,
+)
+from config.config_service import config
+from config.settings import Settings
 from domain.services.hello_world_service import HelloWorldService
+from handlers.batch_processor import BatchProcessor, BatchRecord
+from observability.metrics import metrics
+from observability.tracing import configure_tracing
+from ports.hello_world_port import DEFAULT_PAGE_SIZE
+from utils.deadline import Deadline, deadline_scope
+from utils.lazy_import import lazy_import
 
+# Loaded on first use, so the init phase does not import the AWS SDK
+storage_adapter = lazy_import("adapters.hello_world_storage_adapter")
 
-def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
+# Constants
+LIST_RESOURCE = "/greetings"
+
+# Validate the configuration once, during the init phase
+config.load(create_parameter_adapter())
+configure_tracing(config.settings)
+metrics.namespace = config.settings.hello_world_metrics_namespace
+
+# Names with a saved greeting, when a snapshot is configured
+saved_names = load_saved_names(config.settings.hello_world_saved_names_snapshot)
+
+
+@functools.lru_cache(maxsize=1)
+def _service(settings: Settings) -> HelloWorldService:
+    """
+    Get the service for a configuration, reused across warm invocations.
+
+    Args:
+        settings: Configuration snapshot the service is built from
+
+    Returns:
+        The service
+    """
+    if not saved_names:
+        return HelloWorldService()
+    storage = storage_adapter.HelloWorldStorageAdapter()
+    # The filter only guards reads: listings go to the table directly
+    return HelloWorldService(
+        SavedNamesFilterAdapter(
+            saved_names,
+            storage,
+            max_age_seconds=settings.hello_world_saved_names_max_age_seconds,
+            reload=functools.partial(
+                load_saved_names, settings.hello_world_saved_names_snapshot
+            ),
+        ),
+        catalog=storage,
+    )
+
+
+def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     """
     Hello World Lambda function handler.
 
+    Serves the greeting of a name, and the list of saved greetings on
+    LIST_RESOURCE. Metrics recorded during the invocation are flushed once
+    it completes. Adapter calls are bounded by the time the invocation has
+    left.
+
+    Args:
+        event: Lambda event
+        context: Lambda context
+
+    Returns:
+        API Gateway response
+    """
+    route = f"{event.get('httpMethod', '')} {event.get('resource', '')}".strip()
+    with (
+        metrics.invocation(context, route=route or None),
+        deadline_scope(Deadline.from_context(context)),
+    ):
+        if event.get("resource") == LIST_RESOURCE:
+            return _handle_list(event)
+        return _handle(event)
+
+
+def _handle(event: dict[str, Any]) -> dict[str, Any]:
+    """
+    Build the greeting response for a request.
+
     Args:
         event: Lambda event
-        _context: Lambda context (unused)
 
     Returns:
         API Gateway response
@@ -28,8 +110,8 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
         if not name or name.strip() == "":
             name = "World"
 
-        # Initialize service (adapter is injected by default)
-        service = HelloWorldService()
+        # Get the warm service (adapter is injected by default)
+        service = _service(config.settings)
 
         # Get greeting
         greeting = service.get_greeting(name)
@@ -43,6 +125,7 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
     except Exception as e:
         # Log error
         print(f"Error getting greeting: {e!s}")
+        metrics.add_count("Errors")
 
         # Return error response
         return {
@@ -50,3 +133,127 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
             "headers": {"Content-Type": "application/json"},
             "body": json.dumps({"message": f"Error: {e!s}"}),
         }
+
+
+def _handle_list(event: dict[str, Any]) -> dict[str, Any]:
+    """
+    Build the response listing saved greetings, most recent first.
+
+    The ``limit`` query parameter sets the page size and ``next_token``
+    resumes from the previous page. Responds 404 when the service has no
+    catalog to list greetings from.
+
+    Args:
+        event: Lambda event
+
+    Returns:
+        API Gateway response
+    """
+    query_params = event.get("queryStringParameters") or {}
+    service = _service(config.settings)
+    if service.catalog is None:
+        return {
+            "statusCode": 404,
+            "headers": {"Content-Type": "application/json"},
+            "body": json.dumps({"message": "Error: greetings cannot be listed"}),
+        }
+    try:
+        page = service.list_greetings(
+            int(query_params.get("limit", DEFAULT_PAGE_SIZE)),
+            query_params.get("next_token"),
+        )
+    except ValueError as e:
+        return {
+            "statusCode": 400,
+            "headers": {"Content-Type": "application/json"},
+            "body": json.dumps({"message": f"Error: {e!s}"}),
+        }
+    except Exception as e:
+        print(f"Error listing greetings: {e!s}")
+        metrics.add_count("Errors")
+        return {
+            "statusCode": 500,
+            "headers": {"Content-Type": "application/json"},
+            "body": json.dumps({"message": f"Error: {e!s}"}),
+        }
+
+    greetings = [
+        {
+            "name": greeting.name,
+            "message": greeting.formatted_greeting,
+            "updated_at": greeting.updated_at.isoformat(),
+        }
+        for greeting in page.greetings
+    ]
+    return {
+        "statusCode": 200,
+        "headers": {"Content-Type": "application/json"},
+        "body": json.dumps({"greetings": greetings, "next_token": page.next_token}),
+    }
+
+
+def batch_lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
+    """
+    Save the greetings of an SQS, Kinesis or DynamoDB Streams batch.
+
+    Each record carries a ``name`` and a ``greeting``: as the JSON body of
+    an SQS message or Kinesis record, or as the new image of a DynamoDB
+    Streams record (REMOVE records are skipped). Only the last record of
+    each name is saved; records left without time before the function
+    timeout are reported as failed.
+    Records from the stream of the greetings table itself are not saved,
+    as each save would emit a record saved again, endlessly: they are
+    counted as ``BatchOwnStreamRecords``, and their names are added to the
+    saved-names filter, so that this execution environment reads the
+    greetings saved by others before its snapshot is reloaded.
+    Enable ReportBatchItemFailures on the event source mapping so that only
+    the failed records are retried.
+
+    Args:
+        event: SQS, Kinesis or DynamoDB Streams event
+        context: Lambda context
+
+    Returns:
+        The batch item failures
+    """
+    with metrics.invocation(context), deadline_scope(Deadline.from_context(context)):
+        return batch_processor(event)
+
+
+def _from_own_stream(record: dict[str, Any]) -> bool:
+    """
+    Tell whether a record comes from the stream of the greetings table.
+
+    The name such a record saved is added to the saved-names filter.
+
+    Args:
+        record: Raw batch record
+
+    Returns:
+        True if saving the record would emit it again
+    """
+    table_name = config.settings.hello_world_table_name
+    own = f":table/{table_name}/stream/" in record.get("eventSourceARN", "")
+    if own:
+        metrics.add_count("BatchOwnStreamRecords")
+        port = _service(config.settings).hello_world_port
+        if isinstance(port, SavedNamesFilterAdapter):
+            port.record_saved_names(saved_names_from_stream([record]))
+    return own
+
+
+def _save_record(record: BatchRecord) -> None:
+    """
+    Save the greeting carried by a batch record.
+
+    Args:
+        record: Decoded batch record
+    """
+    payload = record.payload
+    _service(config.settings).save_greeting(payload["name"], payload["greeting"])
+
+
+# Worker pool kept across warm invocations
+batch_processor = BatchProcessor(
+    _save_record, key=lambda record: record.payload["name"], skip=_from_own_stream
+)
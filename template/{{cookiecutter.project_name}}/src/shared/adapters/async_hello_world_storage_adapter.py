@@ -0,0 +1,261 @@
+"""
+Asynchronous DynamoDB adapter for hello world storage.
+"""
+
+import asyncio
+from collections.abc import Sequence
+from contextlib import AsyncExitStack
+from datetime import UTC, datetime
+from typing import Any
+
+from adapters.aws_client_factory import MIN_CALL_BUDGET_SECONDS, get_client_profile
+from adapters.greeting_reads import (
+    build_read_options,
+    capacity_options,
+    record_consumed_capacity,
+)
+from adapters.greeting_upsert import (
+    apply_saved_item,
+    build_upsert_request,
+    raise_for_conflict,
+)
+from aiobotocore.config import AioConfig
+from aiobotocore.session import get_session
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.exceptions import ClientError
+from config.config_service import config
+from models.hello_world_model import HelloWorld, TimestampFormat
+from observability.metrics import metrics
+from observability.tracing import tracer
+from ports.async_hello_world_port import AsyncHelloWorldPort
+from ports.hello_world_port import ReadConsistency
+from utils.deadline import DeadlineExceededError, current_deadline
+
+# Constants
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+class AsyncHelloWorldStorageAdapter(AsyncHelloWorldPort):
+    """
+    Asynchronous DynamoDB adapter for storing hello world data.
+
+    aiobotocore is not bundled with the functions; install the ``async``
+    extra of the shared package to use this adapter. The underlying aiobotocore client is created on first use and reused
+    until ``close`` is called. Batch lookups are bounded by
+    ``max_concurrency`` in-flight requests. aiobotocore clients are bound to
+    an event loop, so they are not shared through ``aws_clients``; only the
+    client profile is. Call latency and consumed capacity are
+    recorded like in ``HelloWorldStorageAdapter``.
+
+    Within a ``deadline_scope``, each call is cancelled when the deadline
+    passes, and a read that runs out of time returns the default greeting
+    instead, counted as ``DeadlineFallbacks``.
+    """
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        """
+        Initialize the asynchronous DynamoDB adapter.
+
+        Args:
+            max_concurrency: Maximum number of concurrent DynamoDB requests
+
+        Raises:
+            ValueError: If max_concurrency is lower than 1
+        """
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1, got {max_concurrency}"
+            raise ValueError(msg)
+
+        settings = config.settings
+        self.table_name = settings.hello_world_table_name
+        self.max_concurrency = max_concurrency
+        self.client_profile = get_client_profile(settings.hello_world_client_profile)
+        self.timestamp_format = TimestampFormat(settings.hello_world_timestamp_format)
+        self.report_capacity = settings.hello_world_report_consumed_capacity
+        self.consumed_capacity_units = 0.0
+        self._session = get_session()
+        self._exit_stack: AsyncExitStack | None = None
+        self._client: Any = None
+        self._serializer = TypeSerializer()
+        self._deserializer = TypeDeserializer()
+
+    async def __aenter__(self) -> "AsyncHelloWorldStorageAdapter":
+        """Open the DynamoDB client."""
+        await self._get_client()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the DynamoDB client."""
+        await self.close()
+
+    @tracer.trace()
+    async def get_saved_greeting(
+        self,
+        name: str,
+        fields: Sequence[str] | None = None,
+        consistency: ReadConsistency = ReadConsistency.EVENTUAL,
+    ) -> HelloWorld:
+        """
+        Get a greeting for a name from DynamoDB.
+
+        Args:
+            name: The name to greet
+            fields: Attributes to read, or None for all of them
+            consistency: Eventually or strongly consistent read
+
+        Returns:
+            HelloWorld model with greeting data
+        """
+        client = await self._get_client()
+        try:
+            async with asyncio.timeout(self._call_timeout()):
+                with metrics.timer("GetItemLatency"):
+                    response = await client.get_item(
+                        TableName=self.table_name,
+                        Key=self._serialize({"name": name}),
+                        **build_read_options(fields, consistency),
+                        **capacity_options(self.report_capacity),
+                    )
+            self._record_capacity(response, "GetItem")
+            if "Item" in response:
+                return HelloWorld.from_dict(self._deserialize(response["Item"]))
+            return HelloWorld(name=name, greeting=None)  # Will use default greeting
+        except ClientError as e:
+            print(f"Error getting greeting: {e!s}")
+            metrics.add_count("GetItemErrors")
+            return HelloWorld(name=name, greeting=None)  # Will use default greeting
+        except (TimeoutError, DeadlineExceededError) as e:
+            print(f"Deadline reached getting greeting: {e!s}")
+            metrics.add_count("DeadlineFallbacks")
+            return HelloWorld(name=name, greeting=None)  # Will use default greeting
+
+    @tracer.trace()
+    async def get_saved_greetings(
+        self,
+        names: list[str],
+        fields: Sequence[str] | None = None,
+        consistency: ReadConsistency = ReadConsistency.EVENTUAL,
+    ) -> list[HelloWorld]:
+        """
+        Get the greetings for several names with bounded concurrency.
+
+        Args:
+            names: The names to greet
+            fields: Attributes to read, or None for all of them
+            consistency: Eventually or strongly consistent read
+
+        Returns:
+            HelloWorld models in the same order as ``names``
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded_lookup(name: str) -> HelloWorld:
+            async with semaphore:
+                return await self.get_saved_greeting(name, fields, consistency)
+
+        return list(await asyncio.gather(*(bounded_lookup(name) for name in names)))
+
+    @tracer.trace()
+    async def save_greeting(self, greeting: HelloWorld) -> None:
+        """
+        Save a greeting to DynamoDB in a single UpdateItem call.
+
+        Args:
+            greeting: HelloWorld model to save
+
+        Raises:
+            VersionConflictError: If ``greeting.version`` is no longer current
+            DeadlineExceededError: If the deadline passes before the save
+        """
+        client = await self._get_client()
+        try:
+            # Update the updated_at timestamp
+            greeting.updated_at = datetime.now(UTC)
+            request = build_upsert_request(
+                greeting.to_dict(self.timestamp_format), greeting.version
+            )
+            request["Key"] = self._serialize(request["Key"])
+            request["ExpressionAttributeValues"] = self._serialize(
+                request["ExpressionAttributeValues"]
+            )
+            async with asyncio.timeout(self._call_timeout()):
+                with metrics.timer("UpdateItemLatency"):
+                    response = await client.update_item(
+                        TableName=self.table_name,
+                        **request,
+                        **capacity_options(self.report_capacity),
+                    )
+            self._record_capacity(response, "UpdateItem")
+            apply_saved_item(greeting, self._deserialize(response["Attributes"]))
+        except ClientError as e:
+            raise_for_conflict(e, greeting)
+            print(f"Error saving greeting: {e!s}")
+            metrics.add_count("UpdateItemErrors")
+            raise
+        except TimeoutError as e:
+            msg = "Deadline reached saving greeting"
+            raise DeadlineExceededError(msg) from e
+
+    async def close(self) -> None:
+        """Close the DynamoDB client and its connection pool."""
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+        self._exit_stack = None
+        self._client = None
+
+    async def _get_client(self) -> Any:
+        """
+        Get the DynamoDB client, creating it on first use.
+
+        Returns:
+            aiobotocore DynamoDB client
+        """
+        if self._client is None:
+            exit_stack = AsyncExitStack()
+            self._client = await exit_stack.enter_async_context(
+                self._session.create_client(
+                    "dynamodb",
+                    config=self.client_profile.to_config(
+                        AioConfig, max_pool_connections=self.max_concurrency
+                    ),
+                )
+            )
+            self._exit_stack = exit_stack
+        return self._client
+
+    @staticmethod
+    def _call_timeout() -> float | None:
+        """
+        Get the time a call may take under the current deadline.
+
+        Returns:
+            Seconds left, or None without a deadline
+
+        Raises:
+            DeadlineExceededError: If too little time is left for a call
+        """
+        deadline = current_deadline()
+        if deadline is None:
+            return None
+        remaining = deadline.remaining()
+        if remaining < MIN_CALL_BUDGET_SECONDS:
+            msg = "Too little time left to call DynamoDB"
+            raise DeadlineExceededError(msg)
+        return remaining
+
+    def _record_capacity(self, response: dict, operation: str) -> None:
+        """Report and accumulate the capacity consumed by a call."""
+        if self.report_capacity:
+            self.consumed_capacity_units += record_consumed_capacity(
+                response, operation
+            )
+
+    def _serialize(self, item: dict[str, Any]) -> dict[str, Any]:
+        """Convert a plain dictionary into DynamoDB attribute values."""
+        return {key: self._serializer.serialize(value) for key, value in item.items()}
+
+    def _deserialize(self, item: dict[str, Any]) -> dict[str, Any]:
+        """Convert DynamoDB attribute values into a plain dictionary."""
+        return {
+            key: self._deserializer.deserialize(value) for key, value in item.items()
+        }
@@ -0,0 +1,291 @@
+"""
+Shared factory for tuned, reused AWS SDK clients.
+
+Creating a boto3 client costs milliseconds of CPU and a fresh connection
+pool, so adapters obtain clients here instead of calling ``boto3.client``
+directly. Clients are cached per (service, region, profile) for the life
+of the execution environment and configured from named profiles.
+"""
+
+import math
+import threading
+from dataclasses import dataclass, replace
+from typing import Any
+
+import boto3
+from botocore.config import Config
+from config.config_service import ConfigurationError, config
+
+# Constants
+DEFAULT_PROFILE = "default"
+# Cap of botocore's exponential backoff between retries
+MAX_RETRY_BACKOFF_SECONDS = 20
+# Below this budget a call is not attempted
+MIN_CALL_BUDGET_SECONDS = 0.05
+
+
+@dataclass(frozen=True)
+class ClientProfile:
+    """Connection, timeout and retry settings for an AWS SDK client."""
+
+    name: str
+    max_pool_connections: int
+    connect_timeout: float
+    read_timeout: float
+    max_attempts: int
+    retry_mode: str = "adaptive"
+    tcp_keepalive: bool = True
+
+    def to_config(
+        self, config_class: type[Config] = Config, **overrides: Any
+    ) -> Config:
+        """
+        Build a botocore configuration from the profile.
+
+        Args:
+            config_class: Config class to build (e.g. aiobotocore's AioConfig)
+            **overrides: Config options taking precedence over the profile
+
+        Returns:
+            Client configuration
+        """
+        options = {
+            "max_pool_connections": self.max_pool_connections,
+            "connect_timeout": self.connect_timeout,
+            "read_timeout": self.read_timeout,
+            # botocore's max_attempts counts retries only; total includes the first
+            "retries": {
+                "mode": self.retry_mode,
+                "total_max_attempts": self.max_attempts,
+            },
+            "tcp_keepalive": self.tcp_keepalive,
+        }
+        return config_class(**{**options, **overrides})
+
+    def worst_case_seconds(self, max_attempts: int | None = None) -> float:
+        """
+        Get the longest a call can take.
+
+        That is every attempt timing out, with the longest backoff between
+        attempts.
+
+        Args:
+            max_attempts: Number of attempts (the profile's if None)
+
+        Returns:
+            Worst-case call duration in seconds
+        """
+        attempts = self.max_attempts if max_attempts is None else max_attempts
+        backoff = sum(
+            min(MAX_RETRY_BACKOFF_SECONDS, 2**retry) for retry in range(attempts - 1)
+        )
+        return attempts * (self.connect_timeout + self.read_timeout) + backoff
+
+    def within(self, seconds: float) -> "ClientProfile | None":
+        """
+        Fit the profile's timeouts and retries into a time budget.
+
+        The budget is rounded down to a power of two, so that the calls
+        bound by a deadline share a handful of cached clients.
+
+        Args:
+            seconds: Time the call may take
+
+        Returns:
+            This profile if its worst case fits the budget; otherwise a
+            profile with fewer attempts and proportionally shorter timeouts;
+            None if the budget is below MIN_CALL_BUDGET_SECONDS
+        """
+        if seconds < MIN_CALL_BUDGET_SECONDS:
+            return None
+        if self.worst_case_seconds() <= seconds:
+            return self
+        budget = 2.0 ** math.floor(math.log2(seconds))
+        attempts = self.max_attempts
+        while attempts > 1 and self.worst_case_seconds(attempts) > budget:
+            attempts -= 1
+        scale = min(1.0, budget / self.worst_case_seconds(attempts))
+        return replace(
+            self,
+            name=f"{self.name}@{budget:g}s",
+            connect_timeout=self.connect_timeout * scale,
+            read_timeout=self.read_timeout * scale,
+            max_attempts=attempts,
+        )
+
+
+# Keyed by the names in config.settings.CLIENT_PROFILE_NAMES
+CLIENT_PROFILES = {
+    profile.name: profile
+    for profile in (
+        # Balanced settings for request/response Lambda handlers
+        ClientProfile(
+            name=DEFAULT_PROFILE,
+            max_pool_connections=10,
+            connect_timeout=1.0,
+            read_timeout=3.0,
+            max_attempts=3,
+        ),
+        # Fail fast on the synchronous request path, no client-side throttling
+        ClientProfile(
+            name="low_latency",
+            max_pool_connections=10,
+            connect_timeout=0.5,
+            read_timeout=1.0,
+            max_attempts=2,
+            retry_mode="standard",
+        ),
+        # Wide pool and patient retries for batch jobs and bulk loads
+        ClientProfile(
+            name="high_throughput",
+            max_pool_connections=50,
+            connect_timeout=2.0,
+            read_timeout=10.0,
+            max_attempts=10,
+        ),
+        # Read timeout above the Lambda timeout for synchronous invocations
+        ClientProfile(
+            name="long_running",
+            max_pool_connections=10,
+            connect_timeout=2.0,
+            read_timeout=60.0,
+            max_attempts=3,
+            retry_mode="standard",
+        ),
+    )
+}
+
+
+def get_client_profile(name: str | None = None) -> ClientProfile:
+    """
+    Look up a client profile by name.
+
+    Args:
+        name: Profile name (the default profile if None)
+
+    Returns:
+        The client profile
+
+    Raises:
+        ConfigurationError: If no profile has that name
+    """
+    profile = CLIENT_PROFILES.get(name or DEFAULT_PROFILE)
+    if profile is None:
+        msg = f"Unknown AWS client profile '{name}', expected one of {sorted(CLIENT_PROFILES)}"
+        raise ConfigurationError(msg)
+    return profile
+
+
+class AwsClientFactory:
+    """
+    Cache of AWS SDK clients and resources.
+
+    Low-level clients are thread-safe and shared process-wide. boto3
+    resources are not, so they are cached per thread.
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._clients: dict[tuple, Any] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def client(
+        self,
+        service_name: str,
+        profile: ClientProfile | str | None = None,
+        region_name: str | None = None,
+    ) -> Any:
+        """
+        Get a cached low-level client.
+
+        Args:
+            service_name: AWS service name (e.g. "dynamodb")
+            profile: Client profile or profile name (default profile if None)
+            region_name: AWS region (the environment's region if None)
+
+        Returns:
+            boto3 client
+        """
+        key = self._cache_key(service_name, profile, region_name)
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = boto3.client(
+                        service_name,
+                        region_name=key[1],
+                        config=self._profile(profile).to_config(),
+                    )
+                    self._clients[key] = client
+        return client
+
+    def resource(
+        self,
+        service_name: str,
+        profile: ClientProfile | str | None = None,
+        region_name: str | None = None,
+    ) -> Any:
+        """
+        Get a boto3 resource cached for the calling thread.
+
+        Args:
+            service_name: AWS service name (e.g. "dynamodb")
+            profile: Client profile or profile name (default profile if None)
+            region_name: AWS region (the environment's region if None)
+
+        Returns:
+            boto3 service resource
+        """
+        resources = self._thread_resources()
+        key = self._cache_key(service_name, profile, region_name)
+        resource = resources.get(key)
+        if resource is None:
+            with self._lock:
+                resource = boto3.resource(
+                    service_name,
+                    region_name=key[1],
+                    config=self._profile(profile).to_config(),
+                )
+            resources[key] = resource
+        return resource
+
+    def clear(self) -> None:
+        """
+        Drop every cached client and resource.
+
+        Needed when the environment the clients were built from changes,
+        e.g. when tests point ``AWS_ENDPOINT_URL_DYNAMODB`` elsewhere.
+        """
+        with self._lock:
+            self._clients.clear()
+            self._local = threading.local()
+
+    def _thread_resources(self) -> dict[tuple, Any]:
+        """Get the resource cache of the calling thread."""
+        resources = getattr(self._local, "resources", None)
+        if resources is None:
+            resources = self._local.resources = {}
+        return resources
+
+    def _cache_key(
+        self,
+        service_name: str,
+        profile: ClientProfile | str | None,
+        region_name: str | None,
+    ) -> tuple:
+        """Build the cache key of a client or resource."""
+        region = region_name or config.get_optional(config.AWS_REGION)
+        return (service_name, region, self._profile(profile))
+
+    @staticmethod
+    def _profile(profile: ClientProfile | str | None) -> ClientProfile:
+        """Resolve a profile argument to a ClientProfile."""
+        if isinstance(profile, ClientProfile):
+            return profile
+        return get_client_profile(profile)
+
+
+# Initialize singleton instance
+aws_clients = AwsClientFactory()
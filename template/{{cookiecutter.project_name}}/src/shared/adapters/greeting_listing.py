@@ -0,0 +1,373 @@
+"""
+DynamoDB listing and export of greetings.
+
+Every saved greeting carries a ``listing`` attribute, the partition key of
+a global secondary index sorted by ``updated_at``. Its value is one of
+LISTING_SHARDS shards, picked from the name, so that no single index
+partition takes every write. A page of the most recent greetings queries
+every shard in parallel and merges their pages by update time; the key
+each shard resumes after is handed to callers as an opaque continuation
+token. Every shard is asked for a full page, so a page reads up to
+LISTING_SHARDS times page_size index items (at most LISTING_SHARDS times
+MAX_PAGE_SIZE). A full export scans the table instead, in segments read
+in parallel.
+
+Greetings saved before the index existed have no listing attribute and
+are left out of listings until ``build_backfill_request`` adds it (see
+``tools.listing_backfill``).
+"""
+
+import base64
+import contextvars
+import functools
+import json
+import queue
+import threading
+import zlib
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from models.hello_world_model import EPOCH, MICROSECONDS_PER_MILLISECOND
+from ports.hello_world_port import MAX_PAGE_SIZE
+
+# Constants
+KEY_ATTRIBUTE = "name"
+UPDATED_AT_ATTRIBUTE = "updated_at"
+# Must match the index defined in HelloWorldStack
+RECENCY_INDEX_NAME = "RecentGreetingsIndex"
+LISTING_ATTRIBUTE = "listing"
+LISTING_PARTITION = "greeting"
+LISTING_SHARDS = 8
+SHARD_PARTITIONS = tuple(f"{LISTING_PARTITION}#{n}" for n in range(LISTING_SHARDS))
+TOKEN_ATTRIBUTES = frozenset({KEY_ATTRIBUTE, LISTING_ATTRIBUTE, UPDATED_AT_ATTRIBUTE})
+# Scan pages buffered per segment ahead of the consumer
+PAGES_PER_SEGMENT = 2
+# How often a blocked segment checks whether the export was stopped
+STOP_POLL_SECONDS = 0.1
+
+_SEGMENT_DONE = object()
+
+
+# Queries of the shards of a page, run concurrently
+_shard_queries = ThreadPoolExecutor(LISTING_SHARDS, thread_name_prefix="listing")
+
+
+def listing_shard(name: str) -> str:
+    """
+    Get the recency index partition of a greeting.
+
+    Args:
+        name: Name of the greeting, which fixes its shard
+
+    Returns:
+        Value of the listing attribute
+    """
+    return SHARD_PARTITIONS[zlib.crc32(name.encode()) % LISTING_SHARDS]
+
+
+def build_list_requests(
+    page_size: int, start_keys: dict[str, dict[str, Any] | None] | None
+) -> dict[str, dict[str, Any]]:
+    """
+    Build the Query arguments of each shard for a page of recent greetings.
+
+    Every shard is asked for a full page, as the most recent greetings may
+    all be in one of them: a page costs the reads of up to LISTING_SHARDS
+    times page_size items.
+
+    Args:
+        page_size: Maximum number of greetings in the page
+        start_keys: Key each unfinished shard resumes after (None to start
+            it over), or None for the first page
+
+    Returns:
+        Query keyword arguments by shard, with plain (unserialized) values
+
+    Raises:
+        ValueError: If page_size is not between 1 and MAX_PAGE_SIZE
+    """
+    if not 1 <= page_size <= MAX_PAGE_SIZE:
+        msg = f"page_size must be between 1 and {MAX_PAGE_SIZE}, got {page_size}"
+        raise ValueError(msg)
+    if start_keys is None:
+        start_keys = dict.fromkeys(SHARD_PARTITIONS)
+    requests = {}
+    for shard, start_key in start_keys.items():
+        request = {
+            "IndexName": RECENCY_INDEX_NAME,
+            "KeyConditionExpression": "#listing = :listing",
+            "ExpressionAttributeNames": {"#listing": LISTING_ATTRIBUTE},
+            "ExpressionAttributeValues": {":listing": shard},
+            "ScanIndexForward": False,
+            "Limit": page_size,
+        }
+        if start_key is not None:
+            request["ExclusiveStartKey"] = start_key
+        requests[shard] = request
+    return requests
+
+
+def query_shards(
+    query: Callable[..., dict], requests: dict[str, dict[str, Any]]
+) -> dict[str, dict]:
+    """
+    Run the Query of every shard concurrently, in copies of the caller's context.
+
+    Args:
+        query: Query call of the table, safe to call from several threads
+        requests: Query arguments by shard
+
+    Returns:
+        Query responses by shard
+    """
+    futures = {
+        shard: _shard_queries.submit(
+            contextvars.copy_context().run, functools.partial(query, **request)
+        )
+        for shard, request in requests.items()
+    }
+    return {shard: future.result() for shard, future in futures.items()}
+
+
+def merge_pages(
+    responses: dict[str, dict], requests: dict[str, dict[str, Any]], page_size: int
+) -> tuple[list[dict[str, Any]], dict[str, dict[str, Any] | None] | None]:
+    """
+    Merge the shard pages into the most recent greetings.
+
+    Args:
+        responses: Query responses by shard
+        requests: Query arguments the responses answer
+        page_size: Maximum number of greetings in the page
+
+    Returns:
+        The items of the page, most recently updated first, and the key
+        each unfinished shard resumes after (None if no shard is left)
+    """
+    candidates = [
+        (item, shard)
+        for shard, response in responses.items()
+        for item in response["Items"]
+    ]
+    candidates.sort(
+        key=lambda candidate: (
+            _recency(candidate[0][UPDATED_AT_ATTRIBUTE]),
+            candidate[0][KEY_ATTRIBUTE],
+        ),
+        reverse=True,
+    )
+    page = candidates[:page_size]
+    last_listed = {shard: item for item, shard in page}
+
+    start_keys = {}
+    for shard, response in responses.items():
+        items = response["Items"]
+        finished = "LastEvaluatedKey" not in response
+        if shard not in last_listed:
+            # Nothing listed from the shard: read it again from the same key
+            if items or not finished:
+                start_keys[shard] = requests[shard].get("ExclusiveStartKey")
+        elif last_listed[shard] is not items[-1] or not finished:
+            item = last_listed[shard]
+            start_keys[shard] = {name: item[name] for name in TOKEN_ATTRIBUTES}
+    return [item for item, _ in page], start_keys or None
+
+
+def _recency(updated_at: str | Decimal | int) -> int:
+    """
+    Get an update time as epoch microseconds, whatever its storage format.
+
+    Tables switching HELLO_WORLD_TIMESTAMP_FORMAT hold both ISO strings and
+    epoch milliseconds, which do not compare with each other.
+    """
+    if isinstance(updated_at, str):
+        moment = datetime.fromisoformat(updated_at)
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=UTC)
+        return (moment - EPOCH) // timedelta(microseconds=1)
+    return int(updated_at) * MICROSECONDS_PER_MILLISECOND
+
+
+def build_backfill_request(name: str) -> dict[str, Any]:
+    """
+    Build the UpdateItem arguments adding the listing attribute to a greeting.
+
+    The update only applies to a stored greeting still without the
+    attribute, so it never races a save, which sets it itself.
+
+    Args:
+        name: Name of the greeting
+
+    Returns:
+        UpdateItem keyword arguments, with plain (unserialized) values
+    """
+    return {
+        "Key": {KEY_ATTRIBUTE: name},
+        "UpdateExpression": "SET #listing = :listing",
+        "ConditionExpression": "attribute_exists(#name) AND "
+        "attribute_not_exists(#listing)",
+        "ExpressionAttributeNames": {
+            "#name": KEY_ATTRIBUTE,
+            "#listing": LISTING_ATTRIBUTE,
+        },
+        "ExpressionAttributeValues": {":listing": listing_shard(name)},
+    }
+
+
+def encode_continuation_token(
+    start_keys: dict[str, dict[str, Any] | None] | None,
+) -> str | None:
+    """
+    Encode the keys the shards of a listing resume after as a token.
+
+    Args:
+        start_keys: Key of each unfinished shard (None to start it over),
+            if any shard is left
+
+    Returns:
+        URL-safe token, or None if there are no more pages
+    """
+    if start_keys is None:
+        return None
+    serializer = TypeSerializer()
+    document = {
+        shard: {}
+        if key is None
+        else {name: serializer.serialize(value) for name, value in key.items()}
+        for shard, key in start_keys.items()
+    }
+    encoded = json.dumps(document, separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(encoded.encode()).decode()
+
+
+def decode_continuation_token(
+    token: str | None,
+) -> dict[str, dict[str, Any] | None] | None:
+    """
+    Decode a continuation token into the keys the shards resume after.
+
+    Args:
+        token: Token from ``encode_continuation_token``, or None
+
+    Returns:
+        ExclusiveStartKey of each unfinished shard (None to start it over),
+        or None for the first page
+
+    Raises:
+        ValueError: If the token was not produced by a listing
+    """
+    if token is None:
+        return None
+    try:
+        document = json.loads(base64.urlsafe_b64decode(token))
+        if not document or not document.keys() <= set(SHARD_PARTITIONS):
+            msg = "unexpected shards"
+            raise ValueError(msg)
+        deserializer = TypeDeserializer()
+        start_keys = {}
+        for shard, key in document.items():
+            if key and key.keys() != TOKEN_ATTRIBUTES:
+                msg = "unexpected key attributes"
+                raise ValueError(msg)
+            start_keys[shard] = {
+                name: deserializer.deserialize(value) for name, value in key.items()
+            } or None
+    except (AttributeError, IndexError, TypeError, ValueError) as e:
+        msg = "Invalid continuation token"
+        raise ValueError(msg) from e
+    return start_keys
+
+
+def parallel_scan(
+    scan: Callable[..., dict], segments: int, **request: Any
+) -> Iterator[dict]:
+    """
+    Scan a table in parallel segments, yielding Scan responses as they arrive.
+
+    Each segment is scanned page by page on its own thread, in a copy of
+    the caller's context. Pages are handed over through a bounded queue, so
+    a slow consumer holds the scan back rather than buffering the table.
+    Closing the iterator stops every segment after its current page.
+
+    Args:
+        scan: Scan call of the table, safe to call from several threads
+        segments: Number of segments (TotalSegments)
+        **request: Other Scan arguments
+
+    Returns:
+        Iterator over the Scan responses of all segments, interleaved
+
+    Raises:
+        ValueError: If segments is lower than 1
+    """
+    if segments < 1:
+        msg = f"segments must be at least 1, got {segments}"
+        raise ValueError(msg)
+    return _scan_segments(scan, segments, request)
+
+
+def _scan_segments(
+    scan: Callable[..., dict], segments: int, request: dict[str, Any]
+) -> Iterator[dict]:
+    """Run the segment threads and yield their pages until all are done."""
+    pages: queue.Queue = queue.Queue(maxsize=segments * PAGES_PER_SEGMENT)
+    stop = threading.Event()
+    for segment in range(segments):
+        threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(_scan_segment, scan, segment, segments, request),
+            kwargs={"pages": pages, "stop": stop},
+            daemon=True,
+        ).start()
+
+    try:
+        running = segments
+        while running:
+            page = pages.get()
+            if page is _SEGMENT_DONE:
+                running -= 1
+            elif isinstance(page, Exception):
+                raise page
+            else:
+                yield page
+    finally:
+        stop.set()
+
+
+def _scan_segment(
+    scan: Callable[..., dict],
+    segment: int,
+    segments: int,
+    request: dict[str, Any],
+    *,
+    pages: queue.Queue,
+    stop: threading.Event,
+) -> None:
+    """Scan one segment, handing over each page, then a completion marker."""
+    try:
+        start_key = {}
+        while not stop.is_set():
+            response = scan(
+                Segment=segment, TotalSegments=segments, **request, **start_key
+            )
+            _hand_over(pages, response, stop)
+            if "LastEvaluatedKey" not in response:
+                break
+            start_key = {"ExclusiveStartKey": response["LastEvaluatedKey"]}
+    except Exception as e:
+        _hand_over(pages, e, stop)
+    _hand_over(pages, _SEGMENT_DONE, stop)
+
+
+def _hand_over(pages: queue.Queue, item: object, stop: threading.Event) -> None:
+    """Queue an item for the consumer, unless the export is stopped."""
+    while not stop.is_set():
+        try:
+            pages.put(item, timeout=STOP_POLL_SECONDS)
+        except queue.Full:
+            continue
+        return
@@ -0,0 +1,78 @@
+"""
+DynamoDB read options for greetings.
+
+Builds the projection and consistency arguments of greeting lookups, and
+records the capacity consumed by greeting calls as an invocation metric.
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+from observability.metrics import metrics
+from ports.hello_world_port import ReadConsistency
+
+# Constants
+KEY_ATTRIBUTE = "name"
+CONSUMED_CAPACITY_METRIC = "ConsumedCapacity"
+
+
+def build_read_options(
+    fields: Sequence[str] | None, consistency: ReadConsistency
+) -> dict[str, Any]:
+    """
+    Build the GetItem arguments for a projection and consistency mode.
+
+    The key attribute is always projected, so that a HelloWorld model can
+    be built from the returned item.
+
+    Args:
+        fields: Attributes to fetch, or None for the whole item
+        consistency: Eventually or strongly consistent read
+
+    Returns:
+        GetItem keyword arguments
+    """
+    options: dict[str, Any] = {
+        "ConsistentRead": consistency == ReadConsistency.STRONG,
+    }
+    if fields is not None:
+        attributes = [KEY_ATTRIBUTE, *(f for f in fields if f != KEY_ATTRIBUTE)]
+        names = {f"#p{index}": field for index, field in enumerate(attributes)}
+        options["ProjectionExpression"] = ", ".join(names)
+        options["ExpressionAttributeNames"] = names
+    return options
+
+
+def capacity_options(report_capacity: bool) -> dict[str, str]:
+    """
+    Build the ReturnConsumedCapacity argument.
+
+    Args:
+        report_capacity: Whether consumed capacity is reported
+
+    Returns:
+        Keyword arguments requesting the total consumed capacity, if reported
+    """
+    return {"ReturnConsumedCapacity": "TOTAL"} if report_capacity else {}
+
+
+def record_consumed_capacity(response: dict[str, Any], operation: str) -> float:
+    """
+    Record the capacity consumed by a call as an invocation metric.
+
+    Args:
+        response: DynamoDB response, with ConsumedCapacity if it was requested
+            (a list of them for batch operations)
+        operation: Name of the DynamoDB operation (e.g. "GetItem")
+
+    Returns:
+        The consumed capacity units, or 0.0 if the response has none
+    """
+    consumed = response.get("ConsumedCapacity")
+    if not consumed:
+        return 0.0
+    if isinstance(consumed, dict):
+        consumed = [consumed]
+    units = sum(float(table.get("CapacityUnits", 0.0)) for table in consumed)
+    metrics.add_count(f"{operation}{CONSUMED_CAPACITY_METRIC}", units)
+    return units
@@ -0,0 +1,169 @@
+"""
+DynamoDB upsert request for greetings.
+
+Saving a greeting is a single ``UpdateItem`` call: the creation time is
+only written if the item does not have one yet, and the version counter is
+incremented atomically, optionally guarded by the version the caller last
+read (optimistic concurrency). Every save also sets the listing attribute
+that places the greeting in its shard of the recency index.
+
+Bulk loads write whole items instead. A greeting without a version is a
+seed, written at version 1 with ``BatchWriteItem`` whatever is stored. One
+with a version goes in a ``TransactWriteItems`` call, its put conditioned
+so that it never rolls back a stored greeting: it replaces an older
+greeting, or one equal to itself, so that writing it again (as a resumed
+load does) succeeds.
+"""
+
+from typing import Any
+
+from adapters.greeting_listing import LISTING_ATTRIBUTE, listing_shard
+from botocore.exceptions import ClientError
+from models.hello_world_model import HelloWorld
+from ports.hello_world_port import VersionConflictError
+
+# Constants
+KEY_ATTRIBUTE = "name"
+GREETING_ATTRIBUTE = "greeting"
+CREATED_AT_ATTRIBUTE = "created_at"
+VERSION_ATTRIBUTE = "version"
+CONDITIONAL_CHECK_FAILED = "ConditionalCheckFailedException"
+# Cancellation reason of a transaction item whose condition failed
+CONDITIONAL_CHECK_FAILED_REASON = "ConditionalCheckFailed"
+
+
+def build_upsert_request(item: dict[str, Any], expected_version: int | None) -> dict:
+    """
+    Build the UpdateItem arguments that upsert a greeting.
+
+    Args:
+        item: Greeting item as produced by ``HelloWorld.to_dict``
+        expected_version: Stored version the save must replace (0 if the
+            item must not exist yet), or None for an unconditional upsert
+
+    Returns:
+        UpdateItem keyword arguments, with plain (unserialized) values
+    """
+    names = {
+        "#created_at": CREATED_AT_ATTRIBUTE,
+        "#version": VERSION_ATTRIBUTE,
+        "#listing": LISTING_ATTRIBUTE,
+    }
+    values: dict[str, Any] = {
+        ":created_at": item[CREATED_AT_ATTRIBUTE],
+        ":one": 1,
+        ":listing": listing_shard(item[KEY_ATTRIBUTE]),
+    }
+    assignments = [
+        "#created_at = if_not_exists(#created_at, :created_at)",
+        "#listing = :listing",
+    ]
+    for attribute, value in item.items():
+        if attribute in (KEY_ATTRIBUTE, CREATED_AT_ATTRIBUTE, VERSION_ATTRIBUTE):
+            continue
+        names[f"#{attribute}"] = attribute
+        values[f":{attribute}"] = value
+        assignments.append(f"#{attribute} = :{attribute}")
+
+    request = {
+        "Key": {KEY_ATTRIBUTE: item[KEY_ATTRIBUTE]},
+        "UpdateExpression": f"SET {', '.join(assignments)} ADD #version :one",
+        "ExpressionAttributeNames": names,
+        "ExpressionAttributeValues": values,
+        "ReturnValues": "ALL_NEW",
+    }
+    if expected_version == 0:
+        # On the key, as items written before versioning have no version
+        request["ConditionExpression"] = "attribute_not_exists(#name)"
+        names["#name"] = KEY_ATTRIBUTE
+    elif expected_version is not None:
+        request["ConditionExpression"] = "#version = :expected_version"
+        values[":expected_version"] = expected_version
+    return request
+
+
+def build_seed_item(item: dict[str, Any]) -> dict[str, Any]:
+    """
+    Build the item a loaded greeting without a version is written as.
+
+    Args:
+        item: Greeting item as produced by ``HelloWorld.to_dict``
+
+    Returns:
+        The item, listed in the recency index and at version 1, with plain
+        (unserialized) values
+    """
+    return {
+        **item,
+        LISTING_ATTRIBUTE: listing_shard(item[KEY_ATTRIBUTE]),
+        VERSION_ATTRIBUTE: 1,
+    }
+
+
+def build_put_request(item: dict[str, Any]) -> dict[str, Any]:
+    """
+    Build the transactional Put that writes a loaded greeting with a version.
+
+    The put applies if no greeting is stored, if the stored greeting has
+    no version or an older one, or if it is at the same version with the
+    same greeting: the item was written before, e.g. by a load that
+    stopped before saving its checkpoint.
+
+    Args:
+        item: Greeting item with a version, as produced by ``HelloWorld.to_dict``
+
+    Returns:
+        Put arguments without the table name, with plain (unserialized)
+        values: the item, listed in the recency index
+    """
+    names = {
+        "#name": KEY_ATTRIBUTE,
+        "#version": VERSION_ATTRIBUTE,
+        "#greeting": GREETING_ATTRIBUTE,
+    }
+    values: dict[str, Any] = {":version": item[VERSION_ATTRIBUTE]}
+    if item.get(GREETING_ATTRIBUTE) is None:
+        same_greeting = (
+            "(attribute_not_exists(#greeting) OR attribute_type(#greeting, :null))"
+        )
+        values[":null"] = "NULL"
+    else:
+        same_greeting = "#greeting = :greeting"
+        values[":greeting"] = item[GREETING_ATTRIBUTE]
+    return {
+        "Item": {**item, LISTING_ATTRIBUTE: listing_shard(item[KEY_ATTRIBUTE])},
+        "ConditionExpression": (
+            "attribute_not_exists(#name) OR attribute_not_exists(#version) "
+            f"OR #version < :version OR (#version = :version AND {same_greeting})"
+        ),
+        "ExpressionAttributeNames": names,
+        "ExpressionAttributeValues": values,
+    }
+
+
+def apply_saved_item(greeting: HelloWorld, saved_item: dict[str, Any]) -> None:
+    """
+    Update a model with the item stored by an upsert.
+
+    Args:
+        greeting: The saved model
+        saved_item: Item attributes returned by UpdateItem
+    """
+    saved = HelloWorld.from_dict(saved_item)
+    greeting.created_at = saved.created_at
+    greeting.version = saved.version
+
+
+def raise_for_conflict(error: ClientError, greeting: HelloWorld) -> None:
+    """
+    Translate a failed version check into a VersionConflictError.
+
+    Args:
+        error: Error raised by UpdateItem
+        greeting: The model that was being saved
+
+    Raises:
+        VersionConflictError: If the error is a failed condition check
+    """
+    if error.response.get("Error", {}).get("Code") == CONDITIONAL_CHECK_FAILED:
+        raise VersionConflictError(greeting.name, greeting.version) from error
@@ -0,0 +1,170 @@
+"""
+Hedged requests for tail-latency reduction.
+"""
+
+import contextvars
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+
+# Constants
+DEFAULT_PERCENTILE = 95.0
+DEFAULT_MAX_EXTRA_RATE = 0.05
+DEFAULT_INITIAL_DELAY_MS = 50.0
+DEFAULT_WINDOW = 1000
+DEFAULT_MAX_WORKERS = 16
+# Latency samples needed before the percentile replaces the initial delay
+MIN_SAMPLES = 20
+# The delay is recomputed after this many new samples
+RECOMPUTE_EVERY = 32
+# Unused hedges saved up for a burst of slow requests
+MAX_SAVED_HEDGES = 10.0
+MILLISECONDS = 1000
+
+
+@dataclass(frozen=True, slots=True)
+class HedgedResult:
+    """Result of a hedged call and how it was obtained."""
+
+    value: Any
+    hedged: bool
+    hedge_won: bool
+
+
+class HedgingPolicy:
+    """
+    Issue a second request when the first is slower than usual.
+
+    A call waits for its request up to the configured percentile of recent
+    request latencies; past that, it sends the same request again and takes
+    whichever answers first. Requests must be idempotent.
+
+    Each call earns ``max_extra_rate`` of a hedge and each hedge spends one,
+    so hedges never exceed that share of the calls (after a short burst of
+    up to MAX_SAVED_HEDGES). Requests run on a thread pool kept for the life
+    of the policy, in a copy of the caller's context.
+    """
+
+    def __init__(
+        self,
+        percentile: float = DEFAULT_PERCENTILE,
+        max_extra_rate: float = DEFAULT_MAX_EXTRA_RATE,
+        initial_delay_ms: float = DEFAULT_INITIAL_DELAY_MS,
+        window: int = DEFAULT_WINDOW,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            percentile: Latency percentile after which a request is hedged
+            max_extra_rate: Maximum ratio of hedges to calls
+            initial_delay_ms: Hedging delay until enough latencies are known
+            window: Number of recent request latencies the percentile uses
+            max_workers: Maximum number of requests in flight
+
+        Raises:
+            ValueError: If percentile or max_extra_rate is out of range
+        """
+        if not 0 < percentile < 100:
+            msg = f"percentile must be between 0 and 100, got {percentile}"
+            raise ValueError(msg)
+        if not 0 <= max_extra_rate <= 1:
+            msg = f"max_extra_rate must be between 0 and 1, got {max_extra_rate}"
+            raise ValueError(msg)
+        self.percentile = percentile
+        self.max_extra_rate = max_extra_rate
+        self.calls = 0
+        self.hedges_issued = 0
+        self.hedges_won = 0
+        self._delay = initial_delay_ms / MILLISECONDS
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._new_samples = 0
+        self._saved_hedges = 0.0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers)
+
+    @property
+    def delay(self) -> float:
+        """Get the current hedging delay, in seconds."""
+        return self._delay
+
+    def call(self, request: Callable[[], Any]) -> HedgedResult:
+        """
+        Make a request, hedging it if it is slow.
+
+        Args:
+            request: Idempotent request to make
+
+        Returns:
+            The first successful response, and whether it came from a hedge
+
+        Raises:
+            Exception: The error of the last request if every request failed
+        """
+        with self._lock:
+            self.calls += 1
+            self._saved_hedges = min(
+                MAX_SAVED_HEDGES, self._saved_hedges + self.max_extra_rate
+            )
+
+        primary = self._submit(request)
+        done, _ = wait([primary], timeout=self._delay)
+        if done or not self._take_hedge():
+            return HedgedResult(primary.result(), hedged=False, hedge_won=False)
+
+        hedge = self._submit(request)
+        pending = {primary, hedge}
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            # Prefer the primary if both answered, as the hedge was not needed
+            for future in sorted(done, key=lambda future: future is not primary):
+                if future.exception() is None:
+                    hedge_won = future is hedge
+                    if hedge_won:
+                        with self._lock:
+                            self.hedges_won += 1
+                    return HedgedResult(future.result(), True, hedge_won)
+            if not pending:
+                return HedgedResult(hedge.result(), hedged=True, hedge_won=True)
+
+    def close(self) -> None:
+        """Shut down the thread pool, without waiting for abandoned requests."""
+        self._executor.shutdown(wait=False)
+
+    def _submit(self, request: Callable[[], Any]) -> Future:
+        """Start a request and record its latency once it completes."""
+        start = time.perf_counter()
+        future = self._executor.submit(contextvars.copy_context().run, request)
+        future.add_done_callback(
+            lambda _: self._record_latency(time.perf_counter() - start)
+        )
+        return future
+
+    def _take_hedge(self) -> bool:
+        """Spend a saved hedge, if any."""
+        with self._lock:
+            if self._saved_hedges < 1:
+                return False
+            self._saved_hedges -= 1
+            self.hedges_issued += 1
+            return True
+
+    def _record_latency(self, seconds: float) -> None:
+        """Add a request latency and refresh the delay periodically."""
+        with self._lock:
+            self._latencies.append(seconds)
+            self._new_samples += 1
+            if (
+                self._new_samples < RECOMPUTE_EVERY
+                or len(self._latencies) < MIN_SAMPLES
+            ):
+                return
+            self._new_samples = 0
+            ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        self._delay = ordered[index]
@@ -2,56 +2,459 @@
 DynamoDB adapter for hello world storage.
 """
 
+import contextlib
+import threading
+from collections.abc import Iterator, Sequence
 from datetime import UTC, datetime
+from typing import Any
 
-import boto3
-from botocore.exceptions import ClientError
+from adapters.aws_client_factory import (
+    ClientProfile,
+    aws_clients,
+    get_client_profile,
+)
+from adapters.greeting_listing import (
+    build_list_requests,
+    decode_continuation_token,
+    encode_continuation_token,
+    merge_pages,
+    parallel_scan,
+    query_shards,
+)
+from adapters.greeting_reads import (
+    build_read_options,
+    capacity_options,
+    record_consumed_capacity,
+)
+from adapters.greeting_upsert import (
+    CONDITIONAL_CHECK_FAILED_REASON,
+    KEY_ATTRIBUTE,
+    apply_saved_item,
+    build_put_request,
+    build_seed_item,
+    build_upsert_request,
+    raise_for_conflict,
+)
+from adapters.hedging import HedgingPolicy
+from botocore.exceptions import ClientError, ConnectTimeoutError, ReadTimeoutError
 from config.config_service import config
-from models.hello_world_model import HelloWorld
-from ports.hello_world_port import HelloWorldPort
+from models.hello_world_model import HelloWorld, TimestampFormat
+from observability.metrics import metrics
+from observability.tracing import tracer
+from ports.hello_world_port import (
+    DEFAULT_EXPORT_SEGMENTS,
+    DEFAULT_PAGE_SIZE,
+    GreetingCatalogPort,
+    GreetingPage,
+    HelloWorldPort,
+    PutResult,
+    ReadConsistency,
+)
+from utils.deadline import DeadlineExceededError, current_deadline
 
+# Constants
+# Exports are bulk reads, not on the request path
+EXPORT_CLIENT_PROFILE = "high_throughput"
+# Most greetings a single put_greetings call writes
+MAX_BATCH_WRITE_ITEMS = 25
+THROTTLING_ERROR_CODES = frozenset(
+    {"ProvisionedThroughputExceededException", "ThrottlingException"}
+)
+TRANSACTION_CANCELED = "TransactionCanceledException"
 
-class HelloWorldStorageAdapter(HelloWorldPort):
+
+class HelloWorldStorageAdapter(HelloWorldPort, GreetingCatalogPort):
     """
     DynamoDB adapter for storing hello world data.
+
+    The adapter may be shared by threads: each call goes through the
+    calling thread's boto3 resource, and the counters below are updated
+    under a lock.
+
+    Every DynamoDB call is timed as an invocation metric. When
+    HELLO_WORLD_REPORT_CONSUMED_CAPACITY is "true", its consumed capacity
+    is also recorded as a metric and added to ``consumed_capacity_units``.
+
+    Within a ``deadline_scope``, the client's timeouts and retries are cut
+    down to fit the time left, and a read that runs out of time returns the
+    default greeting instead, counted as ``DeadlineFallbacks``.
+
+    With a hedging policy, set up from HELLO_WORLD_HEDGE_PERCENTILE unless
+    one is injected, a slow read is sent again and the first answer wins.
+    Hedges issued and won are counted in ``hedges_issued`` and
+    ``hedges_won`` and as metrics.
+
+    Greetings are listed from the recency index and exported with a
+    parallel segmented Scan (see ``adapters.greeting_listing``). Bulk
+    loads write them in batches with ``put_greetings``.
     """
 
-    def __init__(self):
-        """Initialize the DynamoDB adapter."""
-        self.table_name = config.get_required(config.HELLO_WORLD_TABLE_NAME)
-        self.dynamodb = boto3.resource("dynamodb")
+    def __init__(self, hedging: HedgingPolicy | None = None):
+        """
+        Initialize the DynamoDB adapter.
+
+        Args:
+            hedging: Hedging policy for reads (optional)
+        """
+        settings = config.settings
+        self.table_name = settings.hello_world_table_name
+        self.client_profile = get_client_profile(settings.hello_world_client_profile)
+        self.timestamp_format = TimestampFormat(settings.hello_world_timestamp_format)
+        self.report_capacity = settings.hello_world_report_consumed_capacity
+        self.consumed_capacity_units = 0.0
+        if hedging is None and settings.hello_world_hedge_percentile is not None:
+            hedging = HedgingPolicy(
+                settings.hello_world_hedge_percentile,
+                settings.hello_world_hedge_max_extra_rate,
+            )
+        self.hedging = hedging
+        self.hedges_issued = 0
+        self.hedges_won = 0
+        self._counters_lock = threading.Lock()
+        self.dynamodb = aws_clients.resource("dynamodb", self.client_profile)
         self.table = self.dynamodb.Table(self.table_name)
 
-    def get_saved_greeting(self, name: str) -> HelloWorld:
+    @tracer.trace()
+    def get_saved_greeting(
+        self,
+        name: str,
+        fields: Sequence[str] | None = None,
+        consistency: ReadConsistency = ReadConsistency.EVENTUAL,
+    ) -> HelloWorld:
         """
         Get a greeting for a name from DynamoDB.
 
         Args:
             name: The name to greet
+            fields: Attributes to read, or None for all of them
+            consistency: Eventually or strongly consistent read
 
         Returns:
             HelloWorld model with greeting data
         """
         try:
-            response = self.table.get_item(Key={"name": name})
+            profile = self._profile_within_deadline()
+            with metrics.timer("GetItemLatency"):
+                response = self._get_item(
+                    profile,
+                    Key={"name": name},
+                    **build_read_options(fields, consistency),
+                    **capacity_options(self.report_capacity),
+                )
+            self._record_capacity(response, "GetItem")
             if "Item" in response:
                 return HelloWorld.from_dict(response["Item"])
             return HelloWorld(name=name, greeting=None)  # Will use default greeting
         except ClientError as e:
             print(f"Error getting greeting: {e!s}")
+            metrics.add_count("GetItemErrors")
+            return HelloWorld(name=name, greeting=None)  # Will use default greeting
+        except (ConnectTimeoutError, ReadTimeoutError, DeadlineExceededError) as e:
+            if current_deadline() is None:
+                raise
+            print(f"Deadline reached getting greeting: {e!s}")
+            metrics.add_count("DeadlineFallbacks")
             return HelloWorld(name=name, greeting=None)  # Will use default greeting
 
+    @tracer.trace()
     def save_greeting(self, greeting: HelloWorld) -> None:
         """
-        Save a greeting to DynamoDB.
+        Save a greeting to DynamoDB in a single UpdateItem call.
 
         Args:
             greeting: HelloWorld model to save
+
+        Raises:
+            VersionConflictError: If ``greeting.version`` is no longer current
+            DeadlineExceededError: If too little time is left to save
         """
         try:
+            table = self._table(self._profile_within_deadline())
             # Update the updated_at timestamp
             greeting.updated_at = datetime.now(UTC)
-            self.table.put_item(Item=greeting.to_dict())
+            with metrics.timer("UpdateItemLatency"):
+                response = table.update_item(
+                    **build_upsert_request(
+                        greeting.to_dict(self.timestamp_format), greeting.version
+                    ),
+                    **capacity_options(self.report_capacity),
+                )
+            self._record_capacity(response, "UpdateItem")
+            apply_saved_item(greeting, response["Attributes"])
         except ClientError as e:
+            raise_for_conflict(e, greeting)
             print(f"Error saving greeting: {e!s}")
+            metrics.add_count("UpdateItemErrors")
+            raise
+
+    @tracer.trace()
+    def list_greetings(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        continuation_token: str | None = None,
+    ) -> GreetingPage:
+        """
+        List saved greetings, most recently updated first.
+
+        Each page queries the shards of the recency index in parallel,
+        each through its own client of the adapter's profile.
+
+        Args:
+            page_size: Maximum number of greetings in the page
+            continuation_token: ``next_token`` of the previous page, or None
+
+        Returns:
+            The page of greetings
+
+        Raises:
+            ValueError: If page_size is out of range or the token is invalid
+        """
+        requests = build_list_requests(
+            page_size, decode_continuation_token(continuation_token)
+        )
+        try:
+            profile = self._profile_within_deadline()
+            with metrics.timer("QueryLatency"):
+                responses = query_shards(
+                    lambda **request: (
+                        aws_clients.resource("dynamodb", profile)
+                        .Table(self.table_name)
+                        .query(**request, **capacity_options(self.report_capacity))
+                    ),
+                    requests,
+                )
+        except ClientError as e:
+            print(f"Error listing greetings: {e!s}")
+            metrics.add_count("QueryErrors")
+            raise
+        for response in responses.values():
+            self._record_capacity(response, "Query")
+        items, start_keys = merge_pages(responses, requests, page_size)
+        return GreetingPage(
+            [HelloWorld.from_dict(item) for item in items],
+            encode_continuation_token(start_keys),
+        )
+
+    def export_greetings(
+        self, segments: int = DEFAULT_EXPORT_SEGMENTS
+    ) -> Iterator[HelloWorld]:
+        """
+        Stream every saved greeting with a parallel segmented Scan.
+
+        Each segment is scanned on its own thread, through its own client
+        of the EXPORT_CLIENT_PROFILE profile.
+
+        Args:
+            segments: Number of segments scanned in parallel
+
+        Returns:
+            Iterator over the greetings; closing it stops the scan
+
+        Raises:
+            ValueError: If segments is lower than 1
+        """
+        profile = get_client_profile(EXPORT_CLIENT_PROFILE)
+        pages = parallel_scan(
+            lambda **request: (
+                aws_clients.resource("dynamodb", profile)
+                .Table(self.table_name)
+                .scan(**request)
+            ),
+            segments,
+            **capacity_options(self.report_capacity),
+        )
+        return self._exported_greetings(pages)
+
+    @tracer.trace()
+    def put_greetings(self, greetings: Sequence[HelloWorld]) -> PutResult:
+        """
+        Write loaded greetings.
+
+        A greeting without a version is a seed: seeds are written in one
+        BatchWriteItem call, at version 1, replacing any stored greeting.
+        Greetings with a version are written in one TransactWriteItems
+        call, each only if the stored greeting is older or equal to it
+        (see ``build_put_request``), so that a load never rolls back the
+        version optimistic locking relies on, yet can write a greeting
+        again. If any of them is refused, none of them is written.
+        Transactional writes consume twice the write capacity of plain
+        ones, which is why seeds do without.
+
+        Nothing is retried here: the caller resubmits the unprocessed
+        greetings, at a pace of its choosing.
+
+        Args:
+            greetings: Up to MAX_BATCH_WRITE_ITEMS greetings with distinct names
+
+        Returns:
+            The greetings refused, and those not written: those throttled
+            or left unprocessed, and the other greetings with a version if
+            some were refused
+
+        Raises:
+            ValueError: If there are too many greetings for one call
+        """
+        if len(greetings) > MAX_BATCH_WRITE_ITEMS:
+            msg = (
+                f"At most {MAX_BATCH_WRITE_ITEMS} greetings per batch, "
+                f"got {len(greetings)}"
+            )
+            raise ValueError(msg)
+        seeds = [greeting for greeting in greetings if greeting.version is None]
+        versioned = [greeting for greeting in greetings if greeting.version is not None]
+        unprocessed = self._write_seeds(seeds) if seeds else []
+        if not versioned:
+            return PutResult(unprocessed, [])
+        result = self._transact_puts(versioned)
+        return PutResult(unprocessed + result.unprocessed, result.conflicts)
+
+    def _write_seeds(self, seeds: list[HelloWorld]) -> list[HelloWorld]:
+        """Write seeds in a BatchWriteItem call, returning those not written."""
+        requests = [
+            {
+                "PutRequest": {
+                    "Item": build_seed_item(seed.to_dict(self.timestamp_format))
+                }
+            }
+            for seed in seeds
+        ]
+        try:
+            with metrics.timer("BatchWriteItemLatency"):
+                response = self.dynamodb.meta.client.batch_write_item(
+                    RequestItems={self.table_name: requests},
+                    **capacity_options(self.report_capacity),
+                )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in THROTTLING_ERROR_CODES:
+                metrics.add_count("BatchWriteItemThrottles")
+                return seeds
+            print(f"Error writing greetings: {e!s}")
+            metrics.add_count("BatchWriteItemErrors")
             raise
+        self._record_capacity(response, "BatchWriteItem")
+        left = {
+            request["PutRequest"]["Item"][KEY_ATTRIBUTE]
+            for request in response.get("UnprocessedItems", {}).get(self.table_name, [])
+        }
+        if left:
+            metrics.add_count("BatchWriteItemUnprocessed", len(left))
+        return [seed for seed in seeds if seed.name in left]
+
+    def _transact_puts(self, greetings: list[HelloWorld]) -> PutResult:
+        """Write greetings with a version in a TransactWriteItems call."""
+        requests = [
+            {
+                "Put": {
+                    "TableName": self.table_name,
+                    **build_put_request(greeting.to_dict(self.timestamp_format)),
+                }
+            }
+            for greeting in greetings
+        ]
+        try:
+            with metrics.timer("TransactWriteItemsLatency"):
+                response = self.dynamodb.meta.client.transact_write_items(
+                    TransactItems=requests,
+                    **capacity_options(self.report_capacity),
+                )
+        except ClientError as e:
+            code = e.response.get("Error", {}).get("Code")
+            if code in THROTTLING_ERROR_CODES:
+                metrics.add_count("TransactWriteItemsThrottles")
+                return PutResult(list(greetings), [])
+            if code == TRANSACTION_CANCELED:
+                return _canceled_put(greetings, e.response)
+            print(f"Error writing greetings: {e!s}")
+            metrics.add_count("TransactWriteItemsErrors")
+            raise
+        self._record_capacity(response, "TransactWriteItems")
+        return PutResult([], [])
+
+    def _exported_greetings(self, pages: Iterator[dict]) -> Iterator[HelloWorld]:
+        """Convert Scan pages into greetings, recording their capacity."""
+        with contextlib.closing(pages):
+            for page in pages:
+                metrics.add_count("ScanPages")
+                self._record_capacity(page, "Scan")
+                for item in page["Items"]:
+                    yield HelloWorld.from_dict(item)
+
+    def _get_item(self, profile: ClientProfile, **request: Any) -> dict:
+        """
+        Read an item, hedging the read if a hedging policy is set.
+
+        Args:
+            profile: Client profile of the read
+            **request: GetItem request
+
+        Returns:
+            GetItem response
+        """
+        if self.hedging is None:
+            return self._table(profile).get_item(**request)
+
+        # Requests run on the policy's threads, each with its own resource
+        result = self.hedging.call(
+            lambda: (
+                aws_clients.resource("dynamodb", profile)
+                .Table(self.table_name)
+                .get_item(**request)
+            )
+        )
+        with self._counters_lock:
+            self.hedges_issued += result.hedged
+            self.hedges_won += result.hedge_won
+        if result.hedged:
+            metrics.add_count("GetItemHedges")
+        if result.hedge_won:
+            metrics.add_count("GetItemHedgeWins")
+        return result.value
+
+    def _profile_within_deadline(self) -> ClientProfile:
+        """
+        Get a client profile whose worst case fits the deadline.
+
+        Returns:
+            The adapter's profile, or one derived to fit the time left
+
+        Raises:
+            DeadlineExceededError: If too little time is left for a call
+        """
+        deadline = current_deadline()
+        if deadline is None:
+            return self.client_profile
+        profile = self.client_profile.within(deadline.remaining())
+        if profile is None:
+            msg = "Too little time left to call DynamoDB"
+            raise DeadlineExceededError(msg)
+        return profile
+
+    def _table(self, profile: ClientProfile) -> Any:
+        """Get the table through the calling thread's resource of a profile."""
+        return aws_clients.resource("dynamodb", profile).Table(self.table_name)
+
+    def _record_capacity(self, response: dict, operation: str) -> None:
+        """Report and accumulate the capacity consumed by a call."""
+        if self.report_capacity:
+            units = record_consumed_capacity(response, operation)
+            with self._counters_lock:
+                self.consumed_capacity_units += units
+
+
+def _canceled_put(greetings: Sequence[HelloWorld], response: dict) -> PutResult:
+    """Split the greetings of a canceled transaction by the reason of each."""
+    reasons = response.get("CancellationReasons", [])
+    refused = {
+        greeting.name
+        for greeting, reason in zip(greetings, reasons, strict=False)
+        if reason.get("Code") == CONDITIONAL_CHECK_FAILED_REASON
+    }
+    if refused:
+        metrics.add_count("TransactWriteItemsConflicts", len(refused))
+    else:
+        # Conflicting transactions or throttled items
+        metrics.add_count("TransactWriteItemsCanceled")
+    return PutResult(
+        [greeting for greeting in greetings if greeting.name not in refused],
+        [greeting for greeting in greetings if greeting.name in refused],
+    )
@@ -0,0 +1,467 @@
+"""
+In-memory adapter for hello world storage.
+
+A reference implementation of ``HelloWorldPort`` without any I/O: the
+zero-cost baseline of domain benchmarks and a deterministic backend for
+load simulations. It follows the semantics of the DynamoDB adapter (upserts
+keeping the creation time, version counting and checks, recency listing
+with opaque continuation tokens), so it passes the same contract tests.
+
+Latency and errors can be injected into every call with a ``FaultProfile``.
+The stored greetings can be snapshotted to a file and restored from it.
+"""
+
+import base64
+import bisect
+import json
+import mmap
+import random
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from models.hello_world_model import HelloWorld
+from ports.hello_world_port import (
+    DEFAULT_EXPORT_SEGMENTS,
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    GreetingCatalogPort,
+    GreetingPage,
+    HelloWorldPort,
+    PutResult,
+    ReadConsistency,
+    VersionConflictError,
+)
+
+# Constants
+KEY_ATTRIBUTE = "name"
+GREETING_ATTRIBUTE = "greeting"
+UPDATED_AT_ATTRIBUTE = "updated_at"
+VERSION_ATTRIBUTE = "version"
+# Attributes every snapshot line must hold
+SNAPSHOT_ATTRIBUTES = frozenset(
+    {KEY_ATTRIBUTE, UPDATED_AT_ATTRIBUTE, VERSION_ATTRIBUTE}
+)
+# Most greetings a single put_greetings call accepts, as in DynamoDB
+MAX_BATCH_WRITE_ITEMS = 25
+MILLISECONDS = 1000
+
+# Position of a greeting in the recency listing: (updated_at, name)
+RecencyKey = tuple[str, str]
+RECENCY_KEY_PARTS = 2
+
+
+class InjectedFaultError(Exception):
+    """Raised by a call failed on purpose by a fault profile."""
+
+    def __init__(self, operation: str):
+        """
+        Initialize the error.
+
+        Args:
+            operation: Name of the failed adapter method
+        """
+        self.operation = operation
+        super().__init__(f"Injected failure of {operation}")
+
+
+@dataclass(frozen=True)
+class FaultProfile:
+    """
+    Latency and errors injected into every call of the in-memory adapter.
+
+    Calls are delayed first, then fail with probability ``error_rate``.
+    With a seed, the same sequence of calls fails the same way every run.
+    """
+
+    # Delay of every call in milliseconds, or a callable returning the
+    # delay of the next call
+    latency_ms: float | Callable[[], float] = 0.0
+    # Share of calls raising InjectedFaultError, between 0 and 1
+    error_rate: float = 0.0
+    seed: int | None = None
+
+    def __post_init__(self):
+        """
+        Validate the error rate.
+
+        Raises:
+            ValueError: If error_rate is not between 0 and 1
+        """
+        if not 0.0 <= self.error_rate <= 1.0:
+            msg = f"error_rate must be between 0 and 1, got {self.error_rate}"
+            raise ValueError(msg)
+
+
+class InMemoryHelloWorldAdapter(HelloWorldPort, GreetingCatalogPort):
+    """
+    Thread-safe in-memory adapter for storing hello world data.
+
+    Greetings are kept as stored items, the dictionaries the DynamoDB
+    adapter writes with ISO timestamps, alongside a list of their recency
+    keys kept sorted for listings. A single lock guards both; injected
+    latency is spent outside of it, so concurrent callers overlap their
+    delays as they would their network waits.
+    """
+
+    def __init__(self, faults: FaultProfile | None = None):
+        """
+        Initialize the in-memory adapter.
+
+        Args:
+            faults: Latency and errors injected into every call (none if None)
+        """
+        self.faults = faults or FaultProfile()
+        self.calls = 0
+        self._items: dict[str, dict[str, Any]] = {}
+        self._recency: list[RecencyKey] = []
+        self._lock = threading.Lock()
+        self._random = random.Random(self.faults.seed)
+
+    def get_saved_greeting(
+        self,
+        name: str,
+        fields: Sequence[str] | None = None,
+        consistency: ReadConsistency = ReadConsistency.EVENTUAL,
+    ) -> HelloWorld:
+        """
+        Get a greeting for a name.
+
+        Every read is strongly consistent.
+
+        Args:
+            name: The name to greet
+            fields: Attributes to read, or None for all of them
+            consistency: Eventually or strongly consistent read
+
+        Returns:
+            HelloWorld model with greeting data
+        """
+        self._inject("get_saved_greeting")
+        with self._lock:
+            item = self._items.get(name)
+        if item is None:
+            return HelloWorld(name=name, greeting=None)  # Will use default greeting
+        return HelloWorld.from_dict(_project(item, fields))
+
+    def get_saved_greetings(
+        self,
+        names: list[str],
+        fields: Sequence[str] | None = None,
+        consistency: ReadConsistency = ReadConsistency.EVENTUAL,
+    ) -> list[HelloWorld]:
+        """
+        Get the greetings for several names in a single call.
+
+        Args:
+            names: The names to greet
+            fields: Attributes to read, or None for all of them
+            consistency: Eventually or strongly consistent read
+
+        Returns:
+            HelloWorld models in the same order as ``names``
+        """
+        self._inject("get_saved_greetings")
+        with self._lock:
+            items = [self._items.get(name) for name in names]
+        return [
+            HelloWorld(name=name, greeting=None)
+            if item is None
+            else HelloWorld.from_dict(_project(item, fields))
+            for name, item in zip(names, items, strict=True)
+        ]
+
+    def save_greeting(self, greeting: HelloWorld) -> None:
+        """
+        Save a greeting, keeping its creation time and counting its version.
+
+        Args:
+            greeting: HelloWorld model to save
+
+        Raises:
+            VersionConflictError: If ``greeting.version`` is no longer current
+        """
+        self._inject("save_greeting")
+        greeting.updated_at = datetime.now(UTC)
+        item = greeting.to_dict()
+        with self._lock:
+            stored = self._items.get(greeting.name)
+            # Version 0 stands for a greeting that does not exist yet
+            stored_version = 0 if stored is None else stored[VERSION_ATTRIBUTE]
+            if greeting.version is not None and greeting.version != stored_version:
+                raise VersionConflictError(greeting.name, greeting.version)
+            if stored is not None:
+                item["created_at"] = stored["created_at"]
+            item[VERSION_ATTRIBUTE] = stored_version + 1
+            self._store(item)
+        greeting.created_at = HelloWorld.from_dict(item).created_at
+        greeting.version = item[VERSION_ATTRIBUTE]
+
+    def put_greetings(self, greetings: Sequence[HelloWorld]) -> PutResult:
+        """
+        Write loaded greetings.
+
+        As in DynamoDB, a greeting without a version is a seed, written at
+        version 1 whatever is stored. Greetings with a version are written
+        all or none of them, each only if the stored greeting is older or
+        equal to it.
+
+        Args:
+            greetings: Up to MAX_BATCH_WRITE_ITEMS greetings with distinct names
+
+        Returns:
+            The greetings refused, and the other greetings with a version as
+            not written if any were
+
+        Raises:
+            ValueError: If there are too many greetings for one call
+        """
+        if len(greetings) > MAX_BATCH_WRITE_ITEMS:
+            msg = (
+                f"At most {MAX_BATCH_WRITE_ITEMS} greetings per batch, "
+                f"got {len(greetings)}"
+            )
+            raise ValueError(msg)
+        self._inject("put_greetings")
+        items = [greeting.to_dict() for greeting in greetings]
+        seeds = [item for item in items if VERSION_ATTRIBUTE not in item]
+        versioned = [item for item in items if VERSION_ATTRIBUTE in item]
+        with self._lock:
+            for item in seeds:
+                self._store({**item, VERSION_ATTRIBUTE: 1})
+            refused = {
+                item[KEY_ATTRIBUTE]
+                for item in versioned
+                if not _replaces(self._items.get(item[KEY_ATTRIBUTE]), item)
+            }
+            if refused:
+                return PutResult(
+                    [
+                        g
+                        for g in greetings
+                        if g.version is not None and g.name not in refused
+                    ],
+                    [g for g in greetings if g.name in refused],
+                )
+            for item in versioned:
+                self._store(item)
+        return PutResult([], [])
+
+    def list_greetings(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        continuation_token: str | None = None,
+    ) -> GreetingPage:
+        """
+        List saved greetings, most recently updated first.
+
+        Args:
+            page_size: Maximum number of greetings in the page
+            continuation_token: ``next_token`` of the previous page, or None
+
+        Returns:
+            The page of greetings
+
+        Raises:
+            ValueError: If page_size is out of range or the token is invalid
+        """
+        if not 1 <= page_size <= MAX_PAGE_SIZE:
+            msg = f"page_size must be between 1 and {MAX_PAGE_SIZE}, got {page_size}"
+            raise ValueError(msg)
+        start_key = _decode_token(continuation_token)
+        self._inject("list_greetings")
+        with self._lock:
+            end = (
+                len(self._recency)
+                if start_key is None
+                else bisect.bisect_left(self._recency, start_key)
+            )
+            begin = max(0, end - page_size)
+            keys = self._recency[begin:end][::-1]
+            items = [self._items[name] for _, name in keys]
+        return GreetingPage(
+            [HelloWorld.from_dict(item) for item in items],
+            _encode_token(keys[-1]) if begin else None,
+        )
+
+    def export_greetings(
+        self, segments: int = DEFAULT_EXPORT_SEGMENTS
+    ) -> Iterator[HelloWorld]:
+        """
+        Stream every saved greeting, as stored when the export started.
+
+        Args:
+            segments: Number of parts of the greetings read in parallel,
+                only validated here
+
+        Returns:
+            Iterator over the greetings
+
+        Raises:
+            ValueError: If segments is lower than 1
+        """
+        if segments < 1:
+            msg = f"segments must be at least 1, got {segments}"
+            raise ValueError(msg)
+        self._inject("export_greetings")
+        with self._lock:
+            items = list(self._items.values())
+        return (HelloWorld.from_dict(item) for item in items)
+
+    def snapshot(self, path: Path) -> int:
+        """
+        Write every stored greeting to a snapshot file.
+
+        The file holds one JSON item per line. It is written next to its
+        destination, then moved into place, so that a crash never leaves a
+        partial snapshot behind.
+
+        Args:
+            path: Snapshot file
+
+        Returns:
+            Number of greetings written
+        """
+        with self._lock:
+            items = list(self._items.values())
+        temporary = path.with_name(f"{path.name}.tmp")
+        with temporary.open("w", encoding="utf-8") as file:
+            for item in items:
+                file.write(json.dumps(item, separators=(",", ":")) + "\n")
+        temporary.replace(path)
+        return len(items)
+
+    def restore(self, path: Path) -> int:
+        """
+        Replace the stored greetings with those of a snapshot file.
+
+        The file is memory-mapped and parsed line by line, so a large
+        snapshot is never copied into memory as a whole.
+
+        Args:
+            path: Snapshot file written by ``snapshot``
+
+        Returns:
+            Number of greetings restored
+
+        Raises:
+            ValueError: If a line of the file is not a greeting item
+        """
+        items = []
+        with path.open("rb") as file:
+            if path.stat().st_size:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    items = [_parse_item(line) for line in iter(mapped.readline, b"")]
+        with self._lock:
+            self._items.clear()
+            self._recency.clear()
+            for item in items:
+                self._store(item)
+        return len(items)
+
+    def _store(self, item: dict[str, Any]) -> None:
+        """Store an item and move it in the recency listing; hold the lock."""
+        stored = self._items.get(item[KEY_ATTRIBUTE])
+        if stored is not None:
+            index = bisect.bisect_left(self._recency, _recency_key(stored))
+            del self._recency[index]
+        self._items[item[KEY_ATTRIBUTE]] = item
+        bisect.insort(self._recency, _recency_key(item))
+
+    def _inject(self, operation: str) -> None:
+        """
+        Count a call, then delay or fail it as set by the fault profile.
+
+        Raises:
+            InjectedFaultError: If the call is picked to fail
+        """
+        faults = self.faults
+        with self._lock:
+            self.calls += 1
+            fails = bool(faults.error_rate) and (
+                self._random.random() < faults.error_rate
+            )
+        latency_ms = (
+            faults.latency_ms() if callable(faults.latency_ms) else faults.latency_ms
+        )
+        if latency_ms > 0:
+            time.sleep(latency_ms / MILLISECONDS)
+        if fails:
+            raise InjectedFaultError(operation)
+
+
+def _recency_key(item: dict[str, Any]) -> RecencyKey:
+    """Get the position of an item in the recency listing."""
+    return (str(item[UPDATED_AT_ATTRIBUTE]), item[KEY_ATTRIBUTE])
+
+
+def _replaces(stored: dict[str, Any] | None, item: dict[str, Any]) -> bool:
+    """Tell whether a loaded item with a version may replace the stored one."""
+    if stored is None:
+        return True
+    stored_version = stored.get(VERSION_ATTRIBUTE)
+    if stored_version is None or stored_version < item[VERSION_ATTRIBUTE]:
+        return True
+    # Written before, e.g. by a load resumed from an older checkpoint
+    return stored_version == item[VERSION_ATTRIBUTE] and stored.get(
+        GREETING_ATTRIBUTE
+    ) == item.get(GREETING_ATTRIBUTE)
+
+
+def _project(item: dict[str, Any], fields: Sequence[str] | None) -> dict[str, Any]:
+    """Keep the key and the requested attributes of an item."""
+    if fields is None:
+        return item
+    return {
+        attribute: value
+        for attribute, value in item.items()
+        if attribute == KEY_ATTRIBUTE or attribute in fields
+    }
+
+
+def _encode_token(key: RecencyKey) -> str:
+    """Encode the last listed position as a continuation token."""
+    encoded = json.dumps(list(key), separators=(",", ":"))
+    return base64.urlsafe_b64encode(encoded.encode()).decode()
+
+
+def _decode_token(token: str | None) -> RecencyKey | None:
+    """
+    Decode a continuation token into the position a listing resumes before.
+
+    Raises:
+        ValueError: If the token was not produced by a listing
+    """
+    if token is None:
+        return None
+    try:
+        key = json.loads(base64.urlsafe_b64decode(token))
+        if not (
+            isinstance(key, list)
+            and len(key) == RECENCY_KEY_PARTS
+            and all(isinstance(part, str) for part in key)
+        ):
+            msg = "unexpected position"
+            raise ValueError(msg)
+    except ValueError as e:
+        msg = "Invalid continuation token"
+        raise ValueError(msg) from e
+    return (key[0], key[1])
+
+
+def _parse_item(line: bytes) -> dict[str, Any]:
+    """
+    Parse a snapshot line into a stored item.
+
+    Raises:
+        ValueError: If the line is not a greeting item
+    """
+    item = json.loads(line)
+    if not isinstance(item, dict) or not item.keys() >= SNAPSHOT_ATTRIBUTES:
+        msg = f"Invalid snapshot line: {line[:80]!r}"
+        raise ValueError(msg)
+    return item
@@ -0,0 +1,59 @@
+"""
+Local parameter adapter standing in for Parameter Store.
+"""
+
+import json
+from pathlib import Path
+
+from ports.parameter_port import ParameterPort
+
+
+class LocalParameterAdapter(ParameterPort):
+    """
+    Parameter adapter backed by a dictionary, for local runs and tests.
+    """
+
+    def __init__(self, values: dict[str, str] | None = None):
+        """
+        Initialize the local parameter adapter.
+
+        Args:
+            values: Parameter values by name (empty if not provided)
+        """
+        self.values = dict(values or {})
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "LocalParameterAdapter":
+        """
+        Create an adapter from a JSON file mapping names to values.
+
+        Args:
+            path: Path of the JSON file
+
+        Returns:
+            Local parameter adapter
+        """
+        with Path(path).open(encoding="utf-8") as file:
+            return cls({name: str(value) for name, value in json.load(file).items()})
+
+    def get_parameter(self, name: str) -> str | None:
+        """
+        Get a parameter value.
+
+        Args:
+            name: Parameter name
+
+        Returns:
+            The parameter value, or None if the parameter does not exist
+        """
+        return self.values.get(name)
+
+    def put_parameter(self, name: str, value: str) -> None:
+        """
+        Set a parameter value.
+
+        Args:
+            name: Parameter name
+            value: Parameter value
+        """
+        self.values[name] = value
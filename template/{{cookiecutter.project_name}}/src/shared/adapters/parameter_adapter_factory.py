@@ -0,0 +1,31 @@
+"""
+Selection of the parameter adapter settings are read from.
+"""
+
+from config.config_service import config
+from ports.parameter_port import ParameterPort
+from utils.lazy_import import lazy_import
+
+# Loaded on first use, so only the selected adapter is imported
+local_parameter_adapter = lazy_import("adapters.local_parameter_adapter")
+ssm_parameter_adapter = lazy_import("adapters.ssm_parameter_adapter")
+
+
+def create_parameter_adapter() -> ParameterPort | None:
+    """
+    Create the parameter adapter selected through ConfigService.
+
+    Values are not cached here: ConfigService reads them once per settings
+    snapshot, and reloads the snapshot after its TTL.
+
+    Returns:
+        None if HELLO_WORLD_PARAMETER_PREFIX is unset; otherwise the local
+        adapter if HELLO_WORLD_LOCAL_PARAMETERS_FILE is set, or the
+        Parameter Store adapter
+    """
+    if not config.get_optional(config.HELLO_WORLD_PARAMETER_PREFIX):
+        return None
+    local_file = config.get_optional(config.HELLO_WORLD_LOCAL_PARAMETERS_FILE)
+    if local_file:
+        return local_parameter_adapter.LocalParameterAdapter.from_file(local_file)
+    return ssm_parameter_adapter.SsmParameterAdapter()
@@ -0,0 +1,312 @@
+"""
+Bloom filter of saved names in front of a hello world port.
+"""
+
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from models.hello_world_model import HelloWorld
+from observability.metrics import MetricUnit, metrics
+from ports.hello_world_port import HelloWorldPort, ReadConsistency
+from utils.bloom_filter import BloomFilter
+from utils.lazy_import import lazy_import
+
+# Loaded on first use, so importing the adapter does not import the AWS SDK
+storage_adapter = lazy_import("adapters.hello_world_storage_adapter")
+aws_client_factory = lazy_import("adapters.aws_client_factory")
+
+# Constants
+# Snapshot locations with this prefix are S3 objects (s3://bucket/key)
+S3_SCHEME = "s3://"
+# DynamoDB Streams events that leave a saved greeting behind
+SAVE_EVENT_NAMES = frozenset({"INSERT", "MODIFY"})
+# Shortest interval between attempts to reload a stale snapshot
+RELOAD_INTERVAL_SECONDS = 30.0
+# Names recorded this long before a reloaded snapshot was taken are added to
+# it again, as their save may have landed after the export read past them
+RECORDED_NAMES_MARGIN = timedelta(minutes=5)
+
+
+class SavedNamesFilterAdapter(HelloWorldPort):
+    """
+    ``HelloWorldPort`` answering reads of never-saved names without I/O.
+
+    A Bloom filter holds every name with a saved greeting. A name that is
+    not in the filter gets the default greeting straight away; any other
+    name is read from the wrapped port, so false positives only cost the
+    read they would have cost anyway.
+
+    The filter must not miss a saved name, yet names saved by other
+    execution environments after its snapshot was taken are not in it.
+    With ``max_age_seconds``, the filter is only trusted while its snapshot
+    (``BloomFilter.as_of``) is younger than that: past it, reads go to the
+    wrapped port, and ``reload`` is called at most every
+    RELOAD_INTERVAL_SECONDS until it returns a fresh snapshot (see
+    ``tools.saved_names_snapshot``). Names saved through this adapter are
+    recorded before they are written, and carried over to the reloaded
+    filter; ``record_saved_names`` adds names saved elsewhere, e.g. read
+    from the stream of the greetings table.
+    """
+
+    def __init__(
+        self,
+        saved_names: BloomFilter,
+        port: HelloWorldPort = None,
+        *,
+        max_age_seconds: float | None = None,
+        reload: Callable[[], BloomFilter | None] | None = None,
+    ):
+        """
+        Initialize the adapter with dependency injection.
+
+        Args:
+            saved_names: Filter of the names with a saved greeting
+            port: Port to read and save greetings through (optional)
+            max_age_seconds: Age of the snapshot past which the filter is
+                bypassed, or None to always trust it
+            reload: Loader of the latest snapshot (optional)
+        """
+        self.saved_names = saved_names
+        # Default to HelloWorldStorageAdapter if no port is provided
+        self.port = port or storage_adapter.HelloWorldStorageAdapter()
+        self.max_age = (
+            None if max_age_seconds is None else timedelta(seconds=max_age_seconds)
+        )
+        self._reload = reload
+        self._next_reload = 0.0
+        # Names recorded here, by the time they were recorded
+        self._recorded: dict[str, datetime] = {}
+        self._lock = threading.Lock()
+
+    def get_saved_greeting(
+        self,
+        name: str,
+        fields: Sequence[str] | None = None,
+        consistency: ReadConsistency = ReadConsistency.EVENTUAL,
+    ) -> HelloWorld:
+        """
+        Get a greeting for a name, skipping the read if it was never saved.
+
+        Args:
+            name: The name to greet
+            fields: Attributes to read, or None for all of them
+            consistency: Eventually or strongly consistent read
+
+        Returns:
+            HelloWorld model with greeting data
+        """
+        saved_names = self._current_filter()
+        if saved_names is not None and name not in saved_names:
+            metrics.add_count("SavedNamesFilterSkippedReads")
+            return HelloWorld(name=name, greeting=None)  # Will use default greeting
+        return self.port.get_saved_greeting(name, fields, consistency)
+
+    def get_saved_greetings(
+        self,
+        names: list[str],
+        fields: Sequence[str] | None = None,
+        consistency: ReadConsistency = ReadConsistency.EVENTUAL,
+    ) -> list[HelloWorld]:
+        """
+        Get the greetings for several names, reading only the saved ones.
+
+        Args:
+            names: The names to greet
+            fields: Attributes to read, or None for all of them
+            consistency: Eventually or strongly consistent read
+
+        Returns:
+            HelloWorld models in the same order as ``names``
+        """
+        saved_names = self._current_filter()
+        saved = [name for name in names if saved_names is None or name in saved_names]
+        skipped = len(names) - len(saved)
+        if skipped:
+            metrics.add_count("SavedNamesFilterSkippedReads", skipped)
+
+        found = {}
+        if saved:
+            greetings = self.port.get_saved_greetings(saved, fields, consistency)
+            found = {greeting.name: greeting for greeting in greetings}
+        return [
+            found.get(name) or HelloWorld(name=name, greeting=None) for name in names
+        ]
+
+    def save_greeting(self, greeting: HelloWorld) -> None:
+        """
+        Save a greeting, recording its name first.
+
+        Args:
+            greeting: HelloWorld model to save
+        """
+        self.record_saved_names([greeting.name])
+        self.port.save_greeting(greeting)
+
+    def record_saved_names(self, names: Iterable[str]) -> None:
+        """
+        Add names saved elsewhere, e.g. by other execution environments.
+
+        Args:
+            names: Names that now have a saved greeting
+        """
+        recorded_at = datetime.now(UTC)
+        with self._lock:
+            for name in names:
+                self.saved_names.add(name)
+                self._recorded[name] = recorded_at
+
+    def _current_filter(self) -> BloomFilter | None:
+        """Get the filter, or None while its snapshot is too old to trust."""
+        if self.max_age is None or self._is_fresh(self.saved_names):
+            return self.saved_names
+        self._reload_if_due()
+        if self._is_fresh(self.saved_names):
+            return self.saved_names
+        metrics.add_count("SavedNamesFilterStaleReads")
+        return None
+
+    def _is_fresh(self, saved_names: BloomFilter) -> bool:
+        """Check whether the snapshot of a filter is younger than the max age."""
+        return (
+            saved_names.as_of is not None
+            and datetime.now(UTC) - saved_names.as_of <= self.max_age
+        )
+
+    def _reload_if_due(self) -> None:
+        """Replace the filter with the latest snapshot, if it is time to try."""
+        if self._reload is None or time.monotonic() < self._next_reload:
+            return
+        with self._lock:
+            if time.monotonic() < self._next_reload:
+                return
+            self._next_reload = time.monotonic() + RELOAD_INTERVAL_SECONDS
+            try:
+                reloaded = self._reload()
+            except (OSError, ValueError) as e:
+                print(f"Error reloading saved names: {e!s}")
+                metrics.add_count("SavedNamesFilterReloadErrors")
+                return
+            if reloaded is None or reloaded.as_of is None:
+                return
+            current = self.saved_names.as_of
+            if current is not None and reloaded.as_of <= current:
+                return
+            cutoff = reloaded.as_of - RECORDED_NAMES_MARGIN
+            self._recorded = {
+                name: recorded_at
+                for name, recorded_at in self._recorded.items()
+                if recorded_at >= cutoff
+            }
+            reloaded.update(self._recorded)
+            self.saved_names = reloaded
+
+
+def saved_names_from_stream(records: Iterable[dict]) -> list[str]:
+    """
+    Get the saved names from DynamoDB Streams records of the greetings table.
+
+    Args:
+        records: ``Records`` of a DynamoDB Streams event
+
+    Returns:
+        Names inserted or modified by the records
+    """
+    return [
+        record["dynamodb"]["Keys"]["name"]["S"]
+        for record in records
+        if record.get("eventName") in SAVE_EVENT_NAMES
+    ]
+
+
+def load_saved_names(snapshot: str | None) -> BloomFilter | None:
+    """
+    Load the saved-names filter from a snapshot.
+
+    The snapshot is an S3 object (``s3://bucket/key``), so that every
+    execution environment reloads the one the builder last wrote, or a
+    local file, e.g. packaged with the function. The snapshot size and
+    estimated false-positive rate are recorded as metrics with the next
+    flush.
+
+    Args:
+        snapshot: Location of a snapshot written by ``BloomFilter.to_bytes``,
+            or None
+
+    Returns:
+        The filter, or None if no snapshot is configured
+
+    Raises:
+        OSError: If the snapshot cannot be read
+        ValueError: If the location or the filter is invalid
+    """
+    if not snapshot:
+        return None
+    saved_names = BloomFilter.from_bytes(read_snapshot(snapshot))
+    metrics.add_value("SavedNamesFilterSize", saved_names.size_bytes, MetricUnit.BYTES)
+    metrics.add_value(
+        "SavedNamesFilterFalsePositiveRate", saved_names.false_positive_rate
+    )
+    return saved_names
+
+
+def read_snapshot(location: str) -> bytes:
+    """
+    Read a snapshot from S3 or from a file.
+
+    Args:
+        location: ``s3://bucket/key`` or a file path
+
+    Returns:
+        The snapshot bytes
+
+    Raises:
+        OSError: If the snapshot cannot be read
+    """
+    if not location.startswith(S3_SCHEME):
+        return Path(location).read_bytes()
+    # Imported here so that only S3 snapshots import the AWS SDK
+    from botocore.exceptions import ClientError  # noqa: PLC0415
+
+    bucket, key = _split_s3_location(location)
+    try:
+        response = aws_client_factory.aws_clients.client("s3").get_object(
+            Bucket=bucket, Key=key
+        )
+        return response["Body"].read()
+    except ClientError as e:
+        msg = f"Cannot read {location}: {e!s}"
+        raise OSError(msg) from e
+
+
+def write_snapshot(saved_names: BloomFilter, location: str) -> None:
+    """
+    Write a snapshot atomically, so a reader never sees it half written.
+
+    Args:
+        saved_names: Filter to write
+        location: ``s3://bucket/key`` or a file path
+    """
+    data = saved_names.to_bytes()
+    if location.startswith(S3_SCHEME):
+        bucket, key = _split_s3_location(location)
+        # An S3 object is replaced as a whole
+        aws_client_factory.aws_clients.client("s3").put_object(
+            Bucket=bucket, Key=key, Body=data
+        )
+        return
+    path = Path(location)
+    staging = path.with_name(f"{path.name}.tmp")
+    staging.write_bytes(data)
+    staging.replace(path)
+
+
+def _split_s3_location(location: str) -> tuple[str, str]:
+    """Split ``s3://bucket/key`` into the bucket and the key."""
+    bucket, _, key = location.removeprefix(S3_SCHEME).partition("/")
+    if not bucket or not key:
+        msg = f"Expected s3://bucket/key, got {location!r}"
+        raise ValueError(msg)
+    return bucket, key
@@ -0,0 +1,70 @@
+"""
+AWS Systems Manager Parameter Store adapter.
+"""
+
+from typing import Any
+
+from adapters.aws_client_factory import aws_clients
+from botocore.exceptions import ClientError
+from ports.parameter_port import ParameterPort
+
+# Constants
+MAX_NAMES_PER_REQUEST = 10  # GetParameters limit
+
+
+class SsmParameterAdapter(ParameterPort):
+    """
+    Parameter Store adapter reading (and decrypting) parameters.
+    """
+
+    def __init__(self, client: Any = None):
+        """
+        Initialize the Parameter Store adapter.
+
+        Args:
+            client: SSM client (the shared client if not provided)
+        """
+        self.client = client or aws_clients.client("ssm")
+
+    def get_parameter(self, name: str) -> str | None:
+        """
+        Get a parameter value from Parameter Store.
+
+        Args:
+            name: Parameter name
+
+        Returns:
+            The parameter value, or None if the parameter does not exist
+        """
+        try:
+            response = self.client.get_parameter(Name=name, WithDecryption=True)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == "ParameterNotFound":
+                return None
+            print(f"Error getting parameter: {e!s}")
+            raise
+        return response["Parameter"]["Value"]
+
+    def get_parameters(self, names: list[str]) -> dict[str, str]:
+        """
+        Get several parameter values with as few requests as possible.
+
+        Args:
+            names: Parameter names
+
+        Returns:
+            Values of the parameters that exist, by name
+        """
+        values = {}
+        for start in range(0, len(names), MAX_NAMES_PER_REQUEST):
+            try:
+                response = self.client.get_parameters(
+                    Names=names[start : start + MAX_NAMES_PER_REQUEST],
+                    WithDecryption=True,
+                )
+            except ClientError as e:
+                print(f"Error getting parameters: {e!s}")
+                raise
+            for parameter in response["Parameters"]:
+                values[parameter["Name"]] = parameter["Value"]
+        return values
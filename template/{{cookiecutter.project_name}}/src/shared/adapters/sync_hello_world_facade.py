@@ -0,0 +1,99 @@
+"""
+Synchronous facade over an asynchronous hello world port.
+"""
+
+import asyncio
+from collections.abc import Coroutine, Sequence
+from typing import Any, TypeVar
+
+from models.hello_world_model import HelloWorld
+from ports.async_hello_world_port import AsyncHelloWorldPort
+from ports.hello_world_port import HelloWorldPort, ReadConsistency
+from utils.lazy_import import lazy_import
+
+# Loaded on first use, so importing the facade does not import the AWS SDK
+async_storage_adapter = lazy_import("adapters.async_hello_world_storage_adapter")
+
+T = TypeVar("T")
+
+
+class SyncHelloWorldFacade(HelloWorldPort):
+    """
+    Synchronous ``HelloWorldPort`` backed by an ``AsyncHelloWorldPort``.
+
+    The facade owns a private event loop that lives as long as the facade,
+    so a facade kept at module level reuses its connection pool across warm
+    Lambda invocations. It must not be called from a running event loop.
+    """
+
+    def __init__(self, async_port: AsyncHelloWorldPort = None):
+        """
+        Initialize the facade with dependency injection.
+
+        Args:
+            async_port: Asynchronous port to delegate to (optional)
+        """
+        # Default to AsyncHelloWorldStorageAdapter if no port is provided
+        self.async_port = (
+            async_port or async_storage_adapter.AsyncHelloWorldStorageAdapter()
+        )
+        self._loop = asyncio.new_event_loop()
+
+    def get_saved_greeting(
+        self,
+        name: str,
+        fields: Sequence[str] | None = None,
+        consistency: ReadConsistency = ReadConsistency.EVENTUAL,
+    ) -> HelloWorld:
+        """
+        Get a greeting for a name.
+
+        Args:
+            name: The name to greet
+            fields: Attributes to read, or None for all of them
+            consistency: Eventually or strongly consistent read
+
+        Returns:
+            HelloWorld model with greeting data
+        """
+        return self._run(self.async_port.get_saved_greeting(name, fields, consistency))
+
+    def get_saved_greetings(
+        self,
+        names: list[str],
+        fields: Sequence[str] | None = None,
+        consistency: ReadConsistency = ReadConsistency.EVENTUAL,
+    ) -> list[HelloWorld]:
+        """
+        Get the greetings for several names concurrently.
+
+        Args:
+            names: The names to greet
+            fields: Attributes to read, or None for all of them
+            consistency: Eventually or strongly consistent read
+
+        Returns:
+            HelloWorld models in the same order as ``names``
+        """
+        return self._run(
+            self.async_port.get_saved_greetings(names, fields, consistency)
+        )
+
+    def save_greeting(self, greeting: HelloWorld) -> None:
+        """
+        Save a greeting.
+
+        Args:
+            greeting: HelloWorld model to save
+        """
+        self._run(self.async_port.save_greeting(greeting))
+
+    def close(self) -> None:
+        """Close the asynchronous port and the private event loop."""
+        if not self._loop.is_closed():
+            self._run(self.async_port.close())
+            self._loop.close()
+
+    def _run(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine to completion on the private event loop."""
+        return self._loop.run_until_complete(coroutine)
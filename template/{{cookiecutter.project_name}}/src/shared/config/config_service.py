@@ -2,11 +2,24 @@
 Configuration service for centralized application configuration.
 
 This service provides a centralized way to access configuration values
-with strict validation and no fallbacks.
+with strict validation. Only optional tuning settings, read through
+``get_optional``, may be absent.
+
+Functions load a typed ``Settings`` snapshot once, during the init phase,
+so that a misconfigured function fails before serving a request. The
+snapshot is immutable, so the request path reads plain attributes. A
+snapshot sourced from the parameter store is replaced by a fresh one once
+HELLO_WORLD_PARAMETER_TTL_SECONDS have elapsed.
 """
 
 import logging
 import os
+import threading
+import time
+from collections.abc import Callable
+
+from config.settings import Settings, SettingsError
+from ports.parameter_port import ParameterPort
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +46,133 @@ class ConfigService:
         "HELLO_WORLD_TABLE_NAME"  # Changed from GREETINGS_TABLE_NAME
     )
 
+    # Parameter store source of settings missing from the environment
+    HELLO_WORLD_PARAMETER_PREFIX = "HELLO_WORLD_PARAMETER_PREFIX"
+    HELLO_WORLD_LOCAL_PARAMETERS_FILE = "HELLO_WORLD_LOCAL_PARAMETERS_FILE"
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the service without a settings snapshot.
+
+        Args:
+            clock: Monotonic clock in seconds, timing parameter reloads
+        """
+        self._settings: Settings | None = None
+        self._clock = clock
+        # Source of a parameter-sourced snapshot, and when to reload it
+        self._parameters: ParameterPort | None = None
+        self._reload_at: float | None = None
+        self._reload_lock = threading.Lock()
+
+    @property
+    def settings(self) -> Settings:
+        """
+        Get the settings snapshot, loading it from the environment if needed.
+
+        A parameter-sourced snapshot is reloaded once its TTL has elapsed.
+
+        Raises:
+            ConfigurationError: If the configuration is invalid
+        """
+        settings = self._settings
+        if settings is None:
+            settings = self.load()
+        elif self._reload_at is not None and self._clock() >= self._reload_at:
+            settings = self._reload()
+        return settings
+
+    def load(self, parameters: ParameterPort | None = None) -> Settings:
+        """
+        Load and validate the settings snapshot.
+
+        Values come from the environment. If a parameter source is given
+        and HELLO_WORLD_PARAMETER_PREFIX is set, settings missing from the
+        environment are read from the parameters named by the prefix
+        followed by the variable name, and read again after
+        HELLO_WORLD_PARAMETER_TTL_SECONDS.
+
+        Args:
+            parameters: Parameter source for settings missing from the environment
+
+        Returns:
+            The validated settings
+
+        Raises:
+            ConfigurationError: If the configuration is invalid
+        """
+        variables = Settings.variable_names()
+        values = {
+            field: os.environ[variable]
+            for field, variable in variables.items()
+            if variable in os.environ
+        }
+
+        prefix = os.environ.get(self.HELLO_WORLD_PARAMETER_PREFIX)
+        if not prefix:
+            parameters = None
+        if parameters is not None:
+            missing = {
+                f"{prefix}{variable}": field
+                for field, variable in variables.items()
+                if field not in values
+            }
+            for name, value in parameters.get_parameters(list(missing)).items():
+                values[missing[name]] = value
+
+        try:
+            settings = Settings.from_values(values)
+        except SettingsError as e:
+            problems = "; ".join(
+                f"{variables[field]}: {problem}"
+                for field, problem in e.problems.items()
+            )
+            error_message = f"Invalid configuration: {problems}"
+            logger.error(error_message)
+            raise ConfigurationError(error_message) from e
+
+        self._settings = settings
+        self._parameters = parameters
+        self._reload_at = (
+            None
+            if parameters is None
+            else self._clock() + settings.hello_world_parameter_ttl_seconds
+        )
+        return settings
+
+    def _reload(self) -> Settings:
+        """
+        Reload a parameter-sourced snapshot, once across threads.
+
+        A failed reload keeps the current snapshot until the next TTL, so
+        that requests are not failed by a parameter store outage.
+
+        Returns:
+            The fresh snapshot, or the current one if the reload failed
+        """
+        with self._reload_lock:
+            current = self._settings
+            if self._reload_at is not None and self._clock() < self._reload_at:
+                # Reloaded by another thread
+                return current
+            try:
+                return self.load(self._parameters)
+            except Exception:
+                logger.exception("Keeping the settings snapshot after reload failure")
+                self._reload_at = (
+                    self._clock() + current.hello_world_parameter_ttl_seconds
+                )
+                return current
+
+    def clear(self) -> None:
+        """
+        Drop the settings snapshot, so that the next access reloads it.
+
+        Needed when the environment changes, e.g. between tests.
+        """
+        self._settings = None
+        self._parameters = None
+        self._reload_at = None
+
     @staticmethod
     def get_required(key: str) -> str:
         """
@@ -54,6 +194,19 @@ class ConfigService:
             raise ConfigurationError(error_message)
         return value
 
+    @staticmethod
+    def get_optional(key: str) -> str | None:
+        """
+        Get an optional configuration value.
+
+        Args:
+            key: Configuration key (environment variable name)
+
+        Returns:
+            Configuration value, or None if it is not set
+        """
+        return os.environ.get(key)
+
 
 # Initialize singleton instance
 config = ConfigService()
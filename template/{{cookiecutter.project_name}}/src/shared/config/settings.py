@@ -0,0 +1,192 @@
+"""
+Typed configuration snapshot.
+
+Settings are validated with the standard library: the snapshot is built
+during every cold start, where importing pydantic took most of the
+handler's import time.
+"""
+
+import dataclasses
+import operator
+import types
+import typing
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+# Constants
+TRUE_VALUES = frozenset({"1", "true", "t", "yes", "y", "on"})
+FALSE_VALUES = frozenset({"0", "false", "f", "no", "n", "off"})
+# Names of the AWS client profiles (see adapters.aws_client_factory)
+CLIENT_PROFILE_NAMES = ("default", "low_latency", "high_throughput", "long_running")
+# Bounds accepted in field metadata: comparison and its description
+BOUNDS = {
+    "gt": (operator.gt, "greater than"),
+    "ge": (operator.ge, "greater than or equal to"),
+    "lt": (operator.lt, "less than"),
+    "le": (operator.le, "less than or equal to"),
+}
+
+
+class SettingsError(ValueError):
+    """Exception raised for invalid settings, with the problem of each field."""
+
+    def __init__(self, problems: dict[str, str]):
+        """
+        Initialize the error.
+
+        Args:
+            problems: Problem of each invalid setting, by field name
+        """
+        self.problems = problems
+        super().__init__(
+            "; ".join(f"{name}: {problem}" for name, problem in problems.items())
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """
+    Validated, immutable configuration of an execution environment.
+
+    Each field is read from the environment variable of the same name in
+    upper case (e.g. ``hello_world_table_name`` from HELLO_WORLD_TABLE_NAME).
+    Constraints are given as field metadata: ``min_length`` and
+    ``choices`` for strings, and the bounds of ``BOUNDS`` for numbers.
+    """
+
+    # DynamoDB table of saved greetings
+    hello_world_table_name: str = field(metadata={"min_length": 1})
+
+    # Storage format of HelloWorld timestamps (see models.hello_world_model)
+    hello_world_timestamp_format: Literal["iso", "epoch_ms"] = "iso"
+
+    # AWS client profile (see adapters.aws_client_factory.CLIENT_PROFILES)
+    hello_world_client_profile: str | None = field(
+        default=None, metadata={"choices": CLIENT_PROFILE_NAMES}
+    )
+
+    # Record DynamoDB consumed capacity as a metric
+    hello_world_report_consumed_capacity: bool = False
+
+    # Bloom filter snapshot of saved names: s3://bucket/key or a file path
+    hello_world_saved_names_snapshot: str | None = None
+
+    # Snapshot age past which it is reloaded, and bypassed until a newer loads
+    hello_world_saved_names_max_age_seconds: float = field(
+        default=300, metadata={"gt": 0}
+    )
+
+    # Hedge greeting reads slower than this latency percentile (off if unset)
+    hello_world_hedge_percentile: float | None = field(
+        default=None, metadata={"gt": 0, "lt": 100}
+    )
+
+    # Maximum ratio of hedged reads to reads
+    hello_world_hedge_max_extra_rate: float = field(
+        default=0.05, metadata={"ge": 0, "le": 1}
+    )
+
+    # CloudWatch namespace of Embedded Metric Format metrics
+    hello_world_metrics_namespace: str = field(
+        default="HelloWorld", metadata={"min_length": 1}
+    )
+
+    # Tracing backend (see observability.tracing) and root span sampling rate
+    hello_world_tracing: Literal["off", "xray", "memory"] = "off"
+    hello_world_trace_sample_rate: float = field(
+        default=1.0, metadata={"ge": 0, "le": 1}
+    )
+
+    # How long settings read from the parameter store are used before a reload
+    hello_world_parameter_ttl_seconds: float = field(default=300, metadata={"gt": 0})
+
+    @classmethod
+    def from_values(cls, values: Mapping[str, str]) -> "Settings":
+        """
+        Validate settings given as strings, as read from the environment.
+
+        Args:
+            values: Value of each set field, by field name
+
+        Returns:
+            The settings, with defaults for the fields not set
+
+        Raises:
+            SettingsError: If a required field is missing or a value is invalid
+        """
+        parsed: dict[str, Any] = {}
+        problems: dict[str, str] = {}
+        for setting in dataclasses.fields(cls):
+            if setting.name not in values:
+                if setting.default is dataclasses.MISSING:
+                    problems[setting.name] = "Field required"
+                continue
+            try:
+                value = _parse(setting.type, values[setting.name])
+                _check(value, setting.metadata)
+            except ValueError as e:
+                problems[setting.name] = str(e)
+                continue
+            parsed[setting.name] = value
+        if problems:
+            raise SettingsError(problems)
+        return cls(**parsed)
+
+    @classmethod
+    def variable_names(cls) -> dict[str, str]:
+        """
+        Get the environment variable name of each field.
+
+        Returns:
+            Environment variable names by field name
+        """
+        return {
+            setting.name: setting.name.upper() for setting in dataclasses.fields(cls)
+        }
+
+
+def _parse(annotation: Any, raw: str) -> Any:
+    """Convert a string to the type of a field, raising ValueError if invalid."""
+    if isinstance(annotation, types.UnionType):
+        # Optional fields are None only by default
+        (annotation,) = (
+            arg for arg in typing.get_args(annotation) if arg is not type(None)
+        )
+    if typing.get_origin(annotation) is Literal:
+        choices = typing.get_args(annotation)
+        if raw not in choices:
+            msg = f"Input should be one of {', '.join(map(repr, choices))}"
+            raise ValueError(msg)
+        return raw
+    if annotation is bool:
+        lowered = raw.strip().lower()
+        if lowered in TRUE_VALUES or lowered in FALSE_VALUES:
+            return lowered in TRUE_VALUES
+        msg = "Input should be a valid boolean"
+        raise ValueError(msg)
+    if annotation is float:
+        try:
+            return float(raw)
+        except ValueError:
+            msg = "Input should be a valid number"
+            raise ValueError(msg) from None
+    return raw
+
+
+def _check(value: Any, constraints: Mapping[str, Any]) -> None:
+    """Check a parsed value against the constraints of its field."""
+    min_length = constraints.get("min_length")
+    if min_length is not None and len(value) < min_length:
+        msg = f"String should have at least {min_length} characters"
+        raise ValueError(msg)
+    choices = constraints.get("choices")
+    if choices is not None and value not in choices:
+        msg = f"Input should be one of {', '.join(map(repr, choices))}"
+        raise ValueError(msg)
+    for name, (compare, description) in BOUNDS.items():
+        bound = constraints.get(name)
+        # Written so that NaN fails every bound
+        if bound is not None and not compare(value, bound):
+            msg = f"Input should be {description} {bound}"
+            raise ValueError(msg)
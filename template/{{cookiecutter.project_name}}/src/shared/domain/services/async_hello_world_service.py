@@ -0,0 +1,90 @@
+"""
+Asynchronous Hello World service implementation.
+"""
+
+from models.hello_world_model import HelloWorld
+from observability.tracing import tracer
+from ports.async_hello_world_port import AsyncHelloWorldPort
+from utils.lazy_import import lazy_import
+
+# Loaded on first use, so importing the service does not import the AWS SDK
+async_storage_adapter = lazy_import("adapters.async_hello_world_storage_adapter")
+
+# Constants
+# Only the greeting is rendered, so reads skip the timestamps and version
+GREETING_FIELDS = ("greeting",)
+
+
+class AsyncHelloWorldService:
+    """
+    Asynchronous service for managing hello world operations.
+    """
+
+    def __init__(self, hello_world_port: AsyncHelloWorldPort = None):
+        """
+        Initialize the service with dependency injection.
+
+        Args:
+            hello_world_port: Asynchronous port for hello world operations (optional)
+        """
+        # Default to AsyncHelloWorldStorageAdapter if no adapter is provided
+        self.hello_world_port = (
+            hello_world_port or async_storage_adapter.AsyncHelloWorldStorageAdapter()
+        )
+
+    @tracer.trace()
+    async def get_greeting(self, name: str) -> str:
+        """
+        Get a greeting for a name.
+
+        Args:
+            name: The name to greet
+
+        Returns:
+            A greeting message
+        """
+        greeting = await self.hello_world_port.get_saved_greeting(
+            name, fields=GREETING_FIELDS
+        )
+        return greeting.formatted_greeting
+
+    @tracer.trace()
+    async def get_greetings(self, names: list[str]) -> list[str]:
+        """
+        Get greetings for several names concurrently.
+
+        Args:
+            names: The names to greet
+
+        Returns:
+            Greeting messages in the same order as ``names``
+        """
+        greetings = await self.hello_world_port.get_saved_greetings(
+            names, fields=GREETING_FIELDS
+        )
+        return [greeting.formatted_greeting for greeting in greetings]
+
+    @tracer.trace()
+    async def save_greeting(
+        self, name: str, message: str, expected_version: int | None = None
+    ) -> int:
+        """
+        Save a greeting for a name.
+
+        The original creation time of an existing greeting is preserved.
+
+        Args:
+            name: The name to greet
+            message: The greeting message
+            expected_version: Version the caller last read, to reject
+                concurrent changes (0 to only create; None to always save)
+
+        Returns:
+            The new version of the greeting
+
+        Raises:
+            VersionConflictError: If the greeting is no longer at expected_version
+        """
+        greeting = HelloWorld(name=name, greeting=message, version=expected_version)
+        await self.hello_world_port.save_greeting(greeting)
+        return greeting.version
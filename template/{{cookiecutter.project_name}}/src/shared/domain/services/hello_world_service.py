@@ -2,9 +2,25 @@
 Hello World service implementation.
 """
 
-from adapters.hello_world_storage_adapter import HelloWorldStorageAdapter
+from collections.abc import Iterator
+
 from models.hello_world_model import HelloWorld
-from ports.hello_world_port import HelloWorldPort
+from observability.tracing import tracer
+from ports.hello_world_port import (
+    DEFAULT_EXPORT_SEGMENTS,
+    DEFAULT_PAGE_SIZE,
+    GreetingCatalogPort,
+    GreetingPage,
+    HelloWorldPort,
+)
+from utils.lazy_import import lazy_import
+
+# Loaded on first use, so importing the service does not import the AWS SDK
+storage_adapter = lazy_import("adapters.hello_world_storage_adapter")
+
+# Constants
+# Only the greeting is rendered, so reads skip the timestamps and version
+GREETING_FIELDS = ("greeting",)
 
 
 class HelloWorldService:
@@ -12,16 +28,29 @@ class HelloWorldService:
     Service for managing hello world operations.
     """
 
-    def __init__(self, hello_world_port: HelloWorldPort = None):
+    def __init__(
+        self,
+        hello_world_port: HelloWorldPort = None,
+        catalog: GreetingCatalogPort | None = None,
+    ):
         """
         Initialize the service with dependency injection.
 
         Args:
             hello_world_port: Port for hello world operations (optional)
+            catalog: Port listing the saved greetings (the hello world port
+                if it implements ``GreetingCatalogPort`` and none is given)
         """
         # Default to HelloWorldStorageAdapter if no adapter is provided
-        self.hello_world_port = hello_world_port or HelloWorldStorageAdapter()
+        self.hello_world_port = (
+            hello_world_port or storage_adapter.HelloWorldStorageAdapter()
+        )
+        if catalog is None and isinstance(self.hello_world_port, GreetingCatalogPort):
+            catalog = self.hello_world_port
+        # None when greetings cannot be listed or exported
+        self.catalog = catalog
 
+    @tracer.trace()
     def get_greeting(self, name: str) -> str:
         """
         Get a greeting for a name.
@@ -32,16 +61,96 @@ class HelloWorldService:
         Returns:
             A greeting message
         """
-        greeting = self.hello_world_port.get_saved_greeting(name)
+        greeting = self.hello_world_port.get_saved_greeting(
+            name, fields=GREETING_FIELDS
+        )
         return greeting.formatted_greeting
 
-    def save_greeting(self, name: str, message: str) -> None:
+    @tracer.trace()
+    def get_greetings(self, names: list[str]) -> list[str]:
+        """
+        Get greetings for several names.
+
+        Args:
+            names: The names to greet
+
+        Returns:
+            Greeting messages in the same order as ``names``
+        """
+        greetings = self.hello_world_port.get_saved_greetings(
+            names, fields=GREETING_FIELDS
+        )
+        return [greeting.formatted_greeting for greeting in greetings]
+
+    @tracer.trace()
+    def save_greeting(
+        self, name: str, message: str, expected_version: int | None = None
+    ) -> int:
         """
         Save a greeting for a name.
 
+        The original creation time of an existing greeting is preserved.
+
         Args:
             name: The name to greet
             message: The greeting message
+            expected_version: Version the caller last read, to reject
+                concurrent changes (0 to only create; None to always save)
+
+        Returns:
+            The new version of the greeting
+
+        Raises:
+            VersionConflictError: If the greeting is no longer at expected_version
         """
-        greeting = HelloWorld(name=name, greeting=message)
+        greeting = HelloWorld(name=name, greeting=message, version=expected_version)
         self.hello_world_port.save_greeting(greeting)
+        return greeting.version
+
+    @tracer.trace()
+    def list_greetings(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        continuation_token: str | None = None,
+    ) -> GreetingPage:
+        """
+        List saved greetings, most recently updated first.
+
+        Args:
+            page_size: Maximum number of greetings in the page
+            continuation_token: ``next_token`` of the previous page, or None
+                for the first page
+
+        Returns:
+            The page of greetings
+
+        Raises:
+            ValueError: If page_size is out of range or the token is invalid
+            LookupError: If the service has no catalog
+        """
+        return self._catalog().list_greetings(page_size, continuation_token)
+
+    def export_greetings(
+        self, segments: int = DEFAULT_EXPORT_SEGMENTS
+    ) -> Iterator[HelloWorld]:
+        """
+        Stream every saved greeting, in no particular order.
+
+        Args:
+            segments: Number of parts of the greetings read in parallel
+
+        Returns:
+            Iterator over the greetings; closing it stops the export
+
+        Raises:
+            ValueError: If segments is lower than 1
+            LookupError: If the service has no catalog
+        """
+        return self._catalog().export_greetings(segments)
+
+    def _catalog(self) -> GreetingCatalogPort:
+        """Get the catalog, raising LookupError if there is none."""
+        if self.catalog is None:
+            msg = f"{type(self.hello_world_port).__name__} cannot list greetings"
+            raise LookupError(msg)
+        return self.catalog
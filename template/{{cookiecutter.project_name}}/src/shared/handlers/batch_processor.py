@@ -0,0 +1,229 @@
+"""
+Batch processing of SQS, Kinesis and DynamoDB Streams events.
+"""
+
+import base64
+import contextvars
+import json
+from collections.abc import Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any
+
+from observability.metrics import metrics
+
+# Constants
+DEFAULT_MAX_WORKERS = 8
+# DynamoDB Streams events carrying a new image (REMOVE records have none)
+IMAGE_EVENT_NAMES = frozenset({"INSERT", "MODIFY"})
+
+
+class EventSource(StrEnum):
+    """Event sources of a batch, as named in ``eventSource``."""
+
+    SQS = "aws:sqs"
+    KINESIS = "aws:kinesis"
+    DYNAMODB = "aws:dynamodb"
+
+
+@dataclass(frozen=True, slots=True)
+class BatchRecord:
+    """A decoded record of a batch."""
+
+    source: EventSource
+    # messageId for SQS, sequence number for Kinesis and DynamoDB Streams
+    identifier: str
+    payload: dict[str, Any]
+    raw: dict[str, Any]
+
+
+def event_source(record: dict[str, Any]) -> str | None:
+    """
+    Get the event source of a record.
+
+    Records name it ``eventSource``; the ``EventSource`` spelling of SNS
+    records is accepted too.
+
+    Args:
+        record: Record of an event
+
+    Returns:
+        The event source, or None if the record names none
+    """
+    return record.get("eventSource") or record.get("EventSource")
+
+
+def decode_record(record: dict[str, Any]) -> BatchRecord:
+    """
+    Decode the payload of an event record.
+
+    SQS bodies and Kinesis data are JSON documents; DynamoDB Streams
+    records carry the new image of the item.
+
+    Args:
+        record: Record of an SQS, Kinesis or DynamoDB Streams event
+
+    Returns:
+        The decoded record
+
+    Raises:
+        ValueError: If the record is not from a supported source or its
+            payload cannot be decoded
+    """
+    source = EventSource(event_source(record))
+    if source == EventSource.SQS:
+        return BatchRecord(
+            source, record["messageId"], json.loads(record["body"]), record
+        )
+    if source == EventSource.KINESIS:
+        kinesis = record["kinesis"]
+        payload = json.loads(base64.b64decode(kinesis["data"]))
+        return BatchRecord(source, kinesis["sequenceNumber"], payload, record)
+
+    # Imported here so that only DynamoDB Streams batches import boto3
+    from boto3.dynamodb.types import TypeDeserializer  # noqa: PLC0415
+
+    stream_record = record["dynamodb"]
+    deserializer = TypeDeserializer()
+    payload = {
+        key: deserializer.deserialize(value)
+        for key, value in stream_record.get("NewImage", {}).items()
+    }
+    return BatchRecord(source, stream_record["SequenceNumber"], payload, record)
+
+
+class BatchProcessor:
+    """
+    Process the records of a batch concurrently and report partial failures.
+
+    Records are decoded, deduplicated by key (the last record of a key
+    wins, as it would when processed in order), and processed on a bounded
+    thread pool that is kept across warm invocations. The result is the
+    ``batchItemFailures`` response the event source mapping expects when
+    ReportBatchItemFailures is enabled: a record that fails, or whose key's
+    winning record fails, is reported and retried. DynamoDB Streams records
+    without a new image, such as REMOVE records, and records the ``skip``
+    predicate refuses are skipped and acknowledged.
+
+    Records are processed in copies of the caller's context, so context
+    variables such as the invocation deadline reach the workers.
+    """
+
+    def __init__(
+        self,
+        process: Callable[[BatchRecord], None],
+        key: Callable[[BatchRecord], Hashable] | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        skip: Callable[[dict[str, Any]], bool] | None = None,
+    ):
+        """
+        Initialize the processor.
+
+        Args:
+            process: Process one record, raising an exception on failure
+            key: Deduplication key of a record (no deduplication if None)
+            max_workers: Maximum number of records processed concurrently
+            skip: Tell whether a raw record is acknowledged without being
+                processed (optional)
+
+        Raises:
+            ValueError: If max_workers is lower than 1
+        """
+        if max_workers < 1:
+            msg = f"max_workers must be at least 1, got {max_workers}"
+            raise ValueError(msg)
+        self.process = process
+        self.key = key
+        self.max_workers = max_workers
+        self.skip = skip
+        self._executor: ThreadPoolExecutor | None = None
+
+    def __call__(self, event: dict[str, Any]) -> dict[str, list[dict[str, str]]]:
+        """
+        Process a batch event.
+
+        Args:
+            event: SQS, Kinesis or DynamoDB Streams event
+
+        Returns:
+            The batch item failures
+        """
+        raw_records = event.get("Records", [])
+        failed: list[str] = []
+        skipped = 0
+        # Winning record of each key, and the identifiers that share its outcome
+        winners: dict[Hashable, BatchRecord] = {}
+        identifiers: dict[Hashable, list[str]] = {}
+        for index, raw in enumerate(raw_records):
+            if not _carries_image(raw) or (self.skip and self.skip(raw)):
+                skipped += 1
+                continue
+            try:
+                record = decode_record(raw)
+                key = self.key(record) if self.key else index
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                print(f"Error decoding record: {e!s}")
+                failed.append(_raw_identifier(raw))
+                continue
+            winners[key] = record
+            identifiers.setdefault(key, []).append(record.identifier)
+
+        metrics.add_count("BatchRecords", len(raw_records))
+        metrics.add_count("BatchSkippedRecords", skipped)
+        metrics.add_count(
+            "BatchDuplicateRecords",
+            len(raw_records) - skipped - len(failed) - len(winners),
+        )
+
+        if winners:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.max_workers)
+            outcomes = self._executor.map(
+                self._process_in_context,
+                [contextvars.copy_context() for _ in winners],
+                winners.values(),
+            )
+            for key, succeeded in zip(winners, outcomes, strict=True):
+                if not succeeded:
+                    failed.extend(identifiers[key])
+
+        metrics.add_count("BatchItemFailures", len(failed))
+        return {"batchItemFailures": [{"itemIdentifier": item} for item in failed]}
+
+    def _process_in_context(
+        self, context: contextvars.Context, record: BatchRecord
+    ) -> bool:
+        """Process a record in a copy of the caller's context."""
+        return context.run(self._process_record, record)
+
+    def _process_record(self, record: BatchRecord) -> bool:
+        """Process a record, reporting whether it succeeded."""
+        try:
+            self.process(record)
+        except Exception as e:
+            print(f"Error processing record {record.identifier}: {e!s}")
+            return False
+        return True
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+def _carries_image(record: dict[str, Any]) -> bool:
+    """Tell whether a record is not a DynamoDB Streams record without image."""
+    if event_source(record) != EventSource.DYNAMODB:
+        return True
+    return record.get("eventName") in IMAGE_EVENT_NAMES
+
+
+def _raw_identifier(record: dict[str, Any]) -> str:
+    """Get the batch item identifier of an undecodable record."""
+    if "messageId" in record:
+        return record["messageId"]
+    if "kinesis" in record:
+        return record["kinesis"]["sequenceNumber"]
+    return record["dynamodb"]["SequenceNumber"]
@@ -2,58 +2,208 @@
 Hello World domain model.
 """
 
-from dataclasses import dataclass
-from datetime import UTC, datetime
+import time
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from enum import StrEnum
+
+# Constants
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+MICROSECONDS_PER_MILLISECOND = 1000
+NANOSECONDS_PER_MICROSECOND = 1000
+
+# A timestamp is kept in the form it arrived in until it is first read:
+# a datetime, an ISO 8601 string, or an int of epoch microseconds.
+RawTimestamp = datetime | str | int
+
+
+class TimestampFormat(StrEnum):
+    """Storage formats for HelloWorld timestamps."""
+
+    ISO = "iso"
+    EPOCH_MILLIS = "epoch_ms"
+
+
+def _now_micros() -> int:
+    """Get the current time as epoch microseconds."""
+    return time.time_ns() // NANOSECONDS_PER_MICROSECOND
+
+
+def _to_datetime(value: RawTimestamp) -> datetime:
+    """Materialize a raw timestamp as a datetime."""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return EPOCH + timedelta(microseconds=value)
+
+
+def _to_iso(value: RawTimestamp) -> str:
+    """Format a raw timestamp as an ISO 8601 string."""
+    if isinstance(value, str):
+        return value
+    return _to_datetime(value).isoformat()
+
+
+def _to_epoch_millis(value: RawTimestamp) -> int:
+    """Format a raw timestamp as epoch milliseconds."""
+    if isinstance(value, int):
+        return value // MICROSECONDS_PER_MILLISECOND
+    return (_to_datetime(value) - EPOCH) // timedelta(milliseconds=1)
+
+
+def _from_stored(value: RawTimestamp | Decimal) -> RawTimestamp:
+    """Convert a stored timestamp (ISO string or epoch milliseconds) to raw form."""
+    if isinstance(value, str | datetime):
+        return value
+    return int(value) * MICROSECONDS_PER_MILLISECOND
 
 
-@dataclass
 class HelloWorld:
     """
     Hello World domain model.
 
     This model represents a greeting with its associated metadata.
+
+    Instances are slotted, and timestamps are parsed lazily: a record read
+    from storage keeps its ISO strings (or epoch milliseconds) until the
+    timestamps are accessed, and writes them back unchanged.
+
+    ``version`` counts the saves of the stored item; it is None for a model
+    that has not been read from or written to storage.
     """
 
-    name: str
-    greeting: str
-    created_at: datetime = None
-    updated_at: datetime = None
+    __slots__ = ("_created_at", "_updated_at", "greeting", "name", "version")
+
+    # Mutable and compared by value, so unhashable like the former dataclass
+    __hash__ = None
 
-    def __post_init__(self):
-        """Initialize timestamps if not provided."""
-        if not self.created_at:
-            self.created_at = datetime.now(UTC)
-        if not self.updated_at:
-            self.updated_at = self.created_at
+    def __init__(
+        self,
+        name: str,
+        greeting: str | None,
+        created_at: datetime | None = None,
+        updated_at: datetime | None = None,
+        version: int | None = None,
+    ):
+        """
+        Initialize the model, defaulting timestamps to the current time.
+
+        Args:
+            name: The name to greet
+            greeting: Custom greeting, or None for the default greeting
+            created_at: Creation time (now if not provided)
+            updated_at: Last update time (created_at if not provided)
+            version: Stored version (None if never saved)
+        """
+        self.name = name
+        self.greeting = greeting
+        self._created_at: RawTimestamp = created_at or _now_micros()
+        self._updated_at: RawTimestamp = updated_at or self._created_at
+        self.version = version
+
+    @property
+    def created_at(self) -> datetime:
+        """Get the creation time."""
+        value = self._created_at
+        if not isinstance(value, datetime):
+            value = self._created_at = _to_datetime(value)
+        return value
+
+    @created_at.setter
+    def created_at(self, value: datetime) -> None:
+        """Set the creation time."""
+        self._created_at = value
+
+    @property
+    def updated_at(self) -> datetime:
+        """Get the last update time."""
+        value = self._updated_at
+        if not isinstance(value, datetime):
+            value = self._updated_at = _to_datetime(value)
+        return value
+
+    @updated_at.setter
+    def updated_at(self, value: datetime) -> None:
+        """Set the last update time."""
+        self._updated_at = value
 
     @property
     def formatted_greeting(self) -> str:
         """Get the formatted greeting message."""
         return self.greeting or f"Hello, {self.name}!"
 
-    def to_dict(self) -> dict:
-        """Convert model to dictionary for storage."""
-        return {
+    def __eq__(self, other: object) -> bool:
+        """Compare models field by field."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.name == other.name
+            and self.greeting == other.greeting
+            and self.created_at == other.created_at
+            and self.updated_at == other.updated_at
+            and self.version == other.version
+        )
+
+    def __repr__(self) -> str:
+        """Represent the model with its fields."""
+        return (
+            f"HelloWorld(name={self.name!r}, greeting={self.greeting!r}, "
+            f"created_at={self.created_at!r}, updated_at={self.updated_at!r}, "
+            f"version={self.version!r})"
+        )
+
+    def to_dict(self, timestamp_format: TimestampFormat = TimestampFormat.ISO) -> dict:
+        """
+        Convert model to dictionary for storage.
+
+        Args:
+            timestamp_format: Store timestamps as ISO strings or epoch milliseconds
+
+        Returns:
+            Dictionary representation of the model, with ``version`` only
+            when it is known
+        """
+        convert = (
+            _to_iso if timestamp_format == TimestampFormat.ISO else _to_epoch_millis
+        )
+        data = {
             "name": self.name,
             "greeting": self.greeting,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "created_at": convert(self._created_at),
+            "updated_at": convert(self._updated_at),
         }
+        if self.version is not None:
+            data["version"] = self.version
+        return data
 
     @classmethod
     def from_dict(cls, data: dict) -> "HelloWorld":
-        """Create model from dictionary data."""
-        return cls(
-            name=data["name"],
-            greeting=data.get("greeting"),
-            created_at=(
-                datetime.fromisoformat(data["created_at"])
-                if "created_at" in data
-                else None
-            ),
-            updated_at=(
-                datetime.fromisoformat(data["updated_at"])
-                if "updated_at" in data
-                else None
-            ),
-        )
+        """
+        Create model from dictionary data.
+
+        Timestamps may be ISO strings or epoch milliseconds; they are not
+        parsed until accessed.
+
+        Args:
+            data: Dictionary representation of the model
+
+        Returns:
+            HelloWorld model
+        """
+        model = cls.__new__(cls)
+        model.name = data["name"]
+        model.greeting = data.get("greeting")
+        created_at = data.get("created_at")
+        if created_at.__class__ is not str:
+            created_at = (
+                _now_micros() if created_at is None else _from_stored(created_at)
+            )
+        model._created_at = created_at
+        updated_at = data.get("updated_at")
+        if updated_at.__class__ is not str:
+            updated_at = created_at if updated_at is None else _from_stored(updated_at)
+        model._updated_at = updated_at
+        version = data.get("version")
+        model.version = None if version is None else int(version)
+        return model
@@ -0,0 +1,257 @@
+"""
+Invocation metrics in CloudWatch Embedded Metric Format (EMF).
+
+Handlers, services and adapters record counters, timers and histograms on
+the shared ``metrics`` instance. Values are aggregated in memory and
+written to stdout once per invocation as EMF JSON, which CloudWatch Logs
+turns into metrics without any API call on the request path.
+"""
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from enum import StrEnum
+from typing import Any
+
+# Constants
+DEFAULT_NAMESPACE = "HelloWorld"
+MAX_VALUES_PER_METRIC = 100  # EMF limit on the values of a metric in one document
+MILLISECONDS_PER_SECOND = 1000
+FUNCTION_DIMENSION = "Function"
+ROUTE_DIMENSION = "Route"
+COLD_START_DIMENSION = "ColdStart"
+INVOCATION_LATENCY_METRIC = "InvocationLatency"
+UNKNOWN_FUNCTION = "unknown"
+
+
+class MetricUnit(StrEnum):
+    """CloudWatch units of recorded metrics."""
+
+    COUNT = "Count"
+    MILLISECONDS = "Milliseconds"
+    BYTES = "Bytes"
+    NONE = "None"
+
+
+class Metrics:
+    """
+    In-memory metric aggregator flushed as one EMF log line.
+
+    Counters are summed; timers and histograms keep every recorded value,
+    so that CloudWatch can compute percentiles. Recording is thread-safe.
+    """
+
+    def __init__(self, namespace: str = DEFAULT_NAMESPACE):
+        """
+        Initialize an empty aggregator.
+
+        Args:
+            namespace: CloudWatch namespace (functions set it from
+                HELLO_WORLD_METRICS_NAMESPACE during their init phase)
+        """
+        self.namespace = namespace
+        self._counters: dict[str, float] = {}
+        self._values: dict[str, list[float]] = {}
+        self._units: dict[str, MetricUnit] = {}
+        self._dimensions: dict[str, str] = {}
+        self._cold_start = True
+        self._lock = threading.Lock()
+        self._encoder = json.JSONEncoder(separators=(",", ":"))
+        # Serialized EMF directives, keyed by dimension names and metric units
+        self._directives: dict[tuple, str] = {}
+
+    def add_count(
+        self, name: str, value: float = 1, unit: MetricUnit = MetricUnit.COUNT
+    ) -> None:
+        """
+        Add to a counter.
+
+        Args:
+            name: Metric name
+            value: Amount to add
+            unit: Metric unit
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+            self._units[name] = unit
+
+    def add_value(
+        self, name: str, value: float, unit: MetricUnit = MetricUnit.NONE
+    ) -> None:
+        """
+        Record a histogram value.
+
+        Args:
+            name: Metric name
+            value: Observed value
+            unit: Metric unit
+        """
+        with self._lock:
+            values = self._values.get(name)
+            if values is None:
+                values = self._values[name] = []
+                self._units[name] = unit
+            values.append(value)
+
+    def add_timing(self, name: str, milliseconds: float) -> None:
+        """
+        Record a duration.
+
+        Args:
+            name: Metric name
+            milliseconds: Duration in milliseconds
+        """
+        self.add_value(name, milliseconds, MetricUnit.MILLISECONDS)
+
+    def timer(self, name: str) -> "Timer":
+        """
+        Time the enclosed block, including when it raises.
+
+        Args:
+            name: Metric name
+
+        Returns:
+            Context manager recording the duration of the block
+        """
+        return Timer(self, name)
+
+    def set_dimension(self, name: str, value: str) -> None:
+        """
+        Set a dimension of the metrics flushed next.
+
+        Args:
+            name: Dimension name
+            value: Dimension value
+        """
+        with self._lock:
+            self._dimensions[name] = value
+
+    @contextmanager
+    def invocation(self, context: Any, route: str | None = None) -> Iterator[None]:
+        """
+        Scope metrics to a Lambda invocation and flush them when it ends.
+
+        Sets the function, route and cold start dimensions and records the
+        invocation latency.
+
+        Args:
+            context: Lambda context (None outside Lambda)
+            route: Route of the request (e.g. "GET /hello"), if any
+        """
+        function_name = getattr(context, "function_name", None) or os.environ.get(
+            "AWS_LAMBDA_FUNCTION_NAME", UNKNOWN_FUNCTION
+        )
+        with self._lock:
+            self._dimensions[FUNCTION_DIMENSION] = function_name
+            if route:
+                self._dimensions[ROUTE_DIMENSION] = route
+            self._dimensions[COLD_START_DIMENSION] = (
+                "true" if self._cold_start else "false"
+            )
+            self._cold_start = False
+        try:
+            with self.timer(INVOCATION_LATENCY_METRIC):
+                yield
+        finally:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the recorded metrics to stdout as EMF and reset them."""
+        with self._lock:
+            counters, self._counters = self._counters, {}
+            values, self._values = self._values, {}
+            units, self._units = self._units, {}
+            dimensions, self._dimensions = self._dimensions, {}
+        if not counters and not values:
+            return
+
+        timestamp = int(time.time() * MILLISECONDS_PER_SECOND)
+        longest = max((len(recorded) for recorded in values.values()), default=1)
+        # Values beyond the EMF limit spill over into further documents
+        for start in range(0, longest, MAX_VALUES_PER_METRIC):
+            document: dict[str, Any] = dict(dimensions)
+            if start == 0:
+                document.update(counters)
+            for name, recorded in values.items():
+                if start < len(recorded):
+                    document[name] = recorded[start : start + MAX_VALUES_PER_METRIC]
+            directive = self._directive(dimensions, units, document)
+            # Splice the cached directive in front of the encoded values
+            print(
+                '{"_aws":{"Timestamp":'
+                + str(timestamp)
+                + ',"CloudWatchMetrics":'
+                + directive
+                + "},"
+                + self._encoder.encode(document)[1:]
+            )
+
+    def _directive(
+        self, dimensions: dict[str, str], units: dict[str, MetricUnit], document: dict
+    ) -> str:
+        """
+        Get the serialized CloudWatchMetrics directive of a document.
+
+        Invocations usually record the same metrics, so the directive is
+        serialized once per distinct set of dimensions and metrics.
+        """
+        metric_units = tuple((name, units[name]) for name in document if name in units)
+        key = (tuple(dimensions), metric_units)
+        directive = self._directives.get(key)
+        if directive is None:
+            directive = self._directives[key] = self._encoder.encode(
+                [
+                    {
+                        "Namespace": self.namespace,
+                        "Dimensions": [list(dimensions)],
+                        "Metrics": [
+                            {"Name": name, "Unit": unit} for name, unit in metric_units
+                        ],
+                    }
+                ]
+            )
+        return directive
+
+    def clear(self) -> None:
+        """Drop the recorded metrics and dimensions without writing them."""
+        with self._lock:
+            self._counters = {}
+            self._values = {}
+            self._units = {}
+            self._dimensions = {}
+
+
+# Initialize singleton instance
+metrics = Metrics()
+
+
+class Timer:
+    """Context manager recording the duration of a block as a metric."""
+
+    __slots__ = ("metrics", "name", "start")
+
+    def __init__(self, metrics: Metrics, name: str):
+        """
+        Initialize the timer.
+
+        Args:
+            metrics: Metrics to record the duration on
+            name: Metric name
+        """
+        self.metrics = metrics
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> "Timer":
+        """Start timing."""
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Record the elapsed time."""
+        self.metrics.add_timing(
+            self.name, (time.perf_counter() - self.start) * MILLISECONDS_PER_SECOND
+        )
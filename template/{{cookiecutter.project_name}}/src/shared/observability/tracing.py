@@ -0,0 +1,365 @@
+"""
+Tracing of port, adapter and service calls.
+
+``tracer.trace`` decorates functions and coroutines and ``tracer.span``
+wraps blocks, so that traces show one subsegment per call instead of one
+opaque block per invocation. Spans are sent to a pluggable backend: AWS
+X-Ray in Lambda, or an in-memory recorder for tests and local profiling.
+When tracing is off, a decorated call costs one attribute check.
+"""
+
+import functools
+import importlib.util
+import inspect
+import random
+import threading
+import time
+import traceback
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import Any, TypeVar
+
+from config.config_service import ConfigurationError
+from config.settings import Settings
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Constants
+DEFAULT_SAMPLE_RATE = 1.0
+
+
+class TracingMode(StrEnum):
+    """Tracing backends selectable through HELLO_WORLD_TRACING."""
+
+    OFF = "off"
+    XRAY = "xray"
+    MEMORY = "memory"
+
+
+class TracingBackend(ABC):
+    """Destination of recorded spans."""
+
+    @abstractmethod
+    def begin(self, name: str, annotations: dict[str, Any]) -> Any:
+        """
+        Open a span.
+
+        Args:
+            name: Span name
+            annotations: Indexed key/value pairs attached to the span
+
+        Returns:
+            Backend handle passed to ``end``
+        """
+        pass
+
+    @abstractmethod
+    def end(self, handle: Any, error: BaseException | None) -> None:
+        """
+        Close a span.
+
+        Args:
+            handle: Handle returned by ``begin``
+            error: Exception raised inside the span, if any
+        """
+        pass
+
+
+@dataclass
+class RecordedSpan:
+    """A span captured by the in-memory backend."""
+
+    name: str
+    parent: "RecordedSpan | None"
+    start: float
+    annotations: dict[str, Any] = field(default_factory=dict)
+    end: float | None = None
+    error: BaseException | None = None
+
+    @property
+    def duration(self) -> float:
+        """Duration of the closed span in seconds."""
+        return (self.end or self.start) - self.start
+
+
+class InMemoryBackend(TracingBackend):
+    """
+    Backend keeping spans in memory, for tests and local profiling.
+
+    Parent spans are tracked per thread and per asyncio task.
+    """
+
+    def __init__(self):
+        """Initialize an empty recorder."""
+        self.spans: list[RecordedSpan] = []
+        self._current: ContextVar[RecordedSpan | None] = ContextVar(
+            "current_span", default=None
+        )
+        self._lock = threading.Lock()
+
+    def begin(self, name: str, annotations: dict[str, Any]) -> Any:
+        """Open a span as a child of the current one."""
+        span = RecordedSpan(name, self._current.get(), time.perf_counter(), annotations)
+        with self._lock:
+            self.spans.append(span)
+        return span, self._current.set(span)
+
+    def end(self, handle: Any, error: BaseException | None) -> None:
+        """Close a span and restore its parent as the current span."""
+        span, token = handle
+        span.end = time.perf_counter()
+        span.error = error
+        self._current.reset(token)
+
+    def names(self) -> list[str]:
+        """Get the names of the recorded spans in opening order."""
+        return [span.name for span in self.spans]
+
+    def clear(self) -> None:
+        """Drop the recorded spans."""
+        with self._lock:
+            self.spans = []
+
+
+class XRayBackend(TracingBackend):
+    """
+    Backend sending spans as AWS X-Ray subsegments.
+
+    Requires the ``aws-xray-sdk`` package and an active segment, which
+    Lambda provides when active tracing is enabled. Concurrent spans on
+    one event loop need the SDK's ``AsyncContext``.
+
+    The SDK's global recorder is imported with the first span rather than
+    with the backend: importing it takes hundreds of milliseconds, which
+    would otherwise be spent in every init phase.
+    """
+
+    def __init__(self, recorder: Any = None):
+        """
+        Initialize the backend.
+
+        Args:
+            recorder: X-Ray recorder (the SDK's global recorder if not provided)
+
+        Raises:
+            ConfigurationError: If the X-Ray SDK is not installed
+        """
+        if recorder is None and importlib.util.find_spec("aws_xray_sdk") is None:
+            msg = "X-Ray tracing requires the aws-xray-sdk package"
+            raise ConfigurationError(msg)
+        self._recorder = recorder
+
+    @property
+    def recorder(self) -> Any:
+        """Get the X-Ray recorder, importing the SDK's on first use."""
+        if self._recorder is None:
+            from aws_xray_sdk.core import xray_recorder  # noqa: PLC0415
+
+            self._recorder = xray_recorder
+        return self._recorder
+
+    def begin(self, name: str, annotations: dict[str, Any]) -> Any:
+        """Open a subsegment of the current segment."""
+        subsegment = self.recorder.begin_subsegment(name)
+        if subsegment is not None:
+            for key, value in annotations.items():
+                subsegment.put_annotation(key, value)
+        return subsegment
+
+    def end(self, handle: Any, error: BaseException | None) -> None:
+        """Close the subsegment, recording the exception if any."""
+        if handle is None:
+            return
+        if error is not None:
+            handle.add_exception(error, traceback.extract_tb(error.__traceback__))
+        self.recorder.end_subsegment()
+
+
+class Tracer:
+    """
+    Creates spans around calls, subject to sampling.
+
+    The sampling decision is made once per root span; nested spans follow
+    the decision of their root.
+    """
+
+    def __init__(
+        self,
+        backend: TracingBackend | None = None,
+        sample_rate: float = DEFAULT_SAMPLE_RATE,
+    ):
+        """
+        Initialize the tracer.
+
+        Args:
+            backend: Span destination (tracing is off if None)
+            sample_rate: Fraction of root spans recorded, between 0 and 1
+        """
+        self.backend: TracingBackend | None = None
+        self.sample_rate = DEFAULT_SAMPLE_RATE
+        self._sampled: ContextVar[bool | None] = ContextVar("sampled", default=None)
+        self.configure(backend, sample_rate)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spans are sent to a backend."""
+        return self.backend is not None
+
+    def configure(
+        self,
+        backend: TracingBackend | None,
+        sample_rate: float = DEFAULT_SAMPLE_RATE,
+    ) -> None:
+        """
+        Replace the backend and sampling rate.
+
+        Args:
+            backend: Span destination (tracing is off if None)
+            sample_rate: Fraction of root spans recorded, between 0 and 1
+
+        Raises:
+            ValueError: If sample_rate is outside [0, 1]
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            msg = f"sample_rate must be between 0 and 1, got {sample_rate}"
+            raise ValueError(msg)
+        self.backend = backend
+        self.sample_rate = sample_rate
+
+    def span(self, name: str, **annotations: Any) -> "Span":
+        """
+        Record the enclosed block as a span.
+
+        Args:
+            name: Span name
+            **annotations: Indexed key/value pairs attached to the span
+
+        Returns:
+            Context manager delimiting the span
+        """
+        return Span(self, name, annotations)
+
+    def trace(self, name: str | None = None) -> Callable[[F], F]:
+        """
+        Decorate a function or coroutine function to record its calls as spans.
+
+        Args:
+            name: Span name (the function's qualified name if not provided)
+
+        Returns:
+            Decorator
+        """
+
+        def decorator(func: F) -> F:
+            span_name = name or func.__qualname__
+
+            if inspect.iscoroutinefunction(func):
+
+                @functools.wraps(func)
+                async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                    if self.backend is None:
+                        return await func(*args, **kwargs)
+                    with self.span(span_name):
+                        return await func(*args, **kwargs)
+
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if self.backend is None:
+                    return func(*args, **kwargs)
+                with self.span(span_name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+
+class Span:
+    """Context manager delimiting one span of a tracer."""
+
+    __slots__ = ("annotations", "handle", "name", "root_token", "sampled", "tracer")
+
+    def __init__(self, tracer: Tracer, name: str, annotations: dict[str, Any]):
+        """
+        Initialize the span.
+
+        Args:
+            tracer: Tracer deciding on sampling and owning the backend
+            name: Span name
+            annotations: Indexed key/value pairs attached to the span
+        """
+        self.tracer = tracer
+        self.name = name
+        self.annotations = annotations
+        self.handle: Any = None
+        self.root_token: Any = None
+        self.sampled = False
+
+    def __enter__(self) -> "Span":
+        """Open the span if tracing is on and its root is sampled."""
+        tracer = self.tracer
+        backend = tracer.backend
+        if backend is None:
+            return self
+        sampled = tracer._sampled.get()
+        if sampled is None:
+            sampled = random.random() < tracer.sample_rate
+            self.root_token = tracer._sampled.set(sampled)
+        self.sampled = sampled
+        if sampled:
+            self.handle = backend.begin(self.name, self.annotations)
+        return self
+
+    def __exit__(
+        self, _exc_type: object, error: BaseException | None, _tb: object
+    ) -> None:
+        """Close the span, recording the exception raised inside it."""
+        if self.sampled:
+            self.tracer.backend.end(self.handle, error)
+        if self.root_token is not None:
+            self.tracer._sampled.reset(self.root_token)
+
+
+def create_backend(mode: TracingMode) -> TracingBackend | None:
+    """
+    Create the backend of a tracing mode.
+
+    Args:
+        mode: Tracing mode
+
+    Returns:
+        The backend, or None when tracing is off
+    """
+    if mode == TracingMode.XRAY:
+        return XRayBackend()
+    if mode == TracingMode.MEMORY:
+        return InMemoryBackend()
+    return None
+
+
+def configure_tracing(settings: Settings, target: Tracer | None = None) -> Tracer:
+    """
+    Configure a tracer from HELLO_WORLD_TRACING and HELLO_WORLD_TRACE_SAMPLE_RATE.
+
+    Args:
+        settings: Configuration snapshot
+        target: Tracer to configure (the shared tracer if not provided)
+
+    Returns:
+        The configured tracer
+    """
+    target = tracer if target is None else target
+    target.configure(
+        create_backend(TracingMode(settings.hello_world_tracing)),
+        settings.hello_world_trace_sample_rate,
+    )
+    return target
+
+
+# Initialize singleton instance, off until configured from the settings
+tracer = Tracer()
@@ -0,0 +1,77 @@
+"""
+Asynchronous port interface for hello world operations.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from models.hello_world_model import HelloWorld
+from ports.hello_world_port import ReadConsistency
+
+
+class AsyncHelloWorldPort(ABC):
+    """
+    Asynchronous port interface for hello world operations.
+
+    Mirrors ``HelloWorldPort`` with coroutine methods so that independent
+    lookups can wait on the network concurrently.
+    """
+
+    @abstractmethod
+    async def get_saved_greeting(
+        self,
+        name: str,
+        fields: Sequence[str] | None = None,
+        consistency: ReadConsistency = ReadConsistency.EVENTUAL,
+    ) -> HelloWorld:
+        """
+        Get a greeting for a name.
+
+        Args:
+            name: The name to greet
+            fields: Attributes to read, or None for all of them
+            consistency: Eventually or strongly consistent read
+
+        Returns:
+            HelloWorld model with greeting data
+        """
+        pass
+
+    @abstractmethod
+    async def get_saved_greetings(
+        self,
+        names: list[str],
+        fields: Sequence[str] | None = None,
+        consistency: ReadConsistency = ReadConsistency.EVENTUAL,
+    ) -> list[HelloWorld]:
+        """
+        Get the greetings for several names concurrently.
+
+        Args:
+            names: The names to greet
+            fields: Attributes to read, or None for all of them
+            consistency: Eventually or strongly consistent read
+
+        Returns:
+            HelloWorld models in the same order as ``names``
+        """
+        pass
+
+    @abstractmethod
+    async def save_greeting(self, greeting: HelloWorld) -> None:
+        """
+        Save a greeting.
+
+        Upserts and checks ``greeting.version`` like
+        ``HelloWorldPort.save_greeting``.
+
+        Args:
+            greeting: HelloWorld model to save
+
+        Raises:
+            VersionConflictError: If the stored version no longer matches
+        """
+        pass
+
+    async def close(self) -> None:  # noqa: B027
+        """Release any resources held by the port."""
@@ -3,9 +3,61 @@ Port interface for hello world operations.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from enum import StrEnum
 
 from models.hello_world_model import HelloWorld
 
+# Constants
+DEFAULT_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 100
+DEFAULT_EXPORT_SEGMENTS = 4
+
+
+class ReadConsistency(StrEnum):
+    """Consistency modes of greeting reads."""
+
+    EVENTUAL = "eventual"
+    STRONG = "strong"
+
+
+@dataclass(frozen=True, slots=True)
+class GreetingPage:
+    """A page of listed greetings."""
+
+    greetings: list[HelloWorld]
+    # Opaque token of the next page, or None on the last page
+    next_token: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class PutResult:
+    """Outcome of writing a batch of greetings."""
+
+    # Greetings not written, to be submitted again
+    unprocessed: list[HelloWorld]
+    # Greetings refused, as they would reset or roll back a stored version
+    conflicts: list[HelloWorld]
+
+
+class VersionConflictError(Exception):
+    """Raised when a greeting was changed since the version being saved."""
+
+    def __init__(self, name: str, expected_version: int):
+        """
+        Initialize the error.
+
+        Args:
+            name: Name of the greeting that was changed concurrently
+            expected_version: Version the save expected to replace
+        """
+        self.name = name
+        self.expected_version = expected_version
+        super().__init__(
+            f"Greeting '{name}' is no longer at version {expected_version}"
+        )
+
 
 class HelloWorldPort(ABC):
     """
@@ -13,12 +65,20 @@ class HelloWorldPort(ABC):
     """
 
     @abstractmethod
-    def get_saved_greeting(self, name: str) -> HelloWorld:
+    def get_saved_greeting(
+        self,
+        name: str,
+        fields: Sequence[str] | None = None,
+        consistency: ReadConsistency = ReadConsistency.EVENTUAL,
+    ) -> HelloWorld:
         """
         Get a greeting for a name.
 
         Args:
             name: The name to greet
+            fields: Attributes to read, or None for all of them; attributes
+                not read keep their model defaults
+            consistency: Eventually or strongly consistent read
 
         Returns:
             HelloWorld model with greeting data
@@ -30,7 +90,88 @@ class HelloWorldPort(ABC):
         """
         Save a greeting.
 
+        The stored creation time is kept if the greeting already exists, and
+        the stored version is incremented. If ``greeting.version`` is set,
+        the save only succeeds while the stored version still matches it
+        (0 meaning that the greeting must not exist yet). On success the
+        model is updated with the stored creation time and new version.
+
         Args:
             greeting: HelloWorld model to save
+
+        Raises:
+            VersionConflictError: If the stored version no longer matches
+        """
+        pass
+
+    def get_saved_greetings(
+        self,
+        names: list[str],
+        fields: Sequence[str] | None = None,
+        consistency: ReadConsistency = ReadConsistency.EVENTUAL,
+    ) -> list[HelloWorld]:
+        """
+        Get the greetings for several names.
+
+        The default implementation performs one lookup per name. Adapters
+        able to issue lookups concurrently should override it.
+
+        Args:
+            names: The names to greet
+            fields: Attributes to read, or None for all of them
+            consistency: Eventually or strongly consistent read
+
+        Returns:
+            HelloWorld models in the same order as ``names``
+        """
+        return [self.get_saved_greeting(name, fields, consistency) for name in names]
+
+
+class GreetingCatalogPort(ABC):
+    """
+    Port interface for listing and exporting every saved greeting.
+
+    Optional: implemented by adapters of a store that can be listed, next
+    to ``HelloWorldPort``. Callers check for it before serving listings.
+    """
+
+    @abstractmethod
+    def list_greetings(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        continuation_token: str | None = None,
+    ) -> GreetingPage:
+        """
+        List saved greetings, most recently updated first.
+
+        Args:
+            page_size: Maximum number of greetings in the page (at most
+                MAX_PAGE_SIZE)
+            continuation_token: ``next_token`` of the previous page, or None
+                for the first page
+
+        Returns:
+            The page of greetings
+
+        Raises:
+            ValueError: If page_size is out of range or the token is invalid
+        """
+        pass
+
+    @abstractmethod
+    def export_greetings(
+        self, segments: int = DEFAULT_EXPORT_SEGMENTS
+    ) -> Iterator[HelloWorld]:
+        """
+        Stream every saved greeting, in no particular order.
+
+        Args:
+            segments: Number of parts of the greetings read in parallel
+
+        Returns:
+            Iterator over the greetings; closing it stops the export
+
+        Raises:
+            ValueError: If segments is lower than 1
         """
         pass
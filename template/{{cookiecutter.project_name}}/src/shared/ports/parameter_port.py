@@ -0,0 +1,44 @@
+"""
+Port interface for parameter store operations.
+"""
+
+from abc import ABC, abstractmethod
+
+
+class ParameterPort(ABC):
+    """
+    Port interface for reading configuration parameters.
+    """
+
+    @abstractmethod
+    def get_parameter(self, name: str) -> str | None:
+        """
+        Get a parameter value.
+
+        Args:
+            name: Parameter name
+
+        Returns:
+            The parameter value, or None if the parameter does not exist
+        """
+        pass
+
+    def get_parameters(self, names: list[str]) -> dict[str, str]:
+        """
+        Get several parameter values.
+
+        The default implementation performs one lookup per name. Adapters
+        with a batch API should override it.
+
+        Args:
+            names: Parameter names
+
+        Returns:
+            Values of the parameters that exist, by name
+        """
+        values = {}
+        for name in names:
+            value = self.get_parameter(name)
+            if value is not None:
+                values[name] = value
+        return values
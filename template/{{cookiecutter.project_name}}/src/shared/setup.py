@@ -15,5 +15,10 @@ setup(
     install_requires=[
         "pydantic>=2.4.0",
         "boto3>=1.28.0",
+        "aws-xray-sdk>=2.12.0",
     ],
+    extras_require={
+        # Asynchronous adapter only; not installed into the function bundles
+        "async": ["aiobotocore>=2.7.0,<2.8.0"],
+    },
 )
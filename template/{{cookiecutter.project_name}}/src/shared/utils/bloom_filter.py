@@ -0,0 +1,207 @@
+"""
+Bloom filter for set membership without false negatives.
+"""
+
+import hashlib
+import math
+import struct
+import threading
+import zlib
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+
+# Constants
+DEFAULT_FALSE_POSITIVE_RATE = 0.01
+SNAPSHOT_MAGIC = b"BLM2"
+# Magic, hash count, bit count, item count, as-of epoch milliseconds (0 if unset)
+SNAPSHOT_HEADER = struct.Struct(">4sBQQQ")
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+BITS_PER_BYTE = 8
+MAX_HASH_COUNT = 32
+
+
+class BloomFilter:
+    """
+    Bloom filter of strings.
+
+    ``key in bloom_filter`` is False only for keys that were never added; a
+    True answer is wrong with the false-positive rate the filter was sized
+    for, as long as it holds at most ``capacity`` keys.
+
+    The bit positions of a key come from one BLAKE2b digest split into two
+    64-bit hashes (double hashing), so a lookup hashes the key once.
+
+    ``count`` estimates the distinct keys added: a key that sets no new bit
+    is not counted. ``as_of`` is the time the keys were current, if set,
+    and is kept in snapshots.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE,
+    ):
+        """
+        Initialize an empty filter sized for a capacity and error rate.
+
+        Args:
+            capacity: Number of keys the filter is sized for
+            false_positive_rate: Accepted false-positive rate at capacity
+
+        Raises:
+            ValueError: If capacity is lower than 1 or the rate is not
+                between 0 and 1
+        """
+        if capacity < 1:
+            msg = f"capacity must be at least 1, got {capacity}"
+            raise ValueError(msg)
+        if not 0 < false_positive_rate < 1:
+            msg = f"false_positive_rate must be between 0 and 1, got {false_positive_rate}"
+            raise ValueError(msg)
+
+        bit_count = math.ceil(
+            -capacity * math.log(false_positive_rate) / math.log(2) ** 2
+        )
+        hash_count = round(bit_count / capacity * math.log(2))
+        self._init(bit_count, min(max(hash_count, 1), MAX_HASH_COUNT))
+
+    def _init(self, bit_count: int, hash_count: int, count: int = 0) -> None:
+        """Set up the bit array and parameters."""
+        self.bit_count = bit_count
+        self.hash_count = hash_count
+        self.count = count
+        self.as_of: datetime | None = None
+        self._bits = bytearray(math.ceil(bit_count / BITS_PER_BYTE))
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_keys(
+        cls,
+        keys: Iterable[str],
+        capacity: int | None = None,
+        false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE,
+    ) -> "BloomFilter":
+        """
+        Build a filter holding keys.
+
+        Args:
+            keys: Keys to add
+            capacity: Number of keys to size for (the number of keys if None)
+            false_positive_rate: Accepted false-positive rate at capacity
+
+        Returns:
+            The filled filter
+        """
+        keys = list(keys)
+        bloom_filter = cls(capacity or max(len(keys), 1), false_positive_rate)
+        bloom_filter.update(keys)
+        return bloom_filter
+
+    def _positions(self, key: str) -> list[int]:
+        """Get the bit positions of a key."""
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        bit_count = self.bit_count
+        return [(first + i * second) % bit_count for i in range(self.hash_count)]
+
+    def add(self, key: str) -> None:
+        """
+        Add a key.
+
+        Args:
+            key: Key to add
+        """
+        positions = self._positions(key)
+        with self._lock:
+            bits = self._bits
+            changed = False
+            for position in positions:
+                mask = 1 << (position & 7)
+                if not bits[position >> 3] & mask:
+                    bits[position >> 3] |= mask
+                    changed = True
+            # A key setting no new bit was probably added before
+            if changed:
+                self.count += 1
+
+    def update(self, keys: Iterable[str]) -> None:
+        """
+        Add several keys.
+
+        Args:
+            keys: Keys to add
+        """
+        for key in keys:
+            self.add(key)
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a key may have been added."""
+        bits = self._bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+    @property
+    def size_bytes(self) -> int:
+        """Get the size of the bit array in bytes."""
+        return len(self._bits)
+
+    @property
+    def fill_ratio(self) -> float:
+        """Get the fraction of bits that are set."""
+        return sum(byte.bit_count() for byte in self._bits) / self.bit_count
+
+    @property
+    def false_positive_rate(self) -> float:
+        """Estimate the current false-positive rate from the bits set."""
+        return self.fill_ratio**self.hash_count
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the filter to a compressed snapshot.
+
+        Returns:
+            Snapshot readable by ``from_bytes``
+        """
+        as_of_ms = 0
+        if self.as_of is not None:
+            as_of_ms = (self.as_of - EPOCH) // timedelta(milliseconds=1)
+        with self._lock:
+            header = SNAPSHOT_HEADER.pack(
+                SNAPSHOT_MAGIC, self.hash_count, self.bit_count, self.count, as_of_ms
+            )
+            return header + zlib.compress(bytes(self._bits))
+
+    @classmethod
+    def from_bytes(cls, snapshot: bytes) -> "BloomFilter":
+        """
+        Load a filter from a snapshot.
+
+        Args:
+            snapshot: Bytes written by ``to_bytes``
+
+        Returns:
+            The filter
+
+        Raises:
+            ValueError: If the snapshot is not a valid filter snapshot
+        """
+        try:
+            magic, hash_count, bit_count, count, as_of_ms = SNAPSHOT_HEADER.unpack_from(
+                snapshot
+            )
+            bits = zlib.decompress(snapshot[SNAPSHOT_HEADER.size :])
+        except (struct.error, zlib.error) as e:
+            msg = f"Invalid Bloom filter snapshot: {e!s}"
+            raise ValueError(msg) from e
+        bloom_filter = cls.__new__(cls)
+        bloom_filter._init(bit_count, hash_count, count)
+        if magic != SNAPSHOT_MAGIC or len(bits) != bloom_filter.size_bytes:
+            msg = "Invalid Bloom filter snapshot: unexpected header or size"
+            raise ValueError(msg)
+        bloom_filter._bits[:] = bits
+        if as_of_ms:
+            bloom_filter.as_of = EPOCH + timedelta(milliseconds=as_of_ms)
+        return bloom_filter
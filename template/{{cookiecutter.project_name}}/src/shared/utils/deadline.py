@@ -0,0 +1,107 @@
+"""
+Invocation deadlines propagated to adapter calls.
+
+The handler opens a ``deadline_scope`` from the Lambda context; adapters
+read ``current_deadline()`` to fit their timeouts and retries into the time
+the invocation has left. The deadline is held in a context variable, so it
+follows the call through the domain services, and into asyncio tasks,
+without being passed explicitly.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+# Constants
+MILLISECONDS = 1000
+# Time kept back to build and return the response once a call gives up
+DEFAULT_SAFETY_MARGIN_MS = 200
+
+
+class DeadlineExceededError(Exception):
+    """Raised when too little time is left to make a call."""
+
+
+@dataclass(frozen=True, slots=True)
+class Deadline:
+    """Point in time, on the monotonic clock, by which work must be done."""
+
+    expires_at: float
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        """
+        Create a deadline a number of seconds from now.
+
+        Args:
+            seconds: Time until the deadline
+
+        Returns:
+            The deadline
+        """
+        return cls(time.monotonic() + seconds)
+
+    @classmethod
+    def from_context(
+        cls, context: Any, safety_margin_ms: float = DEFAULT_SAFETY_MARGIN_MS
+    ) -> "Deadline | None":
+        """
+        Create the deadline of a Lambda invocation.
+
+        Args:
+            context: Lambda context
+            safety_margin_ms: Time kept back before the function timeout
+
+        Returns:
+            The deadline, or None if the context does not report its
+            remaining time (e.g. when invoked outside Lambda)
+        """
+        remaining = getattr(context, "get_remaining_time_in_millis", None)
+        millis = remaining() if callable(remaining) else None
+        if not isinstance(millis, int | float):
+            return None
+        return cls.after((millis - safety_margin_ms) / MILLISECONDS)
+
+    def remaining(self) -> float:
+        """Get the time left, in seconds (negative once expired)."""
+        return self.expires_at - time.monotonic()
+
+
+_current: ContextVar[Deadline | None] = ContextVar("deadline", default=None)
+
+
+def current_deadline() -> Deadline | None:
+    """
+    Get the deadline of the current invocation.
+
+    Returns:
+        The innermost deadline in scope, or None
+    """
+    return _current.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Deadline | None) -> Iterator[Deadline | None]:
+    """
+    Make a deadline current for the duration of a block.
+
+    A nested scope cannot extend an enclosing deadline; the earlier of the
+    two applies. A None deadline leaves the enclosing one in place.
+
+    Args:
+        deadline: Deadline of the work in the block
+
+    Yields:
+        The deadline in effect
+    """
+    enclosing = _current.get()
+    if deadline is None or (enclosing and enclosing.expires_at < deadline.expires_at):
+        deadline = enclosing
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
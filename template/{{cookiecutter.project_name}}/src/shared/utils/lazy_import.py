@@ -0,0 +1,80 @@
+"""
+Deferred module imports.
+
+Lambda runs a function's module-level imports during the init phase of
+every cold start. Adapters that pull in the AWS SDK are imported through
+``lazy_import`` so that their cost is paid on first use instead, and only
+by the code paths that need them.
+
+The first load is serialized: concurrent first accesses wait for the
+module code to finish running instead of seeing a partly loaded module,
+which ``importlib.util.LazyLoader`` allows before Python 3.12.3.
+"""
+
+import importlib.util
+import sys
+import threading
+from types import ModuleType
+from typing import Any
+
+_lock = threading.RLock()
+_loading: set[str] = set()
+
+
+class _LazyModule(ModuleType):
+    """Module whose code runs when a missing attribute is first read."""
+
+    def __getattr__(self, attr: str) -> Any:
+        with _lock:
+            # Another thread may have loaded the module while this one waited,
+            # and a circular import reads it while its code is running
+            spec = self.__spec__
+            if type(self) is _LazyModule and spec.name not in _loading:
+                _loading.add(spec.name)
+                try:
+                    spec.loader.exec_module(self)
+                except BaseException:
+                    sys.modules.pop(spec.name, None)
+                    raise
+                finally:
+                    _loading.discard(spec.name)
+                self.__class__ = ModuleType
+            elif type(self) is _LazyModule:
+                msg = f"partially initialized module {spec.name!r} has no {attr!r}"
+                raise AttributeError(msg)
+        return getattr(self, attr)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Import a module on first attribute access.
+
+    The returned module is registered in ``sys.modules`` straight away, but
+    its code only runs when one of its attributes is first read. A module
+    that is already imported is returned as is. Parent packages are
+    imported straight away, so defer a light package's modules rather
+    than a submodule of a heavy one.
+
+    Args:
+        name: Absolute module name, e.g. "adapters.ssm_parameter_adapter"
+
+    Returns:
+        The module, loaded lazily
+
+    Raises:
+        ModuleNotFoundError: If the module cannot be found
+    """
+    with _lock:
+        module = sys.modules.get(name)
+        if module is not None:
+            return module
+
+        spec = importlib.util.find_spec(name)
+        if spec is None or spec.loader is None:
+            msg = f"No module named {name!r}"
+            raise ModuleNotFoundError(msg, name=name)
+
+        module = importlib.util.module_from_spec(spec)
+        module.__class__ = _LazyModule
+        sys.modules[name] = module
+        return module
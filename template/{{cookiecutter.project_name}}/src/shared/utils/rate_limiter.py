@@ -0,0 +1,126 @@
+"""
+Adaptive client-side rate limiting.
+"""
+
+import threading
+import time
+
+# Constants
+DEFAULT_MIN_RATE = 1.0
+# Share of the rate kept after throttling
+DEFAULT_DECREASE_FACTOR = 0.5
+# Share of the initial rate added after each unthrottled acquire
+DEFAULT_INCREASE_RATIO = 0.05
+# Seconds of the current rate that may be spent at once after idling
+DEFAULT_BURST_SECONDS = 1.0
+# Throttles reported within this time of a decrease belong to the same burst
+DEFAULT_COOLDOWN_SECONDS = 1.0
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket whose rate adapts to throttling.
+
+    The rate grows additively with every successful call and shrinks
+    multiplicatively when the service throttles (AIMD), so it settles just
+    below the throughput the service accepts. A burst of throttles from
+    requests already in flight only lowers the rate once per cooldown.
+
+    ``acquire`` reserves tokens and sleeps until they are available, so
+    concurrent callers are served in the order they arrive. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        initial_rate: float,
+        *,
+        min_rate: float = DEFAULT_MIN_RATE,
+        max_rate: float | None = None,
+        increase: float | None = None,
+        decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+        cooldown_seconds: float = DEFAULT_COOLDOWN_SECONDS,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial_rate: Starting rate, in tokens per second
+            min_rate: Lowest rate throttling can bring the limiter to
+            max_rate: Highest rate successes can bring the limiter to
+                (unbounded if None)
+            increase: Rate added per success (5% of initial_rate if None)
+            decrease_factor: Share of the rate kept after throttling
+            cooldown_seconds: Minimum time between two decreases
+
+        Raises:
+            ValueError: If a rate is not positive or decrease_factor is not
+                between 0 and 1
+        """
+        if not 0 < min_rate <= initial_rate:
+            msg = f"rates must satisfy 0 < min_rate <= initial_rate, got {min_rate}"
+            raise ValueError(msg)
+        if not 0 < decrease_factor < 1:
+            msg = f"decrease_factor must be between 0 and 1, got {decrease_factor}"
+            raise ValueError(msg)
+        self.min_rate = min_rate
+        self.max_rate = max_rate if max_rate is not None else float("inf")
+        self.increase = (
+            increase if increase is not None else initial_rate * DEFAULT_INCREASE_RATIO
+        )
+        self.decrease_factor = decrease_factor
+        self.cooldown_seconds = cooldown_seconds
+        self.throttles = 0
+        self._rate = min(initial_rate, self.max_rate)
+        self._tokens = self._rate * DEFAULT_BURST_SECONDS
+        self._updated_at = time.monotonic()
+        self._decreased_at = float("-inf")
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Get the current rate, in tokens per second."""
+        return self._rate
+
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        Take tokens, waiting until the current rate allows them.
+
+        Args:
+            tokens: Number of tokens to take (e.g. items in a batch)
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def on_success(self) -> None:
+        """Raise the rate after a call the service accepted."""
+        with self._lock:
+            self._refill()
+            self._rate = min(self.max_rate, self._rate + self.increase)
+
+    def on_throttle(self) -> None:
+        """Lower the rate after a call the service throttled."""
+        with self._lock:
+            self.throttles += 1
+            now = time.monotonic()
+            if now - self._decreased_at < self.cooldown_seconds:
+                return
+            self._refill()
+            self._decreased_at = now
+            self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+            # Drop the burst allowance, so the lower rate applies at once
+            self._tokens = min(self._tokens, 0.0)
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last update."""
+        now = time.monotonic()
+        burst = self._rate * DEFAULT_BURST_SECONDS
+        self._tokens = min(burst, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
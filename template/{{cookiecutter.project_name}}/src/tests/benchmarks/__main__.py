@@ -0,0 +1,47 @@
+"""
+Run the performance benchmarks.
+
+Usage:
+    python -m tests.benchmarks [bench_module ...]
+
+Without arguments every ``bench_*`` module in this package is run.
+"""
+
+import importlib
+import pkgutil
+import sys
+
+import tests.benchmarks as benchmarks_package
+
+# Constants
+BENCHMARK_PREFIX = "bench_"
+
+
+def discover_benchmarks() -> list[str]:
+    """
+    List the benchmark modules of this package.
+
+    Returns:
+        Sorted benchmark module names
+    """
+    return sorted(
+        module.name
+        for module in pkgutil.iter_modules(benchmarks_package.__path__)
+        if module.name.startswith(BENCHMARK_PREFIX)
+    )
+
+
+def main(argv: list[str]) -> None:
+    """
+    Run the requested benchmark modules.
+
+    Args:
+        argv: Benchmark module names (all benchmarks if empty)
+    """
+    for name in argv or discover_benchmarks():
+        module = importlib.import_module(f"{benchmarks_package.__name__}.{name}")
+        module.main()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
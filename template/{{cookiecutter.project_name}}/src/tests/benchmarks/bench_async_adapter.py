@@ -0,0 +1,70 @@
+"""
+Benchmark sequential versus concurrent greeting lookups.
+
+Compares the synchronous storage adapter, which serializes its network
+waits, with the asynchronous adapter behind its synchronous facade, which
+overlaps them, against an out-of-process local DynamoDB server.
+"""
+
+import os
+
+from adapters.async_hello_world_storage_adapter import AsyncHelloWorldStorageAdapter
+from adapters.hello_world_storage_adapter import HelloWorldStorageAdapter
+from adapters.sync_hello_world_facade import SyncHelloWorldFacade
+from models.hello_world_model import HelloWorld
+
+from tests.benchmarks.timing import measure, print_results
+from tests.utils.local_dynamodb import LocalDynamoDB
+
+# Constants
+TABLE_NAME = "GreetingsTable-bench-async"
+NAME_COUNT = 64
+SAVED_EVERY = 4
+ITERATIONS = 20
+SIMULATED_LATENCY_MS = 5.0
+CONCURRENCY_LEVELS = [4, 16, 64]
+
+
+def _seed(names: list[str]) -> None:
+    """Save a custom greeting for every ``SAVED_EVERY``-th name."""
+    adapter = HelloWorldStorageAdapter()
+    for name in names[::SAVED_EVERY]:
+        adapter.save_greeting(HelloWorld(name=name, greeting=f"Hi {name}"))
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    names = [f"bench-user-{index}" for index in range(NAME_COUNT)]
+
+    with LocalDynamoDB(isolated=True, latency_ms=SIMULATED_LATENCY_MS) as server:
+        os.environ.update(server.environment)
+        os.environ["HELLO_WORLD_TABLE_NAME"] = server.create_greetings_table(TABLE_NAME)
+        _seed(names)
+
+        sync_adapter = HelloWorldStorageAdapter()
+        results = [
+            measure(
+                "sync adapter, sequential",
+                lambda: sync_adapter.get_saved_greetings(names),
+                ITERATIONS,
+                NAME_COUNT,
+            )
+        ]
+
+        for concurrency in CONCURRENCY_LEVELS:
+            facade = SyncHelloWorldFacade(AsyncHelloWorldStorageAdapter(concurrency))
+            results.append(
+                measure(
+                    f"sync facade, concurrency={concurrency}",
+                    lambda facade=facade: facade.get_saved_greetings(names),
+                    ITERATIONS,
+                    NAME_COUNT,
+                )
+            )
+            facade.close()
+
+    print_results(f"Greeting lookups ({NAME_COUNT} names per call)", results)
+
+
+if __name__ == "__main__":
+    main()
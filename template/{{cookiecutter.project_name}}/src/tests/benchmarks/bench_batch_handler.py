@@ -0,0 +1,99 @@
+"""
+Benchmark batch handler throughput.
+
+Saves the greetings of an SQS batch through ``batch_lambda_handler`` with
+several worker pool sizes, against an out-of-process local DynamoDB
+server, and compares them with saving the records one by one.
+"""
+
+import contextlib
+import io
+import json
+import os
+from unittest.mock import MagicMock
+
+from adapters.hello_world_storage_adapter import HelloWorldStorageAdapter
+from handlers.batch_processor import BatchProcessor
+from models.hello_world_model import HelloWorld
+
+from tests.benchmarks.timing import measure, print_results
+from tests.utils.local_dynamodb import LocalDynamoDB
+
+# Constants
+TABLE_NAME = "GreetingsTable-bench-batch"
+BATCH_SIZE = 100
+# Every DUPLICATE_EVERY-th record repeats the name of the record before it
+DUPLICATE_EVERY = 10
+ITERATIONS = 5
+SIMULATED_LATENCY_MS = 5.0
+WORKER_COUNTS = [1, 4, 16]
+
+
+def _sqs_event() -> dict:
+    """Build an SQS batch of greetings with some repeated names."""
+    records = []
+    for index in range(BATCH_SIZE):
+        name = f"bench-user-{index - 1 if index % DUPLICATE_EVERY == 0 else index}"
+        records.append(
+            {
+                "eventSource": "aws:sqs",
+                "messageId": f"m-{index}",
+                "body": json.dumps({"name": name, "greeting": f"Hi {index}"}),
+            }
+        )
+    return {"Records": records}
+
+
+def _quietly(func, *args) -> object:
+    """Call a function, discarding the metric documents it prints."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    event = _sqs_event()
+    context = MagicMock(function_name="bench-batch")
+
+    with LocalDynamoDB(isolated=True, latency_ms=SIMULATED_LATENCY_MS) as server:
+        os.environ.update(server.environment)
+        os.environ["HELLO_WORLD_TABLE_NAME"] = server.create_greetings_table(TABLE_NAME)
+        # Imported once the environment is configured, as in Lambda
+        from functions.hello_world import handler  # noqa: PLC0415
+
+        storage = HelloWorldStorageAdapter()
+        results = [
+            measure(
+                "one save per record, sequential",
+                lambda: [
+                    storage.save_greeting(HelloWorld(**json.loads(record["body"])))
+                    for record in event["Records"]
+                ],
+                ITERATIONS,
+                BATCH_SIZE,
+                warmup=1,
+            )
+        ]
+
+        default_processor = handler.batch_processor
+        for workers in WORKER_COUNTS:
+            handler.batch_processor = BatchProcessor(
+                default_processor.process, default_processor.key, workers
+            )
+            results.append(
+                measure(
+                    f"batch handler, workers={workers}",
+                    lambda: _quietly(handler.batch_lambda_handler, event, context),
+                    ITERATIONS,
+                    BATCH_SIZE,
+                    warmup=1,
+                )
+            )
+            handler.batch_processor.close()
+        handler.batch_processor = default_processor
+
+    print_results(f"SQS batch of {BATCH_SIZE} records (records/s)", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark hedged greeting reads under tail latency.
+
+Reads a greeting through the storage adapter with and without a hedging
+policy, against a local DynamoDB server where a small share of requests
+is very slow, and reports the latency percentiles and the hedges issued.
+"""
+
+import os
+import random
+import threading
+
+from adapters.hedging import HedgingPolicy
+from adapters.hello_world_storage_adapter import HelloWorldStorageAdapter
+from models.hello_world_model import HelloWorld
+
+from tests.benchmarks.timing import measure, print_results
+from tests.utils.local_dynamodb import LocalDynamoDB
+
+# Constants
+TABLE_NAME = "GreetingsTable-bench-hedging"
+ITERATIONS = 500
+TYPICAL_LATENCY_MS = 2.0
+SLOW_LATENCY_MS = 200.0
+SLOW_SHARE = 0.02
+PERCENTILE = 95
+MAX_EXTRA_RATE = 0.1
+SEED = 38
+
+
+class TailLatency:
+    """Latency profile where a share of the requests is very slow."""
+
+    def __init__(self):
+        self._random = random.Random(SEED)
+        self._lock = threading.Lock()
+
+    def __call__(self) -> float:
+        with self._lock:
+            slow = self._random.random() < SLOW_SHARE
+        return SLOW_LATENCY_MS if slow else TYPICAL_LATENCY_MS
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    # In-process server, so that the latency profile can be a callable
+    with LocalDynamoDB() as server:
+        os.environ.update(server.environment)
+        os.environ["HELLO_WORLD_TABLE_NAME"] = server.create_greetings_table(TABLE_NAME)
+        HelloWorldStorageAdapter().save_greeting(
+            HelloWorld(name="Alice", greeting="Hi")
+        )
+        server.app.latency_ms = TailLatency()
+
+        policy = HedgingPolicy(PERCENTILE, MAX_EXTRA_RATE)
+        adapters = {
+            "no hedging": HelloWorldStorageAdapter(),
+            f"hedging p{PERCENTILE}, extra<={MAX_EXTRA_RATE}": (
+                HelloWorldStorageAdapter(hedging=policy)
+            ),
+        }
+        results = [
+            measure(
+                label,
+                lambda adapter=adapter: adapter.get_saved_greeting("Alice"),
+                ITERATIONS,
+                warmup=PERCENTILE,
+            )
+            for label, adapter in adapters.items()
+        ]
+        policy.close()
+
+    print_results(
+        f"Greeting reads, {SLOW_SHARE:.0%} of requests at {SLOW_LATENCY_MS:g}ms",
+        results,
+    )
+    print(
+        f"hedges issued={policy.hedges_issued} won={policy.hedges_won} "
+        f"calls={policy.calls} delay={policy.delay * 1000:.1f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Microbenchmark the request hot path.
+
+Times every step of serving a greeting without any I/O: the Lambda handler
+end to end on a warm in-memory port, the service lookup, the model
+serialization, the configuration lookup and the JSON response. These
+benchmarks are gated against the baselines of ``tests.benchmarks.regression``.
+"""
+
+import contextlib
+import json
+import os
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from adapters.in_memory_hello_world_adapter import InMemoryHelloWorldAdapter
+from config.config_service import config
+from domain.services.hello_world_service import HelloWorldService
+from models.hello_world_model import HelloWorld
+
+from tests.benchmarks.timing import BenchmarkResult, measure, print_results
+
+# Constants
+TABLE_NAME = "GreetingsTable-bench-hot-path"
+# Every sample repeats the benchmarked call, to time microseconds reliably
+OPERATIONS_PER_SAMPLE = 1000
+ITERATIONS = 30
+NAME = "Alice"
+GREETING = "Hi Alice"
+
+
+def repeat(func: Callable[[], object]) -> Callable[[], None]:
+    """Build a sample calling a function OPERATIONS_PER_SAMPLE times."""
+
+    def sample() -> None:
+        for _ in range(OPERATIONS_PER_SAMPLE):
+            func()
+
+    return sample
+
+
+def _response(greeting: str) -> dict:
+    """Build the API Gateway response of a greeting, as the handler does."""
+    return {
+        "statusCode": 200,
+        "headers": {"Content-Type": "application/json"},
+        "body": json.dumps({"message": greeting}),
+    }
+
+
+@contextlib.contextmanager
+def hot_path() -> Iterator[dict[str, Callable[[], object]]]:
+    """
+    Set up the hot path benchmarks.
+
+    The handler serves greetings from a warm in-memory port for as long as
+    the context is open, and the metric documents it prints are discarded.
+
+    Yields:
+        Benchmarked calls by benchmark name
+    """
+    os.environ.setdefault("HELLO_WORLD_TABLE_NAME", TABLE_NAME)
+    # Imported once the environment is configured, as in Lambda
+    from functions.hello_world import handler  # noqa: PLC0415
+
+    port = InMemoryHelloWorldAdapter()
+    port.save_greeting(HelloWorld(name=NAME, greeting=GREETING))
+    service = HelloWorldService(port)
+    item = port.get_saved_greeting(NAME).to_dict()
+    event = {
+        "resource": "/hello",
+        "httpMethod": "GET",
+        "queryStringParameters": {"name": NAME},
+    }
+    context = MagicMock(function_name="bench-hot-path")
+
+    default_service = handler._service
+    handler._service = lambda _settings: service
+    try:
+        with (
+            Path(os.devnull).open("w") as devnull,
+            contextlib.redirect_stdout(devnull),
+        ):
+            yield {
+                "lambda_handler, warm in-memory port": lambda: handler.lambda_handler(
+                    event, context
+                ),
+                "HelloWorldService.get_greeting": lambda: service.get_greeting(NAME),
+                "HelloWorld.to_dict": HelloWorld.from_dict(item).to_dict,
+                "HelloWorld.from_dict": lambda: HelloWorld.from_dict(item),
+                "ConfigService.get_required": lambda: config.get_required(
+                    config.HELLO_WORLD_TABLE_NAME
+                ),
+                "JSON response": lambda: _response(GREETING),
+            }
+    finally:
+        handler._service = default_service
+
+
+def run() -> list[BenchmarkResult]:
+    """
+    Run the hot path benchmarks.
+
+    Returns:
+        One result per benchmark, timing OPERATIONS_PER_SAMPLE calls a sample
+    """
+    with hot_path() as benchmarks:
+        return [
+            measure(name, repeat(func), ITERATIONS, OPERATIONS_PER_SAMPLE)
+            for name, func in benchmarks.items()
+        ]
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    print_results(f"Request hot path ({OPERATIONS_PER_SAMPLE} calls per sample)", run())
+
+
+if __name__ == "__main__":
+    main()
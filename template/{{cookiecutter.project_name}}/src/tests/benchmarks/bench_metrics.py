@@ -0,0 +1,50 @@
+"""
+Benchmark the per-invocation overhead of the EMF metrics.
+
+Records what a typical invocation records (invocation scope, two timers,
+a counter and a consumed capacity value) and flushes it, with stdout
+discarded so that only the metrics code is measured. The budget is 50us.
+"""
+
+import contextlib
+import io
+from types import SimpleNamespace
+
+from observability.metrics import Metrics
+
+from tests.benchmarks.timing import measure, print_results
+
+# Constants
+ITERATIONS = 20_000
+CONTEXT = SimpleNamespace(function_name="hello_world")
+
+
+def _invocation(metrics: Metrics) -> None:
+    """Record and flush the metrics of one invocation."""
+    with metrics.invocation(CONTEXT, route="GET /hello"):
+        with metrics.timer("GetItemLatency"):
+            pass
+        metrics.add_count("GetItemConsumedCapacity", 0.5)
+        metrics.add_count("Greetings")
+
+
+def _empty_invocation(metrics: Metrics) -> None:
+    """Scope an invocation that records nothing of its own."""
+    with metrics.invocation(CONTEXT):
+        pass
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    metrics = Metrics()
+    with contextlib.redirect_stdout(io.StringIO()) as discarded:
+        results = [
+            measure("empty invocation", lambda: _empty_invocation(metrics), ITERATIONS),
+            measure("typical invocation", lambda: _invocation(metrics), ITERATIONS),
+        ]
+    print(discarded.getvalue().splitlines()[-1])
+    print_results("EMF metrics overhead per invocation", results)
+
+
+if __name__ == "__main__":
+    main()
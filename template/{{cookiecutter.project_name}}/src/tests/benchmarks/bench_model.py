@@ -0,0 +1,147 @@
+"""
+Benchmark HelloWorld memory footprint and serialization throughput.
+
+Compares the slotted, lazily parsed model with a copy of the previous
+``@dataclass`` implementation on one million stored records.
+"""
+
+import tracemalloc
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from models.hello_world_model import HelloWorld, TimestampFormat
+
+from tests.benchmarks.timing import measure, print_results
+
+# Constants
+RECORD_COUNT = 1_000_000
+ITERATIONS = 3
+FIRST_TIMESTAMP = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+@dataclass
+class LegacyHelloWorld:
+    """The previous dataclass model, kept as the comparison baseline."""
+
+    name: str
+    greeting: str
+    created_at: datetime = None
+    updated_at: datetime = None
+
+    def __post_init__(self):
+        if not self.created_at:
+            self.created_at = datetime.now(UTC)
+        if not self.updated_at:
+            self.updated_at = self.created_at
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "greeting": self.greeting,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LegacyHelloWorld":
+        return cls(
+            name=data["name"],
+            greeting=data.get("greeting"),
+            created_at=(
+                datetime.fromisoformat(data["created_at"])
+                if "created_at" in data
+                else None
+            ),
+            updated_at=(
+                datetime.fromisoformat(data["updated_at"])
+                if "updated_at" in data
+                else None
+            ),
+        )
+
+
+def _stored_records() -> list[dict]:
+    """Build stored items as the storage adapter reads them."""
+    records = []
+    for index in range(RECORD_COUNT):
+        timestamp = (FIRST_TIMESTAMP + timedelta(seconds=index)).isoformat()
+        records.append(
+            {
+                "name": f"user-{index}",
+                "greeting": f"Hi user-{index}",
+                "created_at": timestamp,
+                "updated_at": timestamp,
+            }
+        )
+    return records
+
+
+def _bytes_per_object(model_class: type, records: list[dict]) -> float:
+    """Measure the memory allocated per model built from stored records."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    models = [model_class.from_dict(record) for record in records]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before - len(models) * 8) / len(models)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    records = _stored_records()
+
+    for model_class in (LegacyHelloWorld, HelloWorld):
+        size = _bytes_per_object(model_class, records)
+        print(f"{model_class.__name__:<20} {size:>8.1f} bytes per object")
+
+    legacy_models = [LegacyHelloWorld.from_dict(record) for record in records]
+    models = [HelloWorld.from_dict(record) for record in records]
+    epoch_models = [
+        HelloWorld.from_dict(model.to_dict(TimestampFormat.EPOCH_MILLIS))
+        for model in models
+    ]
+
+    results = [
+        measure(
+            "legacy from_dict",
+            lambda: [LegacyHelloWorld.from_dict(record) for record in records],
+            ITERATIONS,
+            RECORD_COUNT,
+            warmup=1,
+        ),
+        measure(
+            "slotted from_dict",
+            lambda: [HelloWorld.from_dict(record) for record in records],
+            ITERATIONS,
+            RECORD_COUNT,
+            warmup=1,
+        ),
+        measure(
+            "legacy to_dict",
+            lambda: [model.to_dict() for model in legacy_models],
+            ITERATIONS,
+            RECORD_COUNT,
+            warmup=1,
+        ),
+        measure(
+            "slotted to_dict (iso)",
+            lambda: [model.to_dict() for model in models],
+            ITERATIONS,
+            RECORD_COUNT,
+            warmup=1,
+        ),
+        measure(
+            "slotted to_dict (epoch_ms)",
+            lambda: [
+                model.to_dict(TimestampFormat.EPOCH_MILLIS) for model in epoch_models
+            ],
+            ITERATIONS,
+            RECORD_COUNT,
+            warmup=1,
+        ),
+    ]
+    print_results(f"HelloWorld serialization ({RECORD_COUNT:,} records)", results)
+
+
+if __name__ == "__main__":
+    main()
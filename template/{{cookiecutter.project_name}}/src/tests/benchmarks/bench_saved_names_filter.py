@@ -0,0 +1,127 @@
+"""
+Benchmark the saved-names Bloom filter in front of DynamoDB reads.
+
+Looks up greetings at several hit ratios (the share of names with a saved
+greeting) through the storage adapter alone and behind the filter, against
+an out-of-process local DynamoDB server, and reports the latency and the
+reads that reached DynamoDB. Also reports the filter size and observed
+false-positive rate at several configured rates.
+"""
+
+import os
+
+from adapters.hello_world_storage_adapter import HelloWorldStorageAdapter
+from adapters.saved_names_filter_adapter import SavedNamesFilterAdapter
+from models.hello_world_model import HelloWorld
+from utils.bloom_filter import BloomFilter
+
+from tests.benchmarks.timing import measure, print_results
+from tests.utils.local_dynamodb import LocalDynamoDB
+
+# Constants
+TABLE_NAME = "GreetingsTable-bench-filter"
+LOOKUP_COUNT = 100
+ITERATIONS = 5
+SIMULATED_LATENCY_MS = 2.0
+HIT_RATIOS = [0.05, 0.25, 0.5, 0.9]
+# Read capacity units of an eventually consistent read of up to 4 KB
+READ_UNITS_PER_READ = 0.5
+FILTER_CAPACITY = 1_000_000
+FALSE_POSITIVE_RATES = [0.1, 0.01, 0.001]
+PROBE_COUNT = 100_000
+
+
+class CountingStorageAdapter(HelloWorldStorageAdapter):
+    """Storage adapter counting the reads that reach DynamoDB."""
+
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    def get_saved_greeting(self, name, *args):
+        self.reads += 1
+        return super().get_saved_greeting(name, *args)
+
+
+def _lookup_all(adapter, names: list[str]) -> None:
+    """Read the greeting of every name, one request at a time."""
+    for name in names:
+        adapter.get_saved_greeting(name)
+
+
+def _report_reads(label: str, adapter: CountingStorageAdapter, lookups: int) -> str:
+    """Format the reads per lookup made through an adapter."""
+    reads = adapter.reads / lookups
+    return (
+        f"{label:<40} reads/lookup={reads:>5.2f} "
+        f"RCU/1k lookups={reads * READ_UNITS_PER_READ * 1000:>7.1f}"
+    )
+
+
+def _report_sizes() -> None:
+    """Print the filter size and false-positive rate per configured rate."""
+    print(f"\n== Filter size ({FILTER_CAPACITY:,} names)")
+    for rate in FALSE_POSITIVE_RATES:
+        saved_names = BloomFilter.from_keys(
+            (f"saved-{index}" for index in range(FILTER_CAPACITY)),
+            false_positive_rate=rate,
+        )
+        false_positives = sum(
+            f"unsaved-{index}" in saved_names for index in range(PROBE_COUNT)
+        )
+        print(
+            f"rate={rate:<6} size={saved_names.size_bytes / 1024:>8.0f} KiB "
+            f"snapshot={len(saved_names.to_bytes()) / 1024:>8.0f} KiB "
+            f"hashes={saved_names.hash_count:>2} "
+            f"observed={false_positives / PROBE_COUNT:.4f}"
+        )
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    with LocalDynamoDB(isolated=True, latency_ms=SIMULATED_LATENCY_MS) as server:
+        os.environ.update(server.environment)
+        os.environ["HELLO_WORLD_TABLE_NAME"] = server.create_greetings_table(TABLE_NAME)
+
+        results = []
+        read_reports = []
+        for ratio in HIT_RATIOS:
+            saved_count = int(LOOKUP_COUNT * ratio)
+            names = [f"bench-{ratio}-{index}" for index in range(LOOKUP_COUNT)]
+            seed = HelloWorldStorageAdapter()
+            for name in names[:saved_count]:
+                seed.save_greeting(HelloWorld(name=name, greeting=f"Hi {name}"))
+
+            unfiltered = CountingStorageAdapter()
+            storage = CountingStorageAdapter()
+            filtered = SavedNamesFilterAdapter(
+                BloomFilter.from_keys(names[:saved_count], capacity=LOOKUP_COUNT),
+                storage,
+            )
+            for label, adapter, counter in (
+                (f"no filter, hit ratio={ratio}", unfiltered, unfiltered),
+                (f"bloom filter, hit ratio={ratio}", filtered, storage),
+            ):
+                results.append(
+                    measure(
+                        label,
+                        lambda adapter=adapter, names=names: _lookup_all(
+                            adapter, names
+                        ),
+                        ITERATIONS,
+                        LOOKUP_COUNT,
+                        warmup=1,
+                    )
+                )
+                read_reports.append(
+                    _report_reads(label, counter, LOOKUP_COUNT * (ITERATIONS + 1))
+                )
+
+    print_results(f"Greeting lookups ({LOOKUP_COUNT} names per call)", results)
+    print("\n== DynamoDB reads")
+    print("\n".join(read_reports))
+    _report_sizes()
+
+
+if __name__ == "__main__":
+    main()
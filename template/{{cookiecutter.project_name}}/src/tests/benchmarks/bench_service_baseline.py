@@ -0,0 +1,66 @@
+"""
+Benchmark the hello world service without storage costs.
+
+Runs the same service calls on the in-memory adapter, the zero-I/O
+baseline, and on the DynamoDB adapter against an out-of-process local
+DynamoDB server; the difference is the cost of storage.
+"""
+
+import os
+
+from adapters.hello_world_storage_adapter import HelloWorldStorageAdapter
+from adapters.in_memory_hello_world_adapter import InMemoryHelloWorldAdapter
+from domain.services.hello_world_service import HelloWorldService
+
+from tests.benchmarks.timing import measure, print_results
+from tests.utils.local_dynamodb import LocalDynamoDB
+
+# Constants
+TABLE_NAME = "GreetingsTable-bench-baseline"
+NAME_COUNT = 32
+ITERATIONS = 20
+
+
+def _measure_service(label: str, service: HelloWorldService, names: list[str]):
+    """Measure saves, single reads and batch reads of a service."""
+    return [
+        measure(
+            f"{label}, save_greeting",
+            lambda: [service.save_greeting(name, f"Hi {name}") for name in names],
+            ITERATIONS,
+            NAME_COUNT,
+        ),
+        measure(
+            f"{label}, get_greeting",
+            lambda: [service.get_greeting(name) for name in names],
+            ITERATIONS,
+            NAME_COUNT,
+        ),
+        measure(
+            f"{label}, get_greetings",
+            lambda: service.get_greetings(names),
+            ITERATIONS,
+            NAME_COUNT,
+        ),
+    ]
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    names = [f"bench-user-{index}" for index in range(NAME_COUNT)]
+    results = _measure_service(
+        "in-memory", HelloWorldService(InMemoryHelloWorldAdapter()), names
+    )
+
+    with LocalDynamoDB(isolated=True) as server:
+        os.environ.update(server.environment)
+        os.environ["HELLO_WORLD_TABLE_NAME"] = server.create_greetings_table(TABLE_NAME)
+        results += _measure_service(
+            "dynamodb", HelloWorldService(HelloWorldStorageAdapter()), names
+        )
+
+    print_results(f"Service calls ({NAME_COUNT} names per sample)", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark the cost of tracing decorators.
+
+Compares a plain call with the same function decorated by a tracer that is
+off, recording to memory, and sampling every root span out.
+"""
+
+from observability.tracing import InMemoryBackend, Tracer
+
+from tests.benchmarks.timing import measure, print_results
+
+# Constants
+CALLS_PER_SAMPLE = 10_000
+ITERATIONS = 50
+
+
+def _greet(name: str) -> str:
+    """Stand-in for a port call."""
+    return name
+
+
+def _calls(func) -> None:
+    """Call a function CALLS_PER_SAMPLE times."""
+    for _ in range(CALLS_PER_SAMPLE):
+        func("World")
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    backend = InMemoryBackend()
+    variants = {
+        "plain call": _greet,
+        "tracing off": Tracer().trace()(_greet),
+        "tracing on, sampled out": Tracer(backend, sample_rate=0.0).trace()(_greet),
+        "tracing on, in-memory": Tracer(backend).trace()(_greet),
+    }
+
+    results = []
+    for name, func in variants.items():
+        results.append(
+            measure(name, lambda func=func: _calls(func), ITERATIONS, CALLS_PER_SAMPLE)
+        )
+        backend.clear()
+    print_results("Traced call overhead", results)
+
+    plain, off = results[0], results[1]
+    per_call = (off.mean - plain.mean) / CALLS_PER_SAMPLE
+    print(f"\ntracing off adds {per_call * 1e9:.0f}ns per call")
+
+
+if __name__ == "__main__":
+    main()
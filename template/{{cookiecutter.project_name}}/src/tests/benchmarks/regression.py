@@ -0,0 +1,234 @@
+"""
+Gate the request hot path benchmarks against stored baselines.
+
+Usage:
+    python -m tests.benchmarks.regression [--threshold 0.25] [--processes 5]
+    python -m tests.benchmarks.regression --update
+
+The best time per call of every benchmark is compared with its baseline
+in ``baselines.json``, and the command exits with status 1 when one is
+slower by more than the threshold. Timings are normalized by a fixed
+pure-Python calibration workload, sampled in turn with every benchmark so
+that both run under the same load, and baselines recorded on one machine
+hold on another. Within a process the best samples are kept, as noise
+only ever slows a sample down; the timings of a process also depend on
+its memory layout and hash seed, so every benchmark is timed in several
+fresh processes and their median is compared. Rerun with ``--update``
+after a deliberate change of the hot path and commit the file.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from tests.benchmarks import bench_hot_path
+
+# Constants
+BASELINES_FILE = Path(__file__).with_name("baselines.json")
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_PROCESSES = 5
+# Calibration and benchmark samples taken for every benchmark in a process
+ROUNDS = 30
+CALIBRATION_SIZE = 200
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """A benchmark timing compared with its baseline."""
+
+    name: str
+    # Time per call in units of the calibration workload
+    current: float
+    baseline: float | None
+
+    @property
+    def ratio(self) -> float | None:
+        """Current time over baseline time, None without a baseline."""
+        return None if self.baseline is None else self.current / self.baseline
+
+    def regressed(self, threshold: float) -> bool:
+        """Whether the benchmark is slower than its baseline by over threshold."""
+        return self.ratio is not None and self.ratio > 1 + threshold
+
+    def summary(self, threshold: float) -> str:
+        """Format the comparison as a single report line."""
+        if self.ratio is None:
+            return f"{self.name:<40} new, no baseline"
+        status = "REGRESSED" if self.regressed(threshold) else "ok"
+        return f"{self.name:<40} {self.ratio:>6.2f}x baseline  {status}"
+
+
+def _calibration_workload() -> None:
+    """Exercise the interpreter the way the hot path does: calls, dicts, strings."""
+    values = {str(index): index for index in range(CALIBRATION_SIZE)}
+    sorted(f"{key}-{value}" for key, value in values.items())
+
+
+def calibrated_time(func: Callable[[], object]) -> float:
+    """
+    Time one call of a benchmark in units of the calibration workload.
+
+    Calibration and benchmark samples alternate, with the garbage collector
+    paused as timeit does, and the best sample of each is kept.
+
+    Args:
+        func: Benchmarked call
+
+    Returns:
+        Best time per call over best calibration time
+    """
+    sample = bench_hot_path.repeat(func)
+    calibration, benchmark = [], []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(ROUNDS):
+            calibration.append(_time(_calibration_workload))
+            benchmark.append(_time(sample))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return min(benchmark) / bench_hot_path.OPERATIONS_PER_SAMPLE / min(calibration)
+
+
+def _time(func: Callable[[], object]) -> float:
+    """Time one call of a function in seconds."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def measure_in_process() -> dict[str, float]:
+    """
+    Time every hot path benchmark in this process.
+
+    Returns:
+        Calibrated time per call of each benchmark
+    """
+    with bench_hot_path.hot_path() as benchmarks:
+        return {name: calibrated_time(func) for name, func in benchmarks.items()}
+
+
+def measure_in_processes(processes: int) -> dict[str, float]:
+    """
+    Time every hot path benchmark in several fresh processes.
+
+    Args:
+        processes: Number of processes to run one after the other
+
+    Returns:
+        Median over the processes of the calibrated time per call of each
+        benchmark
+
+    Raises:
+        RuntimeError: If a process fails
+    """
+    runs = []
+    for _ in range(processes):
+        result = subprocess.run(
+            [sys.executable, "-m", __spec__.name, "--worker"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            msg = f"Benchmark process failed:\n{result.stderr[-2000:]}"
+            raise RuntimeError(msg)
+        runs.append(json.loads(result.stdout))
+    return {name: statistics.median(run[name] for run in runs) for name in runs[0]}
+
+
+def compare(timings: dict[str, float], baselines: dict[str, float]) -> list[Comparison]:
+    """
+    Compare calibrated timings with their baselines.
+
+    Args:
+        timings: Calibrated time per call of each benchmark
+        baselines: Calibrated baseline time per call of each benchmark
+
+    Returns:
+        One comparison per benchmark timed, in the order of ``timings``
+    """
+    return [
+        Comparison(name, current, baselines.get(name))
+        for name, current in timings.items()
+    ]
+
+
+def load_baselines(path: Path = BASELINES_FILE) -> dict[str, float]:
+    """
+    Load the calibrated baselines.
+
+    Args:
+        path: Baselines file
+
+    Returns:
+        Calibrated time per call of each benchmark (none if no file)
+    """
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))["benchmarks"]
+
+
+def save_baselines(timings: dict[str, float], path: Path = BASELINES_FILE) -> None:
+    """
+    Store timings as the new baselines.
+
+    Args:
+        timings: Calibrated time per call of each benchmark
+        path: Baselines file
+    """
+    document = {
+        # Informational only: comparisons use the calibrated timings
+        "recorded_with": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+        },
+        "benchmarks": {name: round(value, 6) for name, value in timings.items()},
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+
+
+def main() -> None:
+    """Run the hot path benchmarks and compare or store their timings."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--baselines", type=Path, default=BASELINES_FILE)
+    parser.add_argument("--processes", type=int, default=DEFAULT_PROCESSES)
+    parser.add_argument(
+        "--update", action="store_true", help="Store the timings as baselines"
+    )
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(measure_in_process()))
+        return
+
+    timings = measure_in_processes(args.processes)
+
+    if args.update:
+        save_baselines(timings, args.baselines)
+        print(f"Stored {len(timings)} baselines in {args.baselines}")
+        return
+
+    comparisons = compare(timings, load_baselines(args.baselines))
+    print(f"== Hot path against baselines (threshold {args.threshold:.0%})")
+    for comparison in comparisons:
+        print(comparison.summary(args.threshold))
+    regressed = sum(c.regressed(args.threshold) for c in comparisons)
+    if regressed:
+        print(f"{regressed} of {len(comparisons)} benchmarks regressed")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
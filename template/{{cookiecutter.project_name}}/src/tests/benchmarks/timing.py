@@ -0,0 +1,97 @@
+"""
+Timing helpers shared by the benchmarks.
+"""
+
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+# Constants
+DEFAULT_WARMUP = 3
+MICROSECONDS = 1_000_000
+PERCENTILE_99 = 0.99
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Wall-clock samples collected for one benchmark."""
+
+    name: str
+    samples: list[float]
+    operations_per_sample: int = 1
+
+    @property
+    def mean(self) -> float:
+        """Mean sample duration in seconds."""
+        return statistics.fmean(self.samples)
+
+    @property
+    def p50(self) -> float:
+        """Median sample duration in seconds."""
+        return statistics.median(self.samples)
+
+    @property
+    def p99(self) -> float:
+        """99th percentile sample duration in seconds."""
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * PERCENTILE_99))]
+
+    @property
+    def ops_per_second(self) -> float:
+        """Operations per second derived from the mean sample duration."""
+        return self.operations_per_sample / self.mean
+
+    def summary(self) -> str:
+        """Format the result as a single report line."""
+        return (
+            f"{self.name:<40} mean={self.mean * MICROSECONDS:>12.1f}us "
+            f"p50={self.p50 * MICROSECONDS:>12.1f}us "
+            f"p99={self.p99 * MICROSECONDS:>12.1f}us "
+            f"ops/s={self.ops_per_second:>14,.0f}"
+        )
+
+
+def measure(
+    name: str,
+    func: Callable[[], object],
+    iterations: int,
+    operations_per_sample: int = 1,
+    warmup: int = DEFAULT_WARMUP,
+) -> BenchmarkResult:
+    """
+    Time repeated calls of a function.
+
+    Args:
+        name: Benchmark name used in reports
+        func: Zero-argument callable to time
+        iterations: Number of timed calls
+        operations_per_sample: Logical operations performed by one call
+        warmup: Number of untimed calls made first
+
+    Returns:
+        The collected benchmark result
+    """
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+
+    return BenchmarkResult(name, samples, operations_per_sample)
+
+
+def print_results(title: str, results: list[BenchmarkResult]) -> None:
+    """
+    Print a block of benchmark results.
+
+    Args:
+        title: Heading printed above the results
+        results: Results to print
+    """
+    print(f"\n== {title}")
+    for result in results:
+        print(result.summary())
@@ -2,9 +2,37 @@
 Test configuration and fixtures.
 """
 
+import importlib
+import json
+import uuid
 from unittest.mock import MagicMock
 
 import pytest
+from adapters.aws_client_factory import aws_clients
+from config.config_service import config
+from observability.metrics import metrics
+
+from tests.utils.key_namespace import KeyNamespace
+from tests.utils.local_dynamodb import LocalDynamoDB
+from tests.utils.resource_discovery import ResourceDiscovery, get_resource_discovery
+
+
+def pytest_addoption(parser):
+    """Add the option running the tests on the shared table against AWS."""
+    parser.addoption(
+        "--live",
+        action="store_true",
+        help="run the tests on the shared greetings table against the deployed "
+        "stack instead of the local DynamoDB server",
+    )
+
+
+@pytest.fixture(autouse=True)
+def fresh_config():
+    """Fixture reloading the configuration snapshot for every test."""
+    config.clear()
+    yield
+    config.clear()
 
 
 @pytest.fixture
@@ -35,8 +63,108 @@ def lambda_context():
         "arn:aws:lambda:us-east-1:123456789012:function:test-function"
     )
     context.memory_limit_in_mb = "256"
-    context.remaining_time_in_millis = lambda: 30000
+    context.get_remaining_time_in_millis = lambda: 30000
     context.aws_request_id = "test-request-id"
     context.log_group_name = "/aws/lambda/test-function"
     context.log_stream_name = "2023/01/01/[$LATEST]test-stream"
     return context
+
+
+@pytest.fixture(scope="session")
+def resource_discovery() -> ResourceDiscovery:
+    """Fixture providing the deployed resources, discovered once per session."""
+    return get_resource_discovery()
+
+
+@pytest.fixture(scope="session")
+def key_namespace() -> KeyNamespace:
+    """Fixture providing the key namespace of this test worker."""
+    return KeyNamespace()
+
+
+@pytest.fixture(scope="session")
+def shared_table_environment(request, key_namespace):
+    """
+    Fixture providing the environment of the greetings table of this worker.
+
+    With --live, it is the deployed GreetingsTable; otherwise a table
+    created from the same definition on the local DynamoDB server. The
+    items of every key of the worker namespace are deleted from it at the
+    end of the session.
+    """
+    if request.config.getoption("--live"):
+        discovery = request.getfixturevalue("resource_discovery")
+        table_name = discovery.get_dynamodb_table_name("GreetingsTable")
+        environment, client = {}, None
+    else:
+        server = request.getfixturevalue("local_dynamodb")
+        table_name = server.create_greetings_table("GreetingsTable")
+        environment, client = server.environment, server.client()
+    yield {**environment, "HELLO_WORLD_TABLE_NAME": table_name}
+    if key_namespace.keys:
+        key_namespace.delete_from(table_name, client)
+
+
+@pytest.fixture
+def shared_greetings_table(shared_table_environment, monkeypatch):
+    """Fixture pointing the configuration at the greetings table of this worker."""
+    for key, value in shared_table_environment.items():
+        monkeypatch.setenv(key, value)
+    aws_clients.clear()
+    config.clear()
+    yield shared_table_environment["HELLO_WORLD_TABLE_NAME"]
+    aws_clients.clear()
+
+
+@pytest.fixture(scope="session")
+def local_dynamodb():
+    """Fixture providing a local DynamoDB server for the test session."""
+    with LocalDynamoDB() as server:
+        yield server
+
+
+@pytest.fixture
+def local_greetings_table(local_dynamodb, monkeypatch):
+    """Fixture providing a fresh greetings table on the local DynamoDB server."""
+    for key, value in local_dynamodb.environment.items():
+        monkeypatch.setenv(key, value)
+    aws_clients.clear()
+
+    table_name = local_dynamodb.create_greetings_table(
+        f"GreetingsTable-{uuid.uuid4().hex[:8]}"
+    )
+    monkeypatch.setenv("HELLO_WORLD_TABLE_NAME", table_name)
+    config.clear()
+    yield table_name
+    local_dynamodb.delete_table(table_name)
+    aws_clients.clear()
+    config.clear()
+
+
+@pytest.fixture
+def hello_world_handler():
+    """
+    Fixture providing the Hello World handler module.
+
+    Handlers validate their configuration when imported, so request this
+    fixture after the one configuring the greetings table.
+    """
+    return importlib.import_module("functions.hello_world.handler")
+
+
+@pytest.fixture
+def emf_documents(capsys):
+    """Fixture flushing recorded metrics and returning the EMF documents."""
+    metrics.clear()
+    capsys.readouterr()
+
+    def flush() -> list[dict]:
+        metrics.flush()
+        return [
+            json.loads(line)
+            for line in capsys.readouterr().out.splitlines()
+            if line.startswith("{")
+        ]
+
+    yield flush
+    metrics.clear()
@@ -0,0 +1,123 @@
+"""
+Integration tests for AsyncHelloWorldStorageAdapter and SyncHelloWorldFacade.
+
+Tests run against the local DynamoDB stand-in server.
+"""
+
+import asyncio
+
+import pytest
+from adapters.async_hello_world_storage_adapter import AsyncHelloWorldStorageAdapter
+from adapters.sync_hello_world_facade import SyncHelloWorldFacade
+from domain.services.hello_world_service import HelloWorldService
+from models.hello_world_model import HelloWorld
+
+# Constants
+MAX_CONCURRENCY = 3
+LOOKUP_DELAY_SECONDS = 0.01
+
+
+@pytest.fixture(autouse=True)
+def greetings_table(local_greetings_table):
+    """Use a fresh local greetings table for every test."""
+    return local_greetings_table
+
+
+class TrackingAsyncAdapter(AsyncHelloWorldStorageAdapter):
+    """Adapter recording the peak number of in-flight lookups."""
+
+    def __init__(self, max_concurrency: int):
+        super().__init__(max_concurrency=max_concurrency)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def get_saved_greeting(self, name: str, *args) -> HelloWorld:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(LOOKUP_DELAY_SECONDS)
+            return await super().get_saved_greeting(name, *args)
+        finally:
+            self.in_flight -= 1
+
+
+class TestAsyncHelloWorldStorageAdapter:
+    """Test suite for AsyncHelloWorldStorageAdapter."""
+
+    def test_default_greeting_for_unknown_name(self):
+        """Test that an unknown name falls back to the default greeting."""
+
+        async def scenario() -> HelloWorld:
+            async with AsyncHelloWorldStorageAdapter() as adapter:
+                return await adapter.get_saved_greeting("Unknown")
+
+        model = asyncio.run(scenario())
+        assert model.name == "Unknown"
+        assert model.formatted_greeting == "Hello, Unknown!"
+
+    def test_save_and_get_greeting(self):
+        """Test that a saved greeting is returned by a later lookup."""
+
+        async def scenario() -> HelloWorld:
+            async with AsyncHelloWorldStorageAdapter() as adapter:
+                await adapter.save_greeting(HelloWorld(name="Alice", greeting="Hi!"))
+                return await adapter.get_saved_greeting("Alice")
+
+        model = asyncio.run(scenario())
+        assert model.greeting == "Hi!"
+
+    def test_get_saved_greetings_preserves_order(self):
+        """Test that concurrent lookups return results in input order."""
+        names = ["Alice", "Bob", "Charlie", "Diana"]
+
+        async def scenario() -> list[HelloWorld]:
+            async with AsyncHelloWorldStorageAdapter() as adapter:
+                await adapter.save_greeting(HelloWorld(name="Bob", greeting="Yo Bob"))
+                return await adapter.get_saved_greetings(names)
+
+        models = asyncio.run(scenario())
+        assert [model.name for model in models] == names
+        assert models[1].formatted_greeting == "Yo Bob"
+        assert models[0].formatted_greeting == "Hello, Alice!"
+
+    def test_get_saved_greetings_is_bounded(self):
+        """Test that no more than max_concurrency lookups run at once."""
+        names = [f"User{index}" for index in range(10)]
+
+        async def scenario() -> TrackingAsyncAdapter:
+            async with TrackingAsyncAdapter(MAX_CONCURRENCY) as adapter:
+                await adapter.get_saved_greetings(names)
+                return adapter
+
+        adapter = asyncio.run(scenario())
+        assert adapter.peak_in_flight == MAX_CONCURRENCY
+
+    def test_invalid_max_concurrency(self):
+        """Test that a non-positive concurrency limit is rejected."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            AsyncHelloWorldStorageAdapter(max_concurrency=0)
+
+
+class TestSyncHelloWorldFacade:
+    """Test suite for SyncHelloWorldFacade."""
+
+    def test_facade_with_sync_service(self):
+        """Test that the facade plugs into the synchronous service."""
+        facade = SyncHelloWorldFacade()
+        try:
+            service = HelloWorldService(hello_world_port=facade)
+            service.save_greeting("Alice", "Welcome back, Alice")
+            assert service.get_greeting("Alice") == "Welcome back, Alice"
+            assert service.get_greetings(["Alice", "Bob"]) == [
+                "Welcome back, Alice",
+                "Hello, Bob!",
+            ]
+        finally:
+            facade.close()
+
+    def test_facade_close_is_idempotent(self):
+        """Test that closing the facade twice is safe."""
+        facade = SyncHelloWorldFacade()
+        facade.get_saved_greeting("Test")
+        facade.close()
+        facade.close()
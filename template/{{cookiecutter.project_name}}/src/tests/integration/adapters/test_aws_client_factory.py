@@ -0,0 +1,141 @@
+"""
+Integration tests for the shared AWS client factory.
+
+Tests client caching, profile configuration and per-adapter profile
+selection against the local DynamoDB stand-in server.
+"""
+
+import threading
+
+import pytest
+from adapters.aws_client_factory import (
+    CLIENT_PROFILES,
+    AwsClientFactory,
+    get_client_profile,
+)
+from adapters.hello_world_storage_adapter import HelloWorldStorageAdapter
+from config.config_service import ConfigurationError
+from config.settings import CLIENT_PROFILE_NAMES
+from models.hello_world_model import HelloWorld
+
+
+@pytest.fixture(autouse=True)
+def greetings_table(local_greetings_table):
+    """Use a fresh local greetings table for every test."""
+    return local_greetings_table
+
+
+@pytest.fixture
+def factory():
+    """Provide an empty client factory."""
+    return AwsClientFactory()
+
+
+class TestAwsClientFactory:
+    """Test suite for AwsClientFactory."""
+
+    def test_client_is_cached(self, factory):
+        """Test that the same client is returned for the same key."""
+        assert factory.client("dynamodb") is factory.client("dynamodb")
+
+    def test_profiles_get_distinct_clients(self, factory):
+        """Test that each profile gets its own client."""
+        default_client = factory.client("dynamodb")
+        bulk_client = factory.client("dynamodb", "high_throughput")
+        assert default_client is not bulk_client
+
+    def test_regions_get_distinct_clients(self, factory):
+        """Test that each region gets its own client."""
+        client = factory.client("dynamodb", region_name="eu-west-1")
+        assert client.meta.region_name == "eu-west-1"
+        assert client is not factory.client("dynamodb", region_name="us-west-2")
+
+    def test_profile_is_applied(self, factory):
+        """Test that the profile settings reach the botocore configuration."""
+        profile = CLIENT_PROFILES["high_throughput"]
+        client_config = factory.client("dynamodb", profile).meta.config
+        assert client_config.max_pool_connections == profile.max_pool_connections
+        assert client_config.connect_timeout == profile.connect_timeout
+        assert client_config.read_timeout == profile.read_timeout
+        assert client_config.tcp_keepalive is True
+        assert client_config.retries["mode"] == "adaptive"
+        assert client_config.retries["total_max_attempts"] == profile.max_attempts
+
+    def test_resources_are_cached_per_thread(self, factory):
+        """Test that resources are shared within, but not across, threads."""
+        main_resource = factory.resource("dynamodb")
+        other = {}
+        thread = threading.Thread(
+            target=lambda: other.update(resource=factory.resource("dynamodb"))
+        )
+        thread.start()
+        thread.join()
+        assert factory.resource("dynamodb") is main_resource
+        assert other["resource"] is not main_resource
+
+    def test_clear_drops_cached_clients(self, factory):
+        """Test that clear forces new clients to be created."""
+        client = factory.client("dynamodb")
+        factory.clear()
+        assert factory.client("dynamodb") is not client
+
+    def test_profiles_match_setting_choices(self):
+        """Test that HELLO_WORLD_CLIENT_PROFILE accepts exactly the profiles."""
+        assert set(CLIENT_PROFILES) == set(CLIENT_PROFILE_NAMES)
+
+    def test_unknown_profile(self):
+        """Test that an unknown profile name is a configuration error."""
+        with pytest.raises(ConfigurationError, match="no-such-profile"):
+            get_client_profile("no-such-profile")
+
+
+class TestClientProfileWithin:
+    """Test suite for ClientProfile.within."""
+
+    def test_profile_kept_with_enough_time(self):
+        """Test that a budget above the worst case keeps the profile."""
+        profile = get_client_profile()
+        assert profile.within(profile.worst_case_seconds() + 1) is profile
+
+    def test_profile_fits_short_budget(self):
+        """Test that a short budget trims attempts and timeouts to fit."""
+        profile = get_client_profile()
+        derived = profile.within(2.5)
+        assert derived.max_attempts < profile.max_attempts
+        assert derived.worst_case_seconds() <= 2.5
+        assert derived.read_timeout < profile.read_timeout
+
+    def test_budgets_share_profiles(self):
+        """Test that close budgets derive the same profile."""
+        profile = get_client_profile()
+        assert profile.within(2.5) == profile.within(3.5)
+
+    def test_no_profile_without_time(self):
+        """Test that a budget below the minimum call time gives no profile."""
+        assert get_client_profile().within(0.01) is None
+
+
+class TestAdapterClientProfile:
+    """Test suite for client profile selection through ConfigService."""
+
+    def test_adapter_uses_default_profile(self):
+        """Test that the adapter uses the default profile when unset."""
+        adapter = HelloWorldStorageAdapter()
+        assert adapter.client_profile is get_client_profile()
+
+    def test_adapter_uses_configured_profile(self, monkeypatch):
+        """Test that HELLO_WORLD_CLIENT_PROFILE selects the adapter profile."""
+        monkeypatch.setenv("HELLO_WORLD_CLIENT_PROFILE", "low_latency")
+        adapter = HelloWorldStorageAdapter()
+        client_config = adapter.table.meta.client.meta.config
+        assert adapter.client_profile.name == "low_latency"
+        assert client_config.retries["mode"] == "standard"
+
+        adapter.save_greeting(HelloWorld(name="Alice", greeting="Hi Alice"))
+        assert adapter.get_saved_greeting("Alice").greeting == "Hi Alice"
+
+    def test_adapters_share_resource(self):
+        """Test that adapters reuse the cached resource and its pool."""
+        assert (
+            HelloWorldStorageAdapter().dynamodb is HelloWorldStorageAdapter().dynamodb
+        )
@@ -0,0 +1,102 @@
+"""
+Integration tests for deadline-bound adapter calls.
+
+Tests that reads fall back to the default greeting when the invocation
+runs out of time, against the local moto server with injected latency.
+"""
+
+import asyncio
+import time
+
+import pytest
+from adapters.async_hello_world_storage_adapter import AsyncHelloWorldStorageAdapter
+from adapters.hello_world_storage_adapter import HelloWorldStorageAdapter
+from models.hello_world_model import HelloWorld
+from utils.deadline import Deadline, DeadlineExceededError, deadline_scope
+
+# Constants
+SLOW_RESPONSE_MS = 1500
+DEADLINE_SECONDS = 0.3
+# Calls must give up well before the slow response arrives
+MAX_FALLBACK_SECONDS = 1.0
+
+
+@pytest.fixture
+def saved_greeting():
+    """Save a greeting to fall back from, in the table of the test."""
+    HelloWorldStorageAdapter().save_greeting(HelloWorld(name="Alice", greeting="Hi"))
+    return "Alice"
+
+
+@pytest.fixture
+def slow_dynamodb(local_dynamodb, monkeypatch):
+    """Delay every response of the local DynamoDB server."""
+    monkeypatch.setattr(local_dynamodb.app, "latency_ms", SLOW_RESPONSE_MS)
+
+
+@pytest.mark.usefixtures("local_greetings_table")
+class TestStorageAdapterDeadline:
+    """Test suite for HelloWorldStorageAdapter under a deadline."""
+
+    def test_read_without_time_left(self, saved_greeting, emf_documents):
+        """Test that an expired deadline returns the default greeting."""
+        adapter = HelloWorldStorageAdapter()
+        with deadline_scope(Deadline.after(0)):
+            greeting = adapter.get_saved_greeting(saved_greeting)
+        assert greeting.formatted_greeting == "Hello, Alice!"
+        (document,) = emf_documents()
+        assert document["DeadlineFallbacks"] == 1
+
+    def test_read_within_deadline(self, saved_greeting):
+        """Test that a read with enough time left is unaffected."""
+        adapter = HelloWorldStorageAdapter()
+        with deadline_scope(Deadline.after(DEADLINE_SECONDS)):
+            assert adapter.get_saved_greeting(saved_greeting).greeting == "Hi"
+
+    def test_slow_read_times_out(self, saved_greeting, slow_dynamodb, emf_documents):
+        """Test that a slow read gives up in time and falls back."""
+        adapter = HelloWorldStorageAdapter()
+        start = time.monotonic()
+        with deadline_scope(Deadline.after(DEADLINE_SECONDS)):
+            greeting = adapter.get_saved_greeting(saved_greeting)
+        assert greeting.greeting is None
+        assert time.monotonic() - start < MAX_FALLBACK_SECONDS
+        (document,) = emf_documents()
+        assert document["DeadlineFallbacks"] == 1
+
+    def test_save_without_time_left(self, saved_greeting):
+        """Test that a save is not attempted without time left."""
+        adapter = HelloWorldStorageAdapter()
+        with (
+            deadline_scope(Deadline.after(0)),
+            pytest.raises(DeadlineExceededError),
+        ):
+            adapter.save_greeting(HelloWorld(name="Bob", greeting="Hey"))
+
+
+@pytest.mark.usefixtures("local_greetings_table")
+class TestAsyncStorageAdapterDeadline:
+    """Test suite for AsyncHelloWorldStorageAdapter under a deadline."""
+
+    def test_slow_read_times_out(self, saved_greeting, slow_dynamodb, emf_documents):
+        """Test that a slow read is cancelled at the deadline and falls back."""
+
+        async def read():
+            async with AsyncHelloWorldStorageAdapter() as adapter:
+                with deadline_scope(Deadline.after(DEADLINE_SECONDS)):
+                    return await adapter.get_saved_greeting(saved_greeting)
+
+        assert asyncio.run(read()).greeting is None
+        (document,) = emf_documents()
+        assert document["DeadlineFallbacks"] == 1
+
+    def test_save_without_time_left(self, saved_greeting):
+        """Test that a save is not attempted without time left."""
+
+        async def save():
+            async with AsyncHelloWorldStorageAdapter() as adapter:
+                with deadline_scope(Deadline.after(0)):
+                    await adapter.save_greeting(HelloWorld(name="Bob", greeting="Hey"))
+
+        with pytest.raises(DeadlineExceededError):
+            asyncio.run(save())
@@ -0,0 +1,239 @@
+"""
+Integration tests for listing and exporting greetings.
+
+Tests recency ordering, continuation tokens and the parallel segmented
+export against the local DynamoDB stand-in server.
+"""
+
+import threading
+import time
+from decimal import Decimal
+
+import pytest
+from adapters.greeting_listing import (
+    LISTING_SHARDS,
+    SHARD_PARTITIONS,
+    build_list_requests,
+    decode_continuation_token,
+    encode_continuation_token,
+    listing_shard,
+    merge_pages,
+    parallel_scan,
+)
+from adapters.hello_world_storage_adapter import HelloWorldStorageAdapter
+from domain.services.hello_world_service import HelloWorldService
+from models.hello_world_model import HelloWorld
+
+# Constants
+GREETING_COUNT = 7
+PAGE_SIZE = 3
+EXPORT_COUNT = 40
+
+
+@pytest.fixture
+def adapter():
+    """Fixture providing a storage adapter on the table of the test."""
+    return HelloWorldStorageAdapter()
+
+
+@pytest.fixture
+def saved_names(adapter):
+    """Save greetings one after the other, returning the names in save order."""
+    names = [f"user-{index}" for index in range(GREETING_COUNT)]
+    for name in names:
+        adapter.save_greeting(HelloWorld(name=name, greeting=f"Hi {name}"))
+        # Distinct update times, whatever the clock resolution
+        time.sleep(0.002)
+    return names
+
+
+@pytest.mark.usefixtures("local_greetings_table")
+class TestListGreetings:
+    """Test suite for HelloWorldStorageAdapter.list_greetings."""
+
+    def test_most_recent_first(self, adapter, saved_names):
+        """Test that greetings are listed by descending update time."""
+        page = adapter.list_greetings(page_size=GREETING_COUNT + 1)
+        assert [greeting.name for greeting in page.greetings] == saved_names[::-1]
+        assert page.greetings[0].greeting == f"Hi {saved_names[-1]}"
+
+    def test_pages_follow_tokens(self, adapter, saved_names):
+        """Test that continuation tokens walk every greeting exactly once."""
+        listed, token, pages = [], None, 0
+        while True:
+            page = adapter.list_greetings(PAGE_SIZE, token)
+            listed.extend(greeting.name for greeting in page.greetings)
+            pages += 1
+            assert len(page.greetings) <= PAGE_SIZE
+            token = page.next_token
+            if token is None:
+                break
+        assert listed == saved_names[::-1]
+        assert pages >= GREETING_COUNT // PAGE_SIZE
+
+    def test_resaved_greeting_moves_to_front(self, adapter, saved_names):
+        """Test that saving a greeting again lists it first."""
+        adapter.save_greeting(HelloWorld(name=saved_names[0], greeting="Welcome back"))
+        first = adapter.list_greetings(page_size=1).greetings[0]
+        assert first.name == saved_names[0]
+        assert first.greeting == "Welcome back"
+
+    def test_empty_table(self, adapter):
+        """Test that an empty table lists a single empty page."""
+        page = adapter.list_greetings()
+        assert page.greetings == []
+        assert page.next_token is None
+
+    @pytest.mark.parametrize("page_size", [0, 101])
+    def test_page_size_out_of_range(self, adapter, page_size):
+        """Test that page sizes outside 1..MAX_PAGE_SIZE are rejected."""
+        with pytest.raises(ValueError, match="page_size"):
+            adapter.list_greetings(page_size)
+
+    @pytest.mark.parametrize("token", ["not a token", "e30=", "W10="])
+    def test_invalid_token(self, adapter, token):
+        """Test that a token not produced by a listing is rejected."""
+        with pytest.raises(ValueError, match="Invalid continuation token"):
+            adapter.list_greetings(continuation_token=token)
+
+    def test_pages_merge_shards(self, adapter):
+        """Test that a page takes the most recent greetings of every shard."""
+        names = [f"shard-{index}" for index in range(4 * LISTING_SHARDS)]
+        assert len({listing_shard(name) for name in names}) > 1
+        for name in names:
+            adapter.save_greeting(HelloWorld(name=name, greeting="Hi"))
+            time.sleep(0.002)
+
+        listed, token = [], None
+        while True:
+            page = adapter.list_greetings(PAGE_SIZE, token)
+            listed.extend(greeting.name for greeting in page.greetings)
+            token = page.next_token
+            if token is None:
+                break
+        assert listed == names[::-1]
+
+    def test_service_lists_greetings(self, adapter, saved_names):
+        """Test that the service lists greetings through its port."""
+        page = HelloWorldService(adapter).list_greetings(page_size=1)
+        assert [greeting.name for greeting in page.greetings] == [saved_names[-1]]
+
+
+class TestMergePages:
+    """Test suite for merging the pages of the shards."""
+
+    def test_mixed_timestamp_formats(self):
+        """Test that ISO and epoch-millisecond update times sort together."""
+        iso_shard, epoch_shard = SHARD_PARTITIONS[:2]
+        responses = {
+            iso_shard: {
+                "Items": [
+                    {"name": "Carol", "updated_at": "2024-01-01T00:00:03+00:00"},
+                    {"name": "Alice", "updated_at": "2024-01-01T00:00:01"},
+                ]
+            },
+            # 2024-01-01T00:00:02Z
+            epoch_shard: {
+                "Items": [{"name": "Bob", "updated_at": Decimal(1704067202000)}]
+            },
+        }
+        requests = build_list_requests(3, {iso_shard: None, epoch_shard: None})
+        items, start_keys = merge_pages(responses, requests, 3)
+        assert [item["name"] for item in items] == ["Carol", "Bob", "Alice"]
+        assert start_keys is None
+
+
+class TestContinuationToken:
+    """Test suite for continuation token encoding."""
+
+    def test_round_trip(self):
+        """Test that a decoded token gives back the key of each shard."""
+        shard, fresh_shard = SHARD_PARTITIONS[:2]
+        key = {"name": "Alice", "listing": shard, "updated_at": "2024-01-01"}
+        start_keys = {shard: key, fresh_shard: None}
+        token = encode_continuation_token(start_keys)
+        assert token.isascii()
+        assert decode_continuation_token(token) == start_keys
+
+    def test_unknown_shard(self):
+        """Test that a token naming another partition is rejected."""
+        token = encode_continuation_token({"greeting": None})
+        with pytest.raises(ValueError, match="Invalid continuation token"):
+            decode_continuation_token(token)
+
+    def test_no_more_pages(self):
+        """Test that no key means no token and no token means no key."""
+        assert encode_continuation_token(None) is None
+        assert decode_continuation_token(None) is None
+
+
+@pytest.mark.usefixtures("local_greetings_table")
+class TestExportGreetings:
+    """Test suite for the parallel segmented export."""
+
+    @pytest.mark.parametrize("segments", [1, 4])
+    def test_export_yields_every_greeting(self, adapter, segments):
+        """Test that every greeting is exported exactly once."""
+        names = {f"export-{index}" for index in range(EXPORT_COUNT)}
+        for name in names:
+            adapter.save_greeting(HelloWorld(name=name, greeting="Hi"))
+
+        exported = [greeting.name for greeting in adapter.export_greetings(segments)]
+        assert sorted(exported) == sorted(names)
+
+    def test_invalid_segments(self, adapter):
+        """Test that fewer than one segment is rejected up front."""
+        with pytest.raises(ValueError, match="segments"):
+            adapter.export_greetings(0)
+
+
+class TestParallelScan:
+    """Test suite for parallel_scan with a stand-in Scan call."""
+
+    def test_segments_scanned_concurrently(self):
+        """Test that every page of every segment is yielded."""
+        calls = []
+        lock = threading.Lock()
+
+        def scan(Segment, TotalSegments, ExclusiveStartKey=0):
+            with lock:
+                calls.append((Segment, TotalSegments, ExclusiveStartKey))
+            page = {"Items": [(Segment, ExclusiveStartKey)]}
+            if ExclusiveStartKey < 2:
+                page["LastEvaluatedKey"] = ExclusiveStartKey + 1
+            return page
+
+        items = [item for page in parallel_scan(scan, 3) for item in page["Items"]]
+        assert sorted(items) == [(s, p) for s in range(3) for p in range(3)]
+        assert {total for _, total, _ in calls} == {3}
+
+    def test_segment_error_raised(self):
+        """Test that the error of a segment is raised to the consumer."""
+
+        def scan(Segment, **_request):
+            if Segment == 1:
+                msg = "segment failed"
+                raise RuntimeError(msg)
+            return {"Items": []}
+
+        with pytest.raises(RuntimeError, match="segment failed"):
+            list(parallel_scan(scan, 2))
+
+    def test_closing_stops_segments(self):
+        """Test that closing the iterator stops the segments early."""
+        calls = []
+
+        def scan(ExclusiveStartKey=0, **_request):
+            calls.append(ExclusiveStartKey)
+            return {
+                "Items": [ExclusiveStartKey],
+                "LastEvaluatedKey": ExclusiveStartKey + 1,
+            }
+
+        pages = parallel_scan(scan, 1)
+        next(pages)
+        pages.close()
+        time.sleep(0.3)
+        stopped_at = len(calls)
+        time.sleep(0.3)
+        assert len(calls) == stopped_at
@@ -0,0 +1,165 @@
+"""
+Integration tests for greeting read options of both storage adapters.
+
+Tests projections, consistency modes and consumed capacity reporting
+against the local DynamoDB stand-in server.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from adapters.async_hello_world_storage_adapter import AsyncHelloWorldStorageAdapter
+from adapters.hello_world_storage_adapter import HelloWorldStorageAdapter
+from adapters.sync_hello_world_facade import SyncHelloWorldFacade
+from domain.services.hello_world_service import HelloWorldService
+from models.hello_world_model import HelloWorld
+from ports.hello_world_port import ReadConsistency
+
+# Constants
+CONCURRENT_SAVES = 32
+
+
+@pytest.fixture(autouse=True)
+def greetings_table(local_greetings_table):
+    """Use a fresh local greetings table for every test."""
+    return local_greetings_table
+
+
+@pytest.fixture(params=["sync", "async"])
+def adapter(request):
+    """Provide the synchronous adapter or the asynchronous one behind a facade."""
+    if request.param == "sync":
+        yield HelloWorldStorageAdapter()
+        return
+    facade = SyncHelloWorldFacade(AsyncHelloWorldStorageAdapter())
+    yield facade
+    facade.close()
+
+
+@pytest.fixture
+def get_item_calls():
+    """Record the GetItem parameters sent by a synchronous adapter."""
+    calls = []
+
+    def track(adapter: HelloWorldStorageAdapter) -> HelloWorldStorageAdapter:
+        adapter.table.meta.client.meta.events.register(
+            "provide-client-params.dynamodb.GetItem",
+            lambda params, **_: calls.append(dict(params)),
+        )
+        return adapter
+
+    track.calls = calls
+    return track
+
+
+class TestGreetingReads:
+    """Test suite for projections and consistency modes."""
+
+    def test_projection_returns_requested_fields(self, adapter):
+        """Test that a projected read only returns the requested attributes."""
+        adapter.save_greeting(HelloWorld(name="Alice", greeting="Hi Alice"))
+        model = adapter.get_saved_greeting("Alice", fields=["greeting"])
+        assert model.name == "Alice"
+        assert model.formatted_greeting == "Hi Alice"
+        assert model.version is None
+
+    def test_full_read_by_default(self, adapter):
+        """Test that all attributes are read without a projection."""
+        adapter.save_greeting(HelloWorld(name="Bob", greeting="Hi Bob"))
+        assert adapter.get_saved_greeting("Bob").version == 1
+
+    def test_strong_consistency(self, adapter):
+        """Test that a strongly consistent read sees the latest write."""
+        adapter.save_greeting(HelloWorld(name="Carol", greeting="Hi Carol"))
+        models = adapter.get_saved_greetings(
+            ["Carol", "Dave"], ["greeting"], ReadConsistency.STRONG
+        )
+        assert [model.formatted_greeting for model in models] == [
+            "Hi Carol",
+            "Hello, Dave!",
+        ]
+
+    def test_request_parameters(self, get_item_calls):
+        """Test the GetItem parameters for a projection and consistency mode."""
+        adapter = get_item_calls(HelloWorldStorageAdapter())
+        adapter.get_saved_greeting("Erin")
+        adapter.get_saved_greeting("Erin", ["greeting"], ReadConsistency.STRONG)
+
+        full_read, projected_read = get_item_calls.calls
+        assert full_read["ConsistentRead"] is False
+        assert "ProjectionExpression" not in full_read
+        assert projected_read["ConsistentRead"] is True
+        assert projected_read["ProjectionExpression"] == "#p0, #p1"
+        assert projected_read["ExpressionAttributeNames"] == {
+            "#p0": "name",
+            "#p1": "greeting",
+        }
+
+    def test_service_reads_only_the_greeting(self, get_item_calls):
+        """Test that the handler path projects the rendered attribute only."""
+        adapter = get_item_calls(HelloWorldStorageAdapter())
+        HelloWorldService(adapter).get_greeting("Frank")
+        (params,) = get_item_calls.calls
+        assert params["ExpressionAttributeNames"] == {
+            "#p0": "name",
+            "#p1": "greeting",
+        }
+
+
+class TestConsumedCapacity:
+    """Test suite for consumed capacity reporting."""
+
+    def test_not_reported_by_default(self, adapter, emf_documents):
+        """Test that capacity is not requested or recorded by default."""
+        adapter.save_greeting(HelloWorld(name="Grace", greeting="Hi"))
+        adapter.get_saved_greeting("Grace")
+        (document,) = emf_documents()
+        assert "GetItemLatency" in document
+        assert "GetItemConsumedCapacity" not in document
+
+    def test_recorded_as_metric(self, monkeypatch, emf_documents):
+        """Test that consumed capacity is recorded per operation."""
+        monkeypatch.setenv("HELLO_WORLD_REPORT_CONSUMED_CAPACITY", "true")
+        adapter = HelloWorldStorageAdapter()
+        adapter.save_greeting(HelloWorld(name="Heidi", greeting="Hi"))
+        adapter.get_saved_greeting("Heidi", ["greeting"])
+
+        (document,) = emf_documents()
+        assert document["UpdateItemConsumedCapacity"] > 0
+        assert document["GetItemConsumedCapacity"] > 0
+        assert {"Name": "GetItemConsumedCapacity", "Unit": "Count"} in document["_aws"][
+            "CloudWatchMetrics"
+        ][0]["Metrics"]
+        assert adapter.consumed_capacity_units == (
+            document["UpdateItemConsumedCapacity"] + document["GetItemConsumedCapacity"]
+        )
+
+    def test_accumulated_across_threads(self, monkeypatch):
+        """Test that saves from concurrent threads all add their capacity."""
+        monkeypatch.setenv("HELLO_WORLD_REPORT_CONSUMED_CAPACITY", "true")
+        adapter = HelloWorldStorageAdapter()
+        adapter.save_greeting(HelloWorld(name="Ivan", greeting="Hi"))
+        units_per_save = adapter.consumed_capacity_units
+
+        with ThreadPoolExecutor(8) as pool:
+            list(
+                pool.map(
+                    lambda index: adapter.save_greeting(
+                        HelloWorld(name=f"user-{index}", greeting="Hi")
+                    ),
+                    range(CONCURRENT_SAVES),
+                )
+            )
+        assert units_per_save > 0
+        assert adapter.consumed_capacity_units == pytest.approx(
+            units_per_save * (CONCURRENT_SAVES + 1)
+        )
+
+    def test_async_adapter_accumulates(self, monkeypatch):
+        """Test that the asynchronous adapter accumulates consumed capacity."""
+        monkeypatch.setenv("HELLO_WORLD_REPORT_CONSUMED_CAPACITY", "true")
+        async_adapter = AsyncHelloWorldStorageAdapter()
+        facade = SyncHelloWorldFacade(async_adapter)
+        facade.get_saved_greetings(["Ivan", "Judy"])
+        facade.close()
+        assert async_adapter.consumed_capacity_units > 0
@@ -0,0 +1,137 @@
+"""
+Integration tests for the greeting upsert of both storage adapters.
+
+Tests creation time preservation, version counting and optimistic
+concurrency against the local DynamoDB stand-in server.
+"""
+
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+from adapters.async_hello_world_storage_adapter import AsyncHelloWorldStorageAdapter
+from adapters.hello_world_storage_adapter import HelloWorldStorageAdapter
+from adapters.sync_hello_world_facade import SyncHelloWorldFacade
+from domain.services.hello_world_service import HelloWorldService
+from models.hello_world_model import HelloWorld
+from ports.hello_world_port import VersionConflictError
+
+# Constants
+ORIGINAL_CREATED_AT = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture(autouse=True)
+def greetings_table(local_greetings_table):
+    """Use a fresh local greetings table for every test."""
+    return local_greetings_table
+
+
+@pytest.fixture(params=["sync", "async"])
+def adapter(request):
+    """Provide the synchronous adapter or the asynchronous one behind a facade."""
+    if request.param == "sync":
+        yield HelloWorldStorageAdapter()
+        return
+    facade = SyncHelloWorldFacade(AsyncHelloWorldStorageAdapter())
+    yield facade
+    facade.close()
+
+
+class TestGreetingUpsert:
+    """Test suite for the UpdateItem based save_greeting."""
+
+    def test_created_at_is_preserved(self, adapter):
+        """Test that saving again keeps the original creation time."""
+        first = HelloWorld(name="Alice", greeting="Hi", created_at=ORIGINAL_CREATED_AT)
+        adapter.save_greeting(first)
+
+        second = HelloWorld(name="Alice", greeting="Hello again")
+        adapter.save_greeting(second)
+
+        stored = adapter.get_saved_greeting("Alice")
+        assert stored.greeting == "Hello again"
+        assert stored.created_at == ORIGINAL_CREATED_AT
+        assert second.created_at == ORIGINAL_CREATED_AT
+        assert stored.updated_at > ORIGINAL_CREATED_AT
+
+    def test_version_is_incremented(self, adapter):
+        """Test that every save increments the stored version."""
+        greeting = HelloWorld(name="Bob", greeting="Hi")
+        adapter.save_greeting(greeting)
+        assert greeting.version == 1
+
+        adapter.save_greeting(HelloWorld(name="Bob", greeting="Hey"))
+        assert adapter.get_saved_greeting("Bob").version == 2
+
+    def test_matching_version_is_saved(self, adapter):
+        """Test that a save at the current version succeeds."""
+        adapter.save_greeting(HelloWorld(name="Carol", greeting="Hi"))
+        current = adapter.get_saved_greeting("Carol")
+        current.greeting = "Updated"
+        adapter.save_greeting(current)
+        assert current.version == 2
+        assert adapter.get_saved_greeting("Carol").greeting == "Updated"
+
+    def test_stale_version_conflicts(self, adapter):
+        """Test that a save from a stale read is rejected."""
+        adapter.save_greeting(HelloWorld(name="Dave", greeting="Hi"))
+        first_reader = adapter.get_saved_greeting("Dave")
+        second_reader = adapter.get_saved_greeting("Dave")
+
+        first_reader.greeting = "First"
+        adapter.save_greeting(first_reader)
+        second_reader.greeting = "Second"
+        with pytest.raises(VersionConflictError) as error:
+            adapter.save_greeting(second_reader)
+
+        assert error.value.expected_version == 1
+        assert adapter.get_saved_greeting("Dave").greeting == "First"
+
+    def test_version_zero_only_creates(self, adapter):
+        """Test that expected version 0 refuses to overwrite an existing item."""
+        adapter.save_greeting(HelloWorld(name="Erin", greeting="Hi", version=0))
+        with pytest.raises(VersionConflictError):
+            adapter.save_greeting(HelloWorld(name="Erin", greeting="Again", version=0))
+
+    def test_version_zero_keeps_unversioned_item(self, adapter):
+        """Test that an item written before versioning is not overwritten."""
+        legacy = HelloWorld(name="Ivan", greeting="Legacy")
+        HelloWorldStorageAdapter().table.put_item(Item=legacy.to_dict())
+        with pytest.raises(VersionConflictError):
+            adapter.save_greeting(HelloWorld(name="Ivan", greeting="New", version=0))
+        assert adapter.get_saved_greeting("Ivan").greeting == "Legacy"
+
+
+class TestGreetingUpsertRoundTrips:
+    """Test suite for the number of DynamoDB calls per save."""
+
+    def test_save_is_a_single_update_item(self):
+        """Test that a save issues exactly one UpdateItem and no read."""
+        adapter = HelloWorldStorageAdapter()
+        calls = []
+        adapter.table.meta.client.meta.events.register(
+            "before-call.dynamodb", lambda model, **_: calls.append(model.name)
+        )
+        adapter.save_greeting(HelloWorld(name="Frank", greeting="Hi"))
+        adapter.save_greeting(HelloWorld(name="Frank", greeting="Hey", version=1))
+        assert calls == ["UpdateItem", "UpdateItem"]
+
+    def test_service_returns_new_version(self):
+        """Test that the service reports the saved version."""
+        service = HelloWorldService(HelloWorldStorageAdapter())
+        assert service.save_greeting("Grace", "Hi") == 1
+        assert service.save_greeting("Grace", "Hey", expected_version=1) == 2
+        with pytest.raises(VersionConflictError):
+            service.save_greeting("Grace", "Stale", expected_version=1)
+
+    def test_async_adapter_conflict(self):
+        """Test the conflict handling of the asynchronous adapter directly."""
+
+        async def scenario() -> None:
+            async with AsyncHelloWorldStorageAdapter() as adapter:
+                await adapter.save_greeting(HelloWorld(name="Heidi", greeting="Hi"))
+                stale = HelloWorld(name="Heidi", greeting="Stale", version=0)
+                await adapter.save_greeting(stale)
+
+        with pytest.raises(VersionConflictError):
+            asyncio.run(scenario())
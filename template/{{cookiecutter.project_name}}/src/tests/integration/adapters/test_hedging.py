@@ -0,0 +1,149 @@
+"""
+Integration tests for hedged requests.
+
+Tests the hedging policy with sleeping stand-in requests, and hedged
+greeting reads against the local moto server with injected latency.
+"""
+
+import itertools
+import threading
+import time
+
+import pytest
+from adapters.hedging import HedgingPolicy
+from adapters.hello_world_storage_adapter import HelloWorldStorageAdapter
+from models.hello_world_model import HelloWorld
+
+# Constants
+FAST_SECONDS = 0.001
+SLOW_SECONDS = 0.3
+HEDGE_DELAY_MS = 20
+SLOW_RESPONSE_MS = 500
+
+
+def slow_first(value: str = "ok", error: Exception | None = None):
+    """Build a request that is slow (or fails) the first time only."""
+    calls = itertools.count()
+    lock = threading.Lock()
+
+    def request() -> str:
+        with lock:
+            first = next(calls) == 0
+        if first:
+            time.sleep(SLOW_SECONDS)
+            if error is not None:
+                raise error
+            return "primary"
+        return value
+
+    return request
+
+
+@pytest.fixture
+def policy():
+    """Fixture providing a policy allowed to hedge every call."""
+    policy = HedgingPolicy(max_extra_rate=1, initial_delay_ms=HEDGE_DELAY_MS)
+    yield policy
+    policy.close()
+
+
+class TestHedgingPolicy:
+    """Test suite for HedgingPolicy."""
+
+    def test_fast_request_not_hedged(self, policy):
+        """Test that a request answering within the delay is not hedged."""
+        result = policy.call(lambda: "ok")
+        assert result.value == "ok"
+        assert not result.hedged
+        assert policy.hedges_issued == 0
+
+    def test_slow_request_hedged(self, policy):
+        """Test that a slow request is hedged and the hedge answers first."""
+        start = time.monotonic()
+        result = policy.call(slow_first("hedge"))
+        assert result.value == "hedge"
+        assert result.hedged
+        assert result.hedge_won
+        assert time.monotonic() - start < SLOW_SECONDS
+        assert (policy.hedges_issued, policy.hedges_won) == (1, 1)
+
+    def test_failed_request_hedged(self, policy):
+        """Test that the hedge answers when the slow request fails."""
+        result = policy.call(slow_first("hedge", RuntimeError("timeout")))
+        assert result.value == "hedge"
+        assert result.hedge_won
+
+    def test_all_requests_failing(self, policy):
+        """Test that the error is raised when every request fails."""
+
+        def request():
+            time.sleep(HEDGE_DELAY_MS * 2 / 1000)
+            raise RuntimeError("unavailable")
+
+        with pytest.raises(RuntimeError, match="unavailable"):
+            policy.call(request)
+        assert policy.hedges_issued == 1
+
+    def test_extra_rate_capped(self):
+        """Test that hedges stay within the maximum extra rate."""
+        policy = HedgingPolicy(max_extra_rate=0.25, initial_delay_ms=1)
+        try:
+            for _ in range(20):
+                policy.call(lambda: time.sleep(0.01))
+        finally:
+            policy.close()
+        assert policy.calls == 20
+        assert policy.hedges_issued == 5
+
+    def test_delay_follows_percentile(self, policy):
+        """Test that the delay converges to the observed latency percentile."""
+        for _ in range(64):
+            policy.call(lambda: time.sleep(FAST_SECONDS))
+        assert policy.delay < HEDGE_DELAY_MS / 1000
+
+    @pytest.mark.parametrize("options", [{"percentile": 100}, {"max_extra_rate": 2}])
+    def test_invalid_options(self, options):
+        """Test that out-of-range options are rejected."""
+        with pytest.raises(ValueError):
+            HedgingPolicy(**options)
+
+
+class TestHedgedGreetingReads:
+    """Test suite for hedged reads of HelloWorldStorageAdapter."""
+
+    def test_slow_read_hedged(
+        self, local_greetings_table, local_dynamodb, monkeypatch, emf_documents, policy
+    ):
+        """Test that a slow GetItem is hedged and the hedge's answer is used."""
+        HelloWorldStorageAdapter().save_greeting(
+            HelloWorld(name="Alice", greeting="Hi")
+        )
+        requests = itertools.count()
+        monkeypatch.setattr(
+            local_dynamodb.app,
+            "latency_ms",
+            lambda: SLOW_RESPONSE_MS if next(requests) == 0 else 0,
+        )
+
+        adapter = HelloWorldStorageAdapter(hedging=policy)
+        start = time.monotonic()
+        greeting = adapter.get_saved_greeting("Alice")
+        assert greeting.greeting == "Hi"
+        assert time.monotonic() - start < SLOW_RESPONSE_MS / 1000
+        assert (adapter.hedges_issued, adapter.hedges_won) == (1, 1)
+        (document,) = emf_documents()
+        assert document["GetItemHedges"] == 1
+        assert document["GetItemHedgeWins"] == 1
+
+    def test_hedging_from_settings(self, local_greetings_table, monkeypatch):
+        """Test that HELLO_WORLD_HEDGE_PERCENTILE enables hedging."""
+        monkeypatch.setenv("HELLO_WORLD_HEDGE_PERCENTILE", "99")
+        monkeypatch.setenv("HELLO_WORLD_HEDGE_MAX_EXTRA_RATE", "0.02")
+        adapter = HelloWorldStorageAdapter()
+        assert adapter.hedging.percentile == 99
+        assert adapter.hedging.max_extra_rate == 0.02
+        adapter.hedging.close()
+
+    def test_hedging_off_by_default(self, local_greetings_table):
+        """Test that reads are not hedged unless configured."""
+        assert HelloWorldStorageAdapter().hedging is None
@@ -0,0 +1,235 @@
+"""
+Contract tests of HelloWorldPort.
+
+Every implementation of the port runs the same tests: the DynamoDB
+adapters against the local DynamoDB stand-in server, and the in-memory
+adapter. An implementation passing them can replace another behind
+HelloWorldService.
+"""
+
+import time
+from datetime import UTC, datetime
+
+import pytest
+from adapters.async_hello_world_storage_adapter import AsyncHelloWorldStorageAdapter
+from adapters.hello_world_storage_adapter import HelloWorldStorageAdapter
+from adapters.in_memory_hello_world_adapter import InMemoryHelloWorldAdapter
+from adapters.sync_hello_world_facade import SyncHelloWorldFacade
+from domain.services.hello_world_service import HelloWorldService
+from models.hello_world_model import HelloWorld
+from ports.hello_world_port import ReadConsistency, VersionConflictError
+
+# Constants
+ORIGINAL_CREATED_AT = datetime(2024, 1, 1, tzinfo=UTC)
+GREETING_COUNT = 7
+PAGE_SIZE = 3
+EXPORT_COUNT = 30
+
+
+# Implementations of the port, and those also implementing GreetingCatalogPort
+PORTS = ["dynamodb", "async", "memory"]
+LISTING_PORTS = ["dynamodb", "memory"]
+
+
+def _create_port(request):
+    """Create the implementation named by the fixture parameter."""
+    if request.param == "memory":
+        return InMemoryHelloWorldAdapter()
+    request.getfixturevalue("local_greetings_table")
+    if request.param == "dynamodb":
+        return HelloWorldStorageAdapter()
+    facade = SyncHelloWorldFacade(AsyncHelloWorldStorageAdapter())
+    request.addfinalizer(facade.close)
+    return facade
+
+
+@pytest.fixture(params=PORTS)
+def port(request):
+    """Provide each implementation of the port, with nothing saved yet."""
+    return _create_port(request)
+
+
+@pytest.fixture(params=LISTING_PORTS)
+def listing_port(request):
+    """Provide each implementation able to list and export greetings."""
+    return _create_port(request)
+
+
+@pytest.fixture
+def listed_port(listing_port):
+    """Save greetings one after the other, returning the port and save order."""
+    names = [f"user-{index}" for index in range(GREETING_COUNT)]
+    for name in names:
+        listing_port.save_greeting(HelloWorld(name=name, greeting=f"Hi {name}"))
+        # Distinct update times, whatever the clock resolution
+        time.sleep(0.002)
+    return listing_port, names
+
+
+class TestReads:
+    """Contract of greeting reads."""
+
+    def test_unknown_name_gets_default_greeting(self, port):
+        """Test that a name without a saved greeting gets the default one."""
+        model = port.get_saved_greeting("Nobody")
+        assert model.name == "Nobody"
+        assert model.formatted_greeting == "Hello, Nobody!"
+        assert model.version is None
+
+    def test_saved_greeting_is_read(self, port):
+        """Test that a saved greeting is read back whole."""
+        port.save_greeting(HelloWorld(name="Alice", greeting="Hi Alice"))
+        model = port.get_saved_greeting("Alice", consistency=ReadConsistency.STRONG)
+        assert model.formatted_greeting == "Hi Alice"
+        assert model.version == 1
+
+    def test_projection(self, port):
+        """Test that attributes not read keep their model defaults."""
+        port.save_greeting(HelloWorld(name="Bob", greeting="Hi Bob"))
+        model = port.get_saved_greeting("Bob", fields=["greeting"])
+        assert model.name == "Bob"
+        assert model.formatted_greeting == "Hi Bob"
+        assert model.version is None
+
+    def test_several_names_in_order(self, port):
+        """Test that several greetings are read in the order of the names."""
+        port.save_greeting(HelloWorld(name="Carol", greeting="Hi Carol"))
+        models = port.get_saved_greetings(["Dave", "Carol", "Dave"], ["greeting"])
+        assert [model.formatted_greeting for model in models] == [
+            "Hello, Dave!",
+            "Hi Carol",
+            "Hello, Dave!",
+        ]
+
+
+class TestSaves:
+    """Contract of greeting saves."""
+
+    def test_created_at_is_preserved(self, port):
+        """Test that saving again keeps the original creation time."""
+        first = HelloWorld(name="Alice", greeting="Hi", created_at=ORIGINAL_CREATED_AT)
+        port.save_greeting(first)
+        second = HelloWorld(name="Alice", greeting="Hello again")
+        port.save_greeting(second)
+
+        stored = port.get_saved_greeting("Alice")
+        assert stored.greeting == "Hello again"
+        assert stored.created_at == ORIGINAL_CREATED_AT
+        assert second.created_at == ORIGINAL_CREATED_AT
+        assert stored.updated_at > ORIGINAL_CREATED_AT
+
+    def test_version_is_incremented(self, port):
+        """Test that every save increments the stored version."""
+        greeting = HelloWorld(name="Bob", greeting="Hi")
+        port.save_greeting(greeting)
+        assert greeting.version == 1
+        port.save_greeting(HelloWorld(name="Bob", greeting="Hey"))
+        assert port.get_saved_greeting("Bob").version == 2
+
+    def test_stale_version_conflicts(self, port):
+        """Test that a save from a stale read is rejected."""
+        port.save_greeting(HelloWorld(name="Dave", greeting="Hi"))
+        first_reader = port.get_saved_greeting("Dave")
+        second_reader = port.get_saved_greeting("Dave")
+
+        first_reader.greeting = "First"
+        port.save_greeting(first_reader)
+        assert first_reader.version == 2
+        second_reader.greeting = "Second"
+        with pytest.raises(VersionConflictError) as error:
+            port.save_greeting(second_reader)
+
+        assert error.value.expected_version == 1
+        assert port.get_saved_greeting("Dave").greeting == "First"
+
+    def test_version_zero_only_creates(self, port):
+        """Test that expected version 0 refuses to overwrite a greeting."""
+        port.save_greeting(HelloWorld(name="Erin", greeting="Hi", version=0))
+        with pytest.raises(VersionConflictError):
+            port.save_greeting(HelloWorld(name="Erin", greeting="Again", version=0))
+
+    def test_missing_greeting_conflicts(self, port):
+        """Test that a save expecting a version of a missing greeting fails."""
+        with pytest.raises(VersionConflictError):
+            port.save_greeting(HelloWorld(name="Frank", greeting="Hi", version=3))
+
+    def test_service_on_port(self, port):
+        """Test the service round trip through the port."""
+        service = HelloWorldService(port)
+        assert service.save_greeting("Grace", "Hi Grace") == 1
+        assert service.get_greeting("Grace") == "Hi Grace"
+        assert service.get_greetings(["Grace", "Heidi"]) == [
+            "Hi Grace",
+            "Hello, Heidi!",
+        ]
+
+
+class TestListing:
+    """Contract of greeting listings."""
+
+    def test_most_recent_first(self, listed_port):
+        """Test that greetings are listed by descending update time."""
+        port, names = listed_port
+        page = port.list_greetings(page_size=GREETING_COUNT + 1)
+        assert [greeting.name for greeting in page.greetings] == names[::-1]
+        assert page.greetings[0].greeting == f"Hi {names[-1]}"
+
+    def test_pages_follow_tokens(self, listed_port):
+        """Test that continuation tokens walk every greeting exactly once."""
+        port, names = listed_port
+        listed, token = [], None
+        while True:
+            page = port.list_greetings(PAGE_SIZE, token)
+            assert len(page.greetings) <= PAGE_SIZE
+            listed.extend(greeting.name for greeting in page.greetings)
+            token = page.next_token
+            if token is None:
+                break
+        assert listed == names[::-1]
+
+    def test_resaved_greeting_moves_to_front(self, listed_port):
+        """Test that saving a greeting again lists it first."""
+        port, names = listed_port
+        port.save_greeting(HelloWorld(name=names[0], greeting="Welcome back"))
+        (first,) = port.list_greetings(page_size=1).greetings
+        assert first.name == names[0]
+        assert first.greeting == "Welcome back"
+
+    def test_empty(self, listing_port):
+        """Test that nothing saved lists a single empty page."""
+        page = listing_port.list_greetings()
+        assert page.greetings == []
+        assert page.next_token is None
+
+    @pytest.mark.parametrize("page_size", [0, 101])
+    def test_page_size_out_of_range(self, listing_port, page_size):
+        """Test that page sizes outside 1..MAX_PAGE_SIZE are rejected."""
+        with pytest.raises(ValueError, match="page_size"):
+            listing_port.list_greetings(page_size)
+
+    @pytest.mark.parametrize("token", ["not a token", "e30=", "W10="])
+    def test_invalid_token(self, listing_port, token):
+        """Test that a token not produced by a listing is rejected."""
+        with pytest.raises(ValueError, match="Invalid continuation token"):
+            listing_port.list_greetings(continuation_token=token)
+
+
+class TestExport:
+    """Contract of greeting exports."""
+
+    @pytest.mark.parametrize("segments", [1, 4])
+    def test_every_greeting_once(self, listing_port, segments):
+        """Test that every greeting is exported exactly once."""
+        names = [f"export-{index}" for index in range(EXPORT_COUNT)]
+        for name in names:
+            listing_port.save_greeting(HelloWorld(name=name, greeting="Hi"))
+
+        exported = [
+            greeting.name for greeting in listing_port.export_greetings(segments)
+        ]
+        assert sorted(exported) == sorted(names)
+
+    def test_invalid_segments(self, listing_port):
+        """Test that fewer than one segment is rejected up front."""
+        with pytest.raises(ValueError, match="segments"):
+            listing_port.export_greetings(0)
@@ -4,62 +4,57 @@ Integration tests for HelloWorldStorageAdapter.
 Tests the adapter's interaction with DynamoDB and data persistence.
 """
 
-import os
-
 import pytest
 
 # Clean imports without src/shared prefixes
 from adapters.hello_world_storage_adapter import HelloWorldStorageAdapter
 from models.hello_world_model import HelloWorld
 
-# Import test utilities
-from tests.utils.resource_discovery import get_dynamodb_table_name
-
 
 @pytest.fixture(autouse=True)
-def dynamodb_table():
-    """Get DynamoDB table name and set environment variable."""
-    table_name = get_dynamodb_table_name("GreetingsTable")
-    os.environ["HELLO_WORLD_TABLE_NAME"] = table_name
-    return table_name
+def dynamodb_table(shared_greetings_table):
+    """Use the greetings table of this worker for every test."""
+    return shared_greetings_table
 
 
 class TestHelloWorldStorageAdapter:
     """Test suite for HelloWorldStorageAdapter."""
 
-    def test_storage_adapter_direct(self):
+    def test_storage_adapter_direct(self, key_namespace):
         """Test HelloWorldStorageAdapter directly."""
+        name = key_namespace.key("Test")
         adapter = HelloWorldStorageAdapter()
-        model = adapter.get_saved_greeting("Test")
+        model = adapter.get_saved_greeting(name)
         assert isinstance(model, HelloWorld)
-        assert model.name == "Test"
-        assert "Hello, Test!" in model.formatted_greeting
+        assert model.name == name
+        assert f"Hello, {name}!" in model.formatted_greeting
 
-    def test_adapter_persistence(self):
+    def test_adapter_persistence(self, key_namespace):
         """Test that adapter can save and retrieve data."""
+        name = key_namespace.key("PersistenceTest")
         adapter = HelloWorldStorageAdapter()
 
         # Create a greeting
-        original_model = adapter.get_saved_greeting("PersistenceTest")
+        original_model = adapter.get_saved_greeting(name)
 
         # Verify the model was created correctly
         assert isinstance(original_model, HelloWorld)
-        assert original_model.name == "PersistenceTest"
-        assert "Hello, PersistenceTest!" in original_model.formatted_greeting
+        assert original_model.name == name
+        assert f"Hello, {name}!" in original_model.formatted_greeting
 
         # Retrieve the same greeting again
-        retrieved_model = adapter.get_saved_greeting("PersistenceTest")
+        retrieved_model = adapter.get_saved_greeting(name)
 
         # Verify consistency
         assert retrieved_model.name == original_model.name
         assert retrieved_model.formatted_greeting == original_model.formatted_greeting
 
-    def test_adapter_different_names(self):
+    def test_adapter_different_names(self, key_namespace):
         """Test adapter with different names."""
         adapter = HelloWorldStorageAdapter()
 
         # Test multiple different names
-        names = ["Alice", "Bob", "Charlie"]
+        names = [key_namespace.key(name) for name in ["Alice", "Bob", "Charlie"]]
 
         for name in names:
             model = adapter.get_saved_greeting(name)
@@ -67,11 +62,11 @@ class TestHelloWorldStorageAdapter:
             assert model.name == name
             assert f"Hello, {name}!" in model.formatted_greeting
 
-    def test_adapter_initialization(self):
+    def test_adapter_initialization(self, key_namespace):
         """Test adapter initialization."""
         adapter = HelloWorldStorageAdapter()
         assert adapter is not None
 
         # Test that adapter can be used immediately
-        model = adapter.get_saved_greeting("InitTest")
+        model = adapter.get_saved_greeting(key_namespace.key("InitTest"))
         assert isinstance(model, HelloWorld)
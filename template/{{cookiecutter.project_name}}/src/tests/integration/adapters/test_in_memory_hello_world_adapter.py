@@ -0,0 +1,186 @@
+"""
+Integration tests for the in-memory hello world adapter.
+
+The port semantics are covered by the contract tests; these cover what
+only the in-memory adapter does: thread safety, batched puts, snapshots
+and injected faults.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from adapters.in_memory_hello_world_adapter import (
+    FaultProfile,
+    InjectedFaultError,
+    InMemoryHelloWorldAdapter,
+)
+from models.hello_world_model import HelloWorld
+from ports.hello_world_port import PutResult, VersionConflictError
+
+# Constants
+THREADS = 8
+SAVES_PER_THREAD = 50
+GREETING_COUNT = 40
+CALLS = 200
+LATENCY_MS = 20
+
+
+class TestThreadSafety:
+    """Test suite for concurrent use of one adapter."""
+
+    def test_concurrent_saves_count_every_version(self):
+        """Test that saves of the same name from many threads are all counted."""
+        adapter = InMemoryHelloWorldAdapter()
+
+        def save_many(thread: int) -> None:
+            for index in range(SAVES_PER_THREAD):
+                adapter.save_greeting(HelloWorld(name="Alice", greeting=f"{thread}"))
+                adapter.save_greeting(
+                    HelloWorld(name=f"t{thread}-{index}", greeting="Hi")
+                )
+
+        with ThreadPoolExecutor(THREADS) as executor:
+            list(executor.map(save_many, range(THREADS)))
+
+        assert adapter.get_saved_greeting("Alice").version == THREADS * SAVES_PER_THREAD
+        listed = adapter.list_greetings(page_size=1)
+        assert listed.next_token is not None
+        exported = list(adapter.export_greetings())
+        assert len(exported) == THREADS * SAVES_PER_THREAD + 1
+
+    def test_conditional_saves_have_one_winner(self):
+        """Test that only one of many creations of the same name succeeds."""
+        adapter = InMemoryHelloWorldAdapter()
+
+        def create_once(thread: int) -> bool:
+            greeting = HelloWorld(name="Bob", greeting=f"{thread}", version=0)
+            try:
+                adapter.save_greeting(greeting)
+            except VersionConflictError:
+                return False
+            return True
+
+        with ThreadPoolExecutor(THREADS) as executor:
+            created = list(executor.map(create_once, range(THREADS)))
+
+        assert created.count(True) == 1
+        assert adapter.get_saved_greeting("Bob").version == 1
+
+
+class TestPutGreetings:
+    """Test suite for batched puts, conditioned as in DynamoDB."""
+
+    def test_seeds_and_versions(self):
+        """Test that seeds overwrite, and versions never roll back."""
+        adapter = InMemoryHelloWorldAdapter()
+        saved = HelloWorld(name="Alice", greeting="Hi")
+        adapter.save_greeting(saved)
+        adapter.save_greeting(saved)
+        seed = HelloWorld(name="Alice", greeting="Seed")
+        assert adapter.put_greetings([seed]) == PutResult([], [])
+        stored = adapter.get_saved_greeting("Alice")
+        assert (stored.greeting, stored.version) == ("Seed", 1)
+
+        clash = HelloWorld(name="Alice", greeting="Clash", version=1)
+        new = HelloWorld(name="Bob", greeting="Hey", version=1)
+        assert adapter.put_greetings([clash, new]) == PutResult([new], [clash])
+        assert adapter.get_saved_greeting("Bob").greeting is None
+
+        newer = HelloWorld(name="Alice", greeting="Newer", version=2)
+        assert adapter.put_greetings([newer, new]) == PutResult([], [])
+        # Written again, as by a resumed load
+        assert adapter.put_greetings([newer, new]) == PutResult([], [])
+        assert adapter.get_saved_greeting("Alice").greeting == "Newer"
+        assert adapter.get_saved_greeting("Bob").version == 1
+
+
+class TestSnapshots:
+    """Test suite for snapshots and restores."""
+
+    def test_roundtrip(self, tmp_path):
+        """Test that a restored adapter reads and lists like the original."""
+        original = InMemoryHelloWorldAdapter()
+        for index in range(GREETING_COUNT):
+            original.save_greeting(HelloWorld(name=f"user-{index}", greeting="Hi"))
+        original.save_greeting(HelloWorld(name="user-0", greeting="Again"))
+        path = tmp_path / "greetings.jsonl"
+
+        assert original.snapshot(path) == GREETING_COUNT
+        restored = InMemoryHelloWorldAdapter()
+        restored.save_greeting(HelloWorld(name="replaced", greeting="Gone"))
+        assert restored.restore(path) == GREETING_COUNT
+
+        assert restored.get_saved_greeting("user-0") == original.get_saved_greeting(
+            "user-0"
+        )
+        assert restored.get_saved_greeting("replaced").greeting is None
+        assert restored.list_greetings(page_size=GREETING_COUNT) == (
+            original.list_greetings(page_size=GREETING_COUNT)
+        )
+        assert not path.with_name(f"{path.name}.tmp").exists()
+
+    def test_empty(self, tmp_path):
+        """Test that an empty adapter snapshots to an empty file and back."""
+        path = tmp_path / "empty.jsonl"
+        assert InMemoryHelloWorldAdapter().snapshot(path) == 0
+        assert path.read_bytes() == b""
+        assert InMemoryHelloWorldAdapter().restore(path) == 0
+
+    @pytest.mark.parametrize("line", ["not json", "[]", '{"name": "Alice"}'])
+    def test_invalid_line(self, tmp_path, line):
+        """Test that a file of something other than greetings is rejected."""
+        path = tmp_path / "invalid.jsonl"
+        path.write_text(line + "\n", encoding="utf-8")
+        adapter = InMemoryHelloWorldAdapter()
+        adapter.save_greeting(HelloWorld(name="kept", greeting="Hi"))
+
+        with pytest.raises(ValueError):
+            adapter.restore(path)
+
+        assert adapter.get_saved_greeting("kept").greeting == "Hi"
+
+
+class TestFaultProfile:
+    """Test suite for injected latency and errors."""
+
+    def test_seeded_errors_repeat(self):
+        """Test that a seeded profile fails the same calls every run."""
+
+        def failures() -> list[int]:
+            adapter = InMemoryHelloWorldAdapter(FaultProfile(error_rate=0.3, seed=7))
+            failed = []
+            for index in range(CALLS):
+                try:
+                    adapter.get_saved_greeting("Alice")
+                except InjectedFaultError as e:
+                    assert e.operation == "get_saved_greeting"
+                    failed.append(index)
+            return failed
+
+        first = failures()
+        assert first == failures()
+        assert 0 < len(first) < CALLS
+
+    def test_failed_save_is_not_stored(self):
+        """Test that a call failed on purpose has no effect."""
+        adapter = InMemoryHelloWorldAdapter(FaultProfile(error_rate=1.0))
+        with pytest.raises(InjectedFaultError):
+            adapter.save_greeting(HelloWorld(name="Alice", greeting="Hi"))
+        adapter.faults = FaultProfile()
+        assert adapter.get_saved_greeting("Alice").greeting is None
+        assert adapter.calls == 2
+
+    @pytest.mark.parametrize("latency_ms", [LATENCY_MS, lambda: LATENCY_MS])
+    def test_latency(self, latency_ms):
+        """Test that every call is delayed by the profile latency."""
+        adapter = InMemoryHelloWorldAdapter(FaultProfile(latency_ms=latency_ms))
+        start = time.perf_counter()
+        adapter.get_saved_greetings(["Alice", "Bob"])
+        assert time.perf_counter() - start >= LATENCY_MS / 1000
+
+    @pytest.mark.parametrize("error_rate", [-0.1, 1.5])
+    def test_invalid_error_rate(self, error_rate):
+        """Test that error rates outside 0..1 are rejected."""
+        with pytest.raises(ValueError, match="error_rate"):
+            FaultProfile(error_rate=error_rate)
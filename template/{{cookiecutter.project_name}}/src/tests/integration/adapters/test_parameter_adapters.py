@@ -0,0 +1,59 @@
+"""
+Integration tests for the parameter adapters.
+
+Tests the selection of the adapter, the local stand-in, and the Parameter
+Store adapter against the local moto server.
+"""
+
+import json
+
+import boto3
+import pytest
+from adapters.local_parameter_adapter import LocalParameterAdapter
+from adapters.parameter_adapter_factory import create_parameter_adapter
+from adapters.ssm_parameter_adapter import SsmParameterAdapter
+
+
+class TestParameterAdapterSelection:
+    """Test suite for create_parameter_adapter."""
+
+    def test_no_prefix(self, monkeypatch):
+        """Test that no adapter is created without a parameter prefix."""
+        monkeypatch.delenv("HELLO_WORLD_PARAMETER_PREFIX", raising=False)
+        assert create_parameter_adapter() is None
+
+    def test_local_file(self, monkeypatch, tmp_path):
+        """Test that a local parameters file selects the local stand-in."""
+        parameters_file = tmp_path / "parameters.json"
+        parameters_file.write_text(json.dumps({"/app/greeting": "Hi"}))
+        monkeypatch.setenv("HELLO_WORLD_PARAMETER_PREFIX", "/app/")
+        monkeypatch.setenv("HELLO_WORLD_LOCAL_PARAMETERS_FILE", str(parameters_file))
+
+        adapter = create_parameter_adapter()
+        assert isinstance(adapter, LocalParameterAdapter)
+        assert adapter.get_parameter("/app/greeting") == "Hi"
+
+
+class TestSsmParameterAdapter:
+    """Test suite for SsmParameterAdapter."""
+
+    @pytest.fixture
+    def ssm_client(self, local_dynamodb, local_greetings_table):
+        """Provide an SSM client of the local moto server."""
+        return boto3.client("ssm", endpoint_url=local_dynamodb.endpoint_url)
+
+    def test_get_parameter(self, ssm_client):
+        """Test single lookups, including of a missing parameter."""
+        ssm_client.put_parameter(Name="/store/greeting", Value="Hi", Type="String")
+        adapter = SsmParameterAdapter(ssm_client)
+        assert adapter.get_parameter("/store/greeting") == "Hi"
+        assert adapter.get_parameter("/store/missing") is None
+
+    def test_get_parameters_in_batches(self, ssm_client):
+        """Test that batch lookups span several GetParameters requests."""
+        names = [f"/store/batch/{index}" for index in range(12)]
+        for name in names:
+            ssm_client.put_parameter(Name=name, Value=name, Type="SecureString")
+        adapter = SsmParameterAdapter(ssm_client)
+        values = adapter.get_parameters([*names, "/store/batch/missing"])
+        assert values == {name: name for name in names}
@@ -0,0 +1,144 @@
+"""
+Integration tests for the saved-names filter adapter.
+
+Tests that reads of never-saved names skip DynamoDB, against the local
+moto server.
+"""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from adapters.aws_client_factory import aws_clients
+from adapters.hello_world_storage_adapter import HelloWorldStorageAdapter
+from adapters.saved_names_filter_adapter import (
+    SavedNamesFilterAdapter,
+    load_saved_names,
+    saved_names_from_stream,
+)
+from models.hello_world_model import HelloWorld
+from utils.bloom_filter import BloomFilter
+
+# Constants
+CAPACITY = 100
+MAX_AGE_SECONDS = 60
+
+
+class CountingStorageAdapter(HelloWorldStorageAdapter):
+    """Storage adapter recording the names it reads."""
+
+    def __init__(self):
+        super().__init__()
+        self.reads = []
+
+    def get_saved_greeting(self, name, *args):
+        self.reads.append(name)
+        return super().get_saved_greeting(name, *args)
+
+
+@pytest.fixture
+def storage():
+    """Provide a counting storage adapter over the table of the test."""
+    return CountingStorageAdapter()
+
+
+@pytest.fixture
+def adapter(storage):
+    """Provide a filter adapter over an empty filter."""
+    return SavedNamesFilterAdapter(BloomFilter(CAPACITY), storage)
+
+
+@pytest.mark.usefixtures("local_greetings_table")
+class TestSavedNamesFilterAdapter:
+    """Test suite for SavedNamesFilterAdapter."""
+
+    def test_unsaved_name_skips_read(self, adapter, storage, emf_documents):
+        """Test that a name never saved gets the default greeting without I/O."""
+        greeting = adapter.get_saved_greeting("Nobody")
+        assert greeting.formatted_greeting == "Hello, Nobody!"
+        assert storage.reads == []
+        (document,) = emf_documents()
+        assert document["SavedNamesFilterSkippedReads"] == 1
+
+    def test_saved_name_is_read(self, adapter, storage):
+        """Test that saving records the name, so later reads reach storage."""
+        adapter.save_greeting(HelloWorld(name="Alice", greeting="Hi Alice!"))
+        assert adapter.get_saved_greeting("Alice").greeting == "Hi Alice!"
+        assert storage.reads == ["Alice"]
+
+    def test_batch_reads_only_saved_names(self, adapter, storage):
+        """Test that a batch keeps its order and reads only saved names."""
+        adapter.save_greeting(HelloWorld(name="Alice", greeting="Hi Alice!"))
+        greetings = adapter.get_saved_greetings(["Bob", "Alice", "Carol"])
+        assert [greeting.formatted_greeting for greeting in greetings] == [
+            "Hello, Bob!",
+            "Hi Alice!",
+            "Hello, Carol!",
+        ]
+        assert storage.reads == ["Alice"]
+
+    def test_names_saved_elsewhere(self, adapter, storage):
+        """Test refreshing the filter from a DynamoDB Streams batch."""
+        HelloWorldStorageAdapter().save_greeting(HelloWorld(name="Dave", greeting="Yo"))
+        records = [
+            {"eventName": "INSERT", "dynamodb": {"Keys": {"name": {"S": "Dave"}}}},
+            {"eventName": "REMOVE", "dynamodb": {"Keys": {"name": {"S": "Erin"}}}},
+        ]
+        assert saved_names_from_stream(records) == ["Dave"]
+
+        adapter.record_saved_names(saved_names_from_stream(records))
+        assert adapter.get_saved_greeting("Dave").greeting == "Yo"
+
+    def test_stale_snapshot_is_bypassed_until_reloaded(
+        self, storage, emf_documents, monkeypatch
+    ):
+        """Test that an old snapshot is not trusted, and a newer one replaces it."""
+        monkeypatch.setattr(
+            "adapters.saved_names_filter_adapter.RELOAD_INTERVAL_SECONDS", 0
+        )
+        HelloWorldStorageAdapter().save_greeting(HelloWorld(name="Dave", greeting="Yo"))
+        stale = BloomFilter(CAPACITY)
+        stale.as_of = datetime.now(UTC) - timedelta(seconds=MAX_AGE_SECONDS + 1)
+        snapshots = []
+        adapter = SavedNamesFilterAdapter(
+            stale,
+            storage,
+            max_age_seconds=MAX_AGE_SECONDS,
+            reload=lambda: snapshots.pop(0) if snapshots else None,
+        )
+
+        # Nothing newer to load yet: the saved name is read, not skipped
+        assert adapter.get_saved_greeting("Dave").greeting == "Yo"
+        (document,) = emf_documents()
+        assert document["SavedNamesFilterStaleReads"] == 1
+
+        adapter.save_greeting(HelloWorld(name="Alice", greeting="Hi Alice!"))
+        fresh = BloomFilter.from_keys(["Dave"], CAPACITY)
+        fresh.as_of = datetime.now(UTC)
+        snapshots.append(fresh)
+
+        assert adapter.get_saved_greeting("Nobody").greeting is None
+        assert adapter.saved_names is fresh
+        # Recorded here, so carried over to the newer snapshot
+        assert "Alice" in fresh
+        assert storage.reads == ["Dave"]
+
+    def test_load_snapshot(self, tmp_path, emf_documents):
+        """Test loading the filter from a snapshot file."""
+        snapshot = tmp_path / "saved-names.bloom"
+        snapshot.write_bytes(BloomFilter.from_keys(["Alice"]).to_bytes())
+
+        saved_names = load_saved_names(str(snapshot))
+        assert "Alice" in saved_names
+        assert load_saved_names(None) is None
+        (document,) = emf_documents()
+        assert document["SavedNamesFilterSize"] == [saved_names.size_bytes]
+
+    def test_missing_s3_snapshot(self):
+        """Test that an S3 snapshot that cannot be read raises OSError."""
+        bucket = f"saved-names-{uuid.uuid4().hex[:8]}"
+        aws_clients.client("s3").create_bucket(Bucket=bucket)
+        with pytest.raises(OSError, match="NoSuchKey"):
+            load_saved_names(f"s3://{bucket}/saved-names.bloom")
+        with pytest.raises(ValueError, match="s3://bucket/key"):
+            load_saved_names(f"s3://{bucket}")
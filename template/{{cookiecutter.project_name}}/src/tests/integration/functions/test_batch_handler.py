@@ -0,0 +1,109 @@
+"""
+Integration tests for the Hello World batch handler.
+
+Tests that an SQS batch saves its greetings against the local moto server,
+reports the records that failed, and ignores the greetings table's own
+stream.
+"""
+
+import json
+
+import pytest
+from adapters.hello_world_storage_adapter import HelloWorldStorageAdapter
+
+# Constants
+STREAM_ARN = (
+    "arn:aws:dynamodb:us-east-1:123456789012:table/{}/stream/2024-01-01T00:00:00.000"
+)
+
+
+def sqs_event(*payloads):
+    """Build an SQS event with one message per payload."""
+    return {
+        "Records": [
+            {
+                "eventSource": "aws:sqs",
+                "messageId": f"m-{index}",
+                "body": json.dumps(payload),
+            }
+            for index, payload in enumerate(payloads)
+        ]
+    }
+
+
+def stream_event(table_name, name, greeting):
+    """Build a DynamoDB Streams event of a greeting saved in a table."""
+    return {
+        "Records": [
+            {
+                "eventSource": "aws:dynamodb",
+                "eventSourceARN": STREAM_ARN.format(table_name),
+                "eventName": "MODIFY",
+                "dynamodb": {
+                    "SequenceNumber": "1",
+                    "Keys": {"name": {"S": name}},
+                    "NewImage": {"name": {"S": name}, "greeting": {"S": greeting}},
+                },
+            }
+        ]
+    }
+
+
+@pytest.fixture
+def batch_lambda_handler(hello_world_handler):
+    """Provide the handler, imported once the table is configured."""
+    return hello_world_handler.batch_lambda_handler
+
+
+@pytest.mark.usefixtures("local_greetings_table")
+def test_batch_saves_greetings(lambda_context, batch_lambda_handler):
+    """Test that every greeting of a batch is saved, the last one per name."""
+    event = sqs_event(
+        {"name": "Alice", "greeting": "Hi Alice!"},
+        {"name": "Bob", "greeting": "Hey Bob!"},
+        {"name": "Alice", "greeting": "Hello Alice!"},
+    )
+
+    assert batch_lambda_handler(event, lambda_context) == {"batchItemFailures": []}
+
+    storage = HelloWorldStorageAdapter()
+    assert storage.get_saved_greeting("Alice").greeting == "Hello Alice!"
+    assert storage.get_saved_greeting("Alice").version == 1
+    assert storage.get_saved_greeting("Bob").greeting == "Hey Bob!"
+
+
+@pytest.mark.usefixtures("local_greetings_table")
+def test_batch_reports_invalid_records(lambda_context, batch_lambda_handler):
+    """Test that records without a greeting are reported as failures."""
+    event = sqs_event({"name": "Alice"}, {"name": "Bob", "greeting": "Hey Bob!"})
+
+    assert batch_lambda_handler(event, lambda_context) == {
+        "batchItemFailures": [{"itemIdentifier": "m-0"}]
+    }
+    assert HelloWorldStorageAdapter().get_saved_greeting("Bob").greeting == "Hey Bob!"
+
+
+def test_batch_ignores_own_stream(
+    lambda_context, local_greetings_table, batch_lambda_handler, emf_documents
+):
+    """Test that records of the greetings table's own stream are not saved."""
+    event = stream_event(local_greetings_table, "Alice", "Hi Alice!")
+
+    assert batch_lambda_handler(event, lambda_context) == {"batchItemFailures": []}
+
+    (document,) = emf_documents()
+    assert document["BatchOwnStreamRecords"] == 1
+    assert document["BatchSkippedRecords"] == 1
+    assert HelloWorldStorageAdapter().get_saved_greeting("Alice").greeting is None
+
+
+@pytest.mark.usefixtures("local_greetings_table")
+def test_batch_saves_other_streams(lambda_context, batch_lambda_handler):
+    """Test that records of another table's stream are saved."""
+    event = stream_event("OtherGreetings", "Alice", "Hi Alice!")
+
+    assert batch_lambda_handler(event, lambda_context) == {"batchItemFailures": []}
+
+    assert HelloWorldStorageAdapter().get_saved_greeting("Alice").greeting == (
+        "Hi Alice!"
+    )
@@ -5,13 +5,9 @@ Tests the Lambda handler's request/response processing and integration with serv
 """
 
 import json
-import os
 
 import pytest
 
-from functions.hello_world.handler import lambda_handler
-from tests.utils.resource_discovery import get_dynamodb_table_name
-
 # Constants
 HTTP_OK = 200
 HTTP_INTERNAL_SERVER_ERROR = 500
@@ -54,20 +50,27 @@ def lambda_context():
 
 
 @pytest.fixture(autouse=True)
-def dynamodb_table():
-    """Get DynamoDB table name and set environment variable."""
-    table_name = get_dynamodb_table_name("GreetingsTable")
-    os.environ["HELLO_WORLD_TABLE_NAME"] = table_name
-    return table_name
+def dynamodb_table(shared_greetings_table):
+    """Use the greetings table of this worker for every test."""
+    return shared_greetings_table
+
+
+@pytest.fixture
+def lambda_handler(hello_world_handler):
+    """Provide the handler, imported once the table is configured."""
+    return hello_world_handler.lambda_handler
 
 
 class TestLambdaHandler:
     """Test suite for Lambda handler."""
 
-    def test_lambda_handler_success(self, lambda_event, lambda_context):
+    def test_lambda_handler_success(
+        self, lambda_event, lambda_context, key_namespace, lambda_handler
+    ):
         """Test successful Lambda handler invocation."""
+        name = key_namespace.key("TestUser")
         # Update event with test name
-        lambda_event["queryStringParameters"] = {"name": "TestUser"}
+        lambda_event["queryStringParameters"] = {"name": name}
 
         # Invoke handler
         response = lambda_handler(lambda_event, lambda_context)
@@ -80,9 +83,11 @@ class TestLambdaHandler:
         # Parse response body
         body = json.loads(response["body"])
         assert "message" in body
-        assert "Hello, TestUser!" in body["message"]
+        assert f"Hello, {name}!" in body["message"]
 
-    def test_lambda_handler_default_name(self, lambda_event, lambda_context):
+    def test_lambda_handler_default_name(
+        self, lambda_event, lambda_context, lambda_handler
+    ):
         """Test Lambda handler with default name."""
         # Remove name from query parameters
         lambda_event["queryStringParameters"] = {}
@@ -95,7 +100,9 @@ class TestLambdaHandler:
         body = json.loads(response["body"])
         assert "Hello, World!" in body["message"]
 
-    def test_lambda_handler_no_query_params(self, lambda_event, lambda_context):
+    def test_lambda_handler_no_query_params(
+        self, lambda_event, lambda_context, lambda_handler
+    ):
         """Test Lambda handler with no query parameters."""
         # Set query parameters to None
         lambda_event["queryStringParameters"] = None
@@ -108,7 +115,9 @@ class TestLambdaHandler:
         body = json.loads(response["body"])
         assert "Hello, World!" in body["message"]
 
-    def test_lambda_handler_empty_name(self, lambda_event, lambda_context):
+    def test_lambda_handler_empty_name(
+        self, lambda_event, lambda_context, lambda_handler
+    ):
         """Test Lambda handler with empty name parameter."""
         # Set empty name
         lambda_event["queryStringParameters"] = {"name": ""}
@@ -121,9 +130,13 @@ class TestLambdaHandler:
         body = json.loads(response["body"])
         assert "Hello, World!" in body["message"]
 
-    def test_lambda_handler_multiple_names(self, lambda_event, lambda_context):
+    def test_lambda_handler_multiple_names(
+        self, lambda_event, lambda_context, key_namespace, lambda_handler
+    ):
         """Test Lambda handler with multiple different names."""
-        names = ["Alice", "Bob", "Charlie", "Diana"]
+        names = [
+            key_namespace.key(name) for name in ["Alice", "Bob", "Charlie", "Diana"]
+        ]
 
         for name in names:
             # Update event with test name
@@ -137,9 +150,13 @@ class TestLambdaHandler:
             body = json.loads(response["body"])
             assert f"Hello, {name}!" in body["message"]
 
-    def test_lambda_handler_response_format(self, lambda_event, lambda_context):
+    def test_lambda_handler_response_format(
+        self, lambda_event, lambda_context, key_namespace, lambda_handler
+    ):
         """Test Lambda handler response format compliance."""
-        lambda_event["queryStringParameters"] = {"name": "FormatTest"}
+        lambda_event["queryStringParameters"] = {
+            "name": key_namespace.key("FormatTest")
+        }
 
         # Invoke handler
         response = lambda_handler(lambda_event, lambda_context)
@@ -159,9 +176,13 @@ class TestLambdaHandler:
         assert isinstance(body, dict)
         assert "message" in body
 
-    def test_lambda_handler_special_characters(self, lambda_event, lambda_context):
+    def test_lambda_handler_special_characters(
+        self, lambda_event, lambda_context, key_namespace, lambda_handler
+    ):
         """Test Lambda handler with special characters in name."""
-        special_names = ["José", "François", "李明", "محمد"]
+        special_names = [
+            key_namespace.key(name) for name in ["José", "François", "李明", "محمد"]
+        ]
 
         for name in special_names:
             lambda_event["queryStringParameters"] = {"name": name}
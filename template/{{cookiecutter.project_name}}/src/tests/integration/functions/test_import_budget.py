@@ -0,0 +1,60 @@
+"""
+Import-time budgets for the Lambda function handlers.
+
+Each handler is imported in a clean interpreter, as during a cold start,
+with the environment the stacks deploy it with, and its cumulative import
+time is compared with the function's budget.
+"""
+
+import pytest
+
+from tests.utils.import_profiler import parse_importtime, profile_handler
+
+# Constants
+# Cumulative handler import time allowed per function, in milliseconds: about
+# twice the best of the profiled runs measured when the budget was last set
+IMPORT_BUDGETS_MS = {
+    "hello_world": 80,  # Measured at 35 ms, tracing to X-Ray
+}
+# Modules that must only be imported when an adapter or the tracer is first used
+DEFERRED_MODULES = ("aiobotocore", "aws_xray_sdk", "boto3", "botocore")
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:        10 |         10 |   ports.hello_world_port
+import time:        20 |         20 |     models.hello_world_model
+import time:         5 |         25 |   domain.services.hello_world_service
+import time:        30 |         65 | handler
+import time:         7 |          7 | json
+"""
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize(("function_name", "budget_ms"), IMPORT_BUDGETS_MS.items())
+def test_handler_import_within_budget(function_name, budget_ms):
+    """Test that importing a handler stays within its import-time budget."""
+    handler = profile_handler(function_name, dist=False)
+    report = "\n".join(handler.render())
+    assert handler.cumulative_ms <= budget_ms, report
+
+
+@pytest.mark.parametrize("function_name", IMPORT_BUDGETS_MS)
+def test_handler_import_defers_aws_sdk(function_name):
+    """Test that the AWS SDKs are not imported until first used."""
+    handler = profile_handler(function_name, dist=False, repeat=1)
+    imported = {node.name.partition(".")[0] for node in handler.walk()}
+    assert not imported.intersection(DEFERRED_MODULES)
+
+
+def test_parse_importtime_builds_tree():
+    """Test that nested imports become children of the importing module."""
+    profile = parse_importtime(IMPORTTIME_OUTPUT)
+    assert [root.name for root in profile.roots] == ["handler", "json"]
+
+    handler = profile.find("handler")
+    assert handler.cumulative_ms == pytest.approx(0.065)
+    assert [child.name for child in handler.children] == [
+        "ports.hello_world_port",
+        "domain.services.hello_world_service",
+    ]
+    service = handler.children[1]
+    assert [child.name for child in service.children] == ["models.hello_world_model"]
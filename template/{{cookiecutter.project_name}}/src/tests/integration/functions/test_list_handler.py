@@ -0,0 +1,104 @@
+"""
+Integration tests for the greeting list route of the Hello World handler.
+
+Tests paging through saved greetings with the ``limit`` and ``next_token``
+query parameters against the local moto server.
+"""
+
+import json
+
+import pytest
+from adapters.hello_world_storage_adapter import HelloWorldStorageAdapter
+from adapters.saved_names_filter_adapter import SavedNamesFilterAdapter
+from domain.services.hello_world_service import HelloWorldService
+from models.hello_world_model import HelloWorld
+from utils.bloom_filter import BloomFilter
+
+# Constants
+HTTP_OK = 200
+HTTP_BAD_REQUEST = 400
+HTTP_NOT_FOUND = 404
+NAMES = ["Alice", "Bob", "Carol"]
+
+
+def list_event(**query_params):
+    """Build an API Gateway event for the list route."""
+    return {
+        "resource": "/greetings",
+        "path": "/greetings",
+        "httpMethod": "GET",
+        "queryStringParameters": query_params or None,
+    }
+
+
+@pytest.fixture
+def lambda_handler(hello_world_handler):
+    """Provide the handler, imported once the table is configured."""
+    return hello_world_handler.lambda_handler
+
+
+@pytest.fixture
+def saved_greetings(local_greetings_table):
+    """Save a greeting for each name, in order, returning the table name."""
+    storage = HelloWorldStorageAdapter()
+    for name in NAMES:
+        storage.save_greeting(HelloWorld(name=name, greeting=f"Hi {name}!"))
+    return local_greetings_table
+
+
+@pytest.mark.usefixtures("saved_greetings")
+def test_list_pages(lambda_context, lambda_handler):
+    """Test that the list route pages through greetings, most recent first."""
+    response = lambda_handler(list_event(limit="2"), lambda_context)
+    assert response["statusCode"] == HTTP_OK
+    first = json.loads(response["body"])
+    assert [item["name"] for item in first["greetings"]] == ["Carol", "Bob"]
+    assert first["greetings"][0]["message"] == "Hi Carol!"
+
+    response = lambda_handler(
+        list_event(limit="2", next_token=first["next_token"]), lambda_context
+    )
+    second = json.loads(response["body"])
+    assert [item["name"] for item in second["greetings"]] == ["Alice"]
+    assert second["next_token"] is None
+
+
+@pytest.mark.usefixtures("saved_greetings")
+@pytest.mark.parametrize(
+    "query_params", [{"limit": "many"}, {"limit": "0"}, {"next_token": "bogus"}]
+)
+def test_list_rejects_bad_parameters(lambda_context, query_params, lambda_handler):
+    """Test that invalid paging parameters are a client error."""
+    response = lambda_handler(list_event(**query_params), lambda_context)
+    assert response["statusCode"] == HTTP_BAD_REQUEST
+
+
+@pytest.mark.usefixtures("saved_greetings")
+def test_list_with_saved_names_filter(
+    lambda_context, lambda_handler, hello_world_handler, monkeypatch
+):
+    """Test that greetings are listed from the table behind the names filter."""
+    monkeypatch.setattr(
+        hello_world_handler, "saved_names", BloomFilter.from_keys(NAMES)
+    )
+    hello_world_handler._service.cache_clear()
+    try:
+        response = lambda_handler(list_event(), lambda_context)
+    finally:
+        hello_world_handler._service.cache_clear()
+    assert response["statusCode"] == HTTP_OK
+    listed = json.loads(response["body"])["greetings"]
+    assert [item["name"] for item in listed] == NAMES[::-1]
+
+
+@pytest.mark.usefixtures("local_greetings_table")
+def test_list_without_catalog(
+    lambda_context, lambda_handler, hello_world_handler, monkeypatch
+):
+    """Test that the list route is not found on a service unable to list."""
+    service = HelloWorldService(
+        SavedNamesFilterAdapter(BloomFilter.from_keys([]), HelloWorldStorageAdapter())
+    )
+    monkeypatch.setattr(hello_world_handler, "_service", lambda _settings: service)
+    response = lambda_handler(list_event(), lambda_context)
+    assert response["statusCode"] == HTTP_NOT_FOUND
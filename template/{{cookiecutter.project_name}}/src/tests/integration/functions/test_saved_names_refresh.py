@@ -0,0 +1,128 @@
+"""
+Integration tests for the saved-names filter of the Hello World function.
+
+Tests that the function loads its snapshot from S3, reloads it once stale,
+and adds the names read from the greetings table's stream, against the
+local moto server.
+"""
+
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from adapters.aws_client_factory import aws_clients
+from adapters.hello_world_storage_adapter import HelloWorldStorageAdapter
+from adapters.saved_names_filter_adapter import load_saved_names, write_snapshot
+from models.hello_world_model import HelloWorld
+from utils.bloom_filter import BloomFilter
+
+from tools.saved_names_snapshot import build_snapshot
+
+# Constants
+MAX_AGE_SECONDS = 60
+STREAM_ARN = (
+    "arn:aws:dynamodb:us-east-1:123456789012:table/{}/stream/2024-01-01T00:00:00.000"
+)
+
+
+def greeting_event(name):
+    """Build an API Gateway event asking for the greeting of a name."""
+    return {
+        "resource": "/hello",
+        "httpMethod": "GET",
+        "queryStringParameters": {"name": name},
+    }
+
+
+def stream_event(table_name, name, greeting):
+    """Build a DynamoDB Streams event of a greeting saved in a table."""
+    return {
+        "Records": [
+            {
+                "eventSource": "aws:dynamodb",
+                "eventSourceARN": STREAM_ARN.format(table_name),
+                "eventName": "INSERT",
+                "dynamodb": {
+                    "SequenceNumber": "1",
+                    "Keys": {"name": {"S": name}},
+                    "NewImage": {"name": {"S": name}, "greeting": {"S": greeting}},
+                },
+            }
+        ]
+    }
+
+
+@pytest.fixture
+def snapshot(local_greetings_table, monkeypatch):
+    """Provide the S3 location of a snapshot older than the max age."""
+    # Named after the table, which is unique to the test
+    bucket = local_greetings_table.lower()
+    aws_clients.client("s3").create_bucket(Bucket=bucket)
+    location = f"s3://{bucket}/saved-names.bloom"
+    stale = BloomFilter(100)
+    stale.as_of = datetime.now(UTC) - timedelta(seconds=MAX_AGE_SECONDS + 1)
+    write_snapshot(stale, location)
+
+    monkeypatch.setenv("HELLO_WORLD_SAVED_NAMES_SNAPSHOT", location)
+    monkeypatch.setenv("HELLO_WORLD_SAVED_NAMES_MAX_AGE_SECONDS", str(MAX_AGE_SECONDS))
+    monkeypatch.setattr(
+        "adapters.saved_names_filter_adapter.RELOAD_INTERVAL_SECONDS", 0
+    )
+    return location
+
+
+@pytest.fixture
+def handler(snapshot, hello_world_handler, monkeypatch):
+    """Provide the handler module, with the snapshot loaded as during init."""
+    monkeypatch.setattr(hello_world_handler, "saved_names", load_saved_names(snapshot))
+    hello_world_handler._service.cache_clear()
+    yield hello_world_handler
+    hello_world_handler._service.cache_clear()
+
+
+def message(response):
+    """Get the message of an API Gateway response."""
+    return json.loads(response["body"])["message"]
+
+
+def test_stale_snapshot_is_reloaded(lambda_context, handler, snapshot, emf_documents):
+    """Test that a stale snapshot is bypassed until a newer one is written."""
+    HelloWorldStorageAdapter().save_greeting(HelloWorld(name="Dave", greeting="Yo"))
+
+    # Only the stale snapshot is in S3: the saved name is read, not skipped
+    response = handler.lambda_handler(greeting_event("Dave"), lambda_context)
+    assert message(response) == "Yo"
+
+    fresh = build_snapshot(HelloWorldStorageAdapter())
+    write_snapshot(fresh, snapshot)
+    emf_documents()
+
+    response = handler.lambda_handler(greeting_event("Nobody"), lambda_context)
+    assert message(response) == "Hello, Nobody!"
+    (document,) = emf_documents()
+    assert document["SavedNamesFilterSkippedReads"] == 1
+    assert "SavedNamesFilterStaleReads" not in document
+    adapter = handler._service(handler.config.settings).hello_world_port
+    # Snapshots keep their time to the millisecond
+    assert abs(adapter.saved_names.as_of - fresh.as_of) < timedelta(milliseconds=1)
+    assert "Dave" in adapter.saved_names
+
+
+def test_stream_records_refresh_the_filter(
+    lambda_context, handler, snapshot, local_greetings_table
+):
+    """Test that names read from the table's stream are no longer skipped."""
+    write_snapshot(build_snapshot(HelloWorldStorageAdapter()), snapshot)
+    handler.lambda_handler(greeting_event("Nobody"), lambda_context)
+
+    # Saved by another execution environment after the snapshot was taken
+    HelloWorldStorageAdapter().save_greeting(HelloWorld(name="Erin", greeting="Hey"))
+    response = handler.lambda_handler(greeting_event("Erin"), lambda_context)
+    assert message(response) == "Hello, Erin!"
+
+    event = stream_event(local_greetings_table, "Erin", "Hey")
+    assert handler.batch_lambda_handler(event, lambda_context) == {
+        "batchItemFailures": []
+    }
+    response = handler.lambda_handler(greeting_event("Erin"), lambda_context)
+    assert message(response) == "Hey"
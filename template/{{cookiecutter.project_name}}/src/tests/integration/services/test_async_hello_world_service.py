@@ -0,0 +1,44 @@
+"""
+Integration tests for AsyncHelloWorldService.
+
+Tests the asynchronous service against the local DynamoDB stand-in server.
+"""
+
+import asyncio
+
+import pytest
+from adapters.async_hello_world_storage_adapter import AsyncHelloWorldStorageAdapter
+from domain.services.async_hello_world_service import AsyncHelloWorldService
+
+
+@pytest.fixture(autouse=True)
+def greetings_table(local_greetings_table):
+    """Use a fresh local greetings table for every test."""
+    return local_greetings_table
+
+
+class TestAsyncHelloWorldService:
+    """Test suite for AsyncHelloWorldService."""
+
+    def test_service_with_default_adapter(self):
+        """Test AsyncHelloWorldService with its default adapter."""
+
+        async def scenario() -> str:
+            service = AsyncHelloWorldService()
+            try:
+                return await service.get_greeting("Test")
+            finally:
+                await service.hello_world_port.close()
+
+        assert asyncio.run(scenario()) == "Hello, Test!"
+
+    def test_service_save_and_get_greetings(self):
+        """Test saving a greeting and reading several greetings at once."""
+
+        async def scenario() -> list[str]:
+            async with AsyncHelloWorldStorageAdapter() as adapter:
+                service = AsyncHelloWorldService(hello_world_port=adapter)
+                await service.save_greeting("Alice", "Hi Alice!")
+                return await service.get_greetings(["Alice", "Bob"])
+
+        assert asyncio.run(scenario()) == ["Hi Alice!", "Hello, Bob!"]
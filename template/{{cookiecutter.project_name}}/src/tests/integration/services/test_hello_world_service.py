@@ -4,60 +4,62 @@ Integration tests for HelloWorldService.
 Tests the service's business logic and coordination with adapters.
 """
 
-import os
-
 import pytest
 from adapters.hello_world_storage_adapter import HelloWorldStorageAdapter
+from adapters.saved_names_filter_adapter import SavedNamesFilterAdapter
 
 # Clean imports without src/shared prefixes
 from domain.services.hello_world_service import HelloWorldService
-
-# Import test utilities
-from tests.utils.resource_discovery import get_dynamodb_table_name
+from ports.hello_world_port import GreetingPage
+from utils.bloom_filter import BloomFilter
 
 
 @pytest.fixture(autouse=True)
-def dynamodb_table():
-    """Get DynamoDB table name and set environment variable."""
-    table_name = get_dynamodb_table_name("GreetingsTable")
-    os.environ["HELLO_WORLD_TABLE_NAME"] = table_name
-    return table_name
+def dynamodb_table(shared_greetings_table):
+    """Use the greetings table of this worker for every test."""
+    return shared_greetings_table
 
 
 class TestHelloWorldService:
     """Test suite for HelloWorldService."""
 
-    def test_service_with_default_adapter(self):
+    def test_service_with_default_adapter(self, key_namespace):
         """Test HelloWorldService with default adapter."""
+        name = key_namespace.key("Test")
         service = HelloWorldService()
-        greeting = service.get_greeting("Test")
-        assert "Hello, Test!" in greeting
+        greeting = service.get_greeting(name)
+        assert f"Hello, {name}!" in greeting
 
-    def test_service_with_explicit_adapter(self):
+    def test_service_with_explicit_adapter(self, key_namespace):
         """Test HelloWorldService with explicit adapter."""
+        name = key_namespace.key("Test")
         adapter = HelloWorldStorageAdapter()
         service = HelloWorldService(hello_world_port=adapter)
-        greeting = service.get_greeting("Test")
-        assert "Hello, Test!" in greeting
+        greeting = service.get_greeting(name)
+        assert f"Hello, {name}!" in greeting
 
-    def test_service_integration(self):
+    def test_service_integration(self, key_namespace):
         """Test HelloWorldService integration."""
+        name = key_namespace.key("TestUser")
         service = HelloWorldService()
-        greeting = service.get_greeting("TestUser")
-        assert "Hello, TestUser!" in greeting
+        greeting = service.get_greeting(name)
+        assert f"Hello, {name}!" in greeting
 
-    def test_service_default_adapter(self):
+    def test_service_default_adapter(self, key_namespace):
         """Test HelloWorldService with default adapter."""
+        name = key_namespace.key("TestUser")
         service = HelloWorldService()
-        greeting = service.get_greeting("TestUser")
-        assert "Hello, TestUser!" in greeting
+        greeting = service.get_greeting(name)
+        assert f"Hello, {name}!" in greeting
 
-    def test_service_business_logic(self):
+    def test_service_business_logic(self, key_namespace):
         """Test service business logic coordination."""
         service = HelloWorldService()
 
         # Test multiple names to verify business logic
-        names = ["Alice", "Bob", "Charlie", "Diana"]
+        names = [
+            key_namespace.key(name) for name in ["Alice", "Bob", "Charlie", "Diana"]
+        ]
 
         for name in names:
             greeting = service.get_greeting(name)
@@ -65,27 +67,30 @@ class TestHelloWorldService:
             assert isinstance(greeting, str)
             assert len(greeting) > 0
 
-    def test_service_adapter_integration(self):
+    def test_service_adapter_integration(self, key_namespace):
         """Test service integration with different adapters."""
+        name1 = key_namespace.key("ServiceTest1")
+        name2 = key_namespace.key("ServiceTest2")
+
         # Test with default adapter
         service1 = HelloWorldService()
-        greeting1 = service1.get_greeting("ServiceTest1")
+        greeting1 = service1.get_greeting(name1)
 
         # Test with explicit adapter
         adapter = HelloWorldStorageAdapter()
         service2 = HelloWorldService(hello_world_port=adapter)
-        greeting2 = service2.get_greeting("ServiceTest2")
+        greeting2 = service2.get_greeting(name2)
 
         # Both should work correctly
-        assert "Hello, ServiceTest1!" in greeting1
-        assert "Hello, ServiceTest2!" in greeting2
+        assert f"Hello, {name1}!" in greeting1
+        assert f"Hello, {name2}!" in greeting2
 
-    def test_service_consistency(self):
+    def test_service_consistency(self, key_namespace):
         """Test service consistency across multiple calls."""
         service = HelloWorldService()
 
         # Make multiple calls with the same name
-        name = "ConsistencyTest"
+        name = key_namespace.key("ConsistencyTest")
         greeting1 = service.get_greeting(name)
         greeting2 = service.get_greeting(name)
         greeting3 = service.get_greeting(name)
@@ -93,3 +98,30 @@ class TestHelloWorldService:
         # All should return the same greeting
         assert greeting1 == greeting2 == greeting3
         assert f"Hello, {name}!" in greeting1
+
+    def test_catalog_defaults_to_listing_port(self):
+        """Test that a port able to list greetings is the catalog."""
+        adapter = HelloWorldStorageAdapter()
+        assert HelloWorldService(adapter).catalog is adapter
+
+    def test_no_catalog(self):
+        """Test that a service on a port unable to list greetings cannot list."""
+        storage = HelloWorldStorageAdapter()
+        service = HelloWorldService(
+            SavedNamesFilterAdapter(BloomFilter.from_keys([]), storage)
+        )
+        assert service.catalog is None
+        with pytest.raises(LookupError, match="SavedNamesFilterAdapter"):
+            service.list_greetings()
+        with pytest.raises(LookupError):
+            service.export_greetings()
+
+    def test_explicit_catalog(self):
+        """Test that a catalog given explicitly serves the listings."""
+        storage = HelloWorldStorageAdapter()
+        service = HelloWorldService(
+            SavedNamesFilterAdapter(BloomFilter.from_keys([]), storage),
+            catalog=storage,
+        )
+        assert service.catalog is storage
+        assert isinstance(service.list_greetings(), GreetingPage)
@@ -0,0 +1,236 @@
+"""
+Integration tests for batch event processing.
+
+Tests record decoding for each event source, deduplication, bounded
+concurrency and the batchItemFailures response.
+"""
+
+import base64
+import json
+import threading
+import time
+
+import pytest
+from handlers.batch_processor import BatchProcessor, EventSource, decode_record
+
+# Constants
+MAX_WORKERS = 2
+WORK_SECONDS = 0.02
+
+
+def sqs_record(message_id, payload):
+    """Build an SQS record with a JSON body."""
+    return {
+        "eventSource": "aws:sqs",
+        "messageId": message_id,
+        "body": json.dumps(payload),
+    }
+
+
+def kinesis_record(sequence_number, payload):
+    """Build a Kinesis record with base64-encoded JSON data."""
+    data = base64.b64encode(json.dumps(payload).encode()).decode()
+    return {
+        "eventSource": "aws:kinesis",
+        "kinesis": {"sequenceNumber": sequence_number, "data": data},
+    }
+
+
+def stream_record(sequence_number, name, greeting, event_name="INSERT"):
+    """Build a DynamoDB Streams record with a new image."""
+    return {
+        "eventSource": "aws:dynamodb",
+        "eventName": event_name,
+        "dynamodb": {
+            "SequenceNumber": sequence_number,
+            "Keys": {"name": {"S": name}},
+            "NewImage": {"name": {"S": name}, "greeting": {"S": greeting}},
+        },
+    }
+
+
+class RecordingProcess:
+    """Record processor failing for chosen names and tracking concurrency."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.processed = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, record):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(WORK_SECONDS)
+        with self._lock:
+            self.active -= 1
+            self.processed.append(record.payload)
+        if record.payload["name"] in self.failing:
+            msg = f"Cannot process {record.payload['name']}"
+            raise RuntimeError(msg)
+
+
+def by_name(record):
+    """Deduplicate records by greeting name."""
+    return record.payload["name"]
+
+
+class TestDecodeRecord:
+    """Test suite for decode_record."""
+
+    def test_sqs(self):
+        """Test decoding an SQS message body."""
+        record = decode_record(sqs_record("m-1", {"name": "Alice"}))
+        assert record.source == EventSource.SQS
+        assert record.identifier == "m-1"
+        assert record.payload == {"name": "Alice"}
+
+    def test_kinesis(self):
+        """Test decoding Kinesis record data."""
+        record = decode_record(kinesis_record("100", {"name": "Bob"}))
+        assert record.source == EventSource.KINESIS
+        assert record.identifier == "100"
+        assert record.payload == {"name": "Bob"}
+
+    def test_dynamodb_stream(self):
+        """Test decoding the new image of a DynamoDB Streams record."""
+        record = decode_record(stream_record("200", "Carol", "Hi"))
+        assert record.source == EventSource.DYNAMODB
+        assert record.identifier == "200"
+        assert record.payload == {"name": "Carol", "greeting": "Hi"}
+
+    def test_unsupported_source(self):
+        """Test that records of other sources are rejected."""
+        with pytest.raises(ValueError):
+            decode_record({"eventSource": "aws:s3"})
+
+
+class TestBatchProcessor:
+    """Test suite for BatchProcessor."""
+
+    def test_all_records_succeed(self):
+        """Test that a successful batch reports no failures."""
+        process = RecordingProcess()
+        processor = BatchProcessor(process, by_name)
+        event = {
+            "Records": [sqs_record(f"m-{i}", {"name": f"n-{i}"}) for i in range(5)]
+        }
+
+        assert processor(event) == {"batchItemFailures": []}
+        assert len(process.processed) == 5
+
+    def test_failed_records_are_reported(self):
+        """Test that only the failed records are reported."""
+        processor = BatchProcessor(RecordingProcess(failing={"n-1"}), by_name)
+        event = {
+            "Records": [sqs_record(f"m-{i}", {"name": f"n-{i}"}) for i in range(3)]
+        }
+
+        assert processor(event) == {"batchItemFailures": [{"itemIdentifier": "m-1"}]}
+
+    def test_duplicate_keys_keep_last_record(self, emf_documents):
+        """Test that only the last record of a key is processed."""
+        process = RecordingProcess()
+        processor = BatchProcessor(process, by_name)
+        event = {
+            "Records": [
+                kinesis_record("1", {"name": "Alice", "greeting": "Hi"}),
+                kinesis_record("2", {"name": "Bob", "greeting": "Hey"}),
+                kinesis_record("3", {"name": "Alice", "greeting": "Hello"}),
+            ]
+        }
+
+        assert processor(event) == {"batchItemFailures": []}
+        assert sorted(process.processed, key=lambda payload: payload["name"]) == [
+            {"name": "Alice", "greeting": "Hello"},
+            {"name": "Bob", "greeting": "Hey"},
+        ]
+        (document,) = emf_documents()
+        assert document["BatchRecords"] == 3
+        assert document["BatchDuplicateRecords"] == 1
+
+    def test_duplicates_share_the_failure(self):
+        """Test that every record of a failed key is reported for retry."""
+        processor = BatchProcessor(RecordingProcess(failing={"Alice"}), by_name)
+        event = {
+            "Records": [
+                sqs_record("m-1", {"name": "Alice"}),
+                sqs_record("m-2", {"name": "Bob"}),
+                sqs_record("m-3", {"name": "Alice"}),
+            ]
+        }
+
+        assert processor(event) == {
+            "batchItemFailures": [{"itemIdentifier": "m-1"}, {"itemIdentifier": "m-3"}]
+        }
+
+    def test_undecodable_record_is_reported(self):
+        """Test that a record with an invalid payload fails on its own."""
+        process = RecordingProcess()
+        processor = BatchProcessor(process, by_name)
+        invalid = {"eventSource": "aws:sqs", "messageId": "m-bad", "body": "not json"}
+        event = {"Records": [invalid, sqs_record("m-1", {"name": "Alice"})]}
+
+        assert processor(event) == {"batchItemFailures": [{"itemIdentifier": "m-bad"}]}
+        assert process.processed == [{"name": "Alice"}]
+
+    def test_stream_removals_are_skipped(self, emf_documents):
+        """Test that DynamoDB Streams records without a new image are acked."""
+        process = RecordingProcess()
+        processor = BatchProcessor(process, by_name)
+        removal = stream_record("1", "Alice", "Hi", "REMOVE")
+        del removal["dynamodb"]["NewImage"]
+        event = {"Records": [removal, stream_record("2", "Bob", "Hey", "MODIFY")]}
+
+        assert processor(event) == {"batchItemFailures": []}
+        assert process.processed == [{"name": "Bob", "greeting": "Hey"}]
+        (document,) = emf_documents()
+        assert document["BatchSkippedRecords"] == 1
+        assert document["BatchDuplicateRecords"] == 0
+
+    def test_capitalized_event_source_removals_are_skipped(self):
+        """Test that removals naming their source EventSource are acked too."""
+        process = RecordingProcess()
+        removal = stream_record("1", "Alice", "Hi", "REMOVE")
+        removal["EventSource"] = removal.pop("eventSource")
+        del removal["dynamodb"]["NewImage"]
+
+        assert BatchProcessor(process)({"Records": [removal]}) == {
+            "batchItemFailures": []
+        }
+        assert process.processed == []
+
+    def test_skipped_records(self, emf_documents):
+        """Test that records refused by the skip predicate are acked."""
+        process = RecordingProcess()
+        processor = BatchProcessor(
+            process, by_name, skip=lambda raw: raw.get("messageId") == "m-1"
+        )
+        event = {
+            "Records": [
+                sqs_record("m-1", {"name": "Alice"}),
+                sqs_record("m-2", {"name": "Bob"}),
+            ]
+        }
+
+        assert processor(event) == {"batchItemFailures": []}
+        assert process.processed == [{"name": "Bob"}]
+        (document,) = emf_documents()
+        assert document["BatchSkippedRecords"] == 1
+
+    def test_concurrency_is_bounded(self):
+        """Test that at most max_workers records are processed at once."""
+        process = RecordingProcess()
+        processor = BatchProcessor(process, by_name, max_workers=MAX_WORKERS)
+        event = {"Records": [stream_record(str(i), f"n-{i}", "Hi") for i in range(8)]}
+
+        processor(event)
+        assert process.peak == MAX_WORKERS
+        processor.close()
+
+    def test_invalid_max_workers(self):
+        """Test that a pool without workers is rejected."""
+        with pytest.raises(ValueError):
+            BatchProcessor(RecordingProcess(), max_workers=0)
@@ -0,0 +1,54 @@
+"""
+Integration tests for the benchmark regression gate.
+
+Tests the comparison of timings with baselines and the baselines file,
+without timing anything.
+"""
+
+import pytest
+
+from tests.benchmarks import bench_hot_path, regression
+
+# Constants
+THRESHOLD = 0.25
+
+
+class TestCompare:
+    """Test suite for comparisons with baselines."""
+
+    @pytest.mark.parametrize(
+        ("current", "regressed"), [(0.5, False), (1.2, False), (1.3, True)]
+    )
+    def test_threshold(self, current, regressed):
+        """Test that only timings beyond the threshold regress."""
+        (comparison,) = regression.compare({"bench": current}, {"bench": 1.0})
+        assert comparison.ratio == pytest.approx(current)
+        assert comparison.regressed(THRESHOLD) is regressed
+        assert ("REGRESSED" in comparison.summary(THRESHOLD)) is regressed
+
+    def test_new_benchmark_is_not_gated(self):
+        """Test that a benchmark without a baseline never regresses."""
+        (comparison,) = regression.compare({"new": 1.0}, {"other": 1.0})
+        assert comparison.ratio is None
+        assert not comparison.regressed(THRESHOLD)
+        assert "no baseline" in comparison.summary(THRESHOLD)
+
+
+class TestBaselines:
+    """Test suite for the baselines file."""
+
+    def test_roundtrip(self, tmp_path):
+        """Test that stored baselines load back."""
+        path = tmp_path / "baselines.json"
+        regression.save_baselines({"a": 0.5, "b": 0.25}, path)
+        assert regression.load_baselines(path) == {"a": 0.5, "b": 0.25}
+
+    def test_missing_file(self, tmp_path):
+        """Test that a missing file has no baselines."""
+        assert regression.load_baselines(tmp_path / "missing.json") == {}
+
+    def test_every_hot_path_benchmark_has_a_baseline(self):
+        """Test that the committed baselines cover every hot path benchmark."""
+        with bench_hot_path.hot_path() as benchmarks:
+            names = set(benchmarks)
+        assert names == set(regression.load_baselines())
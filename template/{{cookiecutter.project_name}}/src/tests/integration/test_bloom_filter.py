@@ -0,0 +1,93 @@
+"""
+Integration tests for the Bloom filter.
+
+Tests membership, sizing, the false-positive rate and snapshots.
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+from utils.bloom_filter import BloomFilter
+
+# Constants
+CAPACITY = 10_000
+FALSE_POSITIVE_RATE = 0.01
+# Allowed deviation from the configured rate over PROBE_COUNT lookups
+RATE_TOLERANCE = 2
+PROBE_COUNT = 20_000
+
+
+@pytest.fixture
+def saved_names():
+    """Provide a filter filled to capacity."""
+    return BloomFilter.from_keys(
+        (f"saved-{index}" for index in range(CAPACITY)),
+        false_positive_rate=FALSE_POSITIVE_RATE,
+    )
+
+
+class TestBloomFilter:
+    """Test suite for BloomFilter."""
+
+    def test_no_false_negatives(self, saved_names):
+        """Test that every added key is reported present."""
+        assert all(f"saved-{index}" in saved_names for index in range(CAPACITY))
+
+    def test_false_positive_rate_at_capacity(self, saved_names):
+        """Test that the observed false-positive rate matches the sizing."""
+        false_positives = sum(
+            f"unsaved-{index}" in saved_names for index in range(PROBE_COUNT)
+        )
+        observed = false_positives / PROBE_COUNT
+        assert observed < FALSE_POSITIVE_RATE * RATE_TOLERANCE
+        assert saved_names.false_positive_rate == pytest.approx(
+            FALSE_POSITIVE_RATE, rel=0.5
+        )
+
+    def test_repeated_keys_counted_once(self):
+        """Test that adding a key again does not count it again."""
+        bloom_filter = BloomFilter(CAPACITY)
+        bloom_filter.update(["Alice", "Bob", "Alice", "Alice"])
+        assert bloom_filter.count == 2
+
+    def test_size_follows_false_positive_rate(self):
+        """Test that a lower false-positive rate takes more space."""
+        loose = BloomFilter(CAPACITY, 0.05)
+        strict = BloomFilter(CAPACITY, 0.001)
+        assert strict.size_bytes > loose.size_bytes
+        assert strict.hash_count > loose.hash_count
+        # About 9.6 bits per key at 1%
+        assert BloomFilter(CAPACITY, 0.01).size_bytes == pytest.approx(
+            CAPACITY * 9.6 / 8, rel=0.01
+        )
+
+    def test_snapshot_roundtrip(self, saved_names):
+        """Test that a snapshot restores the same filter."""
+        restored = BloomFilter.from_bytes(saved_names.to_bytes())
+        assert restored.bit_count == saved_names.bit_count
+        assert restored.hash_count == saved_names.hash_count
+        assert restored.count == saved_names.count
+        assert restored.as_of is None
+        assert all(f"saved-{index}" in restored for index in range(CAPACITY))
+
+    def test_snapshot_keeps_as_of(self, saved_names):
+        """Test that the time of the keys survives a snapshot."""
+        saved_names.as_of = datetime(2024, 1, 1, 12, 30, 0, 123000, tzinfo=UTC)
+        restored = BloomFilter.from_bytes(saved_names.to_bytes())
+        assert restored.as_of == saved_names.as_of
+
+    def test_empty_snapshot_is_compact(self):
+        """Test that an empty filter compresses to a small snapshot."""
+        empty = BloomFilter(CAPACITY)
+        assert len(empty.to_bytes()) < empty.size_bytes / 10
+
+    def test_invalid_snapshot(self):
+        """Test that a corrupt snapshot is rejected."""
+        with pytest.raises(ValueError, match="Invalid Bloom filter snapshot"):
+            BloomFilter.from_bytes(b"not a snapshot")
+
+    @pytest.mark.parametrize(("capacity", "rate"), [(0, 0.01), (10, 0.0), (10, 1.0)])
+    def test_invalid_sizing(self, capacity, rate):
+        """Test that invalid sizing parameters are rejected."""
+        with pytest.raises(ValueError):
+            BloomFilter(capacity, rate)
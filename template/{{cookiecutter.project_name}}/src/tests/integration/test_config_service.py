@@ -0,0 +1,206 @@
+"""
+Integration tests for the ConfigService settings snapshot.
+
+Tests validation, immutability and parameter sourcing of the snapshot,
+and its reload after the parameter TTL with a controlled clock.
+"""
+
+import dataclasses
+
+import pytest
+from adapters.local_parameter_adapter import LocalParameterAdapter
+from config.config_service import ConfigService, ConfigurationError
+
+# Constants
+PARAMETER_PREFIX = "/hello-world/"
+TTL_SECONDS = 60.0
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FlakyParameterAdapter(LocalParameterAdapter):
+    """Local adapter failing its lookups while ``down`` is set."""
+
+    down = False
+
+    def get_parameters(self, names):
+        if self.down:
+            msg = "Parameter store unavailable"
+            raise RuntimeError(msg)
+        return super().get_parameters(names)
+
+
+@pytest.fixture
+def clock():
+    """Provide a hand-driven clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def service(monkeypatch, clock):
+    """Provide a config service over a minimal valid environment."""
+    monkeypatch.setenv("HELLO_WORLD_TABLE_NAME", "GreetingsTable")
+    for variable in (
+        "HELLO_WORLD_TIMESTAMP_FORMAT",
+        "HELLO_WORLD_CLIENT_PROFILE",
+        "HELLO_WORLD_REPORT_CONSUMED_CAPACITY",
+        "HELLO_WORLD_METRICS_NAMESPACE",
+        "HELLO_WORLD_TRACING",
+        "HELLO_WORLD_TRACE_SAMPLE_RATE",
+        "HELLO_WORLD_PARAMETER_PREFIX",
+        "HELLO_WORLD_PARAMETER_TTL_SECONDS",
+    ):
+        monkeypatch.delenv(variable, raising=False)
+    return ConfigService(clock)
+
+
+class TestSettingsSnapshot:
+    """Test suite for ConfigService.settings."""
+
+    def test_defaults(self, service):
+        """Test that optional settings have typed defaults."""
+        settings = service.settings
+        assert settings.hello_world_table_name == "GreetingsTable"
+        assert settings.hello_world_timestamp_format == "iso"
+        assert settings.hello_world_client_profile is None
+        assert settings.hello_world_report_consumed_capacity is False
+
+    def test_values_are_typed(self, service, monkeypatch):
+        """Test that environment strings are converted to typed values."""
+        monkeypatch.setenv("HELLO_WORLD_REPORT_CONSUMED_CAPACITY", "true")
+        monkeypatch.setenv("HELLO_WORLD_TIMESTAMP_FORMAT", "epoch_ms")
+        monkeypatch.setenv("HELLO_WORLD_HEDGE_PERCENTILE", "99")
+        settings = service.settings
+        assert settings.hello_world_report_consumed_capacity is True
+        assert settings.hello_world_timestamp_format == "epoch_ms"
+        assert settings.hello_world_hedge_percentile == 99.0
+
+    def test_snapshot_is_frozen(self, service, monkeypatch):
+        """Test that the snapshot neither changes nor can be changed."""
+        settings = service.settings
+        monkeypatch.setenv("HELLO_WORLD_TABLE_NAME", "OtherTable")
+        assert service.settings is settings
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            settings.hello_world_table_name = "OtherTable"
+
+        service.clear()
+        assert service.settings.hello_world_table_name == "OtherTable"
+
+    def test_missing_required_setting(self, service, monkeypatch):
+        """Test that a missing required setting fails the load."""
+        monkeypatch.delenv("HELLO_WORLD_TABLE_NAME")
+        with pytest.raises(ConfigurationError, match="HELLO_WORLD_TABLE_NAME"):
+            service.load()
+
+    def test_invalid_setting(self, service, monkeypatch):
+        """Test that an invalid value fails the load with its variable name."""
+        monkeypatch.setenv("HELLO_WORLD_TIMESTAMP_FORMAT", "rfc2822")
+        with pytest.raises(ConfigurationError, match="HELLO_WORLD_TIMESTAMP_FORMAT"):
+            service.load()
+
+    def test_unknown_client_profile(self, service, monkeypatch):
+        """Test that a client profile not in CLIENT_PROFILES fails the load."""
+        monkeypatch.setenv("HELLO_WORLD_CLIENT_PROFILE", "turbo")
+        with pytest.raises(
+            ConfigurationError, match="HELLO_WORLD_CLIENT_PROFILE: Input should be"
+        ):
+            service.load()
+
+    @pytest.mark.parametrize(
+        ("variable", "value"),
+        [
+            ("HELLO_WORLD_REPORT_CONSUMED_CAPACITY", "maybe"),
+            ("HELLO_WORLD_HEDGE_PERCENTILE", "100"),
+            ("HELLO_WORLD_METRICS_NAMESPACE", ""),
+            ("HELLO_WORLD_TRACING", "jaeger"),
+            ("HELLO_WORLD_TRACE_SAMPLE_RATE", "often"),
+            ("HELLO_WORLD_TRACE_SAMPLE_RATE", "1.5"),
+            ("HELLO_WORLD_PARAMETER_TTL_SECONDS", "0"),
+        ],
+    )
+    def test_invalid_tuning_setting(self, service, monkeypatch, variable, value):
+        """Test that invalid observability and parameter settings fail the load."""
+        monkeypatch.setenv(variable, value)
+        with pytest.raises(ConfigurationError, match=variable):
+            service.load()
+
+
+class TestParameterSourcedSettings:
+    """Test suite for settings read from a parameter source."""
+
+    def test_missing_settings_come_from_parameters(self, service, monkeypatch):
+        """Test that parameters fill settings absent from the environment."""
+        monkeypatch.delenv("HELLO_WORLD_TABLE_NAME")
+        monkeypatch.setenv("HELLO_WORLD_PARAMETER_PREFIX", PARAMETER_PREFIX)
+        parameters = LocalParameterAdapter(
+            {
+                f"{PARAMETER_PREFIX}HELLO_WORLD_TABLE_NAME": "ParameterTable",
+                f"{PARAMETER_PREFIX}HELLO_WORLD_CLIENT_PROFILE": "low_latency",
+            }
+        )
+        settings = service.load(parameters)
+        assert settings.hello_world_table_name == "ParameterTable"
+        assert settings.hello_world_client_profile == "low_latency"
+        assert service.settings is settings
+
+    def test_environment_takes_precedence(self, service, monkeypatch):
+        """Test that the environment overrides parameters."""
+        monkeypatch.setenv("HELLO_WORLD_PARAMETER_PREFIX", PARAMETER_PREFIX)
+        parameters = LocalParameterAdapter(
+            {f"{PARAMETER_PREFIX}HELLO_WORLD_TABLE_NAME": "ParameterTable"}
+        )
+        assert service.load(parameters).hello_world_table_name == "GreetingsTable"
+
+    def test_parameters_unused_without_prefix(self, service, monkeypatch):
+        """Test that parameters are ignored when no prefix is configured."""
+        monkeypatch.delenv("HELLO_WORLD_TABLE_NAME")
+        parameters = LocalParameterAdapter({"HELLO_WORLD_TABLE_NAME": "Table"})
+        with pytest.raises(ConfigurationError):
+            service.load(parameters)
+
+    def test_reloaded_after_ttl(self, service, monkeypatch, clock):
+        """Test that a parameter-sourced snapshot is replaced after its TTL."""
+        monkeypatch.delenv("HELLO_WORLD_TABLE_NAME")
+        monkeypatch.setenv("HELLO_WORLD_PARAMETER_PREFIX", PARAMETER_PREFIX)
+        monkeypatch.setenv("HELLO_WORLD_PARAMETER_TTL_SECONDS", str(TTL_SECONDS))
+        name = f"{PARAMETER_PREFIX}HELLO_WORLD_TABLE_NAME"
+        parameters = LocalParameterAdapter({name: "ParameterTable"})
+        settings = service.load(parameters)
+
+        parameters.put_parameter(name, "MovedTable")
+        clock.now = TTL_SECONDS - 1
+        assert service.settings is settings
+        clock.now = TTL_SECONDS
+        assert service.settings.hello_world_table_name == "MovedTable"
+
+    def test_failed_reload_keeps_snapshot(self, service, monkeypatch, clock):
+        """Test that a reload failure keeps the snapshot until the next TTL."""
+        monkeypatch.delenv("HELLO_WORLD_TABLE_NAME")
+        monkeypatch.setenv("HELLO_WORLD_PARAMETER_PREFIX", PARAMETER_PREFIX)
+        monkeypatch.setenv("HELLO_WORLD_PARAMETER_TTL_SECONDS", str(TTL_SECONDS))
+        name = f"{PARAMETER_PREFIX}HELLO_WORLD_TABLE_NAME"
+        parameters = FlakyParameterAdapter({name: "ParameterTable"})
+        settings = service.load(parameters)
+
+        parameters.down = True
+        clock.now = TTL_SECONDS
+        assert service.settings is settings
+        parameters.down = False
+        parameters.put_parameter(name, "MovedTable")
+        assert service.settings is settings
+        clock.now = 2 * TTL_SECONDS
+        assert service.settings.hello_world_table_name == "MovedTable"
+
+    def test_environment_snapshot_is_not_reloaded(self, service, clock):
+        """Test that a snapshot read from the environment only is kept."""
+        settings = service.settings
+        clock.now = 10 * TTL_SECONDS
+        assert service.settings is settings
@@ -0,0 +1,72 @@
+"""
+Integration tests for invocation deadlines.
+
+Tests deadlines built from the Lambda context and their scoping.
+"""
+
+import asyncio
+
+import pytest
+from utils.deadline import (
+    DEFAULT_SAFETY_MARGIN_MS,
+    Deadline,
+    current_deadline,
+    deadline_scope,
+)
+
+# Constants
+REMAINING_MS = 3000
+
+
+class TestDeadline:
+    """Test suite for Deadline."""
+
+    def test_from_context(self, lambda_context):
+        """Test that the safety margin is kept back from the remaining time."""
+        lambda_context.get_remaining_time_in_millis = lambda: REMAINING_MS
+        deadline = Deadline.from_context(lambda_context)
+        expected = (REMAINING_MS - DEFAULT_SAFETY_MARGIN_MS) / 1000
+        assert deadline.remaining() == pytest.approx(expected, abs=0.05)
+
+    def test_from_context_without_remaining_time(self):
+        """Test that a context without remaining time gives no deadline."""
+        assert Deadline.from_context(None) is None
+        assert Deadline.from_context(object()) is None
+
+
+class TestDeadlineScope:
+    """Test suite for deadline_scope."""
+
+    def test_scope_sets_current_deadline(self):
+        """Test that the deadline is current inside the scope only."""
+        deadline = Deadline.after(1)
+        with deadline_scope(deadline):
+            assert current_deadline() is deadline
+        assert current_deadline() is None
+
+    def test_nested_scope_cannot_extend(self):
+        """Test that the earlier of two nested deadlines applies."""
+        outer = Deadline.after(1)
+        with deadline_scope(outer), deadline_scope(Deadline.after(10)) as inner:
+            assert inner is outer
+        with deadline_scope(outer), deadline_scope(Deadline.after(0.5)) as inner:
+            assert inner is not outer
+
+    def test_none_keeps_enclosing_deadline(self):
+        """Test that a scope without deadline keeps the enclosing one."""
+        outer = Deadline.after(1)
+        with deadline_scope(outer), deadline_scope(None) as inner:
+            assert inner is outer
+
+    def test_deadline_reaches_tasks(self):
+        """Test that asyncio tasks see the deadline of their caller."""
+        deadline = Deadline.after(1)
+
+        async def read_deadline():
+            return current_deadline()
+
+        async def main():
+            with deadline_scope(deadline):
+                return await asyncio.gather(read_deadline(), read_deadline())
+
+        assert asyncio.run(main()) == [deadline, deadline]
@@ -5,8 +5,9 @@ Tests the domain model's validation, serialization, and business logic.
 """
 
 from datetime import UTC, datetime
+from decimal import Decimal
 
-from models.hello_world_model import HelloWorld
+from models.hello_world_model import HelloWorld, TimestampFormat
 
 # Constants
 TIMESTAMP_TOLERANCE_SECONDS = 60
@@ -132,3 +133,79 @@ class TestHelloWorldModel:
         assert model.name == "TestUser"
         assert model.greeting == ""
         assert model.formatted_greeting == "Hello, TestUser!"
+
+    def test_model_is_slotted(self):
+        """Test that the model does not allocate a per-instance __dict__."""
+        model = HelloWorld(name="Test", greeting="Hello")
+        assert not hasattr(model, "__dict__")
+
+    def test_model_equality_of_fields(self):
+        """Test that models with identical fields compare equal."""
+        created_at = datetime(2024, 1, 1, tzinfo=UTC)
+        model1 = HelloWorld(name="Test", greeting="Hello", created_at=created_at)
+        model2 = HelloWorld(name="Test", greeting="Hello", created_at=created_at)
+        assert model1 == model2
+        assert model1 != HelloWorld(name="Test", greeting="Hi", created_at=created_at)
+
+    def test_from_dict_keeps_iso_strings_until_accessed(self):
+        """Test that ISO timestamps are written back without reformatting."""
+        data = {
+            "name": "Lazy",
+            "greeting": "Hi",
+            "created_at": "2024-01-01T10:00:00.123456+00:00",
+            "updated_at": "2024-01-02T10:00:00.123456+00:00",
+        }
+        model = HelloWorld.from_dict(data)
+        assert model.to_dict() == data
+        assert model.created_at == datetime(2024, 1, 1, 10, 0, 0, 123456, tzinfo=UTC)
+
+    def test_epoch_millis_roundtrip(self):
+        """Test storing timestamps as epoch milliseconds."""
+        created_at = datetime(2024, 1, 1, 10, 0, 0, 123000, tzinfo=UTC)
+        original = HelloWorld(name="Epoch", greeting="Hi", created_at=created_at)
+
+        data = original.to_dict(TimestampFormat.EPOCH_MILLIS)
+        assert data["created_at"] == 1704103200123
+        assert data["updated_at"] == 1704103200123
+
+        restored = HelloWorld.from_dict(data)
+        assert restored == original
+
+    def test_epoch_millis_from_dynamodb_decimal(self):
+        """Test reading epoch milliseconds returned by DynamoDB as Decimal."""
+        model = HelloWorld.from_dict(
+            {"name": "Epoch", "created_at": Decimal("1704103200123")}
+        )
+        assert model.created_at == datetime(2024, 1, 1, 10, 0, 0, 123000, tzinfo=UTC)
+        assert model.updated_at == model.created_at
+
+    def test_iso_item_rewritten_as_epoch_millis(self):
+        """Test that existing ISO items can be migrated to epoch milliseconds."""
+        model = HelloWorld.from_dict(
+            {"name": "Legacy", "created_at": "2024-01-01T10:00:00.123000+00:00"}
+        )
+        assert model.to_dict(TimestampFormat.EPOCH_MILLIS)["created_at"] == (
+            1704103200123
+        )
+
+    def test_from_dict_without_timestamps(self):
+        """Test that missing timestamps default to the current time."""
+        model = HelloWorld.from_dict({"name": "NoTimestamps"})
+        time_diff = datetime.now(UTC) - model.created_at
+        assert time_diff.total_seconds() < TIMESTAMP_TOLERANCE_SECONDS
+        assert model.updated_at == model.created_at
+        assert model.greeting is None
+
+    def test_version_roundtrip(self):
+        """Test that the stored version survives serialization."""
+        model = HelloWorld.from_dict(
+            {"name": "Test", "greeting": "Hi", "version": Decimal(3)}
+        )
+        assert model.version == 3
+        assert model.to_dict()["version"] == 3
+
+    def test_unsaved_model_has_no_version(self):
+        """Test that a new model has no version and does not serialize one."""
+        model = HelloWorld(name="Test", greeting="Hi")
+        assert model.version is None
+        assert "version" not in model.to_dict()
@@ -0,0 +1,100 @@
+"""
+Integration tests for per-worker key namespaces.
+
+Tests key prefixing and the bulk cleanup of a worker's items against the
+local DynamoDB stand-in server.
+"""
+
+import logging
+
+from adapters.hello_world_storage_adapter import HelloWorldStorageAdapter
+from models.hello_world_model import HelloWorld
+from ports.hello_world_port import PutResult
+
+from tests.utils.key_namespace import KeyNamespace, worker_id
+
+# Constants
+GREETING_COUNT = 60
+BATCH_SIZE = 25
+
+
+class FlakyBatchClient:
+    """DynamoDB client stand-in leaving the last request of each call unprocessed."""
+
+    def __init__(self, unprocessed_calls: int):
+        self.unprocessed_calls = unprocessed_calls
+        self.calls: list[int] = []
+
+    def batch_write_item(self, RequestItems: dict) -> dict:
+        ((table_name, requests),) = RequestItems.items()
+        self.calls.append(len(requests))
+        if len(self.calls) > self.unprocessed_calls:
+            return {"UnprocessedItems": {}}
+        return {"UnprocessedItems": {table_name: requests[-1:]}}
+
+
+class TestKeyNamespace:
+    """Test suite for KeyNamespace."""
+
+    def test_keys_prefixed_per_worker(self, monkeypatch):
+        """Test that keys carry the worker ID and differ between runs."""
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+        first, second = KeyNamespace(), KeyNamespace()
+
+        assert worker_id() == "gw3"
+        assert first.key("Alice").startswith("gw3-")
+        assert first.key("Alice").endswith("-Alice")
+        assert first.key("Alice") != second.key("Alice")
+        assert first.keys == [first.key("Alice")]
+
+    def test_main_worker(self, monkeypatch):
+        """Test the worker ID of a run that is not distributed."""
+        monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+        assert KeyNamespace().prefix.startswith("main-")
+
+    def test_delete_from(self, local_greetings_table):
+        """Test that every item of the namespace is deleted, in batches."""
+        namespace = KeyNamespace()
+        adapter = HelloWorldStorageAdapter()
+        names = [namespace.key(f"user-{index}") for index in range(GREETING_COUNT)]
+        for start in range(0, GREETING_COUNT, BATCH_SIZE):
+            result = adapter.put_greetings(
+                [
+                    HelloWorld(name=name, greeting=f"Hi {name}!")
+                    for name in names[start : start + BATCH_SIZE]
+                ]
+            )
+            assert result == PutResult([], [])
+        adapter.save_greeting(HelloWorld(name="Other", greeting="Hi Other!"))
+        namespace.key("never-written")
+
+        assert namespace.delete_from(local_greetings_table) == []
+        assert adapter.get_saved_greeting(names[0]).greeting is None
+        assert adapter.get_saved_greeting(names[-1]).greeting is None
+        assert adapter.get_saved_greeting("Other").greeting == "Hi Other!"
+
+    def test_unprocessed_items_retried(self, monkeypatch):
+        """Test that unprocessed deletes are retried, then reported."""
+        monkeypatch.setattr("tests.utils.key_namespace.INITIAL_RETRY_DELAY_SECONDS", 0)
+        namespace = KeyNamespace("ns-")
+        for index in range(30):
+            namespace.key(f"user-{index}")
+
+        client = FlakyBatchClient(unprocessed_calls=2)
+        assert namespace.delete_from("GreetingsTable", client) == []
+        assert client.calls == [25, 1, 1, 5]
+
+        client = FlakyBatchClient(unprocessed_calls=100)
+        remaining = namespace.delete_from("GreetingsTable", client)
+        assert len(remaining) == 2
+
+    def test_failed_cleanup_is_logged(self, local_dynamodb, caplog):
+        """Test that a failing table returns its keys instead of raising."""
+        namespace = KeyNamespace("ns-")
+        names = [namespace.key(f"user-{index}") for index in range(30)]
+
+        with caplog.at_level(logging.WARNING, logger="tests.utils.key_namespace"):
+            remaining = namespace.delete_from("MissingTable", local_dynamodb.client())
+
+        assert sorted(remaining) == sorted(names)
+        assert "ResourceNotFoundException" in caplog.text
@@ -0,0 +1,198 @@
+"""
+Integration tests for the fan-out Lambda invoker.
+
+Tests bounded concurrent invocations, result ordering, error capture and
+Event invocations with result polling against the local Lambda stand-in,
+running the Hello World handler on the local DynamoDB stand-in.
+"""
+
+import json
+import time
+
+import pytest
+
+from tests.utils import lambda_utils
+from tests.utils.lambda_utils import LambdaInvoker, get_lambda_invoker
+from tests.utils.local_lambda import LocalLambda
+
+# Constants
+FUNCTION_NAME = "hello-world-local"
+PAYLOAD_COUNT = 24
+CONCURRENCY = 4
+LATENCY_MS = 20.0
+
+
+def hello_event(name: str) -> dict:
+    """Build an API Gateway event for the hello route."""
+    return {"httpMethod": "GET", "queryStringParameters": {"name": name}}
+
+
+def failing_handler(event, _context):
+    """Handler failing on odd numbers."""
+    if event["number"] % 2:
+        msg = f"odd number {event['number']}"
+        raise ValueError(msg)
+    return {"number": event["number"]}
+
+
+def slow_handler(event, _context):
+    """Handler outliving the Event timeout of the tests."""
+    time.sleep(event["seconds"])
+    return {}
+
+
+class PagingLogsClient:
+    """Logs client stand-in answering each query with an empty first page."""
+
+    TOKEN = "more"
+
+    def __init__(self, logs: LocalLambda):
+        self.logs = logs
+        self.calls: list[dict] = []
+
+    def filter_log_events(self, **request) -> dict:
+        self.calls.append(dict(request))
+        if request.get("nextToken") != self.TOKEN:
+            return {"events": [], "nextToken": self.TOKEN}
+        request.pop("nextToken")
+        return self.logs.filter_log_events(**request)
+
+
+@pytest.fixture
+def local_lambda(hello_world_handler):
+    """Fixture providing local functions, the Hello World one on the test table."""
+    stand_in = LocalLambda(
+        {
+            FUNCTION_NAME: hello_world_handler.lambda_handler,
+            "failing": failing_handler,
+            "slow": slow_handler,
+        },
+        latency_ms=LATENCY_MS,
+    )
+    yield stand_in
+    stand_in.join()
+
+
+def invoker(local_lambda: LocalLambda, function_name: str) -> LambdaInvoker:
+    """Build an invoker on the local stand-in."""
+    return LambdaInvoker(
+        function_name,
+        max_concurrency=CONCURRENCY,
+        client=local_lambda,
+        logs_client=local_lambda,
+    )
+
+
+@pytest.mark.usefixtures("local_greetings_table")
+class TestInvokeAll:
+    """Test suite for RequestResponse fan-outs."""
+
+    def test_results_in_input_order(self, local_lambda):
+        """Test that every payload is answered, in order, within the bound."""
+        names = [f"user-{index}" for index in range(PAYLOAD_COUNT)]
+        results = invoker(local_lambda, FUNCTION_NAME).invoke_all(
+            [hello_event(name) for name in names]
+        )
+
+        assert all(result.ok for result in results)
+        messages = [
+            json.loads(result.response["body"])["message"] for result in results
+        ]
+        assert messages == [f"Hello, {name}!" for name in names]
+        assert all(result.duration >= LATENCY_MS / 1000 for result in results)
+        assert 1 < local_lambda.max_in_flight <= CONCURRENCY
+
+    def test_errors_captured_per_payload(self, local_lambda):
+        """Test that function errors are reported without stopping the others."""
+        results = invoker(local_lambda, "failing").invoke_all(
+            [{"number": number} for number in range(4)]
+        )
+
+        assert [result.ok for result in results] == [True, False, True, False]
+        assert results[0].response == {"number": 0}
+        assert "odd number 1" in results[1].error
+        assert results[1].response["errorType"] == "ValueError"
+
+    def test_call_errors_captured(self, local_lambda):
+        """Test that a failed invoke call is reported in the results."""
+        (result,) = invoker(local_lambda, "missing").invoke_all([{}])
+        assert "ResourceNotFoundException" in result.error
+
+    def test_single_invoke(self, local_lambda):
+        """Test that invoke returns the decoded response."""
+        response = invoker(local_lambda, FUNCTION_NAME).invoke(hello_event("Ann"))
+        assert json.loads(response["body"])["message"] == "Hello, Ann!"
+
+
+@pytest.mark.usefixtures("local_greetings_table")
+class TestEventInvocations:
+    """Test suite for Event fan-outs and result polling."""
+
+    def test_results_polled_from_reports(self, local_lambda, monkeypatch):
+        """Test that queued invocations are awaited through their REPORT lines."""
+        monkeypatch.setattr(lambda_utils, "INITIAL_POLL_DELAY_SECONDS", 0.01)
+        results = invoker(local_lambda, FUNCTION_NAME).invoke_all(
+            [hello_event(f"user-{index}") for index in range(8)], "Event"
+        )
+
+        assert all(result.ok for result in results)
+        assert len({result.request_id for result in results}) == len(results)
+        assert all(result.response["duration_ms"] >= LATENCY_MS for result in results)
+        assert local_lambda.invocations[FUNCTION_NAME] == len(results)
+
+    def test_one_paged_log_query_per_round(self, local_lambda, monkeypatch):
+        """Test that each round queries the logs once, from the fan-out start."""
+        monkeypatch.setattr(lambda_utils, "INITIAL_POLL_DELAY_SECONDS", 0.01)
+        logs = PagingLogsClient(local_lambda)
+        before_ms = int(time.time() * 1000)
+        results = LambdaInvoker(
+            FUNCTION_NAME, client=local_lambda, logs_client=logs
+        ).invoke_all([hello_event(f"user-{index}") for index in range(8)], "Event")
+
+        assert all(result.ok for result in results)
+        # Every round starts with an empty page, then follows its token
+        assert [call.get("nextToken") for call in logs.calls] == [
+            None,
+            PagingLogsClient.TOKEN,
+        ] * (len(logs.calls) // 2)
+        assert {call["startTime"] for call in logs.calls} == {
+            logs.calls[0]["startTime"]
+        }
+        assert logs.calls[0]["startTime"] <= before_ms
+
+    def test_timeout(self, local_lambda, monkeypatch):
+        """Test that invocations still running at the deadline time out."""
+        monkeypatch.setattr(lambda_utils, "INITIAL_POLL_DELAY_SECONDS", 0.01)
+        results = invoker(local_lambda, "slow").invoke_all(
+            [{"seconds": 0}, {"seconds": 0.5}], "Event", timeout=0.2
+        )
+        assert results[0].ok
+        assert "Timed out" in results[1].error
+
+    def test_unsupported_invocation_type(self, local_lambda):
+        """Test that unknown invocation types are rejected up front."""
+        with pytest.raises(ValueError, match="Unsupported"):
+            invoker(local_lambda, FUNCTION_NAME).invoke_all([{}], "Later")
+
+
+class TestGetLambdaInvoker:
+    """Test suite for the shared, resolved-once invokers."""
+
+    def test_name_resolved_once(self, monkeypatch):
+        """Test that the function name is looked up once per construct."""
+        lookups = []
+
+        def find(construct_id):
+            lookups.append(construct_id)
+            return f"{construct_id}-abc123"
+
+        monkeypatch.setattr(lambda_utils, "find_lambda_by_name", find)
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+        get_lambda_invoker.cache_clear()
+        try:
+            first = get_lambda_invoker("hello_world")
+            assert get_lambda_invoker("hello_world") is first
+            assert first.function_name == "hello_world-abc123"
+            assert lookups == ["hello_world"]
+        finally:
+            get_lambda_invoker.cache_clear()
@@ -0,0 +1,61 @@
+"""
+Integration tests for deferred module imports.
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from utils.lazy_import import lazy_import
+
+# Constants
+MODULE_NAME = "lazy_import_probe"
+
+
+@pytest.fixture
+def probe_module(tmp_path, monkeypatch):
+    """Create a module that records when its code runs."""
+    (tmp_path / f"{MODULE_NAME}.py").write_text(
+        "import sys\nsys.lazy_import_probe_loads += 1\nVALUE = 42\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(sys, "lazy_import_probe_loads", 0, raising=False)
+    yield MODULE_NAME
+    sys.modules.pop(MODULE_NAME, None)
+
+
+class TestLazyImport:
+    """Test suite for lazy_import."""
+
+    def test_module_runs_on_first_attribute_access(self, probe_module):
+        """Test that the module code runs once, when first used."""
+        module = lazy_import(probe_module)
+        assert sys.lazy_import_probe_loads == 0
+
+        assert module.VALUE == 42
+        assert module.VALUE == 42
+        assert sys.lazy_import_probe_loads == 1
+
+    def test_module_is_registered(self, probe_module):
+        """Test that a later import statement gets the same module."""
+        module = lazy_import(probe_module)
+        assert sys.modules[probe_module] is module
+        assert lazy_import(probe_module) is module
+
+    def test_missing_module(self):
+        """Test that a missing module fails at lazy_import time."""
+        with pytest.raises(ModuleNotFoundError):
+            lazy_import("no_such_module_for_lazy_import")
+
+    def test_concurrent_first_access(self, probe_module, tmp_path):
+        """Test that concurrent first accesses all see the loaded module."""
+        (tmp_path / f"{probe_module}.py").write_text(
+            "import sys, time\nsys.lazy_import_probe_loads += 1\n"
+            "time.sleep(0.05)\nVALUE = 42\n"
+        )
+        module = lazy_import(probe_module)
+        with ThreadPoolExecutor(8) as executor:
+            values = list(executor.map(lambda _: module.VALUE, range(8)))
+
+        assert values == [42] * 8
+        assert sys.lazy_import_probe_loads == 1
@@ -0,0 +1,218 @@
+"""
+Integration tests for the local API Gateway and Lambda emulator.
+
+Tests the proxy events and responses, and the Hello World API served from
+the function sources in execution environments on the local DynamoDB
+stand-in: cold starts, warm reuse, throttling and the REPORT lines.
+"""
+
+import json
+import logging
+import threading
+import urllib.error
+import urllib.request
+import uuid
+
+import pytest
+
+from tests.utils.local_api import (
+    LOCAL_OVERRIDES,
+    LocalApi,
+    api_event,
+    proxy_response,
+)
+from tests.utils.local_dynamodb import LocalDynamoDB
+from tests.utils.stack_definitions import stack_definitions
+
+# Constants
+HTTP_OK = 200
+HTTP_FORBIDDEN = 403
+HTTP_THROTTLED = 429
+STORAGE_LATENCY_MS = 300.0
+CONCURRENCY = 2
+
+
+def _api_environment(server: LocalDynamoDB) -> dict[str, str]:
+    """Create a greetings table and the function settings pointing at it."""
+    table_name = server.create_greetings_table(f"LocalApi-{uuid.uuid4().hex[:8]}")
+    return {
+        **server.environment,
+        **LOCAL_OVERRIDES,
+        "HELLO_WORLD_TABLE_NAME": table_name,
+    }
+
+
+def _get(url: str) -> tuple[int, str | None, dict]:
+    """Send a GET request and return its status, start header and JSON body."""
+    try:
+        with urllib.request.urlopen(url) as response:
+            return (
+                response.status,
+                response.headers["X-Local-Start"],
+                json.load(response),
+            )
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers["X-Local-Start"], json.load(e)
+
+
+@pytest.fixture(scope="module")
+def local_api(local_dynamodb):
+    """Fixture providing the emulator serving the function sources."""
+    with LocalApi(environment=_api_environment(local_dynamodb), dist=False) as api:
+        yield api
+
+
+def _route(method: str, path: str):
+    """Build a route of the API definitions."""
+    return stack_definitions("api_definitions").RouteDefinition(
+        method, path, "hello_world"
+    )
+
+
+class TestProxyIntegration:
+    """Test suite for the proxy events and responses."""
+
+    def test_event(self):
+        """Test that requests map to the fields of API Gateway proxy events."""
+        event = api_event(
+            _route("GET", "/hello"),
+            "/hello",
+            path_parameters={},
+            query="name=Ann&tag=a&tag=b&empty=",
+            headers={"Accept": "application/json"},
+            body=b"",
+            request_id="request-1",
+        )
+
+        assert event["resource"] == event["path"] == "/hello"
+        assert event["httpMethod"] == "GET"
+        assert event["queryStringParameters"] == {
+            "name": "Ann",
+            "tag": "b",
+            "empty": "",
+        }
+        assert event["multiValueQueryStringParameters"]["tag"] == ["a", "b"]
+        assert event["multiValueHeaders"] == {"Accept": ["application/json"]}
+        assert event["pathParameters"] is None
+        assert event["body"] is None
+        assert event["requestContext"]["requestId"] == "request-1"
+
+    def test_response(self):
+        """Test that proxy responses map to HTTP responses."""
+        status, headers, body = proxy_response(
+            {
+                "statusCode": 201,
+                "headers": {"Content-Type": "text/plain"},
+                "multiValueHeaders": {"Set-Cookie": ["a=1", "b=2"]},
+                "body": "aGk=",
+                "isBase64Encoded": True,
+            }
+        )
+        assert status == 201
+        assert headers == [
+            ("Content-Type", "text/plain"),
+            ("Set-Cookie", "a=1"),
+            ("Set-Cookie", "b=2"),
+        ]
+        assert body == b"hi"
+
+    @pytest.mark.parametrize(
+        "result", [None, {"body": "{}"}, {"statusCode": 200, "body": {"a": 1}}]
+    )
+    def test_malformed_response(self, result):
+        """Test that results API Gateway rejects are errors."""
+        with pytest.raises(ValueError, match="proxy response"):
+            proxy_response(result)
+
+
+class TestLocalApi:
+    """Test suite for requests to the served API."""
+
+    def test_cold_then_warm(self, local_api):
+        """Test that the first request starts an environment the next reuse."""
+        first = _get(f"{local_api.url}/hello?name=Local")
+        second = _get(f"{local_api.url}/hello?name=Local")
+
+        assert first == (HTTP_OK, "cold", {"message": "Hello, Local!"})
+        assert second[:2] == (HTTP_OK, "warm")
+        cold, warm = local_api.invocations[-2:]
+        assert cold.cold
+        assert cold.init_ms > 0
+        assert not warm.cold
+        assert warm.init_ms is None
+        assert warm.container == cold.container
+        assert local_api.pools["hello_world"].size == 1
+
+    def test_routes_of_the_stack(self, local_api):
+        """Test that every route is served and others are missing."""
+        status, _, body = _get(f"{local_api.url}/greetings?limit=5")
+        assert status == HTTP_OK
+        assert "greetings" in body
+
+        status, start, body = _get(f"{local_api.url}/missing")
+        assert (status, start) == (HTTP_FORBIDDEN, None)
+        assert body == {"message": "Missing Authentication Token"}
+
+        request = urllib.request.Request(f"{local_api.url}/hello", method="POST")
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(request)
+        assert error.value.code == HTTP_FORBIDDEN
+
+    def test_report_lines(self, local_api, caplog):
+        """Test that every request logs a REPORT line with its start."""
+        with caplog.at_level(logging.INFO, logger="tests.utils.local_api"):
+            _get(f"{local_api.url}/hello")
+
+        (report,) = [
+            r.message for r in caplog.records if r.message.startswith("REPORT")
+        ]
+        invocation = local_api.invocations[-1]
+        assert f"RequestId: {invocation.request_id}" in report
+        assert "Memory Size: 256 MB" in report
+        assert "Max Memory Used: " in report
+        assert report.endswith("Start: warm")
+
+
+@pytest.mark.serial
+class TestConcurrency:
+    """Test suite for the execution environments of a function."""
+
+    def test_concurrent_requests_start_environments(self):
+        """Test that overlapping requests start environments up to the limit."""
+        with (
+            LocalDynamoDB(latency_ms=STORAGE_LATENCY_MS) as server,
+            LocalApi(
+                environment=_api_environment(server),
+                dist=False,
+                concurrency=CONCURRENCY,
+            ) as api,
+        ):
+            results = []
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(_get(f"{api.url}/hello"))
+                )
+                for _ in range(CONCURRENCY + 1)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            starts = sorted((status, start) for status, start, _ in results)
+            assert starts == [(HTTP_OK, "cold")] * CONCURRENCY + [
+                (HTTP_THROTTLED, None)
+            ]
+            assert len({invocation.container for invocation in api.invocations}) == 2
+            assert _get(f"{api.url}/hello")[:2] == (HTTP_OK, "warm")
+
+    def test_idle_environments_are_recycled(self, local_dynamodb):
+        """Test that an environment idle for too long is replaced."""
+        with LocalApi(
+            environment=_api_environment(local_dynamodb), dist=False, idle_seconds=0
+        ) as api:
+            assert _get(f"{api.url}/hello")[1] == "cold"
+            assert _get(f"{api.url}/hello")[1] == "cold"
+            first, second = api.invocations
+            assert second.container != first.container
+            assert api.pools["hello_world"].size == 1
@@ -0,0 +1,124 @@
+"""
+Integration tests for the Embedded Metric Format metrics.
+
+Tests aggregation, EMF output and invocation dimensions by capturing the
+flushed documents from stdout.
+"""
+
+import pytest
+from observability.metrics import (
+    DEFAULT_NAMESPACE,
+    MAX_VALUES_PER_METRIC,
+    Metrics,
+    MetricUnit,
+    metrics,
+)
+
+
+@pytest.fixture
+def lambda_handler(hello_world_handler):
+    """Provide the handler, imported once the table is configured."""
+    return hello_world_handler.lambda_handler
+
+
+class TestMetrics:
+    """Test suite for Metrics."""
+
+    def test_counters_are_summed(self, emf_documents):
+        """Test that counter increments are aggregated into one value."""
+        metrics.add_count("Greetings")
+        metrics.add_count("Greetings", 2)
+        (document,) = emf_documents()
+        assert document["Greetings"] == 3
+
+    def test_values_are_kept_for_percentiles(self, emf_documents):
+        """Test that histogram values are flushed as a list."""
+        metrics.add_value("PayloadSize", 10, MetricUnit.BYTES)
+        metrics.add_value("PayloadSize", 20, MetricUnit.BYTES)
+        (document,) = emf_documents()
+        assert document["PayloadSize"] == [10, 20]
+        assert document["_aws"]["CloudWatchMetrics"][0]["Metrics"] == [
+            {"Name": "PayloadSize", "Unit": "Bytes"}
+        ]
+
+    def test_timer_records_milliseconds(self, emf_documents):
+        """Test that a timer records the block duration, even when it raises."""
+        with pytest.raises(RuntimeError), metrics.timer("Work"):
+            raise RuntimeError
+        (document,) = emf_documents()
+        (duration,) = document["Work"]
+        assert duration >= 0
+        assert document["_aws"]["CloudWatchMetrics"][0]["Metrics"] == [
+            {"Name": "Work", "Unit": "Milliseconds"}
+        ]
+
+    def test_flush_writes_once_and_resets(self, emf_documents):
+        """Test that a flush writes one document and clears the metrics."""
+        metrics.add_count("Greetings")
+        assert len(emf_documents()) == 1
+        assert emf_documents() == []
+
+    def test_values_beyond_emf_limit_spill_over(self, emf_documents):
+        """Test that more values than EMF allows are split across documents."""
+        for value in range(MAX_VALUES_PER_METRIC + 1):
+            metrics.add_value("Sample", value)
+        metrics.add_count("Greetings")
+        first, second = emf_documents()
+        assert len(first["Sample"]) == MAX_VALUES_PER_METRIC
+        assert second["Sample"] == [MAX_VALUES_PER_METRIC]
+        assert "Greetings" in first
+        assert "Greetings" not in second
+
+    def test_namespace(self):
+        """Test that the namespace is configurable."""
+        assert Metrics().namespace == DEFAULT_NAMESPACE
+        assert Metrics("Custom").namespace == "Custom"
+
+
+class TestInvocationMetrics:
+    """Test suite for invocation scoped metrics."""
+
+    def test_cold_start_dimension(self, lambda_context, emf_documents):
+        """Test that only the first invocation is flagged as a cold start."""
+        fresh = Metrics()
+        for _ in range(2):
+            with fresh.invocation(lambda_context):
+                fresh.add_count("Greetings")
+        first, second = emf_documents()
+        assert first["ColdStart"] == "true"
+        assert second["ColdStart"] == "false"
+        assert "Route" not in first
+
+    def test_invocation_flushes_once(self, lambda_context, emf_documents):
+        """Test that one document with the dimensions is written per invocation."""
+        for _ in range(2):
+            with metrics.invocation(lambda_context, route="GET /hello"):
+                metrics.add_count("Greetings")
+        documents = emf_documents()
+        assert len(documents) == 2
+        assert [document["Function"] for document in documents] == [
+            "test-function",
+            "test-function",
+        ]
+        assert documents[0]["Route"] == "GET /hello"
+        assert documents[1]["ColdStart"] == "false"
+        assert documents[0]["_aws"]["CloudWatchMetrics"][0]["Dimensions"] == [
+            ["Function", "Route", "ColdStart"]
+        ]
+        assert len(documents[0]["InvocationLatency"]) == 1
+
+    def test_handler_flushes_metrics(
+        self,
+        local_greetings_table,
+        lambda_event,
+        lambda_context,
+        emf_documents,
+        lambda_handler,
+    ):
+        """Test that the handler writes its and the adapter's metrics."""
+        lambda_event["resource"] = "/hello"
+        lambda_handler(lambda_event, lambda_context)
+        (document,) = emf_documents()
+        assert document["Route"] == "GET /hello"
+        assert len(document["GetItemLatency"]) == 1
+        assert len(document["InvocationLatency"]) == 1
@@ -0,0 +1,70 @@
+"""
+Integration tests for the adaptive rate limiter.
+
+Tests pacing, additive increase and multiplicative decrease.
+"""
+
+import time
+
+import pytest
+from utils.rate_limiter import AdaptiveRateLimiter
+
+# Constants
+RATE = 200.0
+# Allowed scheduling slack, in seconds
+SLACK = 0.05
+
+
+class TestAdaptiveRateLimiter:
+    """Test suite for AdaptiveRateLimiter."""
+
+    def test_burst_then_paced(self):
+        """Test that a second's worth of tokens is free, then paced."""
+        limiter = AdaptiveRateLimiter(RATE)
+        assert limiter.acquire(RATE) == 0
+
+        start = time.monotonic()
+        limiter.acquire(RATE / 10)
+        assert time.monotonic() - start == pytest.approx(0.1, abs=SLACK)
+
+    def test_success_increases_rate(self):
+        """Test that successes raise the rate up to max_rate."""
+        limiter = AdaptiveRateLimiter(RATE, max_rate=RATE + 15, increase=10)
+        limiter.on_success()
+        assert limiter.rate == RATE + 10
+        limiter.on_success()
+        assert limiter.rate == RATE + 15
+
+    def test_throttle_decreases_rate_once_per_cooldown(self):
+        """Test that a burst of throttles halves the rate only once."""
+        limiter = AdaptiveRateLimiter(RATE, cooldown_seconds=60)
+        for _ in range(5):
+            limiter.on_throttle()
+        assert limiter.rate == RATE / 2
+        assert limiter.throttles == 5
+
+    def test_throttle_floor(self):
+        """Test that the rate never drops below min_rate."""
+        limiter = AdaptiveRateLimiter(RATE, min_rate=RATE * 0.75, cooldown_seconds=0)
+        limiter.on_throttle()
+        limiter.on_throttle()
+        assert limiter.rate == RATE * 0.75
+
+    def test_throttle_drops_burst(self):
+        """Test that throttling makes the next acquire wait."""
+        limiter = AdaptiveRateLimiter(RATE)
+        limiter.on_throttle()
+        assert limiter.acquire(RATE / 20) > 0
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"initial_rate": 0}, "rates"),
+            ({"initial_rate": 1, "min_rate": 2}, "rates"),
+            ({"initial_rate": 1, "decrease_factor": 1}, "decrease_factor"),
+        ],
+    )
+    def test_invalid_arguments(self, kwargs, match):
+        """Test that invalid rates and factors are rejected."""
+        with pytest.raises(ValueError, match=match):
+            AdaptiveRateLimiter(**kwargs)
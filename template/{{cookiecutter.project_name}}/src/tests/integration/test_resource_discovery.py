@@ -0,0 +1,286 @@
+"""
+Integration tests for resource discovery.
+
+Tests resolution from deploy outputs and synthesized templates, and the
+paginated sweep and the lookups served from its index, against stubbed
+Resource Groups Tagging API and CloudFormation clients.
+"""
+
+import json
+import random
+import threading
+import time
+from collections import Counter, defaultdict
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+from tests.test_config import TAG_KEY, TAG_VALUE
+from tests.utils.resource_discovery import ResourceDiscovery
+from tests.utils.stack_outputs import StackOutputs
+
+# Constants
+ACCOUNT = "arn:aws:{service}:us-east-1:123456789012:{resource}"
+TABLE_ARN = ACCOUNT.format(service="dynamodb", resource="table/GreetingsTable-abc")
+FUNCTION_ARN = ACCOUNT.format(service="lambda", resource="function:HelloWorld-abc")
+ROLE_ARN = "arn:aws:iam::123456789012:role/HelloWorldRole-abc"
+TAG_FILTERS = [{"Key": TAG_KEY, "Values": [TAG_VALUE]}]
+STACK_NAME = "demo-HelloWorldStack"
+WAIT_TIMEOUT = 0.5
+INITIAL_DELAY = 0.01
+MAX_DELAY = 0.05
+
+
+def mapping(arn: str, resource_id: str) -> dict:
+    """Build a tag mapping of an application resource."""
+    return {
+        "ResourceARN": arn,
+        "Tags": [
+            {"Key": TAG_KEY, "Value": TAG_VALUE},
+            {"Key": "ResourceId", "Value": resource_id},
+        ],
+    }
+
+
+@pytest.fixture
+def no_outputs(tmp_path):
+    """Provide a stack output resolver with nothing deployed or synthesized."""
+    return StackOutputs(tmp_path / "cdk-outputs.json", tmp_path / "cdk.out")
+
+
+@pytest.fixture
+def cdk_out(tmp_path):
+    """Provide a cloud assembly with a literal and a referencing output."""
+    directory = tmp_path / "cdk.out"
+    directory.mkdir()
+    template = {
+        "Resources": {"GreetingsTable1234": {"Type": "AWS::DynamoDB::Table"}},
+        "Outputs": {
+            "GreetingsTableName": {"Value": {"Ref": "GreetingsTable1234"}},
+            "ReportBucketName": {"Value": "reports-bucket"},
+            "HelloWorldApiUrl": {"Value": {"Fn::Join": ["", ["https://", "x"]]}},
+        },
+    }
+    (directory / f"{STACK_NAME}.template.json").write_text(json.dumps(template))
+    manifest = {
+        "artifacts": {
+            "Tree": {"type": "cdk:tree"},
+            STACK_NAME: {
+                "type": "aws:cloudformation:stack",
+                "properties": {"templateFile": f"{STACK_NAME}.template.json"},
+            },
+        }
+    }
+    (directory / "manifest.json").write_text(json.dumps(manifest))
+    return directory
+
+
+@pytest.fixture
+def tagging_client():
+    """Provide a stubbed tagging client returning two pages of resources."""
+    client = boto3.client("resourcegroupstaggingapi", region_name="us-east-1")
+    stubber = Stubber(client)
+    stubber.add_response(
+        "get_resources",
+        {
+            "ResourceTagMappingList": [
+                mapping(TABLE_ARN, "GreetingsTable"),
+                mapping(ROLE_ARN, "HelloWorldRole"),
+            ],
+            "PaginationToken": "page-2",
+        },
+        {"TagFilters": TAG_FILTERS},
+    )
+    stubber.add_response(
+        "get_resources",
+        {"ResourceTagMappingList": [mapping(FUNCTION_ARN, "HelloWorldFunction")]},
+        {"TagFilters": TAG_FILTERS, "PaginationToken": "page-2"},
+    )
+    with stubber:
+        yield client
+    stubber.assert_no_pending_responses()
+
+
+class TestResourceDiscovery:
+    """Test suite for ResourceDiscovery."""
+
+    def test_lookups_share_one_sweep(self, tagging_client, no_outputs):
+        """Test that every page is fetched once and serves all lookups."""
+        discovery = ResourceDiscovery(tagging_client, no_outputs)
+
+        assert discovery.get_dynamodb_table_name("GreetingsTable") == (
+            "GreetingsTable-abc"
+        )
+        assert discovery.get_lambda_function_name("HelloWorldFunction") == (
+            "HelloWorld-abc"
+        )
+        assert discovery.get_iam_role_arn("HelloWorldRole") == ROLE_ARN
+        assert discovery.get_s3_bucket_name("GreetingsTable") is None
+
+    def test_index_by_id_name_and_type(self, tagging_client, no_outputs):
+        """Test that resources are indexed by ResourceId, name and type."""
+        discovery = ResourceDiscovery(tagging_client, no_outputs)
+
+        assert discovery.get_resource_by_id("GreetingsTable")["type"] == (
+            "dynamodb:table"
+        )
+        assert [
+            r["arn"] for r in discovery.get_resources_by_name("HelloWorld-abc")
+        ] == [FUNCTION_ARN]
+        by_type = discovery.get_all_application_resources()
+        assert sorted(by_type) == ["dynamodb:table", "iam:role", "lambda:function"]
+        assert discovery.get_resource_by_id("Missing") is None
+
+    def test_failed_sweep_is_retried(self, no_outputs):
+        """Test that an error leaves nothing cached, so lookups retry."""
+        client = boto3.client("resourcegroupstaggingapi", region_name="us-east-1")
+        with Stubber(client) as stubber:
+            stubber.add_client_error("get_resources", "AccessDeniedException")
+            stubber.add_response(
+                "get_resources",
+                {"ResourceTagMappingList": [mapping(TABLE_ARN, "GreetingsTable")]},
+            )
+            discovery = ResourceDiscovery(client, no_outputs)
+            assert discovery.get_dynamodb_table_name("GreetingsTable") is None
+            assert discovery.get_dynamodb_table_name("GreetingsTable") == (
+                "GreetingsTable-abc"
+            )
+
+
+class AppearingTaggingClient:
+    """
+    Tagging client stand-in whose resources become discoverable only after
+    a number of lookups covering them, as after a deployment.
+    """
+
+    def __init__(self, polls_before_tagged: dict[str, int]):
+        self.polls_before_tagged = polls_before_tagged
+        self.polls: Counter[str] = Counter()
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get_paginator(self, operation_name: str) -> "AppearingTaggingClient":
+        return self
+
+    def paginate(self, TagFilters: list[dict]) -> list[dict]:
+        # A sweep without a ResourceId filter covers every resource
+        wanted = [f["Values"][0] for f in TagFilters if f["Key"] == "ResourceId"]
+        with self._lock:
+            self.calls += 1
+            for resource_id in wanted or self.polls_before_tagged:
+                self.polls[resource_id] += 1
+            tagged = [
+                mapping(TABLE_ARN.replace("GreetingsTable", resource_id), resource_id)
+                for resource_id in wanted or self.polls_before_tagged
+                if self.polls[resource_id]
+                > self.polls_before_tagged.get(resource_id, float("inf"))
+            ]
+        return [{"ResourceTagMappingList": tagged}]
+
+
+class TestWaitForResources:
+    """Test suite for waiting on several resources at once."""
+
+    def test_resolved_and_timed_out(self, no_outputs, monkeypatch):
+        """Test that resources are waited for concurrently, within one deadline."""
+        delays = defaultdict(list)
+        sleep = time.sleep
+
+        def recording_sleep(seconds: float) -> None:
+            delays[threading.get_ident()].append(seconds)
+            sleep(seconds)
+
+        # Always the longest delay, so that the backoff is deterministic
+        monkeypatch.setattr(random, "uniform", lambda _low, high: high)
+        monkeypatch.setattr(time, "sleep", recording_sleep)
+        client = AppearingTaggingClient({"Ready": 0, "Slow": 3, "Slower": 4})
+        discovery = ResourceDiscovery(client, no_outputs)
+
+        readiness = discovery.wait_for_resources(
+            ["Slow", "Slower", "Never", "Slow"],
+            timeout=WAIT_TIMEOUT,
+            initial_delay=INITIAL_DELAY,
+            max_delay=MAX_DELAY,
+        )
+
+        assert sorted(readiness.resolved) == ["Slow", "Slower"]
+        assert readiness.timed_out == {"Never"}
+        assert not readiness.ready
+        # One poller per pending resource, each backing off up to the maximum
+        # delay and never sleeping past the shared deadline, however loaded
+        # the machine is
+        assert len(delays) == 3
+        for poller_delays in delays.values():
+            assert poller_delays[0] == INITIAL_DELAY
+            assert max(poller_delays) <= MAX_DELAY
+            assert sum(poller_delays) <= WAIT_TIMEOUT + 1e-9
+        # Resolved resources are indexed, so lookups need no further polls
+        calls = client.calls
+        assert discovery.get_dynamodb_table_name("Slower") == "Slower-abc"
+        assert client.calls == calls
+
+    def test_indexed_resources_not_polled(self, no_outputs):
+        """Test that resources found by the sweep resolve at once."""
+        client = AppearingTaggingClient({"Ready": 0})
+        discovery = ResourceDiscovery(client, no_outputs)
+
+        readiness = discovery.wait_for_resources(["Ready"], timeout=0)
+        assert readiness.ready
+        assert client.calls == 1
+
+    def test_wait_for_single_resource(self, no_outputs):
+        """Test the single-resource wait on top of the concurrent one."""
+        discovery = ResourceDiscovery(AppearingTaggingClient({"Slow": 1}), no_outputs)
+        assert discovery.wait_for_resource_availability("Slow", 3, 0.05)
+        assert not discovery.wait_for_resource_availability("Never", 2, 0.05)
+
+
+class TestStackOutputs:
+    """Test suite for resolving names from stack outputs."""
+
+    def test_outputs_file_first(self, tmp_path, cdk_out):
+        """Test that deployed outputs resolve without any API call."""
+        outputs_file = tmp_path / "cdk-outputs.json"
+        outputs_file.write_text(
+            json.dumps({STACK_NAME: {"GreetingsTableName": "GreetingsTable-xyz"}})
+        )
+        tagging = boto3.client("resourcegroupstaggingapi", region_name="us-east-1")
+        with Stubber(tagging):
+            discovery = ResourceDiscovery(tagging, StackOutputs(outputs_file, cdk_out))
+            assert discovery.get_dynamodb_table_name("GreetingsTable") == (
+                "GreetingsTable-xyz"
+            )
+
+    def test_synthesized_literal_output(self, tmp_path, cdk_out):
+        """Test that a literal output of the cloud assembly resolves offline."""
+        outputs = StackOutputs(tmp_path / "missing.json", cdk_out)
+        discovery = ResourceDiscovery(outputs=outputs)
+        assert discovery.get_s3_bucket_name("ReportBucket") == "reports-bucket"
+
+    def test_synthesized_reference_described_once(self, tmp_path, cdk_out):
+        """Test that a referenced resource is described once, then cached."""
+        cloudformation = boto3.client("cloudformation", region_name="us-east-1")
+        with Stubber(cloudformation) as stubber:
+            stubber.add_response(
+                "describe_stack_resource",
+                {
+                    "StackResourceDetail": {
+                        "LogicalResourceId": "GreetingsTable1234",
+                        "PhysicalResourceId": "GreetingsTable-xyz",
+                        "ResourceType": "AWS::DynamoDB::Table",
+                        "LastUpdatedTimestamp": "2024-01-01T00:00:00Z",
+                        "ResourceStatus": "CREATE_COMPLETE",
+                    }
+                },
+                {"StackName": STACK_NAME, "LogicalResourceId": "GreetingsTable1234"},
+            )
+            outputs = StackOutputs(tmp_path / "missing.json", cdk_out, cloudformation)
+            assert outputs.get("GreetingsTableName") == "GreetingsTable-xyz"
+            assert outputs.get("GreetingsTableName") == "GreetingsTable-xyz"
+
+    def test_unresolvable_output(self, tmp_path, cdk_out):
+        """Test that computed and unknown outputs are left to the tagging API."""
+        outputs = StackOutputs(tmp_path / "missing.json", cdk_out)
+        assert outputs.get("HelloWorldApiUrl") is None
+        assert outputs.get("Unknown") is None
@@ -0,0 +1,74 @@
+"""
+Integration tests for the table definitions shared with the stacks.
+
+Tests the CreateTable requests built from the definitions HelloWorldStack
+deploys, and the local tables provisioned from them.
+"""
+
+import pytest
+
+from tests.utils.local_dynamodb import table_definitions
+
+
+class TestGreetingsTableDefinition:
+    """Test suite for the greetings table definition."""
+
+    def test_create_table_request(self):
+        """Test that the keys and the recency index are described."""
+        definitions = table_definitions()
+        request = definitions.greetings_table().create_table_request("Greetings")
+
+        assert request["TableName"] == "Greetings"
+        assert request["KeySchema"] == [{"AttributeName": "name", "KeyType": "HASH"}]
+        assert request["BillingMode"] == "PAY_PER_REQUEST"
+        (index,) = request["GlobalSecondaryIndexes"]
+        assert index["IndexName"] == definitions.RECENCY_INDEX_NAME
+        assert [key["AttributeName"] for key in index["KeySchema"]] == [
+            definitions.LISTING_ATTRIBUTE,
+            "updated_at",
+        ]
+        assert index["Projection"] == {
+            "ProjectionType": "INCLUDE",
+            "NonKeyAttributes": ["greeting", "created_at", "version"],
+        }
+        assert request["AttributeDefinitions"] == [
+            {"AttributeName": "name", "AttributeType": "S"},
+            {"AttributeName": "listing", "AttributeType": "S"},
+            {"AttributeName": "updated_at", "AttributeType": "S"},
+        ]
+
+    @pytest.mark.parametrize(
+        ("timestamp_format", "sort_key_type"), [("iso", "S"), ("epoch_ms", "N")]
+    )
+    def test_sort_key_follows_timestamp_format(self, timestamp_format, sort_key_type):
+        """Test that the recency index sort key type follows the timestamp format."""
+        definition = table_definitions().greetings_table(timestamp_format)
+        request = definition.create_table_request("Greetings")
+        types = {
+            attribute["AttributeName"]: attribute["AttributeType"]
+            for attribute in request["AttributeDefinitions"]
+        }
+        assert types["updated_at"] == sort_key_type
+
+    def test_local_table_matches_definition(self, local_dynamodb):
+        """Test that local tables get the keys and indexes of the definition."""
+        client = local_dynamodb.client()
+        table_name = local_dynamodb.create_greetings_table("DefinitionCheck")
+        try:
+            table = client.describe_table(TableName=table_name)["Table"]
+        finally:
+            local_dynamodb.delete_table(table_name)
+
+        definition = table_definitions().greetings_table()
+        expected = definition.create_table_request(table_name)
+        assert table["KeySchema"] == expected["KeySchema"]
+        assert sorted(
+            table["AttributeDefinitions"], key=lambda a: a["AttributeName"]
+        ) == sorted(expected["AttributeDefinitions"], key=lambda a: a["AttributeName"])
+        assert [
+            (index["IndexName"], index["KeySchema"])
+            for index in table["GlobalSecondaryIndexes"]
+        ] == [
+            (index["IndexName"], index["KeySchema"])
+            for index in expected["GlobalSecondaryIndexes"]
+        ]
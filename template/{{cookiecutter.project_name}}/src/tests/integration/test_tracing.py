@@ -0,0 +1,217 @@
+"""
+Integration tests for tracing.
+
+Tests spans, sampling and backends with the in-memory recorder, and the
+spans of service and adapter calls against the local DynamoDB stand-in.
+"""
+
+import asyncio
+import sys
+
+import pytest
+from adapters.async_hello_world_storage_adapter import AsyncHelloWorldStorageAdapter
+from adapters.hello_world_storage_adapter import HelloWorldStorageAdapter
+from aws_xray_sdk.core import xray_recorder
+from config.config_service import ConfigService, ConfigurationError
+from domain.services.async_hello_world_service import AsyncHelloWorldService
+from domain.services.hello_world_service import HelloWorldService
+from observability.tracing import (
+    InMemoryBackend,
+    Tracer,
+    XRayBackend,
+    configure_tracing,
+    tracer,
+)
+
+
+@pytest.fixture
+def recorder():
+    """Send the shared tracer's spans to an in-memory backend."""
+    backend = InMemoryBackend()
+    tracer.configure(backend)
+    yield backend
+    tracer.configure(None)
+
+
+class FakeSubsegment:
+    """Subsegment stand-in recording annotations and exceptions."""
+
+    def __init__(self):
+        self.annotations = {}
+        self.exceptions = []
+
+    def put_annotation(self, key, value):
+        self.annotations[key] = value
+
+    def add_exception(self, exception, stack):
+        self.exceptions.append(exception)
+
+
+class FakeRecorder:
+    """X-Ray recorder stand-in tracking open subsegments."""
+
+    def __init__(self):
+        self.open = []
+        self.closed = []
+
+    def begin_subsegment(self, name):
+        subsegment = FakeSubsegment()
+        subsegment.name = name
+        self.open.append(subsegment)
+        return subsegment
+
+    def end_subsegment(self):
+        self.closed.append(self.open.pop())
+
+
+class TestTracer:
+    """Test suite for Tracer."""
+
+    def test_disabled_tracer_calls_through(self):
+        """Test that a decorated function runs unchanged when tracing is off."""
+        off = Tracer()
+
+        @off.trace()
+        def add(a, b):
+            return a + b
+
+        assert not off.enabled
+        assert add(1, 2) == 3
+        assert add.__name__ == "add"
+
+    def test_nested_spans(self):
+        """Test that nested spans record their parent."""
+        backend = InMemoryBackend()
+        traced = Tracer(backend)
+
+        @traced.trace("inner")
+        def inner():
+            return "done"
+
+        with traced.span("outer", route="GET /hello"):
+            assert inner() == "done"
+
+        outer, inner_span = backend.spans
+        assert backend.names() == ["outer", "inner"]
+        assert inner_span.parent is outer
+        assert outer.annotations == {"route": "GET /hello"}
+        assert outer.duration >= inner_span.duration
+
+    def test_error_is_recorded_and_raised(self):
+        """Test that an exception is attached to the span and propagated."""
+        backend = InMemoryBackend()
+        traced = Tracer(backend)
+
+        @traced.trace()
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            fail()
+        (span,) = backend.spans
+        assert isinstance(span.error, ValueError)
+        assert span.end is not None
+
+    def test_coroutines_are_traced(self):
+        """Test that concurrent coroutines get sibling spans."""
+        backend = InMemoryBackend()
+        traced = Tracer(backend)
+
+        @traced.trace("child")
+        async def child():
+            await asyncio.sleep(0)
+
+        @traced.trace("parent")
+        async def parent():
+            await asyncio.gather(child(), child())
+
+        asyncio.run(parent())
+        root, *children = backend.spans
+        assert backend.names() == ["parent", "child", "child"]
+        assert all(span.parent is root for span in children)
+
+    def test_unsampled_root_skips_its_children(self):
+        """Test that a sample rate of 0 records nothing."""
+        backend = InMemoryBackend()
+        traced = Tracer(backend, sample_rate=0.0)
+
+        with traced.span("outer"), traced.span("inner"):
+            pass
+
+        assert backend.spans == []
+
+    def test_invalid_sample_rate(self):
+        """Test that a sample rate outside [0, 1] is rejected."""
+        with pytest.raises(ValueError, match="sample_rate"):
+            Tracer(InMemoryBackend(), sample_rate=1.5)
+
+    def test_configured_from_settings(self, monkeypatch):
+        """Test that HELLO_WORLD_TRACING selects the backend."""
+        monkeypatch.setenv("HELLO_WORLD_TABLE_NAME", "GreetingsTable")
+        monkeypatch.delenv("HELLO_WORLD_TRACING", raising=False)
+        assert not configure_tracing(ConfigService().settings, Tracer()).enabled
+
+        monkeypatch.setenv("HELLO_WORLD_TRACING", "memory")
+        monkeypatch.setenv("HELLO_WORLD_TRACE_SAMPLE_RATE", "0.25")
+        configured = configure_tracing(ConfigService().settings, Tracer())
+        assert isinstance(configured.backend, InMemoryBackend)
+        assert configured.sample_rate == 0.25
+
+
+class TestXRayBackend:
+    """Test suite for XRayBackend."""
+
+    def test_subsegments(self):
+        """Test that spans become annotated subsegments."""
+        recorder = FakeRecorder()
+        traced = Tracer(XRayBackend(recorder))
+
+        with pytest.raises(RuntimeError), traced.span("call", table="greetings"):
+            raise RuntimeError
+
+        (subsegment,) = recorder.closed
+        assert subsegment.name == "call"
+        assert subsegment.annotations == {"table": "greetings"}
+        assert isinstance(subsegment.exceptions[0], RuntimeError)
+
+    def test_default_recorder(self):
+        """Test that the SDK's global recorder is used by default."""
+        assert XRayBackend().recorder is xray_recorder
+
+    def test_missing_sdk(self, monkeypatch):
+        """Test that the backend is refused when the SDK is not installed."""
+        # A None entry blocks the import, as if the package were missing
+        monkeypatch.setitem(sys.modules, "aws_xray_sdk", None)
+        with pytest.raises(ConfigurationError, match="aws-xray-sdk"):
+            XRayBackend()
+
+
+class TestTracedCalls:
+    """Test suite for the spans of service and adapter calls."""
+
+    def test_service_and_adapter_spans(self, local_greetings_table, recorder):
+        """Test that a service call contains the adapter call."""
+        service = HelloWorldService(HelloWorldStorageAdapter())
+        service.save_greeting("Alice", "Hi Alice")
+        service.get_greeting("Alice")
+
+        assert recorder.names() == [
+            "HelloWorldService.save_greeting",
+            "HelloWorldStorageAdapter.save_greeting",
+            "HelloWorldService.get_greeting",
+            "HelloWorldStorageAdapter.get_saved_greeting",
+        ]
+        assert recorder.spans[3].parent is recorder.spans[2]
+
+    def test_async_service_spans(self, local_greetings_table, recorder):
+        """Test that concurrent lookups are traced under the service call."""
+
+        async def scenario() -> None:
+            async with AsyncHelloWorldStorageAdapter() as adapter:
+                await AsyncHelloWorldService(adapter).get_greetings(["Bob", "Carol"])
+
+        asyncio.run(scenario())
+        service_span, batch_span, *lookups = recorder.spans
+        assert service_span.name == "AsyncHelloWorldService.get_greetings"
+        assert batch_span.parent is service_span
+        assert [span.parent for span in lookups] == [batch_span, batch_span]
@@ -0,0 +1 @@
+"""Tool integration tests."""
@@ -0,0 +1,464 @@
+"""
+Integration tests for the bulk loader.
+
+Tests record parsing and end-to-end loads of CSV and JSON Lines files into
+the local DynamoDB stand-in, including rejects, checkpoint resume and
+backing off when writes are throttled.
+"""
+
+import gzip
+import io
+import json
+import threading
+from datetime import UTC, datetime
+
+import pytest
+from adapters.hello_world_storage_adapter import (
+    MAX_BATCH_WRITE_ITEMS,
+    HelloWorldStorageAdapter,
+)
+from botocore.exceptions import ClientError
+from models.hello_world_model import HelloWorld
+from ports.hello_world_port import PutResult
+from utils.rate_limiter import AdaptiveRateLimiter
+
+from tools.bulk_loader import (
+    BulkLoader,
+    BulkLoadError,
+    Checkpoint,
+    RecordFormat,
+    detect_format,
+    main,
+    parse_greeting,
+    read_records,
+)
+
+# Constants
+RECORD_COUNT = 120
+FAST_RATE = 100_000.0
+
+
+@pytest.fixture
+def adapter():
+    """Fixture providing a storage adapter on the local table."""
+    return HelloWorldStorageAdapter()
+
+
+def stored_names(adapter: HelloWorldStorageAdapter) -> set[str]:
+    """Get the names of every stored greeting."""
+    return {greeting.name for greeting in adapter.export_greetings(1)}
+
+
+def write_jsonl(path, records) -> None:
+    """Write records as a JSON Lines file."""
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+
+
+@pytest.mark.usefixtures("local_greetings_table")
+class TestPutGreetings:
+    """Test suite for HelloWorldStorageAdapter.put_greetings."""
+
+    def test_written_greetings_are_listed(self, adapter):
+        """Test that batched greetings are stored and in the recency index."""
+        greetings = [HelloWorld(name=f"user-{i}", greeting="Hi") for i in range(3)]
+        assert adapter.put_greetings(greetings) == PutResult([], [])
+        listed = adapter.list_greetings(page_size=10).greetings
+        assert {greeting.name for greeting in listed} == {"user-0", "user-1", "user-2"}
+        assert {greeting.version for greeting in listed} == {1}
+
+    def test_seeds_replace_stored_greetings(self, adapter):
+        """Test that greetings without a version are written at version 1."""
+        saved = HelloWorld(name="Alice", greeting="Hi")
+        adapter.save_greeting(saved)
+        adapter.save_greeting(saved)
+        seeds = [HelloWorld(name="Alice", greeting="Seed")]
+
+        assert adapter.put_greetings(seeds) == PutResult([], [])
+        # Seeding again is harmless
+        assert adapter.put_greetings(seeds) == PutResult([], [])
+        stored = adapter.get_saved_greeting("Alice")
+        assert (stored.greeting, stored.version) == ("Seed", 1)
+
+    def test_stored_versions_are_kept(self, adapter):
+        """Test that greetings with a version never roll back a stored one."""
+        saved = HelloWorld(name="Alice", greeting="Hi")
+        adapter.save_greeting(saved)
+        adapter.save_greeting(saved)
+        older = HelloWorld(name="Alice", greeting="Older", version=1)
+        clash = HelloWorld(name="Alice", greeting="Clash", version=2)
+        new = HelloWorld(name="Bob", greeting="Hey", version=1)
+
+        assert adapter.put_greetings([older, new]) == PutResult([new], [older])
+        assert adapter.put_greetings([clash]) == PutResult([], [clash])
+        stored = adapter.get_saved_greeting("Alice")
+        assert (stored.greeting, stored.version) == ("Hi", 2)
+        assert adapter.get_saved_greeting("Bob").greeting is None
+
+        newer = HelloWorld(name="Alice", greeting="Newer", version=3)
+        assert adapter.put_greetings([newer, new]) == PutResult([], [])
+        # The same greetings written again, as by a resumed load
+        assert adapter.put_greetings([newer, new]) == PutResult([], [])
+        stored = adapter.get_saved_greeting("Alice")
+        assert (stored.greeting, stored.version) == ("Newer", 3)
+
+    def test_seeds_and_versions_in_one_batch(self, adapter):
+        """Test that a refused greeting does not hold back the seeds."""
+        adapter.save_greeting(HelloWorld(name="Alice", greeting="Hi"))
+        older = HelloWorld(name="Alice", greeting="Older", version=1)
+        seed = HelloWorld(name="Bob", greeting="Hey")
+
+        assert adapter.put_greetings([older, seed]) == PutResult([], [older])
+        assert adapter.get_saved_greeting("Bob").greeting == "Hey"
+
+    def test_unprocessed_seeds_are_returned(self, adapter, monkeypatch):
+        """Test that seeds BatchWriteItem leaves unprocessed are not written."""
+        client = adapter.dynamodb.meta.client
+        batch_write_item = client.batch_write_item
+
+        def leave_last(RequestItems, **options):
+            ((table, requests),) = RequestItems.items()
+            response = batch_write_item(RequestItems={table: requests[:-1]}, **options)
+            return {**response, "UnprocessedItems": {table: requests[-1:]}}
+
+        monkeypatch.setattr(client, "batch_write_item", leave_last)
+        seeds = [HelloWorld(name=f"user-{i}", greeting="Hi") for i in range(3)]
+        assert adapter.put_greetings(seeds) == PutResult(seeds[-1:], [])
+        assert adapter.get_saved_greeting("user-2").greeting is None
+
+    @pytest.mark.parametrize(
+        ("operation", "version"),
+        [("batch_write_item", None), ("transact_write_items", 1)],
+    )
+    def test_throttled_call_returns_every_greeting(
+        self, adapter, monkeypatch, operation, version
+    ):
+        """Test that a throttled call leaves every greeting unprocessed."""
+
+        def throttle(**_request):
+            raise ClientError(
+                {"Error": {"Code": "ProvisionedThroughputExceededException"}},
+                operation,
+            )
+
+        monkeypatch.setattr(adapter.dynamodb.meta.client, operation, throttle)
+        greetings = [HelloWorld(name="Alice", greeting="Hi", version=version)]
+        assert adapter.put_greetings(greetings) == PutResult(greetings, [])
+
+    def test_too_many_greetings(self, adapter):
+        """Test that more than one call's worth of greetings is rejected."""
+        greetings = [
+            HelloWorld(name=f"user-{i}", greeting=None)
+            for i in range(MAX_BATCH_WRITE_ITEMS + 1)
+        ]
+        with pytest.raises(ValueError, match="At most"):
+            adapter.put_greetings(greetings)
+
+
+class TestParseGreeting:
+    """Test suite for parse_greeting."""
+
+    def test_full_record(self):
+        """Test that every field is validated into the model."""
+        greeting = parse_greeting(
+            {
+                "name": "Alice",
+                "greeting": "Hi",
+                "created_at": "2024-01-01T00:00:00",
+                "updated_at": 1704067200000,
+                "version": "3",
+            }
+        )
+        assert greeting.name == "Alice"
+        assert greeting.greeting == "Hi"
+        assert greeting.created_at == datetime(2024, 1, 1, tzinfo=UTC)
+        assert greeting.updated_at == greeting.created_at
+        assert greeting.version == 3
+
+    @pytest.mark.parametrize(
+        ("record", "match"),
+        [
+            ({}, "name"),
+            ({"name": " "}, "name"),
+            ({"name": "Bob", "greeting": 5}, "greeting"),
+            ({"name": "Bob", "version": 0}, "version"),
+            ({"name": "Bob", "version": "two"}, "version"),
+            ({"name": "Bob", "created_at": "yesterday"}, "created_at"),
+        ],
+    )
+    def test_invalid_record(self, record, match):
+        """Test that missing and malformed fields are rejected."""
+        with pytest.raises(ValueError, match=match):
+            parse_greeting(record)
+
+
+class TestReadRecords:
+    """Test suite for read_records and detect_format."""
+
+    def test_csv_resumes_after_header(self):
+        """Test that CSV rows are keyed by the header, also on resume."""
+        stream = io.BytesIO(b"name,greeting\nAlice,Hi\nBob,\n")
+        (offset, first), (_, second) = read_records(stream, RecordFormat.CSV)
+        assert first == {"name": "Alice", "greeting": "Hi"}
+        assert second == {"name": "Bob"}
+
+        stream.seek(0)
+        resumed = list(read_records(stream, RecordFormat.CSV, offset))
+        assert [record for _, record in resumed] == [second]
+
+    def test_undecodable_line_yielded_as_error(self):
+        """Test that a malformed line does not stop the stream."""
+        stream = io.BytesIO(b'{"name": "Alice"}\nnot json\n[1]\n{"name": "Bob"}\n')
+        records = [record for _, record in read_records(stream, RecordFormat.JSONL)]
+        assert isinstance(records[1], ValueError)
+        assert isinstance(records[2], ValueError)
+        assert records[3] == {"name": "Bob"}
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            ("greetings.csv", RecordFormat.CSV),
+            ("greetings.jsonl.gz", RecordFormat.JSONL),
+            ("greetings.ndjson", RecordFormat.JSONL),
+        ],
+    )
+    def test_detect_format(self, tmp_path, name, expected):
+        """Test that the format is told from the suffix, ignoring .gz."""
+        assert detect_format(tmp_path / name) == expected
+
+
+@pytest.mark.usefixtures("local_greetings_table")
+class TestBulkLoad:
+    """Test suite for loading files into the local table."""
+
+    def test_load_jsonl(self, adapter, tmp_path, capsys):
+        """Test that every record is loaded, with a progress line."""
+        path = tmp_path / "greetings.jsonl"
+        write_jsonl(
+            path,
+            ({"name": f"user-{i}", "greeting": f"Hi {i}"} for i in range(RECORD_COUNT)),
+        )
+
+        exit_code = main([str(path), "--initial-rate", str(FAST_RATE)])
+        assert exit_code == 0
+        assert stored_names(adapter) == {f"user-{i}" for i in range(RECORD_COUNT)}
+        saved = adapter.get_saved_greeting("user-7")
+        assert saved.greeting == "Hi 7"
+        assert saved.version == 1
+        assert f"loaded={RECORD_COUNT}" in capsys.readouterr().err
+
+    def test_load_gzipped_csv_with_rejects(self, adapter, tmp_path):
+        """Test that invalid rows are rejected and the rest loaded."""
+        path = tmp_path / "greetings.csv.gz"
+        with gzip.open(path, "wt") as stream:
+            stream.write("name,greeting,version\n")
+            stream.write("Alice,Hi,4\n,Nameless,1\nBob,Hey,zero\nCarol,,\n")
+        rejects = tmp_path / "rejects.jsonl"
+
+        assert main([str(path), "--rejects", str(rejects)]) == 0
+        assert stored_names(adapter) == {"Alice", "Carol"}
+        assert adapter.get_saved_greeting("Alice").version == 4
+        errors = [
+            json.loads(line)["error"] for line in rejects.read_text().splitlines()
+        ]
+        assert len(errors) == 2
+        assert "version" in errors[1]
+
+    def test_last_record_of_a_name_wins(self, adapter, tmp_path):
+        """Test that repeated names within a batch keep the last record."""
+        path = tmp_path / "greetings.jsonl"
+        write_jsonl(path, [{"name": "Alice", "greeting": g} for g in ("a", "b")])
+
+        assert main([str(path)]) == 0
+        assert adapter.get_saved_greeting("Alice").greeting == "b"
+
+    def test_resume_from_checkpoint(self, adapter, tmp_path):
+        """Test that a resumed load skips the records already loaded."""
+        path = tmp_path / "greetings.jsonl"
+        write_jsonl(path, ({"name": f"user-{i}"} for i in range(RECORD_COUNT)))
+        checkpoint_path = tmp_path / "checkpoint.json"
+
+        # Stop after the first batches, as an interrupted load would
+        records = read_records(path.open("rb"), RecordFormat.JSONL)
+        first = [next(records) for _ in range(50)]
+        loader = BulkLoader(adapter, AdaptiveRateLimiter(FAST_RATE), batch_size=10)
+        loader.load(iter(first), Checkpoint(str(path.resolve())), checkpoint_path)
+        saved = json.loads(checkpoint_path.read_text())
+        assert saved["records"] == saved["loaded"] == 50
+
+        assert main([str(path), "--checkpoint", str(checkpoint_path)]) == 0
+        checkpoint = Checkpoint.load(checkpoint_path, path)
+        assert checkpoint.records == checkpoint.loaded == RECORD_COUNT
+        assert len(stored_names(adapter)) == RECORD_COUNT
+
+    def test_stored_greetings_rejected(self, adapter, tmp_path):
+        """Test that greetings the table refuses are rejected, the rest loaded."""
+        saved = HelloWorld(name="Alice", greeting="Saved")
+        adapter.save_greeting(saved)
+        adapter.save_greeting(saved)
+        path = tmp_path / "greetings.jsonl"
+        write_jsonl(
+            path,
+            [
+                {"name": "Alice", "greeting": "Older", "version": 1},
+                {"name": "Bob", "greeting": "Hey", "version": 1},
+            ],
+        )
+        rejects = tmp_path / "rejects.jsonl"
+        checkpoint_path = tmp_path / "checkpoint.json"
+
+        assert (
+            main(
+                [
+                    str(path),
+                    "--rejects",
+                    str(rejects),
+                    "--checkpoint",
+                    str(checkpoint_path),
+                ]
+            )
+            == 0
+        )
+        assert adapter.get_saved_greeting("Alice").greeting == "Saved"
+        assert adapter.get_saved_greeting("Bob").greeting == "Hey"
+        (reject,) = [json.loads(line) for line in rejects.read_text().splitlines()]
+        assert reject["record"] == {"name": "Alice", "greeting": "Older", "version": 1}
+        assert "version" in reject["error"]
+        checkpoint = Checkpoint.load(checkpoint_path, path)
+        assert (checkpoint.loaded, checkpoint.rejected) == (1, 1)
+
+    def test_resume_does_not_repeat_rejects(self, adapter, tmp_path):
+        """Test that rejects past the checkpoint are dropped on resume."""
+        path = tmp_path / "greetings.jsonl"
+        write_jsonl(path, [{"name": "Alice"}, {"version": 0}, {"name": "Bob"}])
+        checkpoint_path = tmp_path / "checkpoint.json"
+        rejects_path = tmp_path / "rejects.jsonl"
+        rejects_path.write_text('{"earlier": "load"}\n')
+
+        # A load interrupted after writing a reject it never checkpointed
+        records = list(read_records(path.open("rb"), RecordFormat.JSONL))
+        loader = BulkLoader(adapter, AdaptiveRateLimiter(FAST_RATE), batch_size=1)
+        with rejects_path.open("a") as rejects:
+            loader.load(
+                iter(records[:1]),
+                Checkpoint(str(path.resolve())),
+                checkpoint_path,
+                rejects,
+            )
+            rejects.write('{"uncheckpointed": "reject"}\n')
+
+        assert (
+            main(
+                [
+                    str(path),
+                    "--checkpoint",
+                    str(checkpoint_path),
+                    "--rejects",
+                    str(rejects_path),
+                ]
+            )
+            == 0
+        )
+        lines = [json.loads(line) for line in rejects_path.read_text().splitlines()]
+        assert lines[0] == {"earlier": "load"}
+        assert [line["offset"] for line in lines[1:]] == [records[1][0]]
+        assert stored_names(adapter) == {"Alice", "Bob"}
+
+    @pytest.mark.parametrize("version", [None, 1])
+    def test_resume_after_crash_before_checkpoint(
+        self, adapter, tmp_path, monkeypatch, version
+    ):
+        """Test that records written but not checkpointed load again cleanly."""
+        path = tmp_path / "greetings.jsonl"
+        write_jsonl(
+            path,
+            (
+                {"name": f"user-{i}", "greeting": "Hi", "version": version}
+                for i in range(RECORD_COUNT)
+            ),
+        )
+        checkpoint_path = tmp_path / "checkpoint.json"
+        rejects_path = tmp_path / "rejects.jsonl"
+        Checkpoint(str(path.resolve())).save(checkpoint_path)
+
+        # Every batch is written, then the process dies saving the checkpoint
+        def crash(_checkpoint, _path):
+            raise KeyboardInterrupt
+
+        with monkeypatch.context() as patch:
+            patch.setattr(Checkpoint, "save", crash)
+            with pytest.raises(KeyboardInterrupt):
+                main([str(path), "--checkpoint", str(checkpoint_path)])
+        assert json.loads(checkpoint_path.read_text())["records"] == 0
+
+        assert (
+            main(
+                [
+                    str(path),
+                    "--checkpoint",
+                    str(checkpoint_path),
+                    "--rejects",
+                    str(rejects_path),
+                ]
+            )
+            == 0
+        )
+        checkpoint = Checkpoint.load(checkpoint_path, path)
+        assert (checkpoint.loaded, checkpoint.rejected) == (RECORD_COUNT, 0)
+        assert rejects_path.read_text() == ""
+        assert len(stored_names(adapter)) == RECORD_COUNT
+
+    def test_checkpoint_of_another_input(self, tmp_path):
+        """Test that a checkpoint cannot resume a different file."""
+        checkpoint_path = tmp_path / "checkpoint.json"
+        Checkpoint(str(tmp_path / "a.jsonl")).save(checkpoint_path)
+        with pytest.raises(ValueError, match="Checkpoint"):
+            Checkpoint.load(checkpoint_path, tmp_path / "b.jsonl")
+
+
+class ThrottlingAdapter:
+    """Stand-in adapter throttling the first writes of every batch."""
+
+    def __init__(self, throttled_writes: int):
+        self.throttled_writes = throttled_writes
+        self.written: list[str] = []
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def put_greetings(self, greetings: list[HelloWorld]) -> PutResult:
+        with self._lock:
+            self.calls += 1
+            if self.calls <= self.throttled_writes:
+                return PutResult(list(greetings), [])
+            self.written.extend(greeting.name for greeting in greetings)
+        return PutResult([], [])
+
+
+class TestThrottling:
+    """Test suite for backing off when writes are throttled."""
+
+    def records(self, count: int):
+        """Generate valid records with increasing offsets."""
+        return ((i + 1, {"name": f"user-{i}"}) for i in range(count))
+
+    def test_backs_off_and_retries(self):
+        """Test that throttled items are retried at a lower rate."""
+        adapter = ThrottlingAdapter(throttled_writes=3)
+        limiter = AdaptiveRateLimiter(FAST_RATE, cooldown_seconds=0)
+        loader = BulkLoader(adapter, limiter, workers=1, batch_size=5)
+
+        checkpoint = loader.load(self.records(20), Checkpoint("input"))
+        assert sorted(adapter.written) == sorted(f"user-{i}" for i in range(20))
+        assert checkpoint.loaded == 20
+        assert limiter.throttles == 3
+        assert limiter.rate < FAST_RATE
+
+    def test_gives_up_after_max_attempts(self):
+        """Test that a batch throttled on every attempt fails the load."""
+        adapter = ThrottlingAdapter(throttled_writes=100)
+        loader = BulkLoader(
+            adapter,
+            AdaptiveRateLimiter(FAST_RATE, cooldown_seconds=0),
+            max_attempts=3,
+        )
+        with pytest.raises(BulkLoadError, match="3 attempts"):
+            loader.load(self.records(5), Checkpoint("input"))
@@ -0,0 +1,66 @@
+"""
+Integration tests for the listing attribute backfill.
+
+Tests that greetings saved without the listing attribute are listed once
+the backfill has run against the local table.
+"""
+
+import pytest
+from adapters.aws_client_factory import aws_clients
+from adapters.greeting_listing import LISTING_ATTRIBUTE, listing_shard
+from adapters.hello_world_storage_adapter import HelloWorldStorageAdapter
+from models.hello_world_model import HelloWorld
+
+from tools.listing_backfill import backfill_listing, main
+
+# Constants
+LEGACY_NAMES = [f"legacy-{index}" for index in range(5)]
+
+
+@pytest.fixture
+def legacy_greetings(local_greetings_table):
+    """Write greetings the way they were saved before the recency index."""
+    table = aws_clients.resource("dynamodb").Table(local_greetings_table)
+    for index, name in enumerate(LEGACY_NAMES):
+        table.put_item(
+            Item={
+                "name": name,
+                "greeting": f"Hi {name}",
+                "created_at": f"2024-01-01T00:00:0{index}+00:00",
+                "updated_at": f"2024-01-01T00:00:0{index}+00:00",
+                "version": 1,
+            }
+        )
+    return table
+
+
+class TestListingBackfill:
+    """Test suite for backfilling the listing attribute."""
+
+    def test_legacy_greetings_are_listed(self, legacy_greetings):
+        """Test that backfilled greetings join the listing."""
+        adapter = HelloWorldStorageAdapter()
+        adapter.save_greeting(HelloWorld(name="recent", greeting="Hi"))
+        assert [g.name for g in adapter.list_greetings().greetings] == ["recent"]
+
+        result = backfill_listing(legacy_greetings.name, segments=2)
+
+        assert (result.updated, result.skipped) == (len(LEGACY_NAMES), 0)
+        listed = [greeting.name for greeting in adapter.list_greetings().greetings]
+        assert listed == ["recent", *LEGACY_NAMES[::-1]]
+        item = legacy_greetings.get_item(Key={"name": LEGACY_NAMES[0]})["Item"]
+        assert item[LISTING_ATTRIBUTE] == listing_shard(LEGACY_NAMES[0])
+
+    def test_rerun_changes_nothing(self, legacy_greetings):
+        """Test that a second run finds nothing left to backfill."""
+        backfill_listing(legacy_greetings.name)
+        result = backfill_listing(legacy_greetings.name)
+        assert (result.updated, result.skipped) == (0, 0)
+
+    @pytest.mark.usefixtures("legacy_greetings")
+    def test_main(self):
+        """Test that the command line backfills the configured table."""
+        assert main(["--segments", "1"]) == 0
+        assert len(HelloWorldStorageAdapter().list_greetings().greetings) == len(
+            LEGACY_NAMES
+        )
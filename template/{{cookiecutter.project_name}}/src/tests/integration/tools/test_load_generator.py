@@ -0,0 +1,257 @@
+"""
+Integration tests for the load generator.
+
+Tests the latency histograms and request mixes, and short closed and open
+loop runs against the handler in-process on in-memory storage and against
+a local HTTP server.
+"""
+
+import json
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from adapters.in_memory_hello_world_adapter import (
+    FaultProfile,
+    InMemoryHelloWorldAdapter,
+)
+
+from tools.load_generator import (
+    EventFactory,
+    HttpTarget,
+    InProcessTarget,
+    LatencyHistogram,
+    LoadGenerator,
+    LoopMode,
+    RequestKind,
+    RequestMix,
+    main,
+)
+
+# Constants
+SAMPLE_COUNT = 20_000
+RUN_SECONDS = 0.3
+OPEN_RATE = 200.0
+STORAGE_LATENCY_MS = 20.0
+HTTP_OK = 200
+HTTP_NOT_FOUND = 404
+
+
+@pytest.fixture
+def in_process():
+    """Fixture providing the in-process target on in-memory storage."""
+    port = InMemoryHelloWorldAdapter()
+    target = InProcessTarget(port)
+    yield target, port
+    target.close()
+
+
+@pytest.fixture
+def http_server():
+    """Fixture providing a local HTTP server answering /hello only."""
+    paths = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            paths.append(self.path)
+            status = HTTP_OK if self.path.startswith("/hello") else HTTP_NOT_FOUND
+            self.send_response(status)
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", paths
+    server.shutdown()
+    server.server_close()
+
+
+class TestLatencyHistogram:
+    """Test suite for LatencyHistogram."""
+
+    def test_percentiles_within_one_percent(self):
+        """Test that percentiles match exact ones within the bucket precision."""
+        rng = random.Random(1)
+        samples = sorted(rng.lognormvariate(-6, 1.5) for _ in range(SAMPLE_COUNT))
+        histogram = LatencyHistogram()
+        for sample in samples:
+            histogram.record(sample)
+
+        for percentile in (50, 90, 99, 99.9):
+            exact = samples[int(percentile / 100 * SAMPLE_COUNT) - 1]
+            assert histogram.percentile(percentile) == pytest.approx(exact, rel=0.01)
+        assert histogram.percentile(100) == pytest.approx(samples[-1], abs=1e-6)
+        assert histogram.mean == pytest.approx(sum(samples) / SAMPLE_COUNT, rel=0.001)
+
+    def test_merge(self):
+        """Test that merged histograms equal one histogram of every duration."""
+        first, second, both = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for index, seconds in enumerate([0.001, 0.25, 0.003, 2.0, 0.0005]):
+            (first if index % 2 else second).record(seconds)
+            both.record(seconds)
+        first.merge(second)
+        assert first.buckets() == both.buckets()
+        assert first.summary() == both.summary()
+
+    def test_empty(self):
+        """Test that an empty histogram summarizes to zeros."""
+        summary = LatencyHistogram().summary()
+        assert summary["count"] == 0
+        assert summary["p99.9"] == 0
+
+
+class TestRequestMix:
+    """Test suite for RequestMix and EventFactory."""
+
+    def test_parse(self):
+        """Test that a mix round trips through its text form."""
+        mix = RequestMix.parse("hot=70,cold=20,write=10")
+        assert mix.weights == {
+            RequestKind.HOT: 70,
+            RequestKind.COLD: 20,
+            RequestKind.WRITE: 10,
+        }
+        assert RequestMix.parse(str(mix)) == mix
+
+    @pytest.mark.parametrize("text", ["hot", "warm=1", "hot=-1", "hot=0,cold=0"])
+    def test_invalid(self, text):
+        """Test that invalid mixes are rejected."""
+        with pytest.raises(ValueError):
+            RequestMix.parse(text)
+
+    def test_seeded_draws_repeat(self):
+        """Test that a seed makes the sequence of request kinds reproducible."""
+        mix = RequestMix.parse("hot=50,cold=30,list=10,write=10")
+
+        def kinds() -> list[RequestKind]:
+            events = EventFactory(mix, seed=3)
+            return [events.next().kind for _ in range(200)]
+
+        drawn = kinds()
+        assert drawn == kinds()
+        assert set(drawn) == set(RequestKind)
+
+
+class TestInProcess:
+    """Test suite for runs against the handler in this process."""
+
+    def test_closed_loop(self, in_process):
+        """Test that every kind of request is served without errors."""
+        target, port = in_process
+        events = EventFactory(
+            RequestMix.parse("hot=40,cold=30,list=10,write=20"), hot_names=5, seed=1
+        )
+        target.seed(events.hot_names)
+        report = LoadGenerator(target, events, concurrency=4).run_closed(RUN_SECONDS)
+
+        assert report.requests > 0
+        assert report.errors == 0
+        assert report.cpu.count == report.requests
+        assert set(report.kinds) == set(RequestKind)
+        assert {greeting.name for greeting in port.export_greetings()} == set(
+            events.hot_names
+        )
+        document = json.loads(json.dumps(report.to_dict()))
+        assert document["parameters"]["mode"] == LoopMode.CLOSED
+        assert document["requests"] == report.requests
+        assert sum(count for _, count in document["latency_histogram_us"]) == (
+            report.requests
+        )
+
+    def test_open_loop_counts_waiting_time(self):
+        """Test that requests queued behind slow ones include their wait."""
+        port = InMemoryHelloWorldAdapter(FaultProfile(latency_ms=STORAGE_LATENCY_MS))
+        target = InProcessTarget(port)
+        try:
+            events = EventFactory(RequestMix.parse("cold=1"))
+            report = LoadGenerator(target, events, concurrency=1).run_open(
+                OPEN_RATE, RUN_SECONDS
+            )
+        finally:
+            target.close()
+
+        # One request in flight serving one every 20ms cannot keep up with
+        # one due every 5ms, so the last ones wait for most of the run
+        assert report.requests == int(OPEN_RATE * RUN_SECONDS)
+        assert report.latency.percentile(50) > 2 * STORAGE_LATENCY_MS / 1000
+        assert report.latency.max_us / 1_000_000 > RUN_SECONDS
+
+    def test_failures_are_counted(self, in_process):
+        """Test that server errors count as errors, with their latency."""
+        target, port = in_process
+        port.faults = FaultProfile(error_rate=1.0)
+        events = EventFactory(RequestMix.parse("hot=1"), hot_names=1)
+        report = LoadGenerator(target, events, concurrency=2).run_closed(0.05)
+        assert report.requests > 0
+        assert report.errors == report.requests
+
+
+class TestHttp:
+    """Test suite for runs against an HTTP endpoint."""
+
+    def test_requests_are_sent(self, http_server):
+        """Test that API requests become HTTP requests, 4xx not being errors."""
+        url, paths = http_server
+        events = EventFactory(RequestMix.parse("hot=1,list=1"), seed=2)
+        report = LoadGenerator(HttpTarget(url), events, concurrency=2).run_open(
+            OPEN_RATE, 0.1
+        )
+
+        assert report.requests == len(paths) == int(OPEN_RATE * 0.1)
+        assert report.errors == 0
+        assert report.cpu.count == 0
+        assert any(path.startswith("/hello?name=hot-") for path in paths)
+        assert "/greetings?limit=10" in paths
+
+    def test_unreachable_endpoint(self):
+        """Test that requests without a response are errors."""
+        events = EventFactory(RequestMix.parse("cold=1"))
+        target = HttpTarget("http://127.0.0.1:9", timeout=0.5)
+        report = LoadGenerator(target, events, concurrency=1).run_open(50, 0.1)
+        assert report.errors == report.requests == int(50 * 0.1)
+
+    def test_writes_are_rejected(self):
+        """Test that mixes with writes cannot be sent over HTTP."""
+        events = EventFactory(RequestMix.parse("hot=1,write=1"))
+        with pytest.raises(ValueError, match="write"):
+            LoadGenerator(HttpTarget("http://127.0.0.1:9"), events)
+
+
+class TestMain:
+    """Test suite for the command line."""
+
+    def test_report_file(self, tmp_path, capsys):
+        """Test that a run prints its report and writes it as JSON."""
+        output = tmp_path / "load.json"
+        exit_code = main(
+            [
+                "--mode",
+                "open",
+                "--rate",
+                "100",
+                "--duration",
+                "0.2",
+                "--mix",
+                "hot=3,write=1",
+                "--output",
+                str(output),
+            ]
+        )
+
+        assert exit_code == 0
+        document = json.loads(output.read_text())
+        assert document["parameters"]["mix"] == "hot=3,write=1"
+        assert document["requests"] == 20
+        assert set(document["latency_ms"]) >= {"p50", "p90", "p99", "p99.9"}
+        assert "open loop, in-process" in capsys.readouterr().out
+
+    def test_invalid_mix(self, capsys):
+        """Test that an invalid mix is a usage error."""
+        with pytest.raises(SystemExit):
+            main(["--mix", "warm=1"])
+        assert "warm" in capsys.readouterr().err
@@ -0,0 +1,49 @@
+"""
+Integration tests for the saved-names snapshot builder.
+
+Tests that a snapshot of the local table holds every saved name and loads
+as the filter of the Hello World function.
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+from adapters.hello_world_storage_adapter import HelloWorldStorageAdapter
+from adapters.saved_names_filter_adapter import load_saved_names
+from models.hello_world_model import HelloWorld
+
+from tools.saved_names_snapshot import build_snapshot, main
+
+# Constants
+NAME_COUNT = 30
+
+
+@pytest.mark.usefixtures("local_greetings_table")
+class TestSavedNamesSnapshot:
+    """Test suite for building saved-names snapshots."""
+
+    def test_snapshot_holds_saved_names(self, tmp_path):
+        """Test that every saved name is in the written snapshot."""
+        adapter = HelloWorldStorageAdapter()
+        for index in range(NAME_COUNT):
+            adapter.save_greeting(HelloWorld(name=f"user-{index}", greeting="Hi"))
+        started = datetime.now(UTC)
+        path = tmp_path / "saved-names.bloom"
+
+        assert main([str(path)]) == 0
+        saved_names = load_saved_names(str(path))
+        assert all(f"user-{index}" in saved_names for index in range(NAME_COUNT))
+        assert saved_names.count <= NAME_COUNT
+        assert started <= saved_names.as_of <= datetime.now(UTC)
+        assert not path.with_name("saved-names.bloom.tmp").exists()
+
+    def test_empty_table(self):
+        """Test that an empty table gives an empty filter."""
+        saved_names = build_snapshot(HelloWorldStorageAdapter())
+        assert saved_names.count == 0
+        assert "Nobody" not in saved_names
+
+    def test_invalid_headroom(self):
+        """Test that a capacity below the number of names is refused."""
+        with pytest.raises(ValueError, match="capacity_headroom"):
+            build_snapshot(HelloWorldStorageAdapter(), capacity_headroom=0.5)
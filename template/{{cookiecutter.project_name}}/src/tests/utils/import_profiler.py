@@ -0,0 +1,269 @@
+"""
+Import-time profiler for Lambda function handlers.
+
+Imports a function's handler in a clean interpreter with ``-X importtime``,
+as Lambda does during the init phase of a cold start, and reports the
+cumulative import time of every module as a tree. The handler is imported
+from the build output in ``dist/functions`` when it exists, or from
+``src/functions`` and ``src/shared`` otherwise, with the environment the
+stacks deploy the function with (see ``FunctionDefinition.environment``).
+
+Usage:
+    python -m tests.utils.import_profiler hello_world [--budget-ms 400]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from tests.utils.stack_definitions import stack_definitions
+
+# Constants
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+SOURCE_FUNCTIONS = PROJECT_ROOT / "src" / "functions"
+SOURCE_SHARED = PROJECT_ROOT / "src" / "shared"
+DIST_FUNCTIONS = PROJECT_ROOT / "dist" / "functions"
+HANDLER_MODULE = "handler"
+IMPORTTIME_PREFIX = "import time:"
+INDENT_WIDTH = 2
+MICROSECONDS_PER_MILLISECOND = 1000
+DEFAULT_REPEAT = 3
+DEFAULT_MIN_MS = 1.0
+# Settings the stacks add to those of the function definition, with
+# placeholder values
+PROFILE_ENVIRONMENT = {
+    "AWS_DEFAULT_REGION": "us-east-1",
+    "HELLO_WORLD_TABLE_NAME": "ImportProfile",
+}
+
+
+@dataclass
+class ImportNode:
+    """A module import and the imports it triggered."""
+
+    name: str
+    self_us: int
+    cumulative_us: int
+    children: list["ImportNode"] = field(default_factory=list)
+
+    @property
+    def cumulative_ms(self) -> float:
+        """Get the cumulative import time in milliseconds."""
+        return self.cumulative_us / MICROSECONDS_PER_MILLISECOND
+
+    def walk(self) -> Iterator["ImportNode"]:
+        """Yield this node and all of its descendants."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def render(self, min_ms: float = DEFAULT_MIN_MS, depth: int = 0) -> list[str]:
+        """
+        Format the tree, one module per line, slowest imports first.
+
+        Args:
+            min_ms: Omit imports with a lower cumulative time
+            depth: Indentation level of this node
+
+        Returns:
+            Lines with the cumulative and self time of each import
+        """
+        self_ms = self.self_us / MICROSECONDS_PER_MILLISECOND
+        lines = [
+            f"{self.cumulative_ms:>9.1f} ms {self_ms:>8.1f} ms  {'  ' * depth}{self.name}"
+        ]
+        for child in sorted(self.children, key=lambda node: -node.cumulative_us):
+            if child.cumulative_ms >= min_ms:
+                lines.extend(child.render(min_ms, depth + 1))
+        return lines
+
+
+@dataclass
+class ImportProfile:
+    """The imports of one interpreter run."""
+
+    roots: list[ImportNode]
+
+    def find(self, name: str) -> ImportNode | None:
+        """
+        Find the top-level import of a module.
+
+        Args:
+            name: Module name
+
+        Returns:
+            The import node, or None if the module was not imported at top level
+        """
+        return next((root for root in self.roots if root.name == name), None)
+
+
+def parse_importtime(output: str) -> ImportProfile:
+    """
+    Build the import tree from ``-X importtime`` output.
+
+    A module is reported after the imports it triggered, one indentation
+    level deeper, so each line adopts the pending nodes below its level.
+
+    Args:
+        output: Standard error of an interpreter run with ``-X importtime``
+
+    Returns:
+        Import profile with the top-level imports as roots
+    """
+    pending: dict[int, list[ImportNode]] = {}
+    for line in output.splitlines():
+        if not line.startswith(IMPORTTIME_PREFIX):
+            continue
+        self_us, cumulative_us, name = line[len(IMPORTTIME_PREFIX) :].split("|")
+        if not self_us.strip().isdigit():
+            continue  # Column header
+        # One space separates the columns, then two per nesting level
+        depth = (len(name) - len(name.lstrip()) - 1) // INDENT_WIDTH
+        node = ImportNode(
+            name=name.strip(),
+            self_us=int(self_us),
+            cumulative_us=int(cumulative_us),
+            children=pending.pop(depth + 1, []),
+        )
+        pending.setdefault(depth, []).append(node)
+    return ImportProfile(roots=pending.get(0, []))
+
+
+def handler_search_path(function_name: str, dist: bool | None = None) -> list[Path]:
+    """
+    Get the module search path of a function's handler.
+
+    Args:
+        function_name: Function directory name, e.g. "hello_world"
+        dist: Use the build output (True), the sources (False), or the
+            build output if it exists (None)
+
+    Returns:
+        Directories to put in front of ``sys.path``
+
+    Raises:
+        FileNotFoundError: If the function does not exist
+    """
+    built = DIST_FUNCTIONS / function_name
+    if dist or (dist is None and built.is_dir()):
+        search_path = [built]
+    else:
+        search_path = [SOURCE_FUNCTIONS / function_name, SOURCE_SHARED]
+    if not (search_path[0] / f"{HANDLER_MODULE}.py").is_file():
+        msg = f"No handler for function {function_name!r} in {search_path[0]}"
+        raise FileNotFoundError(msg)
+    return search_path
+
+
+def function_environment(function_name: str) -> dict[str, str]:
+    """
+    Get the environment a function's handler is deployed with.
+
+    Args:
+        function_name: Function directory name, e.g. "hello_world"
+
+    Returns:
+        The function definition's variables over PROFILE_ENVIRONMENT
+    """
+    definitions = stack_definitions("api_definitions").function_definitions()
+    definition = definitions.get(function_name)
+    return {
+        **PROFILE_ENVIRONMENT,
+        **(definition.environment if definition is not None else {}),
+    }
+
+
+def profile_import(
+    search_path: list[Path],
+    module: str = HANDLER_MODULE,
+    environment: dict[str, str] | None = None,
+) -> ImportProfile:
+    """
+    Import a module in a clean interpreter and profile its imports.
+
+    The interpreter ignores ``PYTHON*`` variables and the user site
+    directory, and only sees PATH plus ``environment``.
+
+    Args:
+        search_path: Directories to put in front of ``sys.path``
+        module: Module to import
+        environment: Environment variables of the interpreter
+
+    Returns:
+        Import profile of the run
+
+    Raises:
+        RuntimeError: If the import fails
+    """
+    code = (
+        f"import sys; sys.path[:0] = {[str(path) for path in search_path]!r}; "
+        f"import {module}"
+    )
+    result = subprocess.run(
+        [sys.executable, "-E", "-s", "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=False,
+        env={"PATH": os.environ.get("PATH", ""), **(environment or {})},
+    )
+    if result.returncode != 0:
+        msg = f"Importing {module} failed:\n{result.stderr[-2000:]}"
+        raise RuntimeError(msg)
+    return parse_importtime(result.stderr)
+
+
+def profile_handler(
+    function_name: str, dist: bool | None = None, repeat: int = DEFAULT_REPEAT
+) -> ImportNode:
+    """
+    Profile a function's handler import, keeping the fastest of several runs.
+
+    The handler is imported with the function's deployed environment, so
+    settings such as HELLO_WORLD_TRACING weigh on the profile as they do in
+    Lambda.
+
+    Args:
+        function_name: Function directory name, e.g. "hello_world"
+        dist: Where to import the handler from; see ``handler_search_path``
+        repeat: Number of interpreter runs
+
+    Returns:
+        Import tree of the handler module in its fastest run
+    """
+    search_path = handler_search_path(function_name, dist)
+    environment = function_environment(function_name)
+    runs = [
+        profile_import(search_path, environment=environment).find(HANDLER_MODULE)
+        for _ in range(repeat)
+    ]
+    return min(runs, key=lambda node: node.cumulative_us)
+
+
+def main() -> None:
+    """Print the import tree of a function's handler."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("function", help="Function directory name")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--dist", action="store_true", default=None)
+    source.add_argument("--source", dest="dist", action="store_false")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--min-ms", type=float, default=DEFAULT_MIN_MS)
+    parser.add_argument("--budget-ms", type=float)
+    args = parser.parse_args()
+
+    handler = profile_handler(args.function, args.dist, args.repeat)
+    print(f"{'cumulative':>12} {'self':>11}  module")
+    print("\n".join(handler.render(args.min_ms)))
+    module_count = sum(1 for _ in handler.walk())
+    print(f"\n{args.function}: {handler.cumulative_ms:.1f} ms, {module_count} modules")
+    if args.budget_ms is not None and handler.cumulative_ms > args.budget_ms:
+        print(f"Over the import budget of {args.budget_ms:.0f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
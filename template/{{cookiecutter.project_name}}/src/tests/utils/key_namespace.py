@@ -0,0 +1,128 @@
+"""
+Per-worker key namespaces for tests sharing a deployed table.
+
+Tests against the deployed stack all use the same GreetingsTable. Running
+them in parallel (``pytest -n auto``) or from several machines at once is
+only safe if no two of them read or write the same item, so every name a
+test uses goes through the ``KeyNamespace`` of its worker. A namespace
+prefixes names with the pytest-xdist worker ID and a random run ID, and
+remembers them, so that the worker deletes all of its items in bulk when
+its session ends.
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+import uuid
+from typing import Any
+
+from adapters.aws_client_factory import aws_clients
+from botocore.exceptions import ClientError
+
+from tests.utils.local_dynamodb import table_definitions
+
+logger = logging.getLogger(__name__)
+
+# Constants
+WORKER_ENV = "PYTEST_XDIST_WORKER"
+MAIN_WORKER = "main"
+MAX_BATCH_WRITE_ITEMS = 25
+MAX_CLEANUP_ATTEMPTS = 5
+INITIAL_RETRY_DELAY_SECONDS = 0.1
+
+
+def worker_id() -> str:
+    """Get the ID of the pytest-xdist worker, or "main" when not distributed."""
+    return os.environ.get(WORKER_ENV, MAIN_WORKER)
+
+
+class KeyNamespace:
+    """Namespaces and records the keys used by one test worker."""
+
+    def __init__(self, prefix: str | None = None):
+        """
+        Initialize the namespace.
+
+        Args:
+            prefix: Prefix of every key (worker and random run ID if None)
+        """
+        self.prefix = prefix or f"{worker_id()}-{uuid.uuid4().hex[:8]}-"
+        self._keys: set[str] = set()
+        self._lock = threading.Lock()
+
+    def key(self, name: str) -> str:
+        """
+        Get the namespaced key of a name, recording it for cleanup.
+
+        Args:
+            name: Name as written in the test, e.g. "Alice"
+
+        Returns:
+            The name, prefixed with the namespace
+        """
+        key = f"{self.prefix}{name}"
+        with self._lock:
+            self._keys.add(key)
+        return key
+
+    @property
+    def keys(self) -> list[str]:
+        """Keys handed out so far."""
+        with self._lock:
+            return sorted(self._keys)
+
+    def delete_from(self, table_name: str, client: Any = None) -> list[str]:
+        """
+        Delete the items of every key handed out from a table.
+
+        Keys are deleted in BatchWriteItem calls of up to 25 keys; items
+        left unprocessed are retried with exponential backoff and jitter.
+        Deleting a key that has no item is a no-op. A failed call, e.g. on a
+        missing table or without permissions, is logged rather than raised,
+        so that cleanup never fails a test session.
+
+        Args:
+            table_name: Table to clean up
+            client: DynamoDB client (shared client if None)
+
+        Returns:
+            Keys whose items could not be deleted
+        """
+        client = client or aws_clients.client("dynamodb")
+        key_name = table_definitions().greetings_table().partition_key.name
+        keys = self.keys
+        remaining = []
+        for start in range(0, len(keys), MAX_BATCH_WRITE_ITEMS):
+            remaining += self._delete_batch(
+                client,
+                table_name,
+                key_name,
+                keys[start : start + MAX_BATCH_WRITE_ITEMS],
+            )
+        if remaining:
+            logger.warning(
+                "Could not clean up %d keys from %s", len(remaining), table_name
+            )
+        return remaining
+
+    @staticmethod
+    def _delete_batch(
+        client: Any, table_name: str, key_name: str, keys: list[str]
+    ) -> list[str]:
+        """Delete one batch of keys, retrying the unprocessed ones."""
+        requests = [{"DeleteRequest": {"Key": {key_name: {"S": key}}}} for key in keys]
+        for attempt in range(MAX_CLEANUP_ATTEMPTS):
+            if attempt:
+                backoff = INITIAL_RETRY_DELAY_SECONDS * 2**attempt
+                time.sleep(random.uniform(0, backoff))
+            try:
+                response = client.batch_write_item(RequestItems={table_name: requests})
+            except ClientError as e:
+                logger.warning("Cleanup of %s failed: %s", table_name, e)
+                break
+            requests = response.get("UnprocessedItems", {}).get(table_name, [])
+            if not requests:
+                return []
+        return [request["DeleteRequest"]["Key"][key_name]["S"] for request in requests]
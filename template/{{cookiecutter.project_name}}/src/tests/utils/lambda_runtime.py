@@ -0,0 +1,126 @@
+"""
+Execution environment of the local API emulator.
+
+Runs as a script in a clean interpreter, one process per simulated Lambda
+execution environment (see tests.utils.local_api). The init phase imports
+the function's handler from its search path, exactly as a cold start does,
+then the process serves invocations one at a time until its input closes.
+
+The protocol is one JSON document per line: the process reports the init
+phase, then answers each event read from standard input with the result of
+the handler and its timings. Anything the handler prints goes to standard
+error, as its logs, so that it cannot corrupt the protocol.
+
+Only the standard library is imported here, so that the handler's imports
+are the only ones its init phase pays for.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import resource
+import sys
+import time
+import traceback
+from typing import Any, TextIO
+
+# Constants
+MILLISECONDS = 1000
+KILOBYTES_PER_MEGABYTE = 1024
+
+
+class RuntimeContext:
+    """Lambda context of an invocation."""
+
+    def __init__(
+        self, function_name: str, memory_size: int, request_id: str, timeout: float
+    ):
+        self.function_name = function_name
+        self.function_version = "$LATEST"
+        self.invoked_function_arn = (
+            f"arn:aws:lambda:us-east-1:123456789012:function:{function_name}"
+        )
+        self.memory_limit_in_mb = memory_size
+        self.aws_request_id = request_id
+        self.log_group_name = f"/aws/lambda/{function_name}"
+        self.log_stream_name = "local"
+        self._deadline = time.monotonic() + timeout
+
+    def get_remaining_time_in_millis(self) -> int:
+        """Get the time left before the function times out."""
+        return max(0, int((self._deadline - time.monotonic()) * MILLISECONDS))
+
+
+def _max_memory_mb() -> int:
+    """Get the peak resident memory of this process in megabytes."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // KILOBYTES_PER_MEGABYTE
+
+
+def _error(exception: BaseException) -> dict[str, Any]:
+    """Describe an exception the way the Lambda runtime does."""
+    return {
+        "errorMessage": str(exception),
+        "errorType": type(exception).__name__,
+        "stackTrace": traceback.format_tb(exception.__traceback__),
+    }
+
+
+def _send(channel: TextIO, message: dict[str, Any]) -> None:
+    """Write one protocol message."""
+    channel.write(json.dumps(message, default=str) + "\n")
+    channel.flush()
+
+
+def main() -> None:
+    """Import a handler, then invoke it with every event read from stdin."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--handler", required=True, help="module.function")
+    parser.add_argument("--function-name", required=True)
+    parser.add_argument("--memory-size", type=int, required=True)
+    parser.add_argument("--timeout", type=float, required=True)
+    parser.add_argument("--path", action="append", default=[], dest="search_path")
+    args = parser.parse_args()
+
+    # Keep the real stdout for the protocol and send prints to stderr
+    channel = os.fdopen(os.dup(sys.stdout.fileno()), "w")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    # The code directory replaces the directory of this script
+    sys.path[:1] = args.search_path
+
+    start = time.perf_counter()
+    try:
+        module_name, function_name = args.handler.rsplit(".", 1)
+        handler = getattr(importlib.import_module(module_name), function_name)
+    except Exception as e:
+        traceback.print_exc()
+        _send(channel, {"init_error": _error(e)})
+        sys.exit(1)
+    _send(channel, {"init_ms": (time.perf_counter() - start) * MILLISECONDS})
+
+    for line in sys.stdin:
+        request = json.loads(line)
+        context = RuntimeContext(
+            args.function_name, args.memory_size, request["request_id"], args.timeout
+        )
+        start = time.perf_counter()
+        try:
+            result, error = handler(request["event"], context), None
+        except Exception as e:
+            traceback.print_exc()
+            result, error = None, _error(e)
+        duration_ms = (time.perf_counter() - start) * MILLISECONDS
+        sys.stdout.flush()
+        _send(
+            channel,
+            {
+                "result": result,
+                "error": error,
+                "duration_ms": duration_ms,
+                "max_memory_mb": _max_memory_mb(),
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,63 @@
 """
 Lambda utilities for integration tests - KISS approach.
 
-Simple functions to find and invoke Lambda functions using Name tags.
+Simple functions to find and invoke Lambda functions using Name tags, and
+a ``LambdaInvoker`` that fans a list of payloads out to a function with
+bounded concurrency, for smoke suites that invoke it many times.
 """
 
+import functools
 import json
 import logging
+import random
+import re
+import time
+from collections.abc import Callable, Collection
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from typing import Any
 
-import boto3
+from adapters.aws_client_factory import aws_clients, get_client_profile
+from utils.deadline import Deadline
 
 logger = logging.getLogger(__name__)
 
+# Constants
+INVOKE_CLIENT_PROFILE = "long_running"
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_EVENT_TIMEOUT_SECONDS = 60.0
+INITIAL_POLL_DELAY_SECONDS = 0.5
+MAX_POLL_DELAY_SECONDS = 5.0
+REQUEST_RESPONSE = "RequestResponse"
+EVENT = "Event"
+REPORT_FILTER_PATTERN = '"REPORT RequestId"'
+REPORT_LINE = re.compile(r"REPORT RequestId: (\S+)\s+Duration: ([\d.]+) ms")
+MILLISECONDS = 1000
+# Log lookups start this long before the fan-out, allowing for clock skew
+LOG_START_MARGIN_SECONDS = 60
+
+
+@dataclass(frozen=True, slots=True)
+class InvocationResult:
+    """
+    Outcome of one invocation of a fan-out.
+
+    ``response`` is the decoded function response, or for an Event
+    invocation whatever the result probe reported once it completed.
+    ``error`` describes a function error, a failed call or a timeout.
+    """
+
+    payload: Any
+    response: Any
+    duration: float
+    request_id: str | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the invocation completed without error."""
+        return self.error is None
+
 
 def find_lambda_by_name(construct_id: str) -> str | None:
     """
@@ -25,7 +71,7 @@ def find_lambda_by_name(construct_id: str) -> str | None:
     """
     try:
         # Use Resource Groups Tagging API for efficient tag-based filtering
-        tagging_client = boto3.client("resourcegroupstaggingapi")
+        tagging_client = aws_clients.client("resourcegroupstaggingapi")
 
         response = tagging_client.get_resources(
             ResourceTypeFilters=["lambda:function"],
@@ -51,33 +97,302 @@ def find_lambda_by_name(construct_id: str) -> str | None:
         raise
 
 
-def invoke_lambda_by_name(construct_id: str, payload: dict[str, Any]) -> dict[str, Any]:
+class LambdaInvoker:
     """
-    Find and invoke a Lambda function by its Name tag.
+    Invokes one Lambda function, many times and concurrently.
+
+    The lambda and logs clients are created once, with a connection pool
+    sized for the concurrency, and shared by every invocation.
+
+    An Event invocation only queues the function call; its completion is
+    polled with ``result_probe``, with exponential backoff and jitter. By
+    default each polling round makes one CloudWatch Logs query, from the
+    start of the fan-out, for the REPORT lines the Lambda runtime logs when
+    invocations end, and returns their durations.
+    """
+
+    def __init__(
+        self,
+        function_name: str,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        client: Any = None,
+        logs_client: Any = None,
+        result_probe: Callable[[str], Any] | None = None,
+    ):
+        """
+        Initialize the invoker.
+
+        Args:
+            function_name: Name or ARN of the function
+            max_concurrency: Most invocations in flight at once
+            client: Lambda client (pooled shared client if None)
+            logs_client: CloudWatch Logs client for the default result
+                probe (pooled shared client if None)
+            result_probe: Callable taking a request ID and returning the
+                result of a completed Event invocation, or None while it
+                runs (REPORT log line lookup if None)
+
+        Raises:
+            ValueError: If max_concurrency is lower than 1
+        """
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1, got {max_concurrency}"
+            raise ValueError(msg)
+        base = get_client_profile(INVOKE_CLIENT_PROFILE)
+        profile = replace(
+            base,
+            name=f"{base.name}x{max_concurrency}",
+            max_pool_connections=max(base.max_pool_connections, max_concurrency),
+        )
+        self.function_name = function_name
+        self.max_concurrency = max_concurrency
+        self.client = client or aws_clients.client("lambda", profile)
+        self.logs_client = logs_client or (
+            None if result_probe else aws_clients.client("logs", profile)
+        )
+        self.result_probe = result_probe
+
+    def invoke(self, payload: Any) -> Any:
+        """
+        Invoke the function synchronously.
+
+        Args:
+            payload: Function payload
+
+        Returns:
+            Decoded function response (the error document on a function error)
+        """
+        try:
+            response = self.client.invoke(
+                FunctionName=self.function_name,
+                InvocationType=REQUEST_RESPONSE,
+                Payload=json.dumps(payload),
+            )
+            return json.loads(response["Payload"].read())
+        except Exception:
+            logger.exception("Error invoking function %s", self.function_name)
+            raise
+
+    def invoke_all(
+        self,
+        payloads: list[Any],
+        invocation_type: str = REQUEST_RESPONSE,
+        timeout: float = DEFAULT_EVENT_TIMEOUT_SECONDS,
+    ) -> list[InvocationResult]:
+        """
+        Invoke the function once per payload, at most max_concurrency at once.
+
+        Failures are reported in the results rather than raised, so one bad
+        payload does not hide the outcome of the others.
+
+        Args:
+            payloads: Function payloads
+            invocation_type: "RequestResponse", or "Event" to queue the
+                invocations and poll for their completion
+            timeout: Time allowed for every Event invocation to complete
+
+        Returns:
+            One result per payload, in the order of the payloads
+
+        Raises:
+            ValueError: If the invocation type is not supported
+        """
+        if invocation_type not in (REQUEST_RESPONSE, EVENT):
+            msg = f"Unsupported invocation type '{invocation_type}'"
+            raise ValueError(msg)
+        started = time.perf_counter()
+        log_start_ms = int((time.time() - LOG_START_MARGIN_SECONDS) * MILLISECONDS)
+        workers = min(self.max_concurrency, len(payloads)) or 1
+        with ThreadPoolExecutor(workers) as executor:
+            results = list(
+                executor.map(
+                    lambda payload: self._invoke_one(payload, invocation_type),
+                    payloads,
+                )
+            )
+            if invocation_type == EVENT:
+                results = self._await_results(
+                    results, executor, Deadline.after(timeout), started, log_start_ms
+                )
+        return results
+
+    def _invoke_one(self, payload: Any, invocation_type: str) -> InvocationResult:
+        """Invoke the function once, capturing the outcome."""
+        start = time.perf_counter()
+        request_id = result = error = None
+        try:
+            response = self.client.invoke(
+                FunctionName=self.function_name,
+                InvocationType=invocation_type,
+                Payload=json.dumps(payload),
+            )
+            request_id = response.get("ResponseMetadata", {}).get("RequestId")
+            if invocation_type == REQUEST_RESPONSE:
+                result = json.loads(response["Payload"].read() or "null")
+                if response.get("FunctionError"):
+                    error = f"{response['FunctionError']}: {result}"
+        except Exception as e:
+            logger.exception("Error invoking function %s", self.function_name)
+            error = f"{type(e).__name__}: {e}"
+        return InvocationResult(
+            payload, result, time.perf_counter() - start, request_id, error
+        )
+
+    def _await_results(
+        self,
+        queued: list[InvocationResult],
+        executor: ThreadPoolExecutor,
+        deadline: Deadline,
+        started: float,
+        log_start_ms: int,
+    ) -> list[InvocationResult]:
+        """
+        Poll for the results of queued Event invocations.
+
+        Every invocation still running is probed in each round; rounds are
+        spaced with exponential backoff and jitter until all have completed
+        or the deadline passes. Durations run from the start of the fan-out
+        to the round the result was seen in.
+        """
+        results = list(queued)
+        running = [index for index, result in enumerate(queued) if result.ok]
+        attempt = 0
+        while running:
+            probed = self._probe_round(
+                [results[index].request_id for index in running],
+                executor,
+                log_start_ms,
+            )
+            still_running = []
+            for index in running:
+                result = probed.get(results[index].request_id)
+                if result is None:
+                    still_running.append(index)
+                else:
+                    results[index] = replace(
+                        results[index],
+                        response=result,
+                        duration=time.perf_counter() - started,
+                    )
+            running = still_running
+            remaining = deadline.remaining()
+            if not running or remaining <= 0:
+                break
+            backoff = min(
+                MAX_POLL_DELAY_SECONDS, INITIAL_POLL_DELAY_SECONDS * 2**attempt
+            )
+            time.sleep(min(remaining, random.uniform(backoff / 2, backoff)))
+            attempt += 1
+
+        for index in running:
+            results[index] = replace(
+                results[index],
+                duration=time.perf_counter() - started,
+                error="Timed out waiting for the result",
+            )
+        return results
+
+    def _probe_round(
+        self,
+        request_ids: list[str],
+        executor: ThreadPoolExecutor,
+        log_start_ms: int,
+    ) -> dict[str, Any]:
+        """
+        Probe for the results of one polling round.
+
+        A failed probe counts as no result yet.
+
+        Returns:
+            Result of each completed invocation, by request ID
+        """
+        if self.result_probe is None:
+            try:
+                return self._reports_from_logs(request_ids, log_start_ms)
+            except Exception:
+                logger.exception("Error polling the logs of %s", self.function_name)
+                return {}
+        probed = executor.map(self._probe, request_ids)
+        return dict(zip(request_ids, probed, strict=True))
+
+    def _probe(self, request_id: str) -> Any:
+        """Probe for a result, treating a failed probe as no result yet."""
+        try:
+            return self.result_probe(request_id)
+        except Exception:
+            logger.exception("Error polling the result of %s", request_id)
+            return None
+
+    def _reports_from_logs(
+        self, request_ids: Collection[str], start_time_ms: int
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Find the REPORT log lines of the invocations that have ended.
+
+        One query covers every invocation, following its pages: a page may
+        be empty while CloudWatch Logs is still scanning the log group.
+
+        Args:
+            request_ids: Request IDs of the invocations still running
+            start_time_ms: Time the invocations were queued at, in epoch
+                milliseconds, before which no log event is scanned
+
+        Returns:
+            Request ID and duration of each invocation found, by request ID
+        """
+        function_name = self.function_name.rsplit(":", 1)[-1]
+        wanted = set(request_ids)
+        reports = {}
+        request = {
+            "logGroupName": f"/aws/lambda/{function_name}",
+            "filterPattern": REPORT_FILTER_PATTERN,
+            "startTime": start_time_ms,
+        }
+        while True:
+            page = self.logs_client.filter_log_events(**request)
+            for event in page.get("events", []):
+                match = REPORT_LINE.search(event["message"])
+                if match and match.group(1) in wanted:
+                    reports[match.group(1)] = {
+                        "request_id": match.group(1),
+                        "duration_ms": float(match.group(2)),
+                    }
+            if not page.get("nextToken") or len(reports) == len(wanted):
+                return reports
+            request["nextToken"] = page["nextToken"]
+
+
+@functools.cache
+def get_lambda_invoker(construct_id: str) -> LambdaInvoker:
+    """
+    Get the invoker of a function, resolving its name only once.
 
     Args:
         construct_id: The construct ID used when creating the Lambda in CDK
-        payload: Function payload
 
     Returns:
-        Function response
+        The shared invoker of the function
+
+    Raises:
+        ValueError: If no function has this Name tag
     """
     function_name = find_lambda_by_name(construct_id)
     if not function_name:
         msg = f"Lambda function with Name '{construct_id}' not found"
         raise ValueError(msg)
+    return LambdaInvoker(function_name)
 
-    lambda_client = boto3.client("lambda")
 
-    try:
-        response = lambda_client.invoke(
-            FunctionName=function_name,
-            InvocationType="RequestResponse",
-            Payload=json.dumps(payload),
-        )
+def invoke_lambda_by_name(construct_id: str, payload: dict[str, Any]) -> dict[str, Any]:
+    """
+    Find and invoke a Lambda function by its Name tag.
 
-        return json.loads(response["Payload"].read())
+    Args:
+        construct_id: The construct ID used when creating the Lambda in CDK
+        payload: Function payload
 
-    except Exception:
-        logger.exception("Error invoking function %s", function_name)
-        raise
+    Returns:
+        Function response
+    """
+    return get_lambda_invoker(construct_id).invoke(payload)
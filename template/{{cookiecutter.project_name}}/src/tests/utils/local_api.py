@@ -0,0 +1,757 @@
+"""
+Local API Gateway and Lambda emulator.
+
+Serves the routes of the stack's REST API over HTTP and proxies every
+request to its function, built in ``dist/functions`` (or taken from the
+sources when there is no build). Routes and function settings come from
+the same definitions HelloWorldStack deploys.
+
+Each function runs in a pool of worker processes, each one a simulated
+execution environment (see tests.utils.lambda_runtime): a request reuses
+the most recently idle environment, and otherwise starts a new one, whose
+cold start imports the handler in a clean interpreter as Lambda's init
+phase does. Up to ``concurrency`` environments run per function, further
+requests are throttled, and idle environments are recycled after a while.
+Every request logs a REPORT line like Lambda's, with whether it started
+cold and the init duration. Memory sizes are reported, not enforced.
+
+Usage:
+    python -m tests.utils.local_api [--port 3000] [--concurrency 10]
+"""
+
+import argparse
+import base64
+import json
+import logging
+import math
+import os
+import re
+import selectors
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from tests.utils.import_profiler import handler_search_path
+from tests.utils.stack_definitions import stack_definitions
+
+logger = logging.getLogger(__name__)
+
+# Constants
+RUNTIME_SCRIPT = Path(__file__).with_name("lambda_runtime.py")
+LOCAL_HOST = "127.0.0.1"
+DEFAULT_PORT = 3000
+DEFAULT_CONCURRENCY = 10
+# Lambda keeps idle execution environments for minutes, not guaranteed
+DEFAULT_IDLE_SECONDS = 300.0
+# Lambda's limit on the init phase of on-demand functions
+INIT_TIMEOUT_SECONDS = 10.0
+STOP_TIMEOUT_SECONDS = 5.0
+MILLISECONDS = 1000
+READ_SIZE = 65536
+STAGE = "local"
+LOCAL_TABLE_NAME = "LocalGreetings"
+# Deployed settings replaced locally: there is no X-Ray daemon to send to
+LOCAL_OVERRIDES = {"HELLO_WORLD_TRACING": "off"}
+STATUS_FORBIDDEN = 403
+STATUS_THROTTLED = 429
+STATUS_BAD_GATEWAY = 502
+# Error responses of API Gateway itself
+MISSING_ROUTE = {"message": "Missing Authentication Token"}
+THROTTLED = {"message": "Too Many Requests"}
+INTERNAL_ERROR = {"message": "Internal server error"}
+PATH_PARAMETER = re.compile(r"\{(\w+)\}")
+
+
+class ThrottledError(Exception):
+    """Raised when every execution environment of a function is busy."""
+
+
+class InitError(Exception):
+    """Raised when the init phase of an execution environment fails."""
+
+
+@dataclass(frozen=True)
+class Invocation:
+    """One request proxied to a function, as reported in its REPORT line."""
+
+    request_id: str
+    route: str
+    function_name: str
+    status: int
+    # Whether the request started a new execution environment
+    cold: bool
+    duration_ms: float
+    memory_size: int
+    max_memory_mb: int
+    init_ms: float | None = None
+    container: int | None = None
+    error: str | None = None
+
+    @property
+    def billed_ms(self) -> int:
+        """Billed duration, rounded up to the millisecond."""
+        return math.ceil(self.duration_ms)
+
+    def report(self) -> str:
+        """Format the invocation as a Lambda REPORT line, plus its start."""
+        fields = [
+            f"REPORT RequestId: {self.request_id}",
+            f"Duration: {self.duration_ms:.2f} ms",
+            f"Billed Duration: {self.billed_ms} ms",
+            f"Memory Size: {self.memory_size} MB",
+            f"Max Memory Used: {self.max_memory_mb} MB",
+        ]
+        if self.init_ms is not None:
+            fields.append(f"Init Duration: {self.init_ms:.2f} ms")
+        fields.append(f"Start: {'cold' if self.cold else 'warm'}")
+        return "\t".join(fields)
+
+
+class Container:
+    """
+    Simulated execution environment: a runtime process serving one function.
+
+    The process starts with a clean environment (only PATH plus the given
+    variables) and ignores ``PYTHON*`` variables and the user site
+    directory, like the interpreter of the Lambda runtime.
+    """
+
+    def __init__(
+        self,
+        container_id: int,
+        function: Any,
+        search_path: list[Path],
+        environment: dict[str, str],
+    ):
+        """
+        Start the process and wait for its init phase to end.
+
+        Args:
+            container_id: Number of the environment, for the logs
+            function: FunctionDefinition of the function served
+            search_path: Directories the handler is imported from
+            environment: Environment variables of the function
+
+        Raises:
+            InitError: If the handler cannot be imported in time
+        """
+        self.container_id = container_id
+        self.function = function
+        self.last_used = time.monotonic()
+        command = [
+            sys.executable,
+            "-E",
+            "-s",
+            str(RUNTIME_SCRIPT),
+            "--handler",
+            function.handler,
+            "--function-name",
+            function.function_name,
+            "--memory-size",
+            str(function.memory_size),
+            "--timeout",
+            str(function.timeout_seconds),
+        ]
+        for path in search_path:
+            command += ["--path", str(path)]
+        self._process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env={"PATH": os.environ.get("PATH", ""), **environment},
+        )
+        self._buffer = b""
+        try:
+            message = self._receive(INIT_TIMEOUT_SECONDS)
+        except (TimeoutError, EOFError) as e:
+            self.kill()
+            msg = f"Init of {function.function_name} failed: {e}"
+            raise InitError(msg) from e
+        if "init_error" in message:
+            self.close()
+            error = message["init_error"]
+            msg = f"{error['errorType']}: {error['errorMessage']}"
+            raise InitError(msg)
+        self.init_ms: float = message["init_ms"]
+
+    def invoke(self, event: dict[str, Any], request_id: str) -> dict[str, Any]:
+        """
+        Invoke the handler with an event.
+
+        Args:
+            event: Lambda event
+            request_id: Request ID passed in the context
+
+        Returns:
+            The result or error of the handler, its duration and the peak
+            memory of the process
+
+        Raises:
+            TimeoutError: If the handler runs past the function timeout
+            EOFError: If the process exits during the invocation
+        """
+        request = json.dumps({"event": event, "request_id": request_id})
+        self._process.stdin.write(request.encode() + b"\n")
+        self._process.stdin.flush()
+        reply = self._receive(self.function.timeout_seconds)
+        self.last_used = time.monotonic()
+        return reply
+
+    def close(self) -> None:
+        """Stop the process, killing it if it does not exit in time."""
+        try:
+            self._process.stdin.close()
+            self._process.wait(STOP_TIMEOUT_SECONDS)
+        except (OSError, subprocess.TimeoutExpired):
+            self._process.kill()
+            self._process.wait()
+        self._process.stdout.close()
+
+    def kill(self) -> None:
+        """Stop the process at once, e.g. in the middle of an invocation."""
+        self._process.kill()
+        self._process.wait()
+        self._process.stdin.close()
+        self._process.stdout.close()
+
+    def _receive(self, timeout: float) -> dict[str, Any]:
+        """
+        Read the next protocol message of the process.
+
+        Raises:
+            TimeoutError: If no complete message arrives in time
+            EOFError: If the process exits
+        """
+        deadline = time.monotonic() + timeout
+        with selectors.DefaultSelector() as selector:
+            selector.register(self._process.stdout, selectors.EVENT_READ)
+            while b"\n" not in self._buffer:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not selector.select(remaining):
+                    msg = f"No reply from {self.function.function_name} in {timeout}s"
+                    raise TimeoutError(msg)
+                chunk = os.read(self._process.stdout.fileno(), READ_SIZE)
+                if not chunk:
+                    msg = f"Execution environment {self.container_id} exited"
+                    raise EOFError(msg)
+                self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return json.loads(line)
+
+
+class FunctionPool:
+    """
+    Execution environments of one function.
+
+    Idle environments are reused most recently used first, so that the
+    others age out as they do on Lambda.
+    """
+
+    def __init__(
+        self,
+        function: Any,
+        search_path: list[Path],
+        environment: dict[str, str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        idle_seconds: float = DEFAULT_IDLE_SECONDS,
+    ):
+        """
+        Initialize an empty pool.
+
+        Args:
+            function: FunctionDefinition of the function
+            search_path: Directories the handler is imported from
+            environment: Environment variables of the function
+            concurrency: Maximum number of environments
+            idle_seconds: Time after which an idle environment is stopped
+        """
+        self.function = function
+        self.search_path = search_path
+        self.environment = environment
+        self.concurrency = concurrency
+        self.idle_seconds = idle_seconds
+        self.started = 0
+        self._size = 0
+        self._idle: list[Container] = []
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Number of environments, busy, idle or starting."""
+        with self._lock:
+            return self._size
+
+    def acquire(self) -> tuple[Container, bool]:
+        """
+        Get an environment to run an invocation in.
+
+        Returns:
+            The environment, and whether it was just started
+
+        Raises:
+            ThrottledError: If the pool is at its concurrency
+            InitError: If a new environment fails to start
+        """
+        with self._lock:
+            expired = self._take_expired()
+            container = self._idle.pop() if self._idle else None
+            if container is None:
+                if self._size >= self.concurrency:
+                    msg = f"{self.function.function_name} is at its concurrency"
+                    raise ThrottledError(msg)
+                self._size += 1
+                self.started += 1
+                container_id = self.started
+        for stale in expired:
+            stale.close()
+        if container is not None:
+            return container, False
+        try:
+            container = Container(
+                container_id, self.function, self.search_path, self.environment
+            )
+        except BaseException:
+            with self._lock:
+                self._size -= 1
+            raise
+        return container, True
+
+    def release(self, container: Container, reuse: bool = True) -> None:
+        """
+        Return an environment after an invocation.
+
+        Args:
+            container: Environment acquired from this pool
+            reuse: Keep it for later invocations; False kills it, e.g.
+                after a timeout left it mid-invocation
+        """
+        if reuse:
+            with self._lock:
+                self._idle.append(container)
+            return
+        with self._lock:
+            self._size -= 1
+        container.kill()
+
+    def close(self) -> None:
+        """Stop the idle environments."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+        for container in idle:
+            container.close()
+
+    def _take_expired(self) -> list[Container]:
+        """Remove the environments idle for too long; the lock is held."""
+        cutoff = time.monotonic() - self.idle_seconds
+        expired = [c for c in self._idle if c.last_used < cutoff]
+        if expired:
+            self._idle = [c for c in self._idle if c.last_used >= cutoff]
+            self._size -= len(expired)
+        return expired
+
+
+def api_event(
+    route: Any,
+    path: str,
+    *,
+    path_parameters: dict[str, str],
+    query: str,
+    headers: dict[str, str],
+    body: bytes,
+    request_id: str,
+) -> dict[str, Any]:
+    """
+    Build the API Gateway proxy event of a request.
+
+    Args:
+        route: RouteDefinition the request matched
+        path: Request path
+        path_parameters: Values of the path parameters of the route
+        query: Raw query string
+        headers: Request headers
+        body: Request body
+        request_id: API Gateway request ID
+
+    Returns:
+        The event
+    """
+    query_values = parse_qs(query, keep_blank_values=True)
+    return {
+        "resource": route.path,
+        "path": path,
+        "httpMethod": route.method,
+        "headers": headers or None,
+        "multiValueHeaders": {name: [value] for name, value in headers.items()} or None,
+        # Like API Gateway, the last of repeated parameters wins
+        "queryStringParameters": {
+            name: values[-1] for name, values in query_values.items()
+        }
+        or None,
+        "multiValueQueryStringParameters": query_values or None,
+        "pathParameters": path_parameters or None,
+        "stageVariables": None,
+        "requestContext": {
+            "resourcePath": route.path,
+            "httpMethod": route.method,
+            "path": f"/{STAGE}{path}",
+            "stage": STAGE,
+            "requestId": request_id,
+            "requestTimeEpoch": int(time.time() * MILLISECONDS),
+            "identity": {"sourceIp": LOCAL_HOST},
+        },
+        "body": body.decode() if body else None,
+        "isBase64Encoded": False,
+    }
+
+
+def proxy_response(result: Any) -> tuple[int, list[tuple[str, str]], bytes]:
+    """
+    Convert the result of a proxy integration to an HTTP response.
+
+    Args:
+        result: Value returned by the handler
+
+    Returns:
+        Status code, headers and body
+
+    Raises:
+        ValueError: If the result is not a valid proxy response, which API
+            Gateway answers with a 502
+    """
+    if not isinstance(result, dict) or not isinstance(result.get("statusCode"), int):
+        msg = "Malformed Lambda proxy response"
+        raise ValueError(msg)
+    headers = [
+        (name, str(value)) for name, value in (result.get("headers") or {}).items()
+    ]
+    for name, values in (result.get("multiValueHeaders") or {}).items():
+        headers.extend((name, str(value)) for value in values)
+    body = result.get("body") or ""
+    if not isinstance(body, str):
+        msg = "Lambda proxy response body must be a string"
+        raise ValueError(msg)
+    if result.get("isBase64Encoded"):
+        return result["statusCode"], headers, base64.b64decode(body)
+    return result["statusCode"], headers, body.encode()
+
+
+class LocalApi:
+    """
+    Local REST API proxying its routes to pools of execution environments.
+
+    Use it as a context manager and send requests to ``url``. Every proxied
+    request is recorded in ``invocations``.
+    """
+
+    def __init__(
+        self,
+        api: Any = None,
+        functions: Iterable[Any] | None = None,
+        *,
+        environment: dict[str, str] | None = None,
+        dist: bool | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        idle_seconds: float = DEFAULT_IDLE_SECONDS,
+        port: int = 0,
+    ):
+        """
+        Initialize the emulator.
+
+        Args:
+            api: ApiDefinition to serve (the Hello World API by default)
+            functions: FunctionDefinitions of its routes (the Hello World
+                function by default)
+            environment: Variables added to those of every function, e.g.
+                the table names and endpoints of local stand-ins
+            dist: Where to import handlers from; see ``handler_search_path``
+            concurrency: Maximum execution environments per function
+            idle_seconds: Time after which an idle environment is stopped
+            port: TCP port to listen on (a free port is chosen if 0)
+
+        Raises:
+            FileNotFoundError: If a function has no handler
+        """
+        definitions = stack_definitions("api_definitions")
+        self.api = api or definitions.hello_world_api()
+        functions = functions or [definitions.hello_world_function()]
+        self.port = port
+        self.invocations: list[Invocation] = []
+        self.pools = {
+            function.function_name: FunctionPool(
+                function,
+                handler_search_path(function.function_name, dist),
+                _function_environment(function, environment or {}),
+                concurrency,
+                idle_seconds,
+            )
+            for function in functions
+        }
+        self._routes = [(route, _path_pattern(route.path)) for route in self.api.routes]
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "LocalApi":
+        """Start serving."""
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop serving and stop the execution environments."""
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """Base URL of the API."""
+        return f"http://{LOCAL_HOST}:{self.port}"
+
+    def start(self) -> None:
+        """Serve requests in a background thread."""
+        self._server = ThreadingHTTPServer(
+            (LOCAL_HOST, self.port), _handler_class(self)
+        )
+        self._server.daemon_threads = True
+        self.port = self._server.server_port
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info("Serving %s on %s", self.api.rest_api_name, self.url)
+        for route in self.api.routes:
+            logger.info("  %s %s -> %s", route.method, route.path, route.function_name)
+
+    def serve_forever(self) -> None:
+        """Serve requests in the foreground until interrupted."""
+        self.start()
+        try:
+            self._thread.join()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """Stop serving and stop the idle execution environments."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+        for pool in self.pools.values():
+            pool.close()
+
+    def handle(
+        self, method: str, target: str, headers: dict[str, str], body: bytes
+    ) -> tuple[int, list[tuple[str, str]], bytes]:
+        """
+        Answer an HTTP request the way API Gateway would.
+
+        Args:
+            method: HTTP method
+            target: Request target, the path and query string
+            headers: Request headers
+            body: Request body
+
+        Returns:
+            Status code, headers and body of the response
+        """
+        url = urlsplit(target)
+        match = self._match(method, url.path)
+        if match is None:
+            return _json_response(STATUS_FORBIDDEN, MISSING_ROUTE)
+        route, path_parameters = match
+        pool = self.pools[route.function_name]
+        request_id = str(uuid.uuid4())
+        event = api_event(
+            route,
+            url.path,
+            path_parameters=path_parameters,
+            query=url.query,
+            headers=headers,
+            body=body,
+            request_id=request_id,
+        )
+
+        try:
+            container, cold = pool.acquire()
+        except ThrottledError:
+            logger.warning("%s %s %s throttled", method, url.path, STATUS_THROTTLED)
+            return _json_response(STATUS_THROTTLED, THROTTLED)
+        except InitError:
+            logger.exception("Init of %s failed", route.function_name)
+            return _json_response(STATUS_BAD_GATEWAY, INTERNAL_ERROR)
+
+        start = time.perf_counter()
+        try:
+            reply = container.invoke(event, request_id)
+        except (TimeoutError, EOFError) as e:
+            pool.release(container, reuse=False)
+            reply = {
+                "error": {"errorType": type(e).__name__, "errorMessage": str(e)},
+                "duration_ms": (time.perf_counter() - start) * MILLISECONDS,
+                "max_memory_mb": 0,
+            }
+        else:
+            pool.release(container)
+
+        error = reply["error"]
+        if error is None:
+            try:
+                status, response_headers, response_body = proxy_response(
+                    reply["result"]
+                )
+            except ValueError as e:
+                error = {"errorType": type(e).__name__, "errorMessage": str(e)}
+        if error is not None:
+            status, response_headers, response_body = _json_response(
+                STATUS_BAD_GATEWAY, INTERNAL_ERROR
+            )
+        self._record(
+            Invocation(
+                request_id=request_id,
+                route=f"{route.method} {route.path}",
+                function_name=route.function_name,
+                status=status,
+                cold=cold,
+                duration_ms=reply["duration_ms"],
+                memory_size=pool.function.memory_size,
+                max_memory_mb=reply["max_memory_mb"],
+                init_ms=container.init_ms if cold else None,
+                container=container.container_id,
+                error=error and f"{error['errorType']}: {error['errorMessage']}",
+            )
+        )
+        response_headers.append(("X-Local-Start", "cold" if cold else "warm"))
+        return status, response_headers, response_body
+
+    def _match(self, method: str, path: str) -> tuple[Any, dict[str, str]] | None:
+        """Find the route of a request and its path parameters."""
+        for route, pattern in self._routes:
+            match = pattern.fullmatch(path)
+            if match and route.method == method:
+                return route, match.groupdict()
+        return None
+
+    def _record(self, invocation: Invocation) -> None:
+        """Keep and log an invocation."""
+        with self._lock:
+            self.invocations.append(invocation)
+        logger.info(
+            "%s %s %s in environment %s",
+            invocation.route,
+            invocation.status,
+            invocation.function_name,
+            invocation.container,
+        )
+        logger.info(invocation.report())
+        if invocation.error:
+            logger.warning("Function error: %s", invocation.error)
+
+
+def _path_pattern(path: str) -> re.Pattern:
+    """Compile a resource path, with ``{name}`` parameters, to a pattern."""
+    parts = PATH_PARAMETER.split(path)
+    # Literal text and parameter names alternate
+    return re.compile(
+        "".join(
+            f"(?P<{part}>[^/]+)" if index % 2 else re.escape(part)
+            for index, part in enumerate(parts)
+        )
+    )
+
+
+def _function_environment(function: Any, overrides: dict[str, str]) -> dict[str, str]:
+    """Build the environment variables of a function's runtime process."""
+    return {
+        "AWS_LAMBDA_FUNCTION_NAME": function.function_name,
+        "AWS_LAMBDA_FUNCTION_MEMORY_SIZE": str(function.memory_size),
+        "AWS_LAMBDA_FUNCTION_VERSION": "$LATEST",
+        **function.environment,
+        **overrides,
+    }
+
+
+def _json_response(
+    status: int, body: dict[str, Any]
+) -> tuple[int, list[tuple[str, str]], bytes]:
+    """Build a JSON response of API Gateway itself."""
+    return status, [("Content-Type", "application/json")], json.dumps(body).encode()
+
+
+def _handler_class(api: LocalApi) -> type[BaseHTTPRequestHandler]:
+    """Create the HTTP request handler class serving an emulator."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def _proxy(self) -> None:
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else b""
+            status, headers, response_body = api.handle(
+                self.command, self.path, dict(self.headers.items()), body
+            )
+            self.send_response(status)
+            for name, value in headers:
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(response_body)))
+            self.end_headers()
+            self.wfile.write(response_body)
+
+        do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _proxy
+
+        def log_message(self, *args: Any) -> None:
+            pass  # Invocations are logged with their REPORT line
+
+    return Handler
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Serve the API locally, on a local DynamoDB stand-in."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--idle-seconds", type=float, default=DEFAULT_IDLE_SECONDS)
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=0.0,
+        help="Simulated network latency of every DynamoDB request",
+    )
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--dist", action="store_true", default=None)
+    source.add_argument("--source", dest="dist", action="store_false")
+    args = parser.parse_args(argv)
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    # Imported here as it pulls in moto, which the emulator itself does not need
+    from tests.utils.local_dynamodb import LocalDynamoDB  # noqa: PLC0415
+
+    with LocalDynamoDB(isolated=True, latency_ms=args.latency_ms) as dynamodb:
+        dynamodb.create_greetings_table(LOCAL_TABLE_NAME)
+        try:
+            api = LocalApi(
+                environment={
+                    **dynamodb.environment,
+                    **LOCAL_OVERRIDES,
+                    "HELLO_WORLD_TABLE_NAME": LOCAL_TABLE_NAME,
+                },
+                dist=args.dist,
+                concurrency=args.concurrency,
+                idle_seconds=args.idle_seconds,
+                port=args.port,
+            )
+        except FileNotFoundError as e:
+            parser.error(str(e))
+        api.serve_forever()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
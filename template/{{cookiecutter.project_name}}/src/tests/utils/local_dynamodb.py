@@ -0,0 +1,328 @@
+"""
+Local DynamoDB stand-in for integration tests and benchmarks.
+
+Serves the moto DynamoDB backend over HTTP so that adapters talk to a real
+endpoint without a deployed stack or AWS credentials. Adapters are pointed
+at it through the standard ``AWS_ENDPOINT_URL_DYNAMODB`` environment
+variable, so no production code needs to know about it; S3 clients, e.g.
+for the saved-names snapshot, through ``AWS_ENDPOINT_URL_S3``. An optional
+fixed delay per request simulates the network round trip to the real
+service.
+Parallel Scan segments, which moto ignores, are emulated. Tables are
+provisioned from the same definitions HelloWorldStack deploys, so that
+their keys and indexes cannot drift from the real ones.
+"""
+
+import argparse
+import io
+import json
+import logging
+import socket
+import subprocess
+import sys
+import threading
+import time
+import zlib
+from collections.abc import Callable, Iterable
+from types import ModuleType
+from typing import Any
+
+import boto3
+from moto.server import DomainDispatcherApplication, create_backend_app
+from werkzeug.serving import BaseWSGIServer, make_server
+
+# Constants
+LOCAL_HOST = "127.0.0.1"
+LOCAL_REGION = "us-east-1"
+STARTUP_TIMEOUT_SECONDS = 30
+STARTUP_POLL_SECONDS = 0.1
+MILLISECONDS = 1000
+SCAN_TARGET = "DynamoDB_20120810.Scan"
+LOCAL_CREDENTIALS = {
+    "AWS_ACCESS_KEY_ID": "testing",
+    "AWS_SECRET_ACCESS_KEY": "testing",
+    "AWS_SESSION_TOKEN": "testing",
+}
+
+
+def table_definitions() -> ModuleType:
+    """
+    Load the table definitions of the stacks.
+
+    Returns:
+        The ``stacks.table_definitions`` module
+    """
+    # Imported here as the server also runs as a script, outside the tests
+    from tests.utils.stack_definitions import stack_definitions  # noqa: PLC0415
+
+    return stack_definitions("table_definitions")
+
+
+def _find_free_port() -> int:
+    """Ask the operating system for a free local TCP port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((LOCAL_HOST, 0))
+        return sock.getsockname()[1]
+
+
+class LatencyMiddleware:
+    """WSGI middleware delaying every request."""
+
+    def __init__(self, app: Callable, latency_ms: float | Callable[[], float]):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: WSGI application to wrap
+            latency_ms: Delay added before each request, in milliseconds, or
+                a callable returning the delay of the next request
+        """
+        self.app = app
+        self.latency_ms = latency_ms
+
+    def __call__(self, environ: dict, start_response: Callable) -> Iterable[bytes]:
+        """Delay, then delegate to the wrapped application."""
+        delay = self.latency_ms() if callable(self.latency_ms) else self.latency_ms
+        if delay > 0:
+            time.sleep(delay / MILLISECONDS)
+        return self.app(environ, start_response)
+
+
+class SegmentedScanMiddleware:
+    """
+    WSGI middleware emulating parallel Scan segments.
+
+    moto returns the whole table to every segment of a parallel Scan. This
+    middleware keeps, in each Scan response page, only the items of the
+    requested segment, assigning items to segments by a hash of their
+    content, as DynamoDB does by a hash of their partition key.
+    """
+
+    def __init__(self, app: Callable):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: WSGI application to wrap
+        """
+        self.app = app
+
+    def __call__(self, environ: dict, start_response: Callable) -> Iterable[bytes]:
+        """Delegate, filtering the response of segmented Scans."""
+        if environ.get("HTTP_X_AMZ_TARGET") != SCAN_TARGET:
+            return self.app(environ, start_response)
+
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+        body = environ["wsgi.input"].read(length)
+        environ["wsgi.input"] = io.BytesIO(body)
+        request = json.loads(body or b"{}")
+        if "TotalSegments" not in request:
+            return self.app(environ, start_response)
+
+        captured = {}
+
+        def capture(status: str, headers: list, _exc_info: Any = None) -> None:
+            captured.update(status=status, headers=headers)
+
+        response = json.loads(b"".join(self.app(environ, capture)))
+        if "Items" in response:
+            response["Items"] = [
+                item
+                for item in response["Items"]
+                if _segment_of(item, request["TotalSegments"]) == request["Segment"]
+            ]
+            response["Count"] = len(response["Items"])
+        payload = json.dumps(response).encode()
+        # botocore verifies the checksum of DynamoDB responses
+        headers = [
+            (name, value)
+            for name, value in captured["headers"]
+            if name.lower() not in ("content-length", "x-amz-crc32")
+        ]
+        headers += [
+            ("Content-Length", str(len(payload))),
+            ("x-amz-crc32", str(zlib.crc32(payload))),
+        ]
+        start_response(captured["status"], headers)
+        return [payload]
+
+
+def _segment_of(item: dict, total_segments: int) -> int:
+    """Assign an item to a Scan segment by a hash of its content."""
+    return zlib.crc32(json.dumps(item, sort_keys=True).encode()) % total_segments
+
+
+class LocalDynamoDB:
+    """
+    Local DynamoDB server backed by moto.
+
+    Use it as a context manager, then apply ``environment`` to the process
+    (or a pytest ``monkeypatch``) before creating adapters. Benchmarks should
+    pass ``isolated=True`` so the server runs in its own interpreter and does
+    not compete with the code under measurement for the GIL.
+    """
+
+    def __init__(
+        self,
+        port: int | None = None,
+        isolated: bool = False,
+        latency_ms: float = 0.0,
+    ):
+        """
+        Initialize the local DynamoDB server.
+
+        Args:
+            port: TCP port to listen on (a free port is chosen if omitted)
+            isolated: Run the server in a separate process instead of a thread
+            latency_ms: Simulated network latency added to every request
+        """
+        self.port = port or _find_free_port()
+        self.endpoint_url = f"http://{LOCAL_HOST}:{self.port}"
+        self.isolated = isolated
+        self.latency_ms = latency_ms
+        self.app = LatencyMiddleware(
+            SegmentedScanMiddleware(DomainDispatcherApplication(create_backend_app)),
+            latency_ms,
+        )
+        self._server: BaseWSGIServer | None = None
+        self._thread: threading.Thread | None = None
+        self._process: subprocess.Popen | None = None
+        self._client: Any = None
+
+    def __enter__(self) -> "LocalDynamoDB":
+        """Start the server."""
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop the server."""
+        self.stop()
+
+    @property
+    def environment(self) -> dict[str, str]:
+        """Environment variables pointing AWS SDK clients at this server."""
+        return {
+            **LOCAL_CREDENTIALS,
+            "AWS_REGION": LOCAL_REGION,
+            "AWS_DEFAULT_REGION": LOCAL_REGION,
+            "AWS_ENDPOINT_URL_DYNAMODB": self.endpoint_url,
+            "AWS_ENDPOINT_URL_S3": self.endpoint_url,
+        }
+
+    def start(self) -> None:
+        """Start the server in a background thread or process."""
+        if self.isolated:
+            self._process = subprocess.Popen(
+                [
+                    sys.executable,
+                    __file__,
+                    "--port",
+                    str(self.port),
+                    "--latency-ms",
+                    str(self.latency_ms),
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            self._wait_until_listening()
+            return
+
+        # Silence the per-request access log of the embedded HTTP server
+        logging.getLogger("werkzeug").setLevel(logging.ERROR)
+        self._server = make_server(LOCAL_HOST, self.port, self.app, threaded=True)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._process is not None:
+            self._process.terminate()
+            self._process.wait()
+            self._process = None
+        if self._server is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._server = None
+
+    def client(self) -> Any:
+        """
+        Get a low-level DynamoDB client bound to this server.
+
+        The client carries its own endpoint and credentials, so it is kept
+        here rather than in the shared ``aws_clients`` cache.
+
+        Returns:
+            boto3 DynamoDB client
+        """
+        if self._client is None:
+            self._client = boto3.client(
+                "dynamodb",
+                endpoint_url=self.endpoint_url,
+                region_name=LOCAL_REGION,
+                aws_access_key_id=LOCAL_CREDENTIALS["AWS_ACCESS_KEY_ID"],
+                aws_secret_access_key=LOCAL_CREDENTIALS["AWS_SECRET_ACCESS_KEY"],
+            )
+        return self._client
+
+    def create_greetings_table(
+        self, table_name: str, timestamp_format: str | None = None
+    ) -> str:
+        """
+        Create a table with the same keys and indexes as GreetingsTable.
+
+        Args:
+            table_name: Name of the table to create
+            timestamp_format: Timestamp storage format, which sets the type
+                of the recency index sort key (the deployed one if None)
+
+        Returns:
+            The table name
+        """
+        definitions = table_definitions()
+        definition = definitions.greetings_table(
+            timestamp_format or definitions.TIMESTAMP_FORMAT
+        )
+        self.client().create_table(**definition.create_table_request(table_name))
+        return table_name
+
+    def delete_table(self, table_name: str) -> None:
+        """
+        Delete a table.
+
+        Args:
+            table_name: Name of the table to delete
+        """
+        self.client().delete_table(TableName=table_name)
+
+    def _wait_until_listening(self) -> None:
+        """
+        Block until the server accepts TCP connections.
+
+        Raises:
+            TimeoutError: If the server does not start in time
+        """
+        deadline = time.monotonic() + STARTUP_TIMEOUT_SECONDS
+        while time.monotonic() < deadline:
+            try:
+                with socket.create_connection((LOCAL_HOST, self.port), timeout=1):
+                    return
+            except OSError:
+                time.sleep(STARTUP_POLL_SECONDS)
+        self.stop()
+        msg = f"Local DynamoDB did not start on port {self.port}"
+        raise TimeoutError(msg)
+
+
+def main() -> None:
+    """Serve a local DynamoDB in the foreground until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--port", type=int, required=True)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = LocalDynamoDB(port=args.port, latency_ms=args.latency_ms)
+    make_server(LOCAL_HOST, server.port, server.app, threaded=True).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+Local Lambda stand-in for integration tests and benchmarks.
+
+Runs Python handlers in-process behind the ``invoke`` call of a boto3
+Lambda client, so that code invoking functions can be exercised without a
+deployed stack. Event invocations run on background threads and, like the
+Lambda runtime, log a REPORT line when they end; ``filter_log_events``
+answers the CloudWatch Logs lookups made to find it.
+"""
+
+import io
+import json
+import threading
+import time
+import traceback
+import uuid
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any
+
+from botocore.exceptions import ClientError
+
+# Constants
+MILLISECONDS = 1000
+DEFAULT_TIMEOUT_SECONDS = 30
+REQUEST_RESPONSE = "RequestResponse"
+EVENT = "Event"
+DRY_RUN = "DryRun"
+STATUS_OK = 200
+STATUS_ACCEPTED = 202
+STATUS_NO_CONTENT = 204
+
+
+class LocalContext:
+    """Lambda context of a local invocation."""
+
+    def __init__(self, function_name: str, request_id: str, timeout: float):
+        self.function_name = function_name
+        self.function_version = "$LATEST"
+        self.invoked_function_arn = (
+            f"arn:aws:lambda:us-east-1:123456789012:function:{function_name}"
+        )
+        self.memory_limit_in_mb = 128
+        self.aws_request_id = request_id
+        self.log_group_name = f"/aws/lambda/{function_name}"
+        self.log_stream_name = "local"
+        self._deadline = time.monotonic() + timeout
+
+    def get_remaining_time_in_millis(self) -> int:
+        """Get the time left before the function times out."""
+        return max(0, int((self._deadline - time.monotonic()) * MILLISECONDS))
+
+
+class LocalLambda:
+    """
+    In-process stand-in for the Lambda and CloudWatch Logs clients.
+
+    Pass it as both clients: it implements ``invoke`` and
+    ``filter_log_events`` with the request and response shapes of boto3.
+    """
+
+    def __init__(
+        self,
+        handlers: dict[str, Callable[[Any, Any], Any]],
+        latency_ms: float = 0.0,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    ):
+        """
+        Initialize the stand-in.
+
+        Args:
+            handlers: Handler of each function, by function name
+            latency_ms: Delay added to every invocation, simulating the
+                network round trip
+            timeout: Function timeout reported by the context
+        """
+        self.handlers = handlers
+        self.latency_ms = latency_ms
+        self.timeout = timeout
+        self.invocations: dict[str, int] = defaultdict(int)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._logs: dict[str, list[dict]] = defaultdict(list)
+        self._lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
+
+    def invoke(
+        self,
+        FunctionName: str,
+        Payload: str | bytes = b"",
+        InvocationType: str = REQUEST_RESPONSE,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        Invoke a handler like ``lambda_client.invoke``.
+
+        Raises:
+            ClientError: If the function does not exist
+        """
+        function_name = FunctionName.rsplit(":", 1)[-1]
+        handler = self.handlers.get(function_name)
+        if handler is None:
+            raise ClientError(
+                {
+                    "Error": {
+                        "Code": "ResourceNotFoundException",
+                        "Message": f"Function not found: {function_name}",
+                    }
+                },
+                "Invoke",
+            )
+        request_id = str(uuid.uuid4())
+        metadata = {"RequestId": request_id}
+        event = json.loads(Payload or "null")
+
+        if InvocationType == DRY_RUN:
+            return {"StatusCode": STATUS_NO_CONTENT, "ResponseMetadata": metadata}
+        if InvocationType == EVENT:
+            thread = threading.Thread(
+                target=self._run,
+                args=(function_name, handler, event, request_id),
+                daemon=True,
+            )
+            with self._lock:
+                self._threads.append(thread)
+            thread.start()
+            return {
+                "StatusCode": STATUS_ACCEPTED,
+                "Payload": io.BytesIO(b""),
+                "ResponseMetadata": metadata,
+            }
+
+        result, error = self._run(function_name, handler, event, request_id)
+        response = {
+            "StatusCode": STATUS_OK,
+            "ExecutedVersion": "$LATEST",
+            "Payload": io.BytesIO(json.dumps(result).encode()),
+            "ResponseMetadata": metadata,
+        }
+        if error:
+            response["FunctionError"] = "Unhandled"
+        return response
+
+    def filter_log_events(
+        self,
+        logGroupName: str,
+        filterPattern: str = "",
+        startTime: int = 0,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Find log lines containing the (quoted) filter pattern, in one page."""
+        term = filterPattern.strip('"')
+        with self._lock:
+            events = [
+                event
+                for event in self._logs[logGroupName]
+                if term in event["message"] and event["timestamp"] >= startTime
+            ]
+        return {"events": events}
+
+    def join(self, timeout: float | None = None) -> None:
+        """Wait for the Event invocations started so far to end."""
+        with self._lock:
+            threads = list(self._threads)
+        for thread in threads:
+            thread.join(timeout)
+
+    def _run(
+        self,
+        function_name: str,
+        handler: Callable[[Any, Any], Any],
+        event: Any,
+        request_id: str,
+    ) -> tuple[Any, bool]:
+        """Run a handler, then log its REPORT line."""
+        with self._lock:
+            self.invocations[function_name] += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        start = time.perf_counter()
+        try:
+            if self.latency_ms:
+                time.sleep(self.latency_ms / MILLISECONDS)
+            context = LocalContext(function_name, request_id, self.timeout)
+            result, error = handler(event, context), False
+        except Exception as e:
+            result = {
+                "errorMessage": str(e),
+                "errorType": type(e).__name__,
+                "stackTrace": traceback.format_tb(e.__traceback__),
+            }
+            error = True
+        duration_ms = (time.perf_counter() - start) * MILLISECONDS
+        with self._lock:
+            self.in_flight -= 1
+            self._logs[f"/aws/lambda/{function_name}"].append(
+                {
+                    "timestamp": int(time.time() * MILLISECONDS),
+                    "message": (
+                        f"REPORT RequestId: {request_id}\t"
+                        f"Duration: {duration_ms:.2f} ms\t"
+                        f"Billed Duration: {int(duration_ms) + 1} ms"
+                    ),
+                }
+            )
+        return result, error
@@ -4,24 +4,43 @@ AWS resource discovery utility for pytest integration tests.
 This module provides functionality to discover AWS resources by tags,
 enabling tests to dynamically find resource names and ARNs without
 hardcoding them in test files.
+
+Names exported as stack outputs are resolved first, from the deploy
+outputs file or the synthesized cloud assembly (see
+``tests.utils.stack_outputs``). Otherwise, every resource carrying the
+application tag is fetched in one paginated sweep of the Resource Groups
+Tagging API and indexed in memory; lookups are then served from the
+index. The pytest session shares one instance through the
+``resource_discovery`` fixture.
 """
 
-import sys
+import functools
+import random
+import threading
 import time
-from pathlib import Path
+from collections import defaultdict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Any
 
 import boto3
+from adapters.aws_client_factory import aws_clients
 from botocore.exceptions import ClientError
+from utils.deadline import Deadline
 
-# Use test config for path management
-parent_path = Path(__file__).parent / ".."
-sys.path.insert(0, str(parent_path))
-
-from test_config import TAG_KEY, TAG_VALUE  # noqa: E402
+from tests.test_config import TAG_KEY, TAG_VALUE
+from tests.utils.stack_outputs import StackOutputs
 
 # Constants
 MIN_ARN_PARTS = 6
+RESOURCE_ID_TAG = "ResourceId"
+# Stack outputs are named after the ResourceId they describe
+NAME_OUTPUT_SUFFIX = "Name"
+ARN_OUTPUT_SUFFIX = "Arn"
+DEFAULT_READINESS_TIMEOUT_SECONDS = 60.0
+DEFAULT_INITIAL_DELAY_SECONDS = 0.5
+DEFAULT_MAX_DELAY_SECONDS = 8.0
 
 
 # Create a simple config object for compatibility
@@ -33,18 +52,102 @@ class TestConfig:
 infra_config = TestConfig()
 
 
+@dataclass(frozen=True, slots=True)
+class DiscoveredResource:
+    """A resource carrying the application tag."""
+
+    arn: str
+    type: str
+    name: str
+    resource_id: str | None
+    tags: list[dict[str, str]]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Describe the resource as ``get_resource_by_id`` reports it."""
+        return {
+            "arn": self.arn,
+            "type": self.type,
+            "name": self.name,
+            "resource_id": self.resource_id,
+            "tags": self.tags,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Readiness:
+    """Outcome of waiting for resources to be discoverable."""
+
+    resolved: dict[str, DiscoveredResource]
+    timed_out: frozenset[str]
+
+    @property
+    def ready(self) -> bool:
+        """Whether every resource resolved before the deadline."""
+        return not self.timed_out
+
+
+@dataclass
+class ResourceIndex:
+    """Application resources indexed by ResourceId tag, name and type."""
+
+    by_resource_id: dict[str, list[DiscoveredResource]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    by_name: dict[str, list[DiscoveredResource]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    by_type: dict[str, list[DiscoveredResource]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+
+    def add(self, resource: DiscoveredResource) -> None:
+        """Index a resource."""
+        if resource.resource_id is not None:
+            self.by_resource_id[resource.resource_id].append(resource)
+        self.by_name[resource.name].append(resource)
+        self.by_type[resource.type].append(resource)
+
+    def find(
+        self, resource_id: str, resource_type: str | None = None
+    ) -> DiscoveredResource | None:
+        """
+        Find a resource by ResourceId tag, optionally of a given type.
+
+        Args:
+            resource_id: The ResourceId tag value to search for
+            resource_type: Resource type, e.g. "dynamodb:table" (optional)
+
+        Returns:
+            The first matching resource, or None
+        """
+        for resource in self.by_resource_id.get(resource_id, []):
+            if resource_type is None or resource.type == resource_type:
+                return resource
+        return None
+
+
 class ResourceDiscovery:
     """
     Utility class for discovering AWS resources by tags.
 
     This class provides methods to find DynamoDB tables, S3 buckets,
     Lambda functions, and IAM roles by filtering on specific tags.
+
+    A name or ARN exported as the ``<ResourceId>Name`` or
+    ``<ResourceId>Arn`` stack output is taken from the outputs. Otherwise,
+    all application resources are fetched on the first lookup and indexed;
+    call ``refresh`` to fetch them again, e.g. after a deployment, or
+    ``wait_for_resources`` to wait for new resources to become taggable.
     """
 
-    def __init__(self):
+    def __init__(self, client: Any = None, outputs: StackOutputs | None = None):
         """
         Initialize the resource discovery utility.
 
+        Args:
+            client: Resource Groups Tagging API client (shared client if None)
+            outputs: Stack output resolver (default locations if None)
+
         Raises:
             ValueError: If application tags are not configured
         """
@@ -59,49 +162,70 @@ class ResourceDiscovery:
             )
             raise ValueError(msg)
 
-        # Initialize AWS clients - let boto3 handle region management
-        self.dynamodb = boto3.client("dynamodb")
-        self.s3 = boto3.client("s3")
-        self.iam = boto3.client("iam")
-        self.lambda_client = boto3.client("lambda")
-        self.resourcegroupstaggingapi = boto3.client("resourcegroupstaggingapi")
+        self.outputs = outputs or StackOutputs()
+        self._client = client
 
         # Get the region from boto3 session for reference
         self.region_name = boto3.Session().region_name
-
-    def get_dynamodb_table_name(self, resource_id: str) -> str | None:
+        self._index: ResourceIndex | None = None
+        self._index_lock = threading.Lock()
+
+    @property
+    def resourcegroupstaggingapi(self) -> Any:
+        """Get the tagging client, created only if the tagging API is needed."""
+        if self._client is None:
+            # Shared AWS client - let boto3 handle region management
+            self._client = aws_clients.client("resourcegroupstaggingapi")
+        return self._client
+
+    @property
+    def index(self) -> ResourceIndex:
+        """Get the resource index, sweeping the account on first use."""
+        if self._index is None:
+            self.refresh()
+        return self._index or ResourceIndex()
+
+    def refresh(self) -> None:
         """
-        Get DynamoDB table name by resource ID tag.
+        Fetch every application resource again and rebuild the index.
 
-        Args:
-            resource_id: The ResourceId tag value to search for
-
-        Returns:
-            Table name if found, None otherwise
+        A failed sweep leaves the index empty, so the next lookup retries.
         """
+        index = ResourceIndex()
         try:
-            # Use Resource Groups Tagging API for efficient tag-based search
-            response = self.resourcegroupstaggingapi.get_resources(
-                ResourceTypeFilters=["dynamodb:table"],
+            paginator = self.resourcegroupstaggingapi.get_paginator("get_resources")
+            pages = paginator.paginate(
                 TagFilters=[
                     {
                         "Key": self.application_tag_key,
                         "Values": [self.application_tag_value],
                     },
-                    {"Key": "ResourceId", "Values": [resource_id]},
                 ],
             )
+            for page in pages:
+                for mapping in page["ResourceTagMappingList"]:
+                    index.add(self._describe(mapping))
+        except ClientError as e:
+            print(f"Error discovering application resources: {e}")
+            self._index = None
+            return
+        self._index = index
 
-            if response["ResourceTagMappingList"]:
-                # Extract table name from ARN
-                table_arn = response["ResourceTagMappingList"][0]["ResourceARN"]
-                return table_arn.split("/")[-1]
+    def get_dynamodb_table_name(self, resource_id: str) -> str | None:
+        """
+        Get DynamoDB table name by resource ID tag.
 
-            return None
+        Args:
+            resource_id: The ResourceId tag value to search for
 
-        except ClientError as e:
-            print(f"Error discovering DynamoDB table: {e}")
-            return None
+        Returns:
+            Table name if found, None otherwise
+        """
+        exported = self.outputs.get(resource_id + NAME_OUTPUT_SUFFIX)
+        if exported is not None:
+            return exported
+        resource = self.index.find(resource_id, "dynamodb:table")
+        return resource.name if resource else None
 
     def get_s3_bucket_name(self, resource_id: str) -> str | None:
         """
@@ -113,29 +237,11 @@ class ResourceDiscovery:
         Returns:
             Bucket name if found, None otherwise
         """
-        try:
-            # Use Resource Groups Tagging API for efficient tag-based search
-            response = self.resourcegroupstaggingapi.get_resources(
-                ResourceTypeFilters=["s3:bucket"],
-                TagFilters=[
-                    {
-                        "Key": self.application_tag_key,
-                        "Values": [self.application_tag_value],
-                    },
-                    {"Key": "ResourceId", "Values": [resource_id]},
-                ],
-            )
-
-            if response["ResourceTagMappingList"]:
-                # Extract bucket name from ARN
-                bucket_arn = response["ResourceTagMappingList"][0]["ResourceARN"]
-                return bucket_arn.split(":")[-1]
-
-            return None
-
-        except ClientError as e:
-            print(f"Error discovering S3 bucket: {e}")
-            return None
+        exported = self.outputs.get(resource_id + NAME_OUTPUT_SUFFIX)
+        if exported is not None:
+            return exported
+        resource = self.index.find(resource_id, "s3:bucket")
+        return resource.name if resource else None
 
     def get_iam_role_arn(self, resource_id: str) -> str | None:
         """
@@ -147,27 +253,11 @@ class ResourceDiscovery:
         Returns:
             Role ARN if found, None otherwise
         """
-        try:
-            # Use Resource Groups Tagging API for efficient tag-based search
-            response = self.resourcegroupstaggingapi.get_resources(
-                ResourceTypeFilters=["iam:role"],
-                TagFilters=[
-                    {
-                        "Key": self.application_tag_key,
-                        "Values": [self.application_tag_value],
-                    },
-                    {"Key": "ResourceId", "Values": [resource_id]},
-                ],
-            )
-
-            if response["ResourceTagMappingList"]:
-                return response["ResourceTagMappingList"][0]["ResourceARN"]
-
-            return None
-
-        except ClientError as e:
-            print(f"Error discovering IAM role: {e}")
-            return None
+        exported = self.outputs.get(resource_id + ARN_OUTPUT_SUFFIX)
+        if exported is not None:
+            return exported
+        resource = self.index.find(resource_id, "iam:role")
+        return resource.arn if resource else None
 
     def get_lambda_function_name(self, resource_id: str) -> str | None:
         """
@@ -179,29 +269,11 @@ class ResourceDiscovery:
         Returns:
             Function name if found, None otherwise
         """
-        try:
-            # Use Resource Groups Tagging API for efficient tag-based search
-            response = self.resourcegroupstaggingapi.get_resources(
-                ResourceTypeFilters=["lambda:function"],
-                TagFilters=[
-                    {
-                        "Key": self.application_tag_key,
-                        "Values": [self.application_tag_value],
-                    },
-                    {"Key": "ResourceId", "Values": [resource_id]},
-                ],
-            )
-
-            if response["ResourceTagMappingList"]:
-                # Extract function name from ARN
-                function_arn = response["ResourceTagMappingList"][0]["ResourceARN"]
-                return function_arn.split(":")[-1]
-
-            return None
-
-        except ClientError as e:
-            print(f"Error discovering Lambda function: {e}")
-            return None
+        exported = self.outputs.get(resource_id + NAME_OUTPUT_SUFFIX)
+        if exported is not None:
+            return exported
+        resource = self.index.find(resource_id, "lambda:function")
+        return resource.name if resource else None
 
     def get_all_application_resources(self) -> dict[str, list[dict[str, Any]]]:
         """
@@ -210,45 +282,17 @@ class ResourceDiscovery:
         Returns:
             Dictionary mapping resource types to lists of resource information
         """
-        try:
-            response = self.resourcegroupstaggingapi.get_resources(
-                TagFilters=[
-                    {
-                        "Key": self.application_tag_key,
-                        "Values": [self.application_tag_value],
-                    },
-                ],
-            )
-
-            resources_by_type = {}
-
-            for resource in response["ResourceTagMappingList"]:
-                resource_arn = resource["ResourceARN"]
-                resource_type = self._extract_resource_type(resource_arn)
-
-                if resource_type not in resources_by_type:
-                    resources_by_type[resource_type] = []
-
-                # Extract ResourceId tag if present
-                resource_id = None
-                for tag in resource["Tags"]:
-                    if tag["Key"] == "ResourceId":
-                        resource_id = tag["Value"]
-                        break
-
-                resources_by_type[resource_type].append(
-                    {
-                        "arn": resource_arn,
-                        "resource_id": resource_id,
-                        "tags": resource["Tags"],
-                    },
-                )
-
-            return resources_by_type
-
-        except ClientError as e:
-            print(f"Error discovering application resources: {e}")
-            return {}
+        return {
+            resource_type: [
+                {
+                    "arn": resource.arn,
+                    "resource_id": resource.resource_id,
+                    "tags": resource.tags,
+                }
+                for resource in resources
+            ]
+            for resource_type, resources in self.index.by_type.items()
+        }
 
     def get_resource_by_id(self, resource_id: str) -> dict[str, Any] | None:
         """
@@ -260,35 +304,36 @@ class ResourceDiscovery:
         Returns:
             Resource information dictionary if found, None otherwise
         """
-        try:
-            response = self.resourcegroupstaggingapi.get_resources(
-                TagFilters=[
-                    {
-                        "Key": self.application_tag_key,
-                        "Values": [self.application_tag_value],
-                    },
-                    {"Key": "ResourceId", "Values": [resource_id]},
-                ],
-            )
+        resource = self.index.find(resource_id)
+        return resource.to_dict() if resource else None
 
-            if response["ResourceTagMappingList"]:
-                resource = response["ResourceTagMappingList"][0]
-                resource_arn = resource["ResourceARN"]
-                resource_type = self._extract_resource_type(resource_arn)
-
-                return {
-                    "arn": resource_arn,
-                    "type": resource_type,
-                    "name": self._extract_resource_name(resource_arn, resource_type),
-                    "resource_id": resource_id,
-                    "tags": resource["Tags"],
-                }
+    def get_resources_by_name(self, name: str) -> list[dict[str, Any]]:
+        """
+        Get every application resource with a given name.
 
-            return None
+        Args:
+            name: Resource name, as extracted from its ARN
 
-        except ClientError as e:
-            print(f"Error discovering resource by ID: {e}")
-            return None
+        Returns:
+            Resource information dictionaries, empty if none match
+        """
+        return [resource.to_dict() for resource in self.index.by_name.get(name, [])]
+
+    def _describe(self, mapping: dict[str, Any]) -> DiscoveredResource:
+        """Describe a resource from its tag mapping."""
+        resource_arn = mapping["ResourceARN"]
+        resource_type = self._extract_resource_type(resource_arn)
+        tags = mapping.get("Tags", [])
+        resource_id = next(
+            (tag["Value"] for tag in tags if tag["Key"] == RESOURCE_ID_TAG), None
+        )
+        return DiscoveredResource(
+            arn=resource_arn,
+            type=resource_type,
+            name=self._extract_resource_name(resource_arn, resource_type),
+            resource_id=resource_id,
+            tags=tags,
+        )
 
     def _extract_resource_type(self, resource_arn: str) -> str:
         """
@@ -363,6 +408,53 @@ class ResourceDiscovery:
 
         return resources
 
+    def wait_for_resources(
+        self,
+        resource_ids: Iterable[str],
+        timeout: float = DEFAULT_READINESS_TIMEOUT_SECONDS,
+        initial_delay: float = DEFAULT_INITIAL_DELAY_SECONDS,
+        max_delay: float = DEFAULT_MAX_DELAY_SECONDS,
+    ) -> Readiness:
+        """
+        Wait for resources to become discoverable after deployment.
+
+        Resources missing from the index are polled concurrently, each with
+        exponential backoff and full jitter, until all resolve or the single
+        overall deadline passes. Resolved resources are added to the index.
+
+        Args:
+            resource_ids: The ResourceId tag values to wait for
+            timeout: Overall time to wait, in seconds
+            initial_delay: Upper bound of the first delay between polls
+            max_delay: Upper bound of any delay between polls
+
+        Returns:
+            The resources that resolved and the ResourceIds that timed out
+        """
+        deadline = Deadline.after(timeout)
+        index = self.index
+        resolved: dict[str, DiscoveredResource] = {}
+        pending = []
+        for resource_id in dict.fromkeys(resource_ids):
+            resource = index.find(resource_id)
+            if resource is None:
+                pending.append(resource_id)
+            else:
+                resolved[resource_id] = resource
+
+        if pending:
+            with ThreadPoolExecutor(len(pending)) as executor:
+                polled = executor.map(
+                    lambda resource_id: self._poll_until_tagged(
+                        resource_id, deadline, initial_delay, max_delay
+                    ),
+                    pending,
+                )
+                for resource_id, resource in zip(pending, polled, strict=True):
+                    if resource is not None:
+                        resolved[resource_id] = resource
+        return Readiness(resolved, frozenset(pending) - resolved.keys())
+
     def wait_for_resource_availability(
         self,
         resource_id: str,
@@ -380,18 +472,69 @@ class ResourceDiscovery:
         Returns:
             True if resource is found, False if timeout
         """
-        for attempt in range(max_attempts):
-            resource = self.get_resource_by_id(resource_id)
-            if resource:
-                return True
-
-            if attempt < max_attempts - 1:
-                time.sleep(delay)
+        readiness = self.wait_for_resources(
+            [resource_id], timeout=(max_attempts - 1) * delay, max_delay=delay
+        )
+        return readiness.ready
 
-        return False
+    def _poll_until_tagged(
+        self,
+        resource_id: str,
+        deadline: Deadline,
+        initial_delay: float,
+        max_delay: float,
+    ) -> DiscoveredResource | None:
+        """Poll for a resource with backoff, indexing it once found."""
+        attempt = 0
+        while True:
+            resource = self._find_tagged(resource_id)
+            if resource is not None:
+                with self._index_lock:
+                    # Only a successful sweep is cached; otherwise the next
+                    # lookup sweeps again and finds the resource anyway
+                    if self._index is not None:
+                        self._index.add(resource)
+                return resource
+            remaining = deadline.remaining()
+            if remaining <= 0:
+                return None
+            backoff = min(max_delay, initial_delay * 2**attempt)
+            time.sleep(min(remaining, random.uniform(0, backoff)))
+            attempt += 1
+
+    def _find_tagged(self, resource_id: str) -> DiscoveredResource | None:
+        """Look a resource up by its ResourceId tag with the tagging API."""
+        try:
+            paginator = self.resourcegroupstaggingapi.get_paginator("get_resources")
+            pages = paginator.paginate(
+                TagFilters=[
+                    {
+                        "Key": self.application_tag_key,
+                        "Values": [self.application_tag_value],
+                    },
+                    {"Key": RESOURCE_ID_TAG, "Values": [resource_id]},
+                ],
+            )
+            for page in pages:
+                for mapping in page["ResourceTagMappingList"]:
+                    return self._describe(mapping)
+        except ClientError as e:
+            print(f"Error discovering resource by ID: {e}")
+        return None
 
 
 # Convenience functions for direct use in tests
+@functools.cache
+def get_resource_discovery() -> ResourceDiscovery:
+    """
+    Get the discovery shared by the test session.
+
+    Returns:
+        The shared ResourceDiscovery, whose index is built on first lookup
+    """
+    return ResourceDiscovery()
+
+
 def get_lambda_function_name(resource_id: str) -> str | None:
     """
     Convenience function to get Lambda function name by resource ID.
@@ -402,8 +545,7 @@ def get_lambda_function_name(resource_id: str) -> str | None:
     Returns:
         Function name if found, None otherwise
     """
-    discovery = ResourceDiscovery()
-    return discovery.get_lambda_function_name(resource_id)
+    return get_resource_discovery().get_lambda_function_name(resource_id)
 
 
 def get_dynamodb_table_name(resource_id: str) -> str | None:
@@ -416,8 +558,7 @@ def get_dynamodb_table_name(resource_id: str) -> str | None:
     Returns:
         Table name if found, None otherwise
     """
-    discovery = ResourceDiscovery()
-    return discovery.get_dynamodb_table_name(resource_id)
+    return get_resource_discovery().get_dynamodb_table_name(resource_id)
 
 
 def get_s3_bucket_name(resource_id: str) -> str | None:
@@ -430,5 +571,4 @@ def get_s3_bucket_name(resource_id: str) -> str | None:
     Returns:
         Bucket name if found, None otherwise
     """
-    discovery = ResourceDiscovery()
-    return discovery.get_s3_bucket_name(resource_id)
+    return get_resource_discovery().get_s3_bucket_name(resource_id)
@@ -0,0 +1,42 @@
+"""
+Loader of the CDK-free definitions of the stacks.
+
+The table and API definitions in ``infrastructure/stacks`` import no CDK
+code, so local stand-ins build the same tables and routes from them as the
+deployed stack. The infrastructure directory is not on the path of the
+tests, so the ``stacks`` package is loaded from its file.
+"""
+
+import functools
+import importlib
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+# Constants
+STACKS_DIR = Path(__file__).parents[3] / "infrastructure" / "stacks"
+STACKS_PACKAGE = "stacks"
+
+
+@functools.cache
+def stack_definitions(module_name: str) -> ModuleType:
+    """
+    Load a definitions module of the stacks.
+
+    Args:
+        module_name: Module of the ``stacks`` package, e.g. "table_definitions"
+
+    Returns:
+        The ``stacks.<module_name>`` module
+    """
+    if STACKS_PACKAGE not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            STACKS_PACKAGE,
+            STACKS_DIR / "__init__.py",
+            submodule_search_locations=[str(STACKS_DIR)],
+        )
+        package = importlib.util.module_from_spec(spec)
+        sys.modules[STACKS_PACKAGE] = package
+        spec.loader.exec_module(package)
+    return importlib.import_module(f"{STACKS_PACKAGE}.{module_name}")
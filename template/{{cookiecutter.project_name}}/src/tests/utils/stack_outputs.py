@@ -0,0 +1,177 @@
+"""
+Stack output resolution for pytest integration tests.
+
+HelloWorldStack exports the names tests need as stack outputs. They are
+resolved, in order, from:
+
+1. The outputs file ``cdk deploy --outputs-file`` writes (``task
+   cdk:deploy``), offline and instantly.
+2. The synthesized templates in ``cdk.out``: outputs with a literal value
+   are read offline; an output referencing a resource is resolved with a
+   single, strongly consistent CloudFormation DescribeStackResource call.
+
+Both locations can be overridden with the CDK_OUTPUTS_FILE and CDK_OUT_DIR
+environment variables.
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from adapters.aws_client_factory import aws_clients
+from botocore.exceptions import ClientError
+
+# Constants
+INFRASTRUCTURE_DIR = Path(__file__).parents[3] / "infrastructure"
+OUTPUTS_FILE_ENV = "CDK_OUTPUTS_FILE"
+CDK_OUT_ENV = "CDK_OUT_DIR"
+DEFAULT_OUTPUTS_FILE = INFRASTRUCTURE_DIR / "cdk-outputs.json"
+DEFAULT_CDK_OUT = INFRASTRUCTURE_DIR / "cdk.out"
+MANIFEST_FILE = "manifest.json"
+STACK_ARTIFACT_TYPE = "aws:cloudformation:stack"
+
+
+@dataclass(frozen=True, slots=True)
+class ResourceReference:
+    """A resource of a synthesized stack, named only once deployed."""
+
+    stack_name: str
+    logical_id: str
+
+
+@dataclass
+class SynthesizedOutputs:
+    """Outputs read from the templates in ``cdk.out``."""
+
+    values: dict[str, str] = field(default_factory=dict)
+    references: dict[str, ResourceReference] = field(default_factory=dict)
+
+
+def read_outputs_file(path: Path) -> dict[str, str]:
+    """
+    Read the outputs of every stack from a ``cdk deploy`` outputs file.
+
+    Args:
+        path: Outputs file, which may not exist
+
+    Returns:
+        Output values by output key, empty if there is no file
+    """
+    if not path.is_file():
+        return {}
+    stacks = json.loads(path.read_text(encoding="utf-8"))
+    return {
+        key: str(value) for outputs in stacks.values() for key, value in outputs.items()
+    }
+
+
+def read_synthesized_outputs(cdk_out: Path) -> SynthesizedOutputs:
+    """
+    Read the outputs of every stack synthesized in a cloud assembly.
+
+    Args:
+        cdk_out: Cloud assembly directory, which may not exist
+
+    Returns:
+        Literal output values and resources referenced by outputs
+    """
+    synthesized = SynthesizedOutputs()
+    manifest_path = cdk_out / MANIFEST_FILE
+    if not manifest_path.is_file():
+        return synthesized
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    for artifact_id, artifact in manifest.get("artifacts", {}).items():
+        if artifact.get("type") != STACK_ARTIFACT_TYPE:
+            continue
+        properties = artifact.get("properties", {})
+        stack_name = properties.get("stackName", artifact_id)
+        template_path = cdk_out / properties["templateFile"]
+        template = json.loads(template_path.read_text(encoding="utf-8"))
+        for key, output in template.get("Outputs", {}).items():
+            _add_output(synthesized, stack_name, key, output.get("Value"))
+    return synthesized
+
+
+def _add_output(
+    synthesized: SynthesizedOutputs, stack_name: str, key: str, value: Any
+) -> None:
+    """Record an output whose value is a literal or a resource reference."""
+    if isinstance(value, str):
+        synthesized.values[key] = value
+    elif isinstance(value, dict) and isinstance(value.get("Ref"), str):
+        synthesized.references[key] = ResourceReference(stack_name, value["Ref"])
+
+
+class StackOutputs:
+    """
+    Resolves stack outputs without the tagging API.
+
+    Files are read on first use; resolved values are cached.
+    """
+
+    def __init__(
+        self,
+        outputs_file: Path | None = None,
+        cdk_out: Path | None = None,
+        client: Any = None,
+    ):
+        """
+        Initialize the resolver.
+
+        Args:
+            outputs_file: ``cdk deploy`` outputs file (CDK_OUTPUTS_FILE or
+                the infrastructure default if None)
+            cdk_out: Cloud assembly directory (CDK_OUT_DIR or the
+                infrastructure default if None)
+            client: CloudFormation client (shared client if None)
+        """
+        self.outputs_file = outputs_file or Path(
+            os.environ.get(OUTPUTS_FILE_ENV, DEFAULT_OUTPUTS_FILE)
+        )
+        self.cdk_out = cdk_out or Path(os.environ.get(CDK_OUT_ENV, DEFAULT_CDK_OUT))
+        self._client = client
+        self._deployed: dict[str, str] | None = None
+        self._synthesized: SynthesizedOutputs | None = None
+
+    def get(self, key: str) -> str | None:
+        """
+        Resolve a stack output.
+
+        Args:
+            key: Output key, e.g. "GreetingsTableName"
+
+        Returns:
+            The output value, or None if it cannot be resolved this way
+        """
+        if self._deployed is None:
+            self._deployed = read_outputs_file(self.outputs_file)
+        if key in self._deployed:
+            return self._deployed[key]
+
+        if self._synthesized is None:
+            self._synthesized = read_synthesized_outputs(self.cdk_out)
+        if key in self._synthesized.values:
+            return self._synthesized.values[key]
+        reference = self._synthesized.references.get(key)
+        if reference is None:
+            return None
+        value = self._describe(reference)
+        if value is not None:
+            self._deployed[key] = value
+        return value
+
+    def _describe(self, reference: ResourceReference) -> str | None:
+        """Get the physical name of a deployed resource from CloudFormation."""
+        if self._client is None:
+            self._client = aws_clients.client("cloudformation")
+        try:
+            response = self._client.describe_stack_resource(
+                StackName=reference.stack_name,
+                LogicalResourceId=reference.logical_id,
+            )
+        except ClientError as e:
+            print(f"Error resolving stack output: {e}")
+            return None
+        return response["StackResourceDetail"]["PhysicalResourceId"]
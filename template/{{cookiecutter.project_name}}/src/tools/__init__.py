@@ -0,0 +1 @@
+"""Operational tools, run from a workstation rather than deployed."""
@@ -0,0 +1,576 @@
+"""
+Bulk load greetings into the greetings table.
+
+Reads a CSV or JSON Lines file (optionally gzipped) one record at a time,
+validates each record into a ``HelloWorld`` and writes the greetings with
+batched writes on a pool of threads. An adaptive rate limiter paces the
+writes: it speeds up while DynamoDB accepts them and backs off when it
+throttles. A record without a version is a seed, written at version 1
+whatever is stored: load seeds into a table before it takes traffic. A
+record with a version only replaces an older stored greeting, or an equal
+one; the others are rejected. Progress is checkpointed to a file after
+every completed batch, so an interrupted load resumes where it stopped,
+and writing again the records loaded since the checkpoint succeeds.
+
+Usage:
+    python -m tools.bulk_loader greetings.csv --checkpoint load.json
+"""
+
+import argparse
+import contextlib
+import csv
+import gzip
+import json
+import os
+import sys
+import time
+from collections import deque
+from collections.abc import Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime, timedelta
+from enum import StrEnum
+from pathlib import Path
+from typing import Any, BinaryIO, TextIO
+
+from adapters.hello_world_storage_adapter import (
+    MAX_BATCH_WRITE_ITEMS,
+    HelloWorldStorageAdapter,
+)
+from models.hello_world_model import EPOCH, HelloWorld
+from observability.metrics import metrics
+from utils.rate_limiter import AdaptiveRateLimiter
+
+# Constants
+DEFAULT_WORKERS = 4
+# Batches queued per worker, bounding the records held in memory
+BATCHES_PER_WORKER = 2
+DEFAULT_INITIAL_RATE = 100.0
+DEFAULT_MAX_RATE = 1000.0
+DEFAULT_MAX_ATTEMPTS = 10
+DEFAULT_REPORT_SECONDS = 5.0
+GZIP_SUFFIX = ".gz"
+ENCODING = "utf-8"
+# Reject of a greeting the table refuses
+CONFLICT_ERROR = "a newer or different greeting is stored at this version or later"
+
+
+class RecordFormat(StrEnum):
+    """Input file formats."""
+
+    CSV = "csv"
+    JSONL = "jsonl"
+
+
+class BulkLoadError(Exception):
+    """Raised when greetings cannot be written after all attempts."""
+
+
+@dataclass
+class Checkpoint:
+    """
+    Progress of a load, as saved between batches.
+
+    ``offset`` is the input position up to which every record has been
+    written or rejected; the counts cover those records. ``rejects_size``
+    is the size of the rejects file holding their rejects, if there is one.
+    """
+
+    input: str
+    offset: int = 0
+    records: int = 0
+    loaded: int = 0
+    rejected: int = 0
+    rejects_size: int | None = None
+
+    @classmethod
+    def load(cls, path: Path, input_path: Path) -> "Checkpoint":
+        """
+        Read the checkpoint of a load, or start a new one.
+
+        Args:
+            path: Checkpoint file, which may not exist yet
+            input_path: Input file being loaded
+
+        Returns:
+            The saved checkpoint, or an empty one
+
+        Raises:
+            ValueError: If the checkpoint belongs to another input file
+        """
+        input_name = str(input_path.resolve())
+        if not path.exists():
+            return cls(input_name)
+        checkpoint = cls(**json.loads(path.read_text(encoding=ENCODING)))
+        if checkpoint.input != input_name:
+            msg = f"Checkpoint {path} is for {checkpoint.input}, not {input_name}"
+            raise ValueError(msg)
+        return checkpoint
+
+    def save(self, path: Path) -> None:
+        """Write the checkpoint atomically, so a crash never truncates it."""
+        staging = path.with_name(f"{path.name}.tmp")
+        staging.write_text(json.dumps(asdict(self)), encoding=ENCODING)
+        staging.replace(path)
+
+
+@dataclass
+class _Batch:
+    """Greetings read from a span of the input, written together."""
+
+    # Input position after the last record of the batch
+    end_offset: int
+    greetings: dict[str, HelloWorld] = field(default_factory=dict)
+    # Position and record each greeting was read from
+    sources: dict[str, tuple[int, dict[str, Any]]] = field(default_factory=dict)
+    records: int = 0
+    # Rejects of the batch, written once it is checkpointed
+    rejects: list[dict[str, Any]] = field(default_factory=list)
+    # Greetings refused by the table
+    conflicts: list[HelloWorld] = field(default_factory=list)
+    done: bool = False
+
+    @property
+    def loaded(self) -> int:
+        """Number of greetings of the batch written to the table."""
+        return len(self.greetings) - len(self.conflicts)
+
+
+def detect_format(path: Path) -> RecordFormat:
+    """
+    Guess the format of an input file from its name.
+
+    Args:
+        path: Input file, e.g. ``greetings.csv`` or ``greetings.jsonl.gz``
+
+    Returns:
+        The record format
+
+    Raises:
+        ValueError: If the suffix is not recognized
+    """
+    suffixes = [suffix for suffix in path.suffixes if suffix != GZIP_SUFFIX]
+    suffix = suffixes[-1].lstrip(".") if suffixes else ""
+    if suffix == "ndjson":
+        return RecordFormat.JSONL
+    try:
+        return RecordFormat(suffix)
+    except ValueError:
+        msg = f"Cannot tell the format of {path}, use --format"
+        raise ValueError(msg) from None
+
+
+def read_records(
+    stream: BinaryIO, record_format: RecordFormat, offset: int = 0
+) -> Iterator[tuple[int, dict[str, Any] | ValueError]]:
+    """
+    Stream the records of an input file, one line at a time.
+
+    CSV records are read against the header row and must each fit on one
+    line. A line that cannot be decoded is yielded as its error, so that
+    it is rejected like any other invalid record.
+
+    Args:
+        stream: Binary input, positioned at its start
+        record_format: Format of the input
+        offset: Position to resume reading from (after the header for CSV)
+
+    Returns:
+        Iterator over (position after the record, record or error)
+    """
+    header = None
+    if record_format == RecordFormat.CSV:
+        header = next(csv.reader([stream.readline().decode(ENCODING)]), None)
+    if offset:
+        stream.seek(offset)
+    for line in iter(stream.readline, b""):
+        if not line.strip():
+            continue
+        try:
+            yield stream.tell(), _decode_line(line, header)
+        except ValueError as e:
+            yield stream.tell(), e
+
+
+def _decode_line(line: bytes, header: list[str] | None) -> dict[str, Any]:
+    """Decode a JSON Lines record, or a CSV row if there is a header."""
+    text = line.decode(ENCODING)
+    if header is None:
+        record = json.loads(text)
+        if not isinstance(record, dict):
+            msg = "Record is not a JSON object"
+            raise ValueError(msg)
+        return record
+    row = next(csv.reader([text]))
+    if len(row) != len(header):
+        msg = f"Expected {len(header)} columns, got {len(row)}"
+        raise ValueError(msg)
+    # Empty cells are missing values
+    return {
+        column: value for column, value in zip(header, row, strict=True) if value != ""
+    }
+
+
+def _reject(offset: int, record: Any, error: str) -> dict[str, Any]:
+    """Describe a rejected record as a line of the rejects file."""
+    rejected = record if isinstance(record, dict) else None
+    return {"offset": offset, "error": error, "record": rejected}
+
+
+def parse_greeting(record: dict[str, Any]) -> HelloWorld:
+    """
+    Validate a record into a greeting.
+
+    Timestamps may be ISO 8601 strings (UTC unless an offset is given) or
+    epoch milliseconds. Other fields than the model's are ignored.
+
+    Args:
+        record: Decoded record
+
+    Returns:
+        The greeting
+
+    Raises:
+        ValueError: If a field is missing or invalid
+    """
+    name = record.get("name")
+    if not isinstance(name, str) or not name.strip():
+        msg = "name is required"
+        raise ValueError(msg)
+    greeting = record.get("greeting")
+    if greeting is not None and not isinstance(greeting, str):
+        msg = "greeting must be a string"
+        raise ValueError(msg)
+    version = record.get("version")
+    if version is not None:
+        version = _parse_int(version, "version")
+        if version < 1:
+            msg = f"version must be at least 1, got {version}"
+            raise ValueError(msg)
+    return HelloWorld(
+        name=name,
+        greeting=greeting,
+        created_at=_parse_timestamp(record.get("created_at"), "created_at"),
+        updated_at=_parse_timestamp(record.get("updated_at"), "updated_at"),
+        version=version,
+    )
+
+
+def _parse_int(value: Any, field_name: str) -> int:
+    """Parse an integer field, from a JSON number or a string of digits."""
+    if isinstance(value, bool) or not isinstance(value, int | str):
+        msg = f"{field_name} must be an integer"
+        raise ValueError(msg)
+    try:
+        return int(value)
+    except ValueError:
+        msg = f"{field_name} must be an integer, got {value!r}"
+        raise ValueError(msg) from None
+
+
+def _parse_timestamp(value: Any, field_name: str) -> datetime | None:
+    """Parse an ISO 8601 or epoch milliseconds timestamp field."""
+    if value is None:
+        return None
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return EPOCH + timedelta(milliseconds=value)
+    if isinstance(value, str) and value.isdigit():
+        return EPOCH + timedelta(milliseconds=int(value))
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        msg = f"{field_name} must be an ISO 8601 timestamp or epoch milliseconds"
+        raise ValueError(msg) from None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+class BulkLoader:
+    """
+    Loads greetings from a stream of records into the greetings table.
+
+    Records are grouped into batches of distinct names (the last record of
+    a name wins), written on a thread pool with at most BATCHES_PER_WORKER
+    batches per worker in flight. Each write waits for the rate limiter;
+    items DynamoDB leaves unprocessed or throttles are retried after
+    telling the limiter to back off. Greetings the table refuses are
+    rejected, and rejects are only written once their batch is
+    checkpointed, so a resumed load does not repeat them.
+    """
+
+    def __init__(
+        self,
+        adapter: HelloWorldStorageAdapter,
+        limiter: AdaptiveRateLimiter,
+        *,
+        workers: int = DEFAULT_WORKERS,
+        batch_size: int = MAX_BATCH_WRITE_ITEMS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        report_seconds: float = DEFAULT_REPORT_SECONDS,
+        progress: TextIO | None = None,
+    ):
+        """
+        Initialize the loader.
+
+        Args:
+            adapter: Storage adapter writing the greetings
+            limiter: Rate limiter of the writes, in items per second
+            workers: Number of concurrent writes
+            batch_size: Greetings per write, at most MAX_BATCH_WRITE_ITEMS
+            max_attempts: Writes of a batch before giving up on it
+            report_seconds: Interval between progress lines
+            progress: Stream of the progress lines (stderr if None)
+
+        Raises:
+            ValueError: If batch_size or workers is out of range
+        """
+        if not 1 <= batch_size <= MAX_BATCH_WRITE_ITEMS:
+            msg = f"batch_size must be between 1 and {MAX_BATCH_WRITE_ITEMS}"
+            raise ValueError(msg)
+        if workers < 1:
+            msg = f"workers must be at least 1, got {workers}"
+            raise ValueError(msg)
+        self.adapter = adapter
+        self.limiter = limiter
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.report_seconds = report_seconds
+        self.progress = progress or sys.stderr
+
+    def load(
+        self,
+        records: Iterator[tuple[int, dict[str, Any] | ValueError]],
+        checkpoint: Checkpoint,
+        checkpoint_path: Path | None = None,
+        rejects: TextIO | None = None,
+    ) -> Checkpoint:
+        """
+        Load records, advancing the checkpoint as batches complete.
+
+        Args:
+            records: Records from ``read_records``, resumed at the
+                checkpoint's offset
+            checkpoint: Progress so far, updated in place
+            checkpoint_path: File the checkpoint is saved to (optional)
+            rejects: Seekable stream receiving each rejected record as a
+                JSON line (optional); rejects written after the checkpoint
+                by an interrupted load are truncated
+
+        Returns:
+            The final checkpoint
+
+        Raises:
+            BulkLoadError: If a batch could not be written
+        """
+        self._checkpoint = checkpoint
+        self._checkpoint_path = checkpoint_path
+        self._rejects = rejects
+        if rejects is not None:
+            if checkpoint.rejects_size is None:
+                checkpoint.rejects_size = rejects.tell()
+            else:
+                rejects.truncate(checkpoint.rejects_size)
+        self._read = checkpoint.records
+        self._rejected = checkpoint.rejected
+        self._loaded = checkpoint.loaded
+        self._order: deque[_Batch] = deque()
+        self._started = self._reported = time.monotonic()
+        self._reported_loaded = self._loaded
+
+        in_flight: dict[Future, _Batch] = {}
+        with ThreadPoolExecutor(self.workers) as executor:
+            try:
+                for batch in self._batches(records):
+                    while len(in_flight) >= self.workers * BATCHES_PER_WORKER:
+                        self._collect(in_flight)
+                    self._order.append(batch)
+                    in_flight[executor.submit(self._write, batch)] = batch
+                    self._report_if_due()
+                while in_flight:
+                    self._collect(in_flight)
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                raise
+        self._report()
+        return checkpoint
+
+    def _batches(
+        self, records: Iterator[tuple[int, dict[str, Any] | ValueError]]
+    ) -> Iterator[_Batch]:
+        """Validate records and group the greetings into batches."""
+        batch = _Batch(self._checkpoint.offset)
+        for offset, record in records:
+            batch.end_offset = offset
+            batch.records += 1
+            self._read += 1
+            try:
+                if isinstance(record, ValueError):
+                    raise record
+                greeting = parse_greeting(record)
+            except ValueError as e:
+                self._rejected += 1
+                batch.rejects.append(_reject(offset, record, str(e)))
+                continue
+            # Re-insert, so the batch holds the last record of the name
+            batch.greetings.pop(greeting.name, None)
+            batch.greetings[greeting.name] = greeting
+            batch.sources[greeting.name] = (offset, record)
+            if len(batch.greetings) == self.batch_size:
+                yield batch
+                batch = _Batch(offset)
+        if batch.records:
+            yield batch
+
+    def _write(self, batch: _Batch) -> None:
+        """Write a batch, retrying what is not written at the limiter's pace."""
+        pending = list(batch.greetings.values())
+        for _ in range(self.max_attempts):
+            if not pending:
+                return
+            self.limiter.acquire(len(pending))
+            result = self.adapter.put_greetings(pending)
+            batch.conflicts.extend(result.conflicts)
+            # Greetings left over by refused ones are resubmitted at once
+            if result.unprocessed and not result.conflicts:
+                self.limiter.on_throttle()
+            else:
+                self.limiter.on_success()
+            pending = result.unprocessed
+        if pending:
+            msg = (
+                f"{len(pending)} greetings not written after "
+                f"{self.max_attempts} attempts"
+            )
+            raise BulkLoadError(msg)
+
+    def _collect(self, in_flight: dict[Future, _Batch]) -> None:
+        """Wait for writes to complete, then advance the checkpoint."""
+        done, _ = wait(in_flight, self.report_seconds, FIRST_COMPLETED)
+        for future in done:
+            batch = in_flight.pop(future)
+            future.result()
+            batch.done = True
+            for greeting in batch.conflicts:
+                offset, record = batch.sources[greeting.name]
+                batch.rejects.append(_reject(offset, record, CONFLICT_ERROR))
+            self._loaded += batch.loaded
+            self._rejected += len(batch.conflicts)
+
+        # Only the completed prefix of the input is safe to skip on resume
+        checkpoint = self._checkpoint
+        advanced = False
+        while self._order and self._order[0].done:
+            batch = self._order.popleft()
+            checkpoint.offset = batch.end_offset
+            checkpoint.records += batch.records
+            checkpoint.rejected += len(batch.rejects)
+            checkpoint.loaded += batch.loaded
+            self._write_rejects(batch.rejects)
+            advanced = True
+        if advanced and self._rejects is not None:
+            self._rejects.flush()
+            checkpoint.rejects_size = self._rejects.tell()
+        if advanced and self._checkpoint_path is not None:
+            checkpoint.save(self._checkpoint_path)
+        self._report_if_due()
+
+    def _write_rejects(self, rejects: list[dict[str, Any]]) -> None:
+        """Write rejects to the rejects stream, if there is one."""
+        if self._rejects is not None:
+            for reject in rejects:
+                self._rejects.write(json.dumps(reject, default=str) + "\n")
+
+    def _report_if_due(self) -> None:
+        """Print a progress line if the report interval has elapsed."""
+        if time.monotonic() - self._reported >= self.report_seconds:
+            self._report()
+
+    def _report(self) -> None:
+        """Print the progress and the throughput since the last report."""
+        now = time.monotonic()
+        elapsed = max(now - self._reported, 1e-9)
+        throughput = (self._loaded - self._reported_loaded) / elapsed
+        self._reported, self._reported_loaded = now, self._loaded
+        print(
+            f"[{now - self._started:7.1f}s] records={self._read} "
+            f"loaded={self._loaded} rejected={self._rejected} "
+            f"items/s={throughput:.0f} limit={self.limiter.rate:.0f}/s "
+            f"throttles={self.limiter.throttles}",
+            file=self.progress,
+            flush=True,
+        )
+        # Nothing flushes invocation metrics in a long-running process
+        metrics.clear()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Run a bulk load from the command line.
+
+    Args:
+        argv: Command line arguments (sys.argv if None)
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("input", type=Path, help="CSV or JSON Lines file, or .gz")
+    parser.add_argument("--format", type=RecordFormat, choices=list(RecordFormat))
+    parser.add_argument("--table", help="Table name (HELLO_WORLD_TABLE_NAME)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--batch-size", type=int, default=MAX_BATCH_WRITE_ITEMS)
+    parser.add_argument(
+        "--initial-rate",
+        type=float,
+        default=DEFAULT_INITIAL_RATE,
+        help="Starting write rate, in items per second",
+    )
+    parser.add_argument("--max-rate", type=float, default=DEFAULT_MAX_RATE)
+    parser.add_argument("--checkpoint", type=Path, help="Resume file")
+    parser.add_argument("--rejects", type=Path, help="JSON Lines of rejects")
+    parser.add_argument("--report-every", type=float, default=DEFAULT_REPORT_SECONDS)
+    args = parser.parse_args(argv)
+
+    if args.table:
+        os.environ["HELLO_WORLD_TABLE_NAME"] = args.table
+    try:
+        record_format = args.format or detect_format(args.input)
+        checkpoint = (
+            Checkpoint.load(args.checkpoint, args.input)
+            if args.checkpoint
+            else Checkpoint(str(args.input.resolve()))
+        )
+        loader = BulkLoader(
+            HelloWorldStorageAdapter(),
+            AdaptiveRateLimiter(args.initial_rate, max_rate=args.max_rate),
+            workers=args.workers,
+            batch_size=args.batch_size,
+            report_seconds=args.report_every,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    opener = gzip.open if args.input.suffix == GZIP_SUFFIX else open
+    with (
+        opener(args.input, "rb") as stream,
+        (
+            args.rejects.open("a", encoding=ENCODING)
+            if args.rejects
+            else contextlib.nullcontext()
+        ) as rejects,
+    ):
+        try:
+            loader.load(
+                read_records(stream, record_format, checkpoint.offset),
+                checkpoint,
+                args.checkpoint,
+                rejects,
+            )
+        except BulkLoadError as e:
+            print(f"Bulk load stopped: {e!s}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""
+Add the listing attribute to greetings saved without it.
+
+Greetings saved before the recency index existed have no ``listing``
+attribute, so they are missing from listings. The backfill scans the
+greetings table for them in parallel segments and sets the attribute of
+each, to the shard a save would have picked. It can be run again safely,
+and while functions are saving greetings: an update only applies to a
+greeting still without the attribute.
+
+Usage:
+    python -m tools.listing_backfill --table Greetings
+"""
+
+import argparse
+import os
+import sys
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from adapters.aws_client_factory import aws_clients, get_client_profile
+from adapters.greeting_listing import (
+    KEY_ATTRIBUTE,
+    LISTING_ATTRIBUTE,
+    build_backfill_request,
+    parallel_scan,
+)
+from adapters.greeting_upsert import CONDITIONAL_CHECK_FAILED
+from adapters.hello_world_storage_adapter import EXPORT_CLIENT_PROFILE
+from botocore.exceptions import ClientError
+from config.config_service import config
+from ports.hello_world_port import DEFAULT_EXPORT_SEGMENTS
+
+
+@dataclass
+class BackfillResult:
+    """Outcome of a backfill."""
+
+    # Greetings given the listing attribute
+    updated: int = 0
+    # Greetings found without it that were saved or deleted meanwhile
+    skipped: int = 0
+
+
+def backfill_listing(
+    table_name: str, segments: int = DEFAULT_EXPORT_SEGMENTS
+) -> BackfillResult:
+    """
+    Set the listing attribute of every greeting of a table without it.
+
+    Args:
+        table_name: Greetings table
+        segments: Number of parts of the table scanned in parallel
+
+    Returns:
+        The number of greetings updated and skipped
+
+    Raises:
+        ValueError: If segments is lower than 1
+    """
+    profile = get_client_profile(EXPORT_CLIENT_PROFILE)
+
+    def table():
+        return aws_clients.resource("dynamodb", profile).Table(table_name)
+
+    pages = parallel_scan(
+        lambda **request: table().scan(**request),
+        segments,
+        ProjectionExpression="#name",
+        FilterExpression="attribute_not_exists(#listing)",
+        ExpressionAttributeNames={
+            "#name": KEY_ATTRIBUTE,
+            "#listing": LISTING_ATTRIBUTE,
+        },
+    )
+    result = BackfillResult()
+    for page in pages:
+        for item in page["Items"]:
+            try:
+                table().update_item(**build_backfill_request(item[KEY_ATTRIBUTE]))
+            except ClientError as e:
+                if e.response["Error"]["Code"] != CONDITIONAL_CHECK_FAILED:
+                    raise
+                result.skipped += 1
+            else:
+                result.updated += 1
+    return result
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Run a backfill from the command line.
+
+    Args:
+        argv: Command line arguments (sys.argv if None)
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--table", help="Table name (HELLO_WORLD_TABLE_NAME)")
+    parser.add_argument("--segments", type=int, default=DEFAULT_EXPORT_SEGMENTS)
+    args = parser.parse_args(argv)
+
+    if args.table:
+        os.environ["HELLO_WORLD_TABLE_NAME"] = args.table
+    try:
+        result = backfill_listing(config.settings.hello_world_table_name, args.segments)
+    except ValueError as e:
+        parser.error(str(e))
+    print(
+        f"Added the listing attribute to {result.updated} greetings "
+        f"({result.skipped} changed meanwhile)",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,818 @@
+"""
+Generate load against the hello world Lambda handler.
+
+Replays a weighted mix of requests against ``lambda_handler``, either
+in-process or through a local HTTP endpoint such as the API emulator, and
+records HDR-style latency histograms, throughput and CPU time per request.
+Reports are written as JSON, so that runs on two commits can be compared
+when sizing the memory and concurrency of the function.
+
+The load runs in one of two modes:
+
+- closed loop: a fixed number of clients each send a request as soon as
+  their previous one completes;
+- open loop: requests arrive at a constant rate whatever the response
+  times. Latency is measured from the time a request was due, so that the
+  time requests wait for a saturated target is counted rather than hidden
+  (no coordinated omission).
+
+Usage:
+    python -m tools.load_generator --mode open --rate 200 --duration 30 \\
+        --mix hot=70,cold=20,list=5,write=5 --output load.json
+"""
+
+import argparse
+import contextlib
+import itertools
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import StrEnum
+from pathlib import Path
+from typing import Any
+from urllib.error import HTTPError
+from urllib.parse import urlencode
+from urllib.request import Request as HttpRequest
+from urllib.request import urlopen
+
+from adapters.in_memory_hello_world_adapter import (
+    FaultProfile,
+    InMemoryHelloWorldAdapter,
+)
+from domain.services.hello_world_service import HelloWorldService
+from ports.hello_world_port import HelloWorldPort
+
+# Constants
+DEFAULT_DURATION_SECONDS = 10.0
+DEFAULT_CONCURRENCY = 8
+DEFAULT_RATE = 100.0
+DEFAULT_MIX = "hot=80,cold=15,list=5"
+DEFAULT_HOT_NAMES = 100
+DEFAULT_TIMEOUT_SECONDS = 30.0
+LIST_PAGE_SIZE = 10
+REPORTED_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+# Buckets of 2**SUB_BUCKET_BITS values per power of two: values are kept
+# within 1% of their bucket
+SUB_BUCKET_BITS = 8
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+SUB_BUCKET_HALF = SUB_BUCKET_COUNT // 2
+MICROSECONDS = 1_000_000
+MILLISECONDS = 1000
+HTTP_OK = 200
+HTTP_SERVER_ERROR = 500
+# Status of a request that got no response at all
+NO_RESPONSE = 0
+FUNCTION_NAME = "hello-world-load"
+ENCODING = "utf-8"
+
+
+class LoopMode(StrEnum):
+    """Ways of pacing the requests."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+
+
+class RequestKind(StrEnum):
+    """Kinds of requests in a mix."""
+
+    # Greeting of a name saved before the run
+    HOT = "hot"
+    # Greeting of a name never saved, answered with the default greeting
+    COLD = "cold"
+    # First page of the most recent greetings
+    LIST = "list"
+    # Greeting saved through the batch handler, as one SQS message
+    WRITE = "write"
+
+
+class LatencyHistogram:
+    """
+    Histogram of durations with HDR-style log-linear buckets.
+
+    Durations are counted in microsecond buckets that widen with their
+    value, a power of two at a time, so that every duration is kept within
+    1% from microseconds to minutes in a few kilobytes. Histograms of
+    several workers or runs merge exactly.
+    """
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self.counts: Counter[int] = Counter()
+        self.count = 0
+        self.total_us = 0
+        self.max_us = 0
+
+    def record(self, seconds: float) -> None:
+        """
+        Record a duration.
+
+        Args:
+            seconds: Duration in seconds
+        """
+        value = max(0, round(seconds * MICROSECONDS))
+        self.counts[_bucket_index(value)] += 1
+        self.count += 1
+        self.total_us += value
+        self.max_us = max(self.max_us, value)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Add the durations of another histogram to this one.
+
+        Args:
+            other: Histogram to add
+        """
+        self.counts.update(other.counts)
+        self.count += other.count
+        self.total_us += other.total_us
+        self.max_us = max(self.max_us, other.max_us)
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Get the duration below which a share of the durations fall.
+
+        Args:
+            percentile: Share of the durations, between 0 and 100
+
+        Returns:
+            Highest duration of the bucket holding the percentile, in
+            seconds (0 if the histogram is empty)
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(percentile / 100 * self.count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(_bucket_upper(index), self.max_us) / MICROSECONDS
+        return self.max_us / MICROSECONDS
+
+    @property
+    def mean(self) -> float:
+        """Mean duration in seconds (0 if the histogram is empty)."""
+        return self.total_us / self.count / MICROSECONDS if self.count else 0.0
+
+    def summary(self) -> dict[str, float]:
+        """
+        Summarize the histogram.
+
+        Returns:
+            Count, then mean, reported percentiles and maximum in milliseconds
+        """
+        summary = {"count": self.count, "mean": self.mean * MILLISECONDS}
+        for percentile in REPORTED_PERCENTILES:
+            summary[f"p{percentile:g}"] = self.percentile(percentile) * MILLISECONDS
+        summary["max"] = self.max_us / MICROSECONDS * MILLISECONDS
+        return {key: round(value, 3) for key, value in summary.items()}
+
+    def buckets(self) -> list[list[int]]:
+        """
+        List the non-empty buckets.
+
+        Returns:
+            [highest duration in microseconds, count] of every bucket, in
+            increasing order
+        """
+        return [
+            [_bucket_upper(index), self.counts[index]] for index in sorted(self.counts)
+        ]
+
+
+def _bucket_index(value: int) -> int:
+    """Get the bucket of a duration in microseconds."""
+    if value < SUB_BUCKET_COUNT:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return (shift * SUB_BUCKET_HALF) + (value >> shift)
+
+
+def _bucket_upper(index: int) -> int:
+    """Get the highest duration in microseconds counted in a bucket."""
+    if index < SUB_BUCKET_COUNT:
+        return index
+    shift = index // SUB_BUCKET_HALF - 1
+    sub_bucket = index - shift * SUB_BUCKET_HALF
+    return ((sub_bucket + 1) << shift) - 1
+
+
+@dataclass(frozen=True)
+class RequestMix:
+    """Relative weights of the kinds of requests sent."""
+
+    weights: dict[RequestKind, float]
+
+    def __post_init__(self):
+        """
+        Validate the weights.
+
+        Raises:
+            ValueError: If a weight is negative or they are all zero
+        """
+        if any(weight < 0 for weight in self.weights.values()):
+            msg = f"Request weights must not be negative: {self}"
+            raise ValueError(msg)
+        if not any(self.weights.values()):
+            msg = "At least one request weight must be positive"
+            raise ValueError(msg)
+
+    @classmethod
+    def parse(cls, text: str) -> "RequestMix":
+        """
+        Parse a mix written as comma-separated ``kind=weight`` pairs.
+
+        Args:
+            text: Mix, e.g. "hot=70,cold=20,write=10"
+
+        Returns:
+            The request mix
+
+        Raises:
+            ValueError: If a kind or weight is invalid
+        """
+        weights = {}
+        for pair in text.split(","):
+            kind, separator, weight = pair.partition("=")
+            if not separator:
+                msg = f"Expected kind=weight, got {pair!r}"
+                raise ValueError(msg)
+            weights[RequestKind(kind.strip())] = float(weight)
+        return cls(weights)
+
+    @property
+    def kinds(self) -> set[RequestKind]:
+        """Kinds of requests sent at all."""
+        return {kind for kind, weight in self.weights.items() if weight}
+
+    def __str__(self) -> str:
+        """Format the mix as parsed by ``parse``."""
+        return ",".join(f"{kind}={weight:g}" for kind, weight in self.weights.items())
+
+
+@dataclass(frozen=True)
+class LoadRequest:
+    """A request of the mix, as the event of the handler serving it."""
+
+    kind: RequestKind
+    event: dict[str, Any]
+
+
+class EventFactory:
+    """Draws the requests of a mix, with their events."""
+
+    def __init__(
+        self,
+        mix: RequestMix,
+        hot_names: int = DEFAULT_HOT_NAMES,
+        seed: int | None = None,
+    ):
+        """
+        Initialize the factory.
+
+        Args:
+            mix: Weights of the kinds of requests
+            hot_names: Number of names saved before the run
+            seed: Seed of the draws, for a reproducible sequence of requests
+        """
+        self.mix = mix
+        self.hot_names = [f"hot-{index}" for index in range(hot_names)]
+        self._kinds = list(mix.weights)
+        self._weights = list(mix.weights.values())
+        self._random = random.Random(seed)
+        self._numbers = itertools.count()
+        # Cold names are unique to the run, so none of them is ever saved
+        self._run_id = uuid.uuid4().hex[:8]
+        self._lock = threading.Lock()
+
+    def next(self) -> LoadRequest:
+        """
+        Draw the next request.
+
+        Returns:
+            The request
+        """
+        with self._lock:
+            (kind,) = self._random.choices(self._kinds, self._weights)
+            hot_name = self._random.choice(self.hot_names)
+            number = next(self._numbers)
+        if kind is RequestKind.HOT:
+            event = api_event("/hello", {"name": hot_name})
+        elif kind is RequestKind.COLD:
+            event = api_event("/hello", {"name": f"cold-{self._run_id}-{number}"})
+        elif kind is RequestKind.LIST:
+            event = api_event("/greetings", {"limit": str(LIST_PAGE_SIZE)})
+        else:
+            event = sqs_event([(hot_name, f"Hi {hot_name} #{number}")])
+        return LoadRequest(kind, event)
+
+
+def api_event(resource: str, query: dict[str, str]) -> dict[str, Any]:
+    """
+    Build the API Gateway proxy event of a GET request.
+
+    Args:
+        resource: API resource, e.g. "/hello"
+        query: Query string parameters
+
+    Returns:
+        The event
+    """
+    return {
+        "resource": resource,
+        "path": resource,
+        "httpMethod": "GET",
+        "headers": {},
+        "queryStringParameters": query,
+        "pathParameters": None,
+        "requestContext": {},
+        "body": None,
+        "isBase64Encoded": False,
+    }
+
+
+def sqs_event(greetings: list[tuple[str, str]]) -> dict[str, Any]:
+    """
+    Build the SQS event of greetings to save.
+
+    Args:
+        greetings: (name, greeting) of every message
+
+    Returns:
+        The event
+    """
+    return {
+        "Records": [
+            {
+                "eventSource": "aws:sqs",
+                "messageId": str(uuid.uuid4()),
+                "body": json.dumps({"name": name, "greeting": greeting}),
+            }
+            for name, greeting in greetings
+        ]
+    }
+
+
+@dataclass(frozen=True)
+class Response:
+    """Outcome of a request."""
+
+    status: int
+    # CPU time spent serving the request, when the target can tell
+    cpu_seconds: float | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the request got a response other than a server error."""
+        return NO_RESPONSE < self.status < HTTP_SERVER_ERROR
+
+
+class LoadContext:
+    """Lambda context of an in-process invocation."""
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT_SECONDS):
+        self.function_name = FUNCTION_NAME
+        self.aws_request_id = str(uuid.uuid4())
+        self._deadline = time.monotonic() + timeout
+
+    def get_remaining_time_in_millis(self) -> int:
+        """Get the time left before the invocation times out."""
+        return max(0, int((self._deadline - time.monotonic()) * MILLISECONDS))
+
+
+class InProcessTarget:
+    """
+    Invokes the handlers of the hello world function in this process.
+
+    CPU time is measured per request on the thread serving it. Metric
+    documents printed by the handlers are discarded while the target is
+    open.
+    """
+
+    name = "in-process"
+    kinds = frozenset(RequestKind)
+
+    def __init__(self, port: HelloWorldPort | None = None):
+        """
+        Initialize the target.
+
+        Args:
+            port: Port the handlers serve greetings from (the configured
+                greetings table if None)
+        """
+        if port is not None:
+            # Never used with an injected port, but validated on import
+            os.environ.setdefault("HELLO_WORLD_TABLE_NAME", "GreetingsTable")
+        # Imported once the environment is configured, as in Lambda
+        from functions.hello_world import handler  # noqa: PLC0415
+
+        self._handler = handler
+        self._default_service = handler._service
+        if port is not None:
+            service = HelloWorldService(port)
+            handler._service = lambda _settings: service
+        self._output = contextlib.ExitStack()
+        self._output.enter_context(
+            contextlib.redirect_stdout(self._output.enter_context(_devnull()))
+        )
+
+    def seed(self, names: list[str]) -> None:
+        """
+        Save a greeting for every name.
+
+        Args:
+            names: Names to save
+        """
+        event = sqs_event([(name, f"Hello {name}") for name in names])
+        self._handler.batch_lambda_handler(event, LoadContext())
+
+    def send(self, request: LoadRequest) -> Response:
+        """
+        Serve a request.
+
+        Args:
+            request: Request to serve
+
+        Returns:
+            Status of the response and CPU time spent serving it
+        """
+        start = time.thread_time()
+        if request.kind is RequestKind.WRITE:
+            result = self._handler.batch_lambda_handler(request.event, LoadContext())
+            status = HTTP_SERVER_ERROR if result["batchItemFailures"] else HTTP_OK
+        else:
+            result = self._handler.lambda_handler(request.event, LoadContext())
+            status = result["statusCode"]
+        return Response(status, time.thread_time() - start)
+
+    def close(self) -> None:
+        """Restore the handler service and the standard output."""
+        self._handler._service = self._default_service
+        self._output.close()
+
+
+class HttpTarget:
+    """
+    Sends the API requests of a mix to a local HTTP endpoint.
+
+    Writes have no API route, so mixes with writes cannot be sent.
+    """
+
+    name = "http"
+    kinds = frozenset({RequestKind.HOT, RequestKind.COLD, RequestKind.LIST})
+
+    def __init__(self, base_url: str, timeout: float = DEFAULT_TIMEOUT_SECONDS):
+        """
+        Initialize the target.
+
+        Args:
+            base_url: URL of the API root, e.g. "http://127.0.0.1:3000"
+            timeout: Time to wait for each response in seconds
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+
+    def send(self, request: LoadRequest) -> Response:
+        """
+        Send a request.
+
+        Args:
+            request: Request to send
+
+        Returns:
+            Status of the response
+        """
+        event = request.event
+        url = f"{self.base_url}{event['path']}"
+        if event["queryStringParameters"]:
+            url = f"{url}?{urlencode(event['queryStringParameters'])}"
+        http_request = HttpRequest(url, method=event["httpMethod"])
+        try:
+            with urlopen(http_request, timeout=self.timeout) as response:
+                response.read()
+                return Response(response.status)
+        except HTTPError as e:
+            return Response(e.code)
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+@dataclass
+class LoadReport:
+    """Latencies, throughput and CPU time of a load run."""
+
+    mode: LoopMode
+    target: str
+    mix: RequestMix
+    concurrency: int
+    rate: float | None
+    elapsed_seconds: float = 0.0
+    errors: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    cpu: LatencyHistogram = field(default_factory=LatencyHistogram)
+    kinds: dict[RequestKind, LatencyHistogram] = field(default_factory=dict)
+
+    @property
+    def requests(self) -> int:
+        """Number of requests completed."""
+        return self.latency.count
+
+    @property
+    def throughput(self) -> float:
+        """Requests completed per second."""
+        return self.requests / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the report to a JSON-serializable dictionary.
+
+        Returns:
+            Run parameters and environment, then the results; durations
+            are in milliseconds
+        """
+        return {
+            "parameters": {
+                "mode": self.mode.value,
+                "target": self.target,
+                "mix": str(self.mix),
+                "concurrency": self.concurrency,
+                "rate": self.rate,
+            },
+            "environment": {
+                "commit": _git_commit(),
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "cpus": os.cpu_count(),
+            },
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "requests": self.requests,
+            "errors": self.errors,
+            "throughput_rps": round(self.throughput, 1),
+            "latency_ms": self.latency.summary(),
+            "cpu_ms_per_request": self.cpu.summary() if self.cpu.count else None,
+            "kinds": {
+                kind.value: histogram.summary()
+                for kind, histogram in self.kinds.items()
+            },
+            "latency_histogram_us": self.latency.buckets(),
+        }
+
+    def render(self) -> str:
+        """Format the report for a terminal."""
+        lines = [
+            f"{self.mode} loop, {self.target}, mix {self.mix}: "
+            f"{self.requests} requests in {self.elapsed_seconds:.1f}s "
+            f"({self.throughput:,.1f}/s), {self.errors} errors",
+            _render_row("all", self.latency),
+        ]
+        lines += [
+            _render_row(kind, histogram) for kind, histogram in self.kinds.items()
+        ]
+        if self.cpu.count:
+            lines.append(_render_row("cpu time", self.cpu))
+        return "\n".join(lines)
+
+
+def _render_row(label: str, histogram: LatencyHistogram) -> str:
+    """Format a histogram as a report line."""
+    summary = histogram.summary()
+    percentiles = " ".join(
+        f"{key}={value:.2f}ms" for key, value in summary.items() if key[0] == "p"
+    )
+    return (
+        f"  {label:<9} n={histogram.count:<8} {percentiles} max={summary['max']:.2f}ms"
+    )
+
+
+class LoadGenerator:
+    """Sends the requests of a mix to a target and records their latencies."""
+
+    def __init__(
+        self,
+        target: InProcessTarget | HttpTarget,
+        events: EventFactory,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ):
+        """
+        Initialize the generator.
+
+        Args:
+            target: Where requests are sent
+            events: Requests of the mix
+            concurrency: Number of requests in flight at most
+
+        Raises:
+            ValueError: If the target cannot send some requests of the mix
+        """
+        unsupported = events.mix.kinds - target.kinds
+        if unsupported:
+            msg = (
+                f"The {target.name} target cannot send "
+                f"{', '.join(sorted(unsupported))} requests"
+            )
+            raise ValueError(msg)
+        self.target = target
+        self.events = events
+        self.concurrency = concurrency
+        self._report: LoadReport | None = None
+        self._lock = threading.Lock()
+
+    def run_closed(
+        self, duration_seconds: float = DEFAULT_DURATION_SECONDS
+    ) -> LoadReport:
+        """
+        Send requests from ``concurrency`` clients, each waiting for its
+        previous response.
+
+        Args:
+            duration_seconds: Time after which no request is sent
+
+        Returns:
+            The report of the run
+        """
+        report = self._start(LoopMode.CLOSED, None)
+        start = time.perf_counter()
+        end = start + duration_seconds
+
+        def client() -> None:
+            while time.perf_counter() < end:
+                self._send(self.events.next(), time.perf_counter())
+
+        with ThreadPoolExecutor(self.concurrency) as executor:
+            for future in [executor.submit(client) for _ in range(self.concurrency)]:
+                future.result()
+        report.elapsed_seconds = time.perf_counter() - start
+        return report
+
+    def run_open(
+        self,
+        rate: float = DEFAULT_RATE,
+        duration_seconds: float = DEFAULT_DURATION_SECONDS,
+    ) -> LoadReport:
+        """
+        Send requests at a constant rate, whatever the response times.
+
+        Requests are due every 1 / rate seconds and their latency counts
+        from then: when all ``concurrency`` requests in flight are slow, the
+        next ones wait, and their waiting time is part of their latency.
+
+        Args:
+            rate: Requests per second
+            duration_seconds: Time during which requests are due
+
+        Returns:
+            The report of the run
+
+        Raises:
+            ValueError: If the rate is not positive
+        """
+        if rate <= 0:
+            msg = f"rate must be positive, got {rate}"
+            raise ValueError(msg)
+        report = self._start(LoopMode.OPEN, rate)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(self.concurrency) as executor:
+            for index in range(math.floor(rate * duration_seconds)):
+                due = start + index / rate
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                executor.submit(self._send, self.events.next(), due)
+        report.elapsed_seconds = time.perf_counter() - start
+        return report
+
+    def _start(self, mode: LoopMode, rate: float | None) -> LoadReport:
+        """Start the report of a run."""
+        self._report = LoadReport(
+            mode, self.target.name, self.events.mix, self.concurrency, rate
+        )
+        return self._report
+
+    def _send(self, request: LoadRequest, due: float) -> None:
+        """Send a request due at a time, recording its outcome."""
+        try:
+            response = self.target.send(request)
+        except Exception:
+            response = Response(NO_RESPONSE)
+        latency = time.perf_counter() - due
+        report = self._report
+        with self._lock:
+            report.latency.record(latency)
+            report.kinds.setdefault(request.kind, LatencyHistogram()).record(latency)
+            if response.cpu_seconds is not None:
+                report.cpu.record(response.cpu_seconds)
+            if not response.ok:
+                report.errors += 1
+
+
+@contextlib.contextmanager
+def _devnull():
+    """Open the null device for writing."""
+    with Path(os.devnull).open("w", encoding=ENCODING) as devnull:
+        yield devnull
+
+
+def _git_commit() -> str | None:
+    """Get the commit checked out, if run from a git working tree."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Run a load test from the command line.
+
+    Args:
+        argv: Command line arguments (sys.argv if None)
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--mode", type=LoopMode, choices=list(LoopMode), default=LoopMode.CLOSED
+    )
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION_SECONDS)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument(
+        "--rate", type=float, default=DEFAULT_RATE, help="Requests per second"
+    )
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="e.g. hot=70,cold=30")
+    parser.add_argument("--hot-names", type=int, default=DEFAULT_HOT_NAMES)
+    parser.add_argument("--seed", type=int, help="Seed of the request draws")
+    parser.add_argument(
+        "--url", help="Send requests to this HTTP endpoint instead (not seeded)"
+    )
+    parser.add_argument(
+        "--storage",
+        choices=["memory", "dynamodb"],
+        default="memory",
+        help="Storage of the in-process handler (dynamodb: HELLO_WORLD_TABLE_NAME)",
+    )
+    parser.add_argument(
+        "--storage-latency-ms",
+        type=float,
+        default=0.0,
+        help="Latency of in-memory storage calls",
+    )
+    parser.add_argument("--output", type=Path, help="JSON report file")
+    args = parser.parse_args(argv)
+
+    try:
+        events = EventFactory(RequestMix.parse(args.mix), args.hot_names, args.seed)
+        if args.url:
+            target = HttpTarget(args.url)
+        else:
+            port = None
+            if args.storage == "memory":
+                port = InMemoryHelloWorldAdapter(
+                    FaultProfile(latency_ms=args.storage_latency_ms)
+                )
+            target = InProcessTarget(port)
+    except ValueError as e:
+        parser.error(str(e))
+
+    try:
+        generator = LoadGenerator(target, events, args.concurrency)
+        if isinstance(target, InProcessTarget):
+            target.seed(events.hot_names)
+        if args.mode is LoopMode.OPEN:
+            report = generator.run_open(args.rate, args.duration)
+        else:
+            report = generator.run_closed(args.duration)
+    except ValueError as e:
+        parser.error(str(e))
+    finally:
+        target.close()
+
+    print(report.render())
+    if args.output:
+        args.output.write_text(
+            json.dumps(report.to_dict(), indent=2) + "\n", encoding=ENCODING
+        )
+        print(f"Report written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
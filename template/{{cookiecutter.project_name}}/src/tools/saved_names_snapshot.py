@@ -0,0 +1,113 @@
+"""
+Build the Bloom filter snapshot of saved names.
+
+Exports every greeting of the greetings table and writes a filter of their
+names to a snapshot, as loaded by the Hello World function from
+HELLO_WORLD_SAVED_NAMES_SNAPSHOT. The snapshot is stamped with the time the
+export started: functions bypass it once it is older than
+HELLO_WORLD_SAVED_NAMES_MAX_AGE_SECONDS, so run the builder more often than
+that, writing to the S3 object the functions reload from.
+
+Usage:
+    python -m tools.saved_names_snapshot s3://bucket/saved-names.bloom \
+        --table Greetings
+"""
+
+import argparse
+import math
+import os
+import sys
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+from adapters.hello_world_storage_adapter import HelloWorldStorageAdapter
+from adapters.saved_names_filter_adapter import write_snapshot
+from ports.hello_world_port import DEFAULT_EXPORT_SEGMENTS, GreetingCatalogPort
+from utils.bloom_filter import DEFAULT_FALSE_POSITIVE_RATE, BloomFilter
+
+# Constants
+# Room for the names saved while the snapshot is in use
+DEFAULT_CAPACITY_HEADROOM = 1.25
+
+
+def build_snapshot(
+    port: GreetingCatalogPort,
+    *,
+    segments: int = DEFAULT_EXPORT_SEGMENTS,
+    capacity_headroom: float = DEFAULT_CAPACITY_HEADROOM,
+    false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE,
+) -> BloomFilter:
+    """
+    Build the filter of the names with a saved greeting.
+
+    Args:
+        port: Port exporting the saved greetings
+        segments: Number of parts of the greetings read in parallel
+        capacity_headroom: Capacity of the filter relative to the names
+        false_positive_rate: Accepted false-positive rate at capacity
+
+    Returns:
+        The filter, as of the start of the export
+
+    Raises:
+        ValueError: If capacity_headroom is lower than 1
+    """
+    if capacity_headroom < 1:
+        msg = f"capacity_headroom must be at least 1, got {capacity_headroom}"
+        raise ValueError(msg)
+    # Names saved after this may be missed by the export
+    as_of = datetime.now(UTC)
+    names = [greeting.name for greeting in port.export_greetings(segments)]
+    saved_names = BloomFilter.from_keys(
+        names,
+        max(math.ceil(len(names) * capacity_headroom), 1),
+        false_positive_rate,
+    )
+    saved_names.as_of = as_of
+    return saved_names
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Build a snapshot from the command line.
+
+    Args:
+        argv: Command line arguments (sys.argv if None)
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("output", help="Snapshot to write (s3://bucket/key or file)")
+    parser.add_argument("--table", help="Table name (HELLO_WORLD_TABLE_NAME)")
+    parser.add_argument("--segments", type=int, default=DEFAULT_EXPORT_SEGMENTS)
+    parser.add_argument(
+        "--capacity-headroom", type=float, default=DEFAULT_CAPACITY_HEADROOM
+    )
+    parser.add_argument(
+        "--false-positive-rate", type=float, default=DEFAULT_FALSE_POSITIVE_RATE
+    )
+    args = parser.parse_args(argv)
+
+    if args.table:
+        os.environ["HELLO_WORLD_TABLE_NAME"] = args.table
+    try:
+        saved_names = build_snapshot(
+            HelloWorldStorageAdapter(),
+            segments=args.segments,
+            capacity_headroom=args.capacity_headroom,
+            false_positive_rate=args.false_positive_rate,
+        )
+        write_snapshot(saved_names, args.output)
+    except ValueError as e:
+        parser.error(str(e))
+    print(
+        f"Wrote {saved_names.count} names to {args.output} "
+        f"({saved_names.size_bytes} bytes, as of {saved_names.as_of.isoformat()})",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())